@@ -0,0 +1,256 @@
+## ###################################################################################################################
+##  Program :   Back Test Engine
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              engine   = BackTestEngine( data= read_csv( '../data/QQQ_1min_.csv' ), params= strategies.EMA9Params( configs ) )
+##              new_data = engine.Run( account= account, strategy= 'ema9' )
+##  Notes   :   Vectorized back test : the CSV is loaded once into arrays per symbol, the indicators are calculated over
+##              the whole series ( IndicatorSeries ) and the entry / exit rules of a strategy become boolean arrays.
+##              Only the position bookkeeping is a loop - it jumps from one signal to the next ( in time order across the
+##              symbols ) and calls account.Buy / account.Sell there, so the trades, P&L and Performance WIN/LOSS are
+##              the ones the event loop ( DayTradeStrategy.Run per row ) records on the same data
+##              The indicator arrays come from SeriesIndicators , the same IndicatorPlan steps the stream and batch fold
+##              Strategies without vectorized rules ( see RULES ) still go through the event loop
+##              Run( start, end ) trades only the bars of a time window : its signals are calculated from the start of the
+##              window , like DayTradeStrategy.BackTest of those bars primes every symbol on its first candle there ( the
+##              indicators do not carry over from the days before ) - runs of the same window reuse them
+## ###################################################################################################################
+import sys
+import heapq
+import inspect
+
+import numpy    as np
+import pandas   as pd
+
+from IndicatorSnapshot  import IndicatorSnapshot
+from IndicatorSeries    import SeriesIndicators
+
+
+
+class BackTestBar :
+    __slots__ = ( 'Snapshot', )
+
+    def __init__( self, snapshot : IndicatorSnapshot ) -> None :
+        """
+            Indicator values of one bar , handed to account.Buy / account.Sell in place of an Indicators object
+        """
+        self.Snapshot = snapshot
+
+
+    def Summary( self ) -> IndicatorSnapshot :
+        return self.Snapshot
+
+
+
+class BackTestEngine :
+    RULES = { 'ema9' : 'EMA9Rules' }                  # STRATEGY -> METHOD RETURNING ITS SIGNAL ARRAYS
+
+    def __init__( self, data : pd.DataFrame , params : dict ) -> None :
+        """
+            INITIALIZE THE ARRAYS OF EVERY SYMBOL
+            ARGS   :
+                        data   ( DataFrame ) - back test rows ( SYMBOL, DATETIME, LOW, CLOSE, QUOTE, VOLUME, HIGH )
+                        params ( dict )      - strategy parameters ( time_interval, time_interval_bought, volume_threshold )
+            RETURNS:
+                        nothing
+        """
+        self.Params     = params
+        self.Data       = data.sort_values( by=['DATETIME'], kind='stable' ).reset_index( drop=True )   # SAME ORDER AS groupby( 'DATETIME' )
+        self.Series     = {}                    # symbol -> { 'rows' : positions in Data , field : np.ndarray }
+        self.Signals    = {}                    # symbol -> { 'entry' , 'exit' , 'stop' , indicator : np.ndarray }
+        self.Strategy   = None                  # strategy the Signals belong to
+        self.Start      = None                  # first DATETIME the Signals were calculated from ( None for the first bar )
+        self.Window     = {}                    # symbol -> ( first , last + 1 ) index of the bars Run trades
+        self.Events     = []                    # ( position in Data, symbol, 'bought' / 'closed' ) in time order
+
+        for symbol, rows in self.Data.groupby( 'SYMBOL', sort=False ).indices.items() :
+            series = { 'rows' : rows, 'DATETIME' : self.Data['DATETIME'].to_numpy()[ rows ].astype( str ) }
+            for field in ( 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' ) :
+                series[ field ] = self.Data[ field ].to_numpy( dtype=float )[ rows ]
+            self.Series[ str( symbol ) ] = series
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"BackTestEngine : {len( self.Data )} rows  symbols : {list( self.Series.keys() )}  events : {len( self.Events )}"
+
+
+
+    @staticmethod
+    def Supports( strategy : str ) -> bool :
+        """
+            True when the strategy has vectorized rules
+        """
+        return strategy in BackTestEngine.RULES
+
+
+
+    def EMA9Rules( self, series : dict ) -> dict :
+        """
+            DayTradeEMA9Module as arrays :
+                entry - close above the EMA9 on this bar and the two before it, ChopIndex < 63 , RSI < 10 , before 15:45
+                exit  - close below the EMA9 ( or the stop : close <= bought - 0.16 , applied in the sweep )
+            ARGS   :
+                        series ( dict ) - arrays of one symbol
+            RETURNS:
+                        dictionary of the signal and indicator arrays
+        """
+        close       = series['CLOSE']
+        values      = SeriesIndicators( series['HIGH'], series['LOW'], close, series['VOLUME'] ).Values( [ 'EMA9', 'RSI', 'ChopIndex' ] )
+        ema, rsi, chop = values['EMA9'], values['RSI'], values['ChopIndex']
+        above       = close > ema
+        trend       = above.copy()
+        trend[ :2 ] = False                                                 # Previous / Previous1 START AS ROWS OF ZEROS
+        trend[ 2: ] = above[ 2: ] & above[ 1:-1 ] & above[ :-2 ]
+
+        times       = series['DATETIME'].astype( 'datetime64[m]' )
+        minutes     = ( times - times.astype( 'datetime64[D]' ) ).astype( np.int64 )   # MINUTE OF THE DAY
+        early       = minutes < 15 * 60 + 45                                # DONT OPEN TRADES TOO LATE IN THE DAY ( BEFORE 15:45 )
+
+        with np.errstate( invalid='ignore' ):
+            entry   = trend & ( chop < 63 ) & ( rsi < 10 ) & early              # 70 > RSI < 10
+
+        return { 'entry' : entry, 'exit' : close < ema, 'stop' : 0.16, 'EMA9' : ema, 'RSI' : rsi, 'ChopIndex' : chop }
+
+
+
+    def Bar( self, symbol : str , index : int ) -> BackTestBar :
+        """
+            Indicator values of one bar of a symbol
+        """
+        signals = self.Signals[ symbol ]
+        names   = [ name for name in signals if not ( name in ( 'entry', 'exit', 'stop', 'entries', 'exits' ) ) ]
+        return BackTestBar( IndicatorSnapshot( names, [ float( signals[ name ][ index ] ) for name in names ] ) )
+
+
+
+    def Prepare( self, strategy : str , start : str = None ) -> None :
+        """
+            Signal and indicator arrays of every symbol for a strategy , calculated from the bars at or after start
+            ( only when the strategy or the start changes ) - the bars before it are no signal and NaN indicators
+        """
+        if self.Strategy == strategy and self.Start == start :
+            return
+        rules           = getattr( self, self.RULES[ strategy ] )
+        self.Signals    = {}
+        for symbol, series in self.Series.items() :
+            first                   = 0 if start is None else int( np.searchsorted( series['DATETIME'], start ) )
+            signals                 = rules( { field : values[ first: ] for field, values in series.items() } )
+            for name, values in signals.items() :
+                if isinstance( values, np.ndarray ) and first > 0 :
+                    signals[ name ] = np.concatenate( [ np.full( first, False if values.dtype == bool else np.nan ), values ] )
+            self.Signals[ symbol ]  = signals
+            self.Signals[ symbol ]['entries']  = np.flatnonzero( self.Signals[ symbol ]['entry'] )     # BARS OF THE SIGNALS , SEARCHED BY Next
+            self.Signals[ symbol ]['exits']    = np.flatnonzero( self.Signals[ symbol ]['exit'] )
+        self.Strategy   = strategy
+        self.Start      = start
+
+
+
+    def Next( self, symbol : str , start : int , bought : float ) -> int :
+        """
+            Next bar ( from start , inside the window ) where the symbol has something to do : an entry when flat ,
+            an exit in a position
+            RETURNS:
+                        index in the arrays of the symbol or None
+        """
+        signals = self.Signals[ symbol ]
+        limit   = self.Window[ symbol ][1]
+        if bought == 0 :
+            found = np.searchsorted( signals['entries'], start )
+            return None if found == len( signals['entries'] ) or signals['entries'][ found ] >= limit else int( signals['entries'][ found ] )
+
+        found   = np.searchsorted( signals['exits'], start )
+        end     = limit if found == len( signals['exits'] ) else min( limit, int( signals['exits'][ found ] ) )
+        stop    = np.flatnonzero( self.Series[ symbol ]['CLOSE'][ start:end ] <= bought - signals['stop'] )   # ONLY UP TO THE NEXT EXIT
+        if len( stop ) > 0 :
+            return start + int( stop[0] )
+        return None if end == limit else end
+
+
+
+    def Run( self, account : object , strategy : str = 'ema9' , start : str = None , end : str = None ) -> dict :
+        """
+            Back test a strategy over every symbol
+            ARGS   :
+                        account  ( TradeAccount ) - account in TEST mode that records the trades
+                        strategy ( str )          - strategy with vectorized rules ( see RULES )
+                        start    ( str )          - first DATETIME traded ( None for the first bar )
+                        end      ( str )          - DATETIME the trading stops before ( None for after the last bar )
+            RETURNS:
+                        { symbol : [ row dictionaries ] } in the new_data layout of day_trade.back_test
+        """
+        new_data    = {}
+        queue       = []
+        bought      = {}
+
+        try:
+            self.Prepare( strategy, start )
+            for symbol, series in self.Series.items() :
+                times                   = series['DATETIME']
+                self.Window[ symbol ]   = ( 0 if start is None else int( np.searchsorted( times, start ) ),
+                                            len( times ) if end is None else int( np.searchsorted( times, end ) ) )
+                bought[ symbol ]        = 0
+                index                   = self.Next( symbol, self.Window[ symbol ][0], 0 )
+                if index is not None :
+                    heapq.heappush( queue, ( int( series['rows'][ index ] ), symbol, index ) )
+
+            self.Events = []
+            while len( queue ) > 0 :                                        # ONE STEP PER SIGNAL , IN TIME ORDER ACROSS THE SYMBOLS
+                row, symbol, index  = heapq.heappop( queue )
+                series              = self.Series[ symbol ]
+                price               = float( series['CLOSE'][ index ] )
+
+                if bought[ symbol ] == 0 :
+                    if account.Buy( stock=symbol, price=price, current_time=str( series['DATETIME'][ index ] ), volume=series['VOLUME'][ index ],
+                                    volume_threshold=self.Params['volume_threshold'], indicators=self.Bar( symbol, index ) ) :
+                        bought[ symbol ] = price
+                        self.Events.append( ( row, symbol, 'bought' ) )
+                elif account.Sell( stock=symbol, new_price=price, current_time=str( series['DATETIME'][ index ] ),
+                                   ask_volume=float( series['VOLUME'][ index ] ), indicators=self.Bar( symbol, index ) ) :
+                    bought[ symbol ] = 0
+                    self.Events.append( ( row, symbol, 'closed' ) )
+
+                index = self.Next( symbol, index + 1, bought[ symbol ] )    # NO EXIT ON THE BAR OF THE BUY , NO ENTRY ON THE BAR OF THE SELL
+                if index is not None :
+                    heapq.heappush( queue, ( int( series['rows'][ index ] ), symbol, index ) )
+
+            new_data = self.Rows()
+        except:
+            print("\t\t|EXCEPTION: BackTestEngine::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return new_data
+
+
+
+    def Rows( self ) -> dict :
+        """
+            Rows of every symbol in the window with the action of the bar and the interval the strategy asked for after it
+            RETURNS:
+                        { symbol : [ { stock, datetime, low, quote, high, close, volume, interval, msg } ] }
+        """
+        new_data    = {}
+        msg         = np.full( len( self.Data ), '', dtype=object )
+        change      = np.zeros( len( self.Data ), dtype=int )
+        for row, symbol, action in self.Events :
+            msg[ row ]      = action
+            change[ row ]   = 1 if action == 'bought' else -1
+
+        for symbol, series in self.Series.items() :
+            first, last = self.Window.get( symbol, ( 0, len( series['rows'] ) ) )
+            rows        = series['rows'][ first:last ]
+            in_play     = np.cumsum( change[ rows ] ) > 0
+            interval    = np.where( in_play, self.Params['time_interval_bought'], self.Params['time_interval'] ) / 60
+            frame       = pd.DataFrame( { 'stock' : symbol, 'datetime' : series['DATETIME'][ first:last ], 'low' : series['LOW'][ first:last ],
+                                          'quote' : series['QUOTE'][ first:last ], 'high' : series['HIGH'][ first:last ],
+                                          'close' : series['CLOSE'][ first:last ], 'volume' : series['VOLUME'][ first:last ],
+                                          'interval' : interval, 'msg' : msg[ rows ] } )
+            new_data[ symbol ] = frame.to_dict( 'records' )
+
+        return new_data
@@ -0,0 +1,176 @@
+## ###################################################################################################################
+##  Program :   Bar Resampler
+##  Author  :
+##  Install :   pip3 install numpy
+##  Example :
+##              resampler   = BarResampler()
+##              closed      = resampler.Add( 'AAPL', open=1.0, high=1.2, low=0.9, close=1.1, volume=1000, timestamp=1754400000000 )
+##              row         = resampler.Row( 'AAPL', 15 )           # last 15 minute bar in the ticker_row layout
+##              stream      = resampler.Stream( 'AAPL', 15 )        # indicators of the 15 minute bars
+##  Notes   :   Builds the 3/5/10/15/30 minute bars locally from the 1 minute bars, one minute at a time, and keeps an
+##              IndicatorStream per symbol and timeframe - switching the strategy between time_interval and
+##              time_interval_bought reads another stream that is already current instead of calling the broker at
+##              another frequency and recalculating the indicators from scratch
+##              Bars are aligned on the clock ( 09:30 , 09:45 ... ) and labelled with the time of their first minute
+##              A bar missing its last minutes closes when the first minute of a later bar arrives - that minute can
+##              close its own bar too , so Add reports every bar it closed and Bar / Row can read both
+## ###################################################################################################################
+import sys
+import inspect
+
+from datetime           import datetime
+from IndicatorStream    import IndicatorStream
+
+
+MINUTE_MS   = 60000
+TIMEFRAMES  = ( 1, 3, 5, 10, 15, 30 )        # minutes
+
+
+
+class BarResampler :
+    def __init__( self, timeframes : tuple = TIMEFRAMES , required : list = None , **settings ) -> None :
+        """
+            INITIALIZE THE TIMEFRAMES
+            ARGS   :
+                        timeframes ( tuple ) - bar sizes in minutes built from the 1 minute bars
+                        required   ( list )  - indicators folded on every bar of every timeframe
+                                               ( default none , the streams catch up when they are read )
+                        settings   ( dict )  - IndicatorStream parameters ( rsi_window, ema_span ... )
+            RETURNS:
+                        nothing
+        """
+        self.Timeframes = tuple( sorted( set( timeframes ) | { 1 } ) )
+        self.Required   = [] if required is None else list( required )
+        self.Settings   = settings
+        self.Partial    = {}                    # ( symbol, minutes ) -> [ open, high, low, close, volume, start ] bar being built
+        self.Bars       = {}                    # ( symbol, minutes ) -> bars closed by the last minute that closed any ( same layout , oldest first )
+        self.Streams    = {}                    # ( symbol, minutes ) -> IndicatorStream of the closed bars
+        self.Last       = {}                    # symbol -> timestamp of the last 1 minute bar added
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"BarResampler : {sorted( self.Last.keys() )}  timeframes : {self.Timeframes}"
+
+
+
+    def Stream( self, symbol : str , minutes : int ) -> IndicatorStream :
+        """
+            Indicator state of one symbol on one timeframe ( created on first use )
+        """
+        key = ( symbol, int( minutes ) )
+        if not ( key in self.Streams ) :
+            self.Streams[ key ] = IndicatorStream( **self.Settings )
+            self.Streams[ key ].Require( self.Required )
+        return self.Streams[ key ]
+
+
+
+    def Add( self, symbol : str , open : float , high : float , low : float , close : float , volume : float , timestamp : int ) -> list :
+        """
+            Fold one 1 minute bar into every timeframe
+            ARGS   :
+                        symbol                    ( str )   - stock symbol
+                        open / high / low / close ( float ) - 1 minute bar prices
+                        volume                    ( float ) - 1 minute bar volume
+                        timestamp                 ( int )   - epoch milliseconds of the start of the minute
+            RETURNS:
+                        list of the timeframes ( minutes ) whose bar closed with this minute , one entry per bar
+                        ( a timeframe is there twice when a gap closed its previous bar as well as the new one )
+        """
+        closed = []
+
+        try:
+            timestamp = int( timestamp )
+            if symbol in self.Last and timestamp <= self.Last[ symbol ] :  # SAME MINUTE POLLED TWICE
+                return closed
+            self.Last[ symbol ] = timestamp
+            open, high, low, close, volume = float(open), float(high), float(low), float(close), float(volume)
+
+            for minutes in self.Timeframes :
+                key     = ( symbol, minutes )
+                length  = minutes * MINUTE_MS
+                start   = timestamp - timestamp % length
+                bar     = self.Partial.get( key )
+                bars    = []
+
+                if bar is not None and bar[5] != start :                    # MINUTES MISSING AT THE END OF THE LAST BAR
+                    bars.append( self.Close( key ) )
+                    bar = None
+
+                if bar is None :
+                    self.Partial[ key ] = [ open, high, low, close, volume, start ]
+                else:
+                    bar[1]  = max( bar[1], high )
+                    bar[2]  = min( bar[2], low )
+                    bar[3]  = close
+                    bar[4] += volume
+
+                if timestamp + MINUTE_MS >= start + length :                # LAST MINUTE OF THE BAR
+                    bars.append( self.Close( key ) )
+
+                if len( bars ) > 0 :
+                    self.Bars[ key ] = bars
+                    closed          += [ minutes ] * len( bars )
+        except:
+            print("\t\t|EXCEPTION: BarResampler::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return closed
+
+
+
+    def Close( self, key : tuple ) -> list :
+        """
+            Take the bar being built and fold it into the indicators of its timeframe
+            RETURNS:
+                        the closed bar
+        """
+        bar = self.Partial.pop( key )
+        self.Stream( *key ).Update( *bar )
+        return bar
+
+
+
+    def Bar( self, symbol : str , minutes : int , back : int = 0 ) -> dict :
+        """
+            Closed bar of a timeframe
+            ARGS   :
+                        back ( int ) - 0 for the last closed bar , 1 for the one a gap closed on the same minute
+            RETURNS:
+                        { open, high, low, close, volume, datetime } or None when there is no such bar
+        """
+        bars = self.Bars.get( ( symbol, int( minutes ) ), [] )
+        if back >= len( bars ) :
+            return None
+        bar = bars[ -1 - back ]
+        return dict( zip( ( 'open', 'high', 'low', 'close', 'volume', 'datetime' ), bar ) )
+
+
+
+    def Row( self, symbol : str , minutes : int , back : int = 0 ) -> list :
+        """
+            Closed bar of a timeframe ( see Bar ) in the ticker_row layout of TradeAccount.QuoteByInterval
+            RETURNS:
+                        [ symbol, datetime, low, close, open, volume, high ] or None when there is no such bar
+        """
+        bar = self.Bar( symbol, minutes, back )
+        if bar is None :
+            return None
+        return [ symbol, str( datetime.fromtimestamp( bar['datetime'] / 1000 ) ), bar['low'], bar['close'], bar['open'],
+                 bar['volume'], bar['high'] ]
+
+
+
+    def Reset( self ) -> None :
+        """
+            Start a new trading day
+        """
+        self.Streams.clear()
+        self.Partial.clear()
+        self.Bars.clear()
+        self.Last.clear()
@@ -0,0 +1,256 @@
+## ###################################################################################################################
+##  Program :   Batch Replay
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              batch   = BatchReplay( configs=configs, start='2025-06-02', end='2025-08-29', workers=16 )
+##              merged  = batch.Run( account )                     # account : brokerage account for the days the store lacks
+##              print( batch.Summary( merged ) ) ; batch.Save( merged )
+##  Notes   :   replay_test over a range of days : the parent first makes sure the CandleStore has every ( day , symbol )
+##              - the ones it lacks are fetched once through the brokerage account and written to it - then the
+##              ( day , symbol set ) jobs run in a process pool. Every worker opens the store once ( see warm ) and keeps
+##              the DailyCache of the process, so a job reads its day and daily context locally and replays it on a Paper
+##              account ( ReplayCompare.replay_strategy ). The Trades / Performance of every job are merged in day order
+##              Job results are kept in a ResultCache keyed on the store partitions up to the day , so replaying the
+##              range again ( or a longer one ) only runs the jobs that changed - or failed , a failed job is not cached
+## ###################################################################################################################
+import os
+import sys
+import inspect
+import contextlib
+import multiprocessing
+
+import numpy    as np
+import pandas   as pd
+
+from datetime               import datetime
+from concurrent.futures     import ProcessPoolExecutor
+
+from CandleStore            import CandleStore, STORE_FOLDER
+from ReplayData             import ReplayData
+from ReplayCompare          import replay_strategy
+from ResultCache            import ResultCache, CACHE_FOLDER, store_digests, data_digest
+from DayTradeStrategy       import DayTradeStrategy
+from Log                    import set_level, LOG_LEVEL
+
+
+BATCH_FOLDER    = "../files/batch_replay/"
+TRADE_FIELDS    = ( 'bidTime', 'bid', 'askTime', 'ask', 'qty', 'p_l' )
+Shared          = {}                            # THE STORE THIS WORKER OPENED ( see warm )
+
+
+
+def warm( root : str , level : str = LOG_LEVEL ) -> None :
+    """
+        Open the candle store once per worker ( pool initializer ) - its manifest and memory maps serve every job
+        ARGS   :
+                    root  ( str ) - folder of the CandleStore
+                    level ( str ) - log level of the worker ( Log.LEVELS )
+    """
+    set_level( level )                                                  # A SPAWNED WORKER STARTS AT THE DEFAULT
+    Shared['store'] = CandleStore( root=root )
+
+
+
+def replay_job( day : str , symbols : list , configs : dict ) -> dict :
+    """
+        Replay one day for a set of symbols ( runs in a worker )
+        ARGS   :
+                    day     ( str )  - replay day ( 'YYYY-MM-DD' )
+                    symbols ( list ) - symbols of the job
+                    configs ( dict ) - replay configurations ( strategy, interval ... )
+        RETURNS:
+                    { day, symbols, trades, performance, funds, steps, error } - trades as rows of TRADE_FIELDS ,
+                    error is the exception that stopped the replay ( None when it ran )
+    """
+    with open( os.devnull, 'w' ) as quiet, contextlib.redirect_stdout( quiet ) :              # THE REPLAY PRINTS EVERY STEP
+        result  = replay_strategy( configs['strategy'], { **configs, 'stock' : list( symbols ), 'replay_date' : day }, store=Shared.get('store') )
+
+    account = result['account']
+    trades  = [ { 'day' : day, 'symbol' : symbol, **{ key : ( str( trade[ key ] ) if key.endswith( 'Time' ) else trade[ key ] ) for key in TRADE_FIELDS } }
+                for symbol, entries in account.Trades.items() for trade in entries ]
+    return { 'day'          : day,
+             'symbols'      : list( symbols ),
+             'trades'       : sorted( trades, key=lambda trade : trade['askTime'] ),
+             'performance'  : { symbol : list( outcomes ) for symbol, outcomes in account.Performance.items() },
+             'funds'        : round( float( account.Funds ), 2 ),
+             'steps'        : sum( len( rows ) for rows in result['data'].values() ),
+             'error'        : result['error'] }
+
+
+
+class BatchReplay :
+    def __init__( self, configs : dict , start : str , end : str , workers : int = None , chunk : int = None ) -> None :
+        """
+            INITIALIZE THE RANGE OF DAYS AND THE JOBS
+            ARGS   :
+                        configs ( dict ) - replay configurations ( strategy, stock, interval, candle_store ... )
+                        start   ( str )  - first day replayed ( 'YYYY-MM-DD' )
+                        end     ( str )  - last day replayed ( included )
+                        workers ( int )  - processes ( default every core )
+                        chunk   ( int )  - symbols per job ( default every symbol in one job per day )
+            RETURNS:
+                        nothing
+        """
+        self.Configs    = dict( configs )
+        self.Configs['stock']   = [ configs['stock'] ] if isinstance( configs['stock'], str ) else list( configs['stock'] )
+        self.Start      = str( start )[:10]
+        self.End        = str( end or start )[:10]
+        self.Workers    = workers or os.cpu_count() or 1
+        self.Chunk      = max( 1, int( chunk or len( self.Configs['stock'] ) ) )
+        self.Store      = CandleStore( root=self.Configs.get('candle_store') or STORE_FOLDER )
+        self.Cache      = None if configs.get('no_cache') else ResultCache( folder=configs.get('result_cache') or CACHE_FOLDER )
+        self.Resolver   = DayTradeStrategy()                   # RESOLVES THE PARAMS FOR THE CACHE KEY
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"BatchReplay : {self.Configs.get('strategy')}  {self.Start} -> {self.End}  stocks : {self.Configs['stock']}  "
+                 f"symbols per job : {self.Chunk}  workers : {self.Workers}" )
+
+
+
+    def Days( self ) -> list :
+        """
+            Days of the range the store has for at least one of the symbols
+        """
+        return sorted( { day for symbol in self.Configs['stock'] for day in self.Store.Days( symbol, start=self.Start )
+                         if day <= self.End } )
+
+
+
+    def Prefetch( self, account : object = None ) -> list :
+        """
+            Fetch the ( day , symbol ) candles the store does not have yet - once , in the parent
+            ARGS   :
+                        account ( TradeAccount ) - brokerage account ( None to replay only what the store has )
+            RETURNS:
+                        days to replay
+        """
+        if account is not None :
+            for day in pd.bdate_range( self.Start, self.End ).strftime( "%Y-%m-%d" ) :
+                missing = [ symbol for symbol in self.Configs['stock'] if not self.Store.Has( symbol, day ) ]
+                if len( missing ) > 0 :
+                    ReplayData( account=account, symbols=missing, day=day, store=self.Store )
+        return self.Days()
+
+
+
+    def Jobs( self, days : list ) -> list :
+        """
+            ( day , symbols ) of every job , in day order
+        """
+        symbols = self.Configs['stock']
+        return [ ( day, symbols[ first : first + self.Chunk ] ) for day in days for first in range( 0, len( symbols ), self.Chunk ) ]
+
+
+
+    def Key( self, day : str , symbols : list ) -> str :
+        """
+            Cache key of a job : strategy, resolved params, code version and the store partitions of its symbols up to the day
+        """
+        return self.Cache.Key( kind='replay', strategy=self.Configs['strategy'], interval=int( self.Configs['interval'] ),
+                               params=self.Resolver.Params( self.Configs['strategy'], self.Configs ), compact=bool( self.Configs.get('compact') ),
+                               vol_window=int( self.Configs.get('vol_window') or 0 ), day=day, symbols=list( symbols ), data=data_digest( store_digests( self.Store, symbols, end=day ) ) )
+
+
+
+    def Run( self, account : object = None ) -> dict :
+        """
+            Prefetch the range then replay every job in the pool
+            ARGS   :
+                        account ( TradeAccount ) - brokerage account for the days the store lacks
+            RETURNS:
+                        merged result ( see Merge )
+        """
+        results = []
+        try:
+            jobs    = self.Jobs( self.Prefetch( account ) )
+            if len( jobs ) == 0 :
+                print( f"\t\t * No candles between {self.Start} and {self.End} for {self.Configs['stock']}" )
+                return self.Merge( [] )
+
+            keys    = [ self.Key( day, symbols ) if self.Cache is not None else None for day, symbols in jobs ]
+            results = [ self.Cache.Load( key ) if key is not None else None for key in keys ]
+            missing = [ index for index, result in enumerate( results ) if result is None ]
+            if len( missing ) > 0 :
+                with ProcessPoolExecutor( max_workers=min( self.Workers, len( missing ) ), mp_context=multiprocessing.get_context(),
+                                          initializer=warm, initargs=( self.Store.Root, self.Configs.get('log_level') or LOG_LEVEL ) ) as pool :
+                    for index, result in zip( missing, pool.map( replay_job, [ jobs[ index ][0] for index in missing ], [ jobs[ index ][1] for index in missing ],
+                                                                 [ self.Configs ] * len( missing ) ) ) :
+                        results[ index ] = result
+                        if result['error'] is not None :                               # A FAILED JOB RUNS AGAIN NEXT TIME
+                            print( f"\t\t * {result['day']} {result['symbols']} failed , not cached : {result['error']}" )
+                        elif keys[ index ] is not None :
+                            self.Cache.Save( keys[ index ], result )
+        except:
+            print("\t\t|EXCEPTION: BatchReplay::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        return self.Merge( results )
+
+
+
+    def Merge( self, results : list ) -> dict :
+        """
+            One result out of the jobs
+            ARGS   :
+                        results ( list ) - replay_job results in day order
+            RETURNS:
+                        { days        : DataFrame one row per day ( trades, wins, losses, win_rate, p_l, steps ) ,
+                          trades      : DataFrame of every trade ( day, symbol, TRADE_FIELDS ) ,
+                          performance : symbol -> WIN / LOSS of every trade in day order }
+        """
+        trades      = pd.DataFrame( [ trade for result in results for trade in result['trades'] ], columns=[ 'day', 'symbol', *TRADE_FIELDS ] )
+        performance = {}
+        for result in results :
+            for symbol, outcomes in result['performance'].items() :
+                performance.setdefault( symbol, [] ).extend( outcomes )
+
+        days        = pd.DataFrame( { 'day'   : pd.Series( sorted( { result['day'] for result in results } ), dtype=object ) } )    # OBJECT EVEN WITH NO JOBS
+        steps       = pd.DataFrame( [ ( result['day'], result['steps'] ) for result in results ], columns=[ 'day', 'steps' ] ).groupby( 'day' )['steps'].sum()
+        totals      = trades.groupby( 'day' ).agg( trades=( 'p_l', 'size' ), wins=( 'p_l', lambda p_l : int( ( p_l > 0 ).sum() ) ), p_l=( 'p_l', 'sum' ) )
+        days        = days.join( totals, on='day' ).fillna( { 'trades' : 0, 'wins' : 0, 'p_l' : 0.0 } ).join( steps, on='day' )
+        days        = days.astype( { 'trades' : int, 'wins' : int } )
+        days['losses']      = days['trades'] - days['wins']
+        days['win_rate']    = np.where( days['trades'] > 0, ( days['wins'] / days['trades'].clip( lower=1 ) ).round( 4 ), 0.0 )
+        days['p_l']         = days['p_l'].round( 2 )
+
+        return { 'days'        : days[ [ 'day', 'trades', 'wins', 'losses', 'win_rate', 'p_l', 'steps' ] ],
+                 'trades'      : trades.sort_values( by=[ 'day', 'askTime' ], kind='stable' ).reset_index( drop=True ),
+                 'performance' : performance }
+
+
+
+    def Summary( self, merged : dict ) -> dict :
+        """
+            Totals of the batch ( the drawdown is on the running P&L of the trades in the order they closed )
+        """
+        days    = merged['days']
+        p_l     = np.concatenate( [ [0], np.cumsum( merged['trades']['p_l'].to_numpy( dtype=float ) ) ] )
+        trades  = int( days['trades'].sum() )
+        return { 'days'             : len( days ),
+                 'trades'           : trades,
+                 'wins'             : int( days['wins'].sum() ),
+                 'losses'           : int( days['losses'].sum() ),
+                 'win_rate'         : round( float( days['wins'].sum() / trades ), 4 ) if trades > 0 else 0.0,
+                 'p_l'              : round( float( p_l[-1] ), 2 ),
+                 'max_drawdown'     : round( float( np.max( np.maximum.accumulate( p_l ) - p_l ) ), 2 ),
+                 'profitable_days'  : int( ( days['p_l'] > 0 ).sum() ) }
+
+
+
+    def Save( self, merged : dict , folder : str = BATCH_FOLDER ) -> list :
+        """
+            Write the day and trade tables
+            RETURNS:
+                        file names of the csv files
+        """
+        os.makedirs( folder, exist_ok=True )
+        prefix  = os.path.join( folder, f"batch_replay_{self.Configs.get('strategy')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}" )
+        merged['days'].to_csv( f"{prefix}_days.csv", index=False )
+        merged['trades'].to_csv( f"{prefix}_trades.csv", index=False )
+        return [ f"{prefix}_days.csv", f"{prefix}_trades.csv" ]
@@ -0,0 +1,107 @@
+## ###################################################################################################################
+##  Program :   Candle Buffer
+##  Author  :
+##  Install :   pip3 install numpy
+##  Example :
+##              candles = CandleBuffer( capacity = 512 )
+##              candles.Append( open=1.0, high=1.2, low=0.9, close=1.1, volume=1000, timestamp=1754400000000 )
+##              closes  = candles.View( 'close', 15 )          # last 15 closes, oldest first, no copy
+##  Notes   :   Preallocated columnar ring buffer for the intraday candles of one symbol.
+##              Every value is written twice ( slot and slot + capacity ) so the newest N entries are always one
+##              contiguous slice -> indicator math gets plain numpy views and nothing is allocated per candle
+##              A buffer lives as long as its IndicatorStream : PrimeStockEntry builds new Indicators for every
+##              symbol it primes , so there is no per day reset
+## ###################################################################################################################
+import numpy as np
+
+
+CANDLES_PER_DAY = 512           # 390 regular session minutes plus room for the pre-market seed
+
+
+
+class CandleBuffer :
+    FIELDS = ( 'open', 'high', 'low', 'close', 'volume', 'timestamp' )
+
+    def __init__( self, capacity : int = CANDLES_PER_DAY, dtype : object = np.float64 ) -> None :
+        """
+            INITIALIZE THE PREALLOCATED COLUMNS
+            ARGS   :
+                        capacity ( int )   - most candles kept , older ones are overwritten
+                        dtype    ( dtype ) - storage type of the price / volume columns ( timestamps are int64 epoch ms )
+            RETURNS:
+                        nothing
+        """
+        self.Capacity   = capacity
+        self.Count      = 0                                             # candles appended since the buffer was created
+        self.Columns    = { field : np.zeros( 2 * capacity, dtype= np.int64 if field == 'timestamp' else dtype )
+                                                                                    for field in self.FIELDS }
+
+
+
+    def __len__( self ) -> int :
+        """
+            Number of candles currently available
+        """
+        return min( self.Count, self.Capacity )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"CandleBuffer : {len(self)}/{self.Capacity} candles  {self.Nbytes()} bytes"
+
+
+
+    def Append( self, open : float, high : float, low : float, close : float, volume : float, timestamp : int = 0 ) -> None :
+        """
+            Write one candle in place ( overwrites the oldest once the buffer is full )
+            ARGS   :
+                        open / high / low / close ( float ) - candle prices
+                        volume                    ( float ) - candle volume
+                        timestamp                 ( int )   - epoch milliseconds of the candle
+            RETURNS:
+                        nothing
+        """
+        slot = self.Count % self.Capacity
+        for field, value in zip( self.FIELDS, ( open, high, low, close, volume, timestamp or 0 ) ):
+            column                          = self.Columns[ field ]
+            column[ slot ]                  = value
+            column[ slot + self.Capacity ]  = value
+        self.Count += 1
+
+
+
+    def View( self, field : str , length : int = None , back : int = 0 ) -> np.ndarray :
+        """
+            Read only view over the newest entries of a column ( oldest first ) - no copy is made
+            ARGS   :
+                        field  ( str ) - open / high / low / close / volume / timestamp
+                        length ( int ) - how many of the newest entries ( default all available )
+                        back   ( int ) - end the view this many candles before the newest one
+            RETURNS:
+                        np.ndarray view
+        """
+        available   = max( len( self ) - back, 0 )
+        length      = available if length is None else min( length, available )
+        end         = ( ( self.Count - 1 - back ) % self.Capacity ) + self.Capacity + 1 if available > 0 else 0
+        view        = self.Columns[ field ][ end - length : end ]
+        view.flags.writeable = False
+        return view
+
+
+
+    def Last( self, field : str , back : int = 0 ) -> float :
+        """
+            Value of a column 'back' candles before the newest one ( 0 = newest )
+        """
+        return self.Columns[ field ][ ( ( self.Count - 1 - back ) % self.Capacity ) ]
+
+
+
+    def Nbytes( self ) -> int :
+        """
+            Memory held by the columns in bytes ( fixed for the life of the buffer )
+        """
+        return sum( column.nbytes for column in self.Columns.values() )
@@ -0,0 +1,165 @@
+## ###################################################################################################################
+##  Program :   Candle Merge
+##  Author  :
+##  Install :   pip3 install pandas
+##  Example :
+##              merge = CandleMerge( sources='../data/AAPL_1min.csv,../data/QQQ_1min.csv', symbols=['AAPL','QQQ'] )
+##              for bar_time, bar in merge.Bars() :             # bar : ticker rows of every symbol at bar_time
+##                  ...
+##  Notes   :   Streaming k-way merge of per symbol candle files ( one file / partition per symbol , or one file with
+##              every symbol ) for back_test - a heap keyed by the DATETIME of the next row of each source hands out
+##              the rows in global time order, reading every file in chunks instead of loading them whole.
+##              Each row reaches its own SYMBOL once ; ties on the timestamp keep the order of the sources
+##              DATETIME is compared as text ( 'YYYY-MM-DD HH:MM:SS' sorts like the time it holds )
+##              A folder holding a CandleStore ( manifest.json ) is read from its memory mapped partitions instead
+## ###################################################################################################################
+import os
+import sys
+import glob
+import heapq
+import inspect
+import itertools
+
+import pandas   as pd
+
+from CandleStore    import CandleStore, is_store
+
+FIELDS      = ( 'SYMBOL', 'DATETIME', 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' )
+CHUNK_ROWS  = 50000
+
+
+
+class CandleMerge :
+    def __init__( self, sources : object , symbols : list = None , chunksize : int = CHUNK_ROWS ) -> None :
+        """
+            INITIALIZE THE SOURCES
+            ARGS   :
+                        sources   ( str / list ) - csv files , folders of csv files , CandleStore folders or glob patterns
+                                                   ( comma separated in a str )
+                        symbols   ( list )       - symbols to keep ( None / empty for every symbol in the files )
+                        chunksize ( int )        - rows read from a file at a time
+            RETURNS:
+                        nothing
+        """
+        sources         = sources.split(',') if isinstance( sources, str ) else [ str( source ) for source in sources ]
+        symbols         = [ symbols ] if isinstance( symbols, str ) else ( symbols or [] )
+        self.Symbols    = set( symbol.strip() for symbol in symbols if str( symbol ).strip() != '' )
+        self.Chunksize  = chunksize
+        self.Files      = []
+        self.Stores     = []                    # CandleStore of the store folders
+        self.Rows       = 0                     # rows handed out so far
+
+        for source in ( source.strip() for source in sources if source.strip() != '' ) :
+            if is_store( source ) :
+                self.Stores.append( CandleStore( root=source ) )
+            elif os.path.isdir( source ) :
+                self.Files += sorted( glob.glob( os.path.join( source, '*.csv' ) ) )
+            elif any( char in source for char in '*?[' ) :
+                self.Files += sorted( glob.glob( source ) )
+            else:
+                self.Files.append( source )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"CandleMerge : {len( self.Files )} files  {len( self.Stores )} stores  symbols : {sorted( self.Symbols ) or 'all'}  rows : {self.Rows}"
+
+
+
+    def Read( self, file_name : str ) -> object :
+        """
+            Ticker rows of one file in time order, a chunk at a time
+            ( a file that is not in time order is read whole and sorted, like back_test used to )
+            ARGS   :
+                        file_name ( str ) - csv file with the SYMBOL, DATETIME, LOW, CLOSE, QUOTE, VOLUME, HIGH [, MSG] columns
+            RETURNS:
+                        generator of [ symbol, datetime, low, close, quote, volume, high, msg ]
+        """
+        try:
+            if not self.Ordered( file_name ) :
+                print( f"\t\t * {file_name} is not in time order , sorting it in memory" )
+                yield from self.Sorted( file_name )
+                return
+            for chunk in pd.read_csv( file_name, header=0, encoding="ISO-8859-1", index_col=None, chunksize=self.Chunksize ) :
+                yield from self.Convert( chunk )
+        except:
+            print("\t\t|EXCEPTION: CandleMerge::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            print("\t\t * Reading : " , file_name )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+
+
+    def Ordered( self, file_name : str ) -> bool :
+        """
+            True when the DATETIME column of a file never goes back in time ( only that column is read )
+        """
+        last = ''
+        for chunk in pd.read_csv( file_name, header=0, encoding="ISO-8859-1", index_col=None, usecols=['DATETIME'], chunksize=self.Chunksize ) :
+            times = chunk['DATETIME'].astype( str )
+            if len( times ) == 0 :
+                continue
+            if times.iloc[0] < last or not times.is_monotonic_increasing :
+                return False
+            last = times.iloc[-1]
+        return True
+
+
+
+    def Sorted( self, file_name : str ) -> object :
+        """
+            Ticker rows of a whole file sorted on DATETIME ( stable , the file order is kept inside a timestamp )
+        """
+        data = pd.read_csv( file_name, header=0, encoding="ISO-8859-1", index_col=None )
+        data = data.iloc[ data['DATETIME'].astype( str ).argsort( kind='stable' ) ]
+        yield from self.Convert( data )
+
+
+
+    def Convert( self, chunk : pd.DataFrame ) -> object :
+        """
+            Rows of a chunk in the ticker_row layout of back_test ( only the kept symbols )
+        """
+        if len( self.Symbols ) > 0 :
+            chunk = chunk[ chunk['SYMBOL'].astype( str ).isin( self.Symbols ) ]
+        msg     = chunk['MSG'] if 'MSG' in chunk else itertools.repeat( '' )
+        columns = [ chunk['SYMBOL'].astype( str ), chunk['DATETIME'].astype( str ) ] + [ chunk[ field ].astype( float ) for field in FIELDS[2:] ]
+        for values in zip( *columns, msg ) :
+            yield list( values )
+
+
+
+    def __iter__( self ) -> object :
+        """
+            Ticker rows of every source in global time order
+        """
+        stored  = [ store.Rows( symbol ) for store in self.Stores for symbol in store.Symbols() if len( self.Symbols ) == 0 or symbol in self.Symbols ]
+        for row in heapq.merge( *[ self.Read( file_name ) for file_name in self.Files ], *stored, key=lambda row : row[1] ) :
+            self.Rows += 1
+            yield row
+
+
+
+    def Bars( self ) -> object :
+        """
+            Ticker rows grouped by timestamp
+            RETURNS:
+                        generator of ( bar_time, [ ticker rows at bar_time ] )
+        """
+        for bar_time, rows in itertools.groupby( self, key=lambda row : row[1] ) :
+            yield bar_time, list( rows )
+
+
+
+    def Frame( self ) -> pd.DataFrame :
+        """
+            Every row in time order as one DataFrame ( for BackTestEngine , which works on whole series )
+        """
+        if len( self.Files ) == 0 and len( self.Stores ) == 1 :                                    # WHOLE COLUMNS , NO ROW BY ROW MERGE
+            data        = self.Stores[0].Frame( symbols=sorted( self.Symbols ) or None )
+            self.Rows  += len( data )
+            return data
+        return pd.DataFrame( list( self ), columns=list( FIELDS ) + [ 'MSG' ] )
@@ -0,0 +1,313 @@
+## ###################################################################################################################
+##  Program :   Candle Store
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              store = CandleStore( root='../data/store/' )
+##              store.Import( [ '../data/QQQ_1min_.csv', '../data/intraday_15min_QQQ.csv' ] )
+##              data  = store.Frame( symbols=['QQQ'], start='2025-08-01', end='2025-09-01' )
+##  Notes   :   Candles partitioned by symbol / trading day , one typed .npy file per column :
+##                  <root>/<SYMBOL>/<YYYY-MM-DD>/TIME.npy ( datetime64[s] ) LOW / CLOSE / QUOTE / VOLUME / HIGH.npy ( float64 )
+##              and a manifest.json index ( rows , first / last time and the daily open / high / low / close / volume of
+##              every partition ), so picking partitions and the daily history need no candle reads at all.
+##              Partitions are memory mapped when read - no text parsing, a month of 1 min bars loads in milliseconds
+##              Both CSV layouts are imported : SYMBOL,DATETIME,LOW,QUOTE,... ( back_test / send_data_to_file ) and the
+##              stock,timestamp,open,high,low,close,volume one of download_stock_data ( QUOTE is the open of the bar )
+## ###################################################################################################################
+import os
+import sys
+import json
+import inspect
+
+import numpy    as np
+import pandas   as pd
+
+from datetime   import datetime, timedelta
+
+
+STORE_FOLDER    = "../data/store/"
+MANIFEST        = "manifest.json"
+VERSION         = 1
+COLUMNS         = { 'TIME' : 'datetime64[s]', 'LOW' : 'float64', 'CLOSE' : 'float64', 'QUOTE' : 'float64', 'VOLUME' : 'float64', 'HIGH' : 'float64' }
+FIELDS          = ( 'SYMBOL', 'DATETIME', 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' )
+ALIASES         = { 'STOCK' : 'SYMBOL', 'TIMESTAMP' : 'DATETIME', 'OPEN' : 'QUOTE' }        # download_stock_data ( Alpha Vantage ) HEADERS
+
+
+
+def is_store( folder : str ) -> bool :
+    """
+        True when the folder holds a candle store ( has a manifest )
+    """
+    return os.path.isfile( os.path.join( str( folder ), MANIFEST ) )
+
+
+
+def time_text( times : np.ndarray ) -> np.ndarray :
+    """
+        datetime64 values as the 'YYYY-MM-DD HH:MM:SS' text the ticker rows carry
+    """
+    return np.char.replace( np.datetime_as_string( times, unit='s' ), 'T', ' ' )
+
+
+
+def candle_bar( symbol : str , columns : dict , when : datetime , seconds : int = 60 ) -> list :
+    """
+        Ticker row of the candle that starts at a time , built from the candles in [ when , when + seconds )
+        ( like the broker candle of that timestamp ; the last candle before it when there is none )
+        ARGS   :
+                    columns ( dict ) - TIME / LOW / CLOSE / QUOTE / VOLUME / HIGH arrays of one day in time order
+        RETURNS:
+                    [ symbol, datetime, low, close, open, volume, high ] or None
+    """
+    start   = np.datetime64( pd.Timestamp( when ), 's' )
+    first   = int( np.searchsorted( columns['TIME'], start ) )
+    last    = int( np.searchsorted( columns['TIME'], start + np.timedelta64( max( 1, int( seconds ) ), 's' ) ) )
+    if first == last or columns['TIME'][ first ] != start :
+        if first == 0 :
+            return None
+        first, last = first - 1, first
+    return [ symbol, str( when )[:19], float( columns['LOW'][ first:last ].min() ), float( columns['CLOSE'][ last - 1 ] ),
+             float( columns['QUOTE'][ first ] ), float( columns['VOLUME'][ first:last ].sum() ), float( columns['HIGH'][ first:last ].max() ) ]
+
+
+
+class CandleStore :
+    def __init__( self, root : str = STORE_FOLDER ) -> None :
+        """
+            INITIALIZE THE STORE ( the manifest is read when there is one )
+            ARGS   :
+                        root ( str ) - folder of the store
+            RETURNS:
+                        nothing
+        """
+        self.Root       = str( root )
+        self.Manifest   = { 'version' : VERSION, 'columns' : COLUMNS, 'partitions' : {} }    # partitions : symbol -> day -> summary
+
+        if is_store( self.Root ) :
+            with open( os.path.join( self.Root, MANIFEST ), 'r' ) as file :
+                self.Manifest = json.load( file )
+            if self.Manifest.get( 'version' ) != VERSION :
+                print( f"\t\t * Candle store {self.Root} is version {self.Manifest.get('version')} , expected {VERSION}" )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        partitions = self.Manifest['partitions']
+        return ( f"CandleStore : {self.Root}  symbols : {len( partitions )}  partitions : {sum( len( days ) for days in partitions.values() )}  "
+                 f"rows : {sum( day['rows'] for days in partitions.values() for day in days.values() )}" )
+
+
+
+    def Symbols( self ) -> list :
+        return sorted( self.Manifest['partitions'].keys() )
+
+
+    def Days( self, symbol : str , start : str = None , end : str = None ) -> list :
+        """
+            Trading days stored for a symbol that overlap [ start , end ) ( 'YYYY-MM-DD[ HH:MM:SS]' text , None for open ended )
+        """
+        days = sorted( self.Manifest['partitions'].get( symbol, {} ).keys() )
+        return [ day for day in days if ( start is None or day >= str( start )[:10] ) and ( end is None or day < str( end ) ) ]
+
+
+    def Has( self, symbol : str , day : str = None ) -> bool :
+        """
+            True when the symbol ( and the day of a date / time if given ) is in the store
+        """
+        return symbol in self.Manifest['partitions'] and ( day is None or str( day )[:10] in self.Manifest['partitions'][ symbol ] )
+
+
+
+    def Normalize( self, data : pd.DataFrame ) -> pd.DataFrame :
+        """
+            Rows of either CSV layout as typed SYMBOL, TIME, LOW, CLOSE, QUOTE, VOLUME, HIGH columns
+        """
+        data    = data.rename( columns=lambda name : ALIASES.get( str( name ).strip().upper(), str( name ).strip().upper() ) )
+        frame   = pd.DataFrame( { 'SYMBOL' : data['SYMBOL'].astype( str ).str.strip(),
+                                  'TIME'   : pd.to_datetime( data['DATETIME'].astype( str ) ).to_numpy().astype( COLUMNS['TIME'] ) } )
+        for column in ( 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' ) :
+            frame[ column ] = pd.to_numeric( data[ column ], errors='coerce' ).astype( COLUMNS[ column ] )
+        return frame.dropna()
+
+
+
+    def Write( self, data : pd.DataFrame ) -> int :
+        """
+            Add candles to the store ( a partition already there is merged , the new row wins on the same time )
+            ARGS   :
+                        data ( DataFrame ) - rows in either CSV layout
+            RETURNS:
+                        number of partitions written
+        """
+        written = 0
+        try:
+            frame           = self.Normalize( data )
+            frame['DAY']    = np.datetime_as_string( frame['TIME'].to_numpy().astype( 'datetime64[D]' ) )
+            for ( symbol, day ), rows in frame.groupby( [ 'SYMBOL', 'DAY' ], sort=False ) :
+                if self.Has( symbol, day ) :
+                    rows = pd.concat( [ pd.DataFrame( { column : np.array( values ) for column, values in self.Partition( symbol, day ).items() } ), rows ] )
+                rows = rows.drop_duplicates( subset=['TIME'], keep='last' ).sort_values( by=['TIME'], kind='stable' )
+                self.Save( symbol, day, { column : rows[ column ].to_numpy().astype( kind ) for column, kind in COLUMNS.items() } )
+                written += 1
+            self.SaveManifest()
+        except:
+            print("\t\t|EXCEPTION: CandleStore::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return written
+
+
+
+    def Import( self, sources : list ) -> int :
+        """
+            Add csv files to the store
+            ARGS   :
+                        sources ( list ) - csv file names
+            RETURNS:
+                        number of partitions written
+        """
+        written = 0
+        for file_name in ( [ sources ] if isinstance( sources, str ) else sources ) :
+            print( f"\t\t * Importing {file_name}" )
+            written += self.Write( pd.read_csv( file_name, header=0, encoding="ISO-8859-1", index_col=None ) )
+        return written
+
+
+
+    def Save( self, symbol : str , day : str , columns : dict ) -> None :
+        """
+            Write the column files of one partition and its manifest summary
+        """
+        folder = os.path.join( self.Root, symbol, day )
+        os.makedirs( folder, exist_ok=True )
+        for column, values in columns.items() :
+            np.save( os.path.join( folder, f"{column}.tmp.npy" ), values )
+            os.replace( os.path.join( folder, f"{column}.tmp.npy" ), os.path.join( folder, f"{column}.npy" ) )   # READERS NEVER SEE HALF A FILE
+
+        times = time_text( columns['TIME'][ [ 0, -1 ] ] )
+        self.Manifest['partitions'].setdefault( symbol, {} )[ day ] = {
+                    'rows'   : len( columns['TIME'] ),
+                    'first'  : str( times[0] ),
+                    'last'   : str( times[1] ),
+                    'open'   : float( columns['QUOTE'][0] ),
+                    'high'   : float( columns['HIGH'].max() ),
+                    'low'    : float( columns['LOW'].min() ),
+                    'close'  : float( columns['CLOSE'][-1] ),
+                    'volume' : float( columns['VOLUME'].sum() ) }
+
+
+
+    def SaveManifest( self ) -> None :
+        os.makedirs( self.Root, exist_ok=True )
+        with open( os.path.join( self.Root, MANIFEST + '.tmp' ), 'w' ) as file :
+            json.dump( self.Manifest, file, indent=1, sort_keys=True )
+        os.replace( os.path.join( self.Root, MANIFEST + '.tmp' ), os.path.join( self.Root, MANIFEST ) )
+
+
+
+    def Partition( self, symbol : str , day : str ) -> dict :
+        """
+            Memory mapped columns of one symbol / day
+        """
+        folder = os.path.join( self.Root, symbol, str( day )[:10] )
+        return { column : np.load( os.path.join( folder, f"{column}.npy" ), mmap_mode='r' ) for column in COLUMNS }
+
+
+
+    def Concat( self, symbol : str , days : list ) -> dict :
+        """
+            Columns of a symbol over whole days
+        """
+        parts = [ self.Partition( symbol, day ) for day in days ]
+        return { column : np.concatenate( [ part[ column ] for part in parts ] ) if len( parts ) > 0 else np.empty( 0, dtype=kind )
+                 for column, kind in COLUMNS.items() }
+
+
+
+    def Arrays( self, symbol : str , start : str = None , end : str = None ) -> dict :
+        """
+            Columns of a symbol over [ start , end ) ( 'YYYY-MM-DD[ HH:MM:SS]' text , None for open ended )
+        """
+        arrays  = self.Concat( symbol, self.Days( symbol, start, end ) )
+        first   = 0 if start is None else np.searchsorted( arrays['TIME'], np.datetime64( pd.Timestamp( start ), 's' ) )
+        last    = len( arrays['TIME'] ) if end is None else np.searchsorted( arrays['TIME'], np.datetime64( pd.Timestamp( end ), 's' ) )
+        return { column : values[ first:last ] for column, values in arrays.items() }
+
+
+
+    def Frame( self, symbols : list = None , start : str = None , end : str = None ) -> pd.DataFrame :
+        """
+            Candles of the symbols in time order ( stable : a timestamp keeps the symbol order ) in the back test layout
+            ARGS   :
+                        symbols ( list ) - symbols to load ( None / empty for every symbol in the store )
+                        start   ( str )  - first time loaded ( None for the first candle )
+                        end     ( str )  - time to stop before ( None for after the last candle )
+            RETURNS:
+                        DataFrame of SYMBOL, DATETIME, LOW, CLOSE, QUOTE, VOLUME, HIGH , MSG
+        """
+        frames = []
+        for symbol in ( symbols or self.Symbols() ) :
+            arrays = self.Arrays( symbol, start, end )
+            frames.append( pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : time_text( arrays['TIME'] ),
+                                           **{ field : arrays[ field ] for field in FIELDS[2:] }, 'MSG' : '' } ) )
+        if len( frames ) == 0 :
+            return pd.DataFrame( columns=list( FIELDS ) + [ 'MSG' ] )
+        data = pd.concat( frames, ignore_index=True )
+        return data.iloc[ data['DATETIME'].argsort( kind='stable' ) ].reset_index( drop=True )
+
+
+
+    def Rows( self, symbol : str ) -> object :
+        """
+            Ticker rows of a symbol in time order, a partition at a time ( for CandleMerge )
+        """
+        for day in self.Days( symbol ) :
+            part    = self.Partition( symbol, day )
+            times   = time_text( part['TIME'] )
+            for index in range( len( times ) ) :
+                yield [ symbol, str( times[ index ] ) ] + [ float( part[ field ][ index ] ) for field in FIELDS[2:] ] + [ '' ]
+
+
+
+    def Bar( self, symbol : str , when : datetime , seconds : int = 60 ) -> list :
+        """
+            Ticker row of the stored candle that starts at a time ( see candle_bar )
+            RETURNS:
+                        [ symbol, datetime, low, close, open, volume, high ] or None
+        """
+        return candle_bar( symbol, self.Partition( symbol, when ), when, seconds ) if self.Has( symbol, when ) else None
+
+
+
+    def History( self, symbol : str , time_period : str = 'daily' , time_range : int = 1 , today : datetime = None ) -> pd.DataFrame :
+        """
+            Candles before today in the layout of TradeAccount.History ( same day range ) , newest first
+            ARGS   :
+                        time_period ( str ) - 'daily' ( from the manifest ) or 'minute' ( the stored candles )
+                        time_range  ( int ) - days to go back
+                        today       ( datetime )
+            RETURNS:
+                        DataFrame of open, high, low, close, volume, datetime ( ms ) , date
+        """
+        today       = today or datetime.now()
+        end_date    = today - timedelta( days= ( 3 if today.weekday() == 0 else 1 ) )
+        start_date  = end_date - timedelta( days= ( time_range + ( 3 if today.weekday() == 0 else 1 ) ) )
+        days        = self.Days( symbol, start=str( start_date )[:10], end=str( end_date + timedelta( days=1 ) )[:10] )
+
+        if time_period == 'daily' :
+            summaries   = self.Manifest['partitions'].get( symbol, {} )
+            df          = pd.DataFrame( [ { key : summaries[ day ][ key ] for key in ( 'open', 'high', 'low', 'close', 'volume' ) } for day in days ],
+                                        columns=[ 'open', 'high', 'low', 'close', 'volume' ] )
+            times       = [ datetime.strptime( day, "%Y-%m-%d" ) for day in days ]
+        else:
+            arrays      = self.Concat( symbol, days )
+            df          = pd.DataFrame( { 'open' : arrays['QUOTE'], 'high' : arrays['HIGH'], 'low' : arrays['LOW'], 'close' : arrays['CLOSE'], 'volume' : arrays['VOLUME'] } )
+            times       = [ datetime.fromisoformat( value ) for value in time_text( arrays['TIME'] ) ]
+
+        df['datetime']  = [ int( value.timestamp() * 1000 ) for value in times ]       # LOCAL TIME , LIKE THE BROKER CANDLES
+        df['date']      = [ str( value )[:10] for value in times ]
+        return df.sort_values( by=['datetime'], ascending=False ).reset_index( drop=True )
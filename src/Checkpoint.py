@@ -0,0 +1,315 @@
+## ###################################################################################################################
+##  Program :   Checkpoint
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              checkpoint = Checkpoint( key=digest( run ), every=300 )          # seconds between checkpoints
+##              if checkpoint.Due() :
+##                  checkpoint.Save( strategies, account, position=bar_time, data=new_data )
+##              state = checkpoint.Load()                                       # None when there is none
+##              checkpoint.Restore( state, strategies, account )                # then skip the bars up to state['position']
+##  Notes   :   State of a simulation between two bars : DayTradeStrategy.Stocks / Batch , TradeAccount Trades / InPlay /
+##              Performance / Funds and every Indicators object under them. It is written as one compressed npz file :
+##              a versioned json header describing the state tree plus one raw array per numpy array in it ( candle
+##              buffers , batch rows ). Objects are rebuilt field by field and only for the classes in CLASSES - nothing
+##              is pickled and the file is read with allow_pickle=False , so it can be inspected and is safe to load
+##              Objects reached twice ( the watch list batch every Indicators shares ) come back shared , the caches a
+##              class lists in TRANSIENT are left out and come back empty
+## ###################################################################################################################
+import os
+import sys
+import json
+import time
+import inspect
+import importlib
+
+import numpy    as np
+import pandas   as pd
+
+from datetime       import datetime
+from collections    import deque
+
+from ResultCache    import code_version
+
+
+CHECKPOINT_FOLDER   = "../files/checkpoints/"
+CHECKPOINT_EVERY    = 300                           # SECONDS BETWEEN TWO CHECKPOINTS OF A RUN
+FORMAT              = "day_trade.checkpoint"
+VERSION             = 1
+CLASSES             = ( 'CandleBuffer.CandleBuffer', 'IndicatorStream.IndicatorStream', 'IndicatorBatch.IndicatorBatch',
+                        'Indicators.Indicators' )   # module.class OF THE OBJECTS A CHECKPOINT MAY HOLD
+STRATEGY_FIELDS     = ( 'StrategyName', 'Interval', 'Stocks', 'Batch', 'isORBBuild' )
+ACCOUNT_FIELDS      = ( 'Funds', 'Limit', 'LossLimit', 'DailyFunds', 'TargetGoal', 'Trades', 'InPlay', 'Performance' )
+
+
+
+class Encoder :
+    def __init__( self ) -> None :
+        """
+            State tree -> json-able nodes , numpy arrays and objects set aside
+        """
+        self.Arrays     = {}                        # name -> ndarray
+        self.Objects    = []                        # { class , state } in the order they were reached
+        self.Seen       = {}                        # id( object ) -> position in Objects
+
+
+
+    def Encode( self, value : object ) -> object :
+        """
+            json-able node of a value ( tagged dictionaries for what json has no type for )
+        """
+        if value is None or isinstance( value, ( bool, str ) ) :
+            return value
+        if isinstance( value, ( int, float ) ) and type( value ) in ( int, float ) :
+            return value
+        if isinstance( value, np.generic ) :
+            return { '__scalar__' : value.dtype.str, 'value' : value.item() }
+        if isinstance( value, np.ndarray ) :
+            if value.dtype.hasobject :
+                raise TypeError( "Checkpoint : object arrays are not supported" )
+            name                = f"a{len( self.Arrays )}"
+            self.Arrays[ name ] = value
+            return { '__array__' : name }
+        if isinstance( value, dict ) :
+            if all( isinstance( key, str ) and not key.startswith( '__' ) for key in value ) :
+                return { key : self.Encode( item ) for key, item in value.items() }
+            return { '__dict__' : [ [ self.Encode( key ), self.Encode( item ) ] for key, item in value.items() ] }
+        if isinstance( value, list ) :
+            return [ self.Encode( item ) for item in value ]
+        if isinstance( value, tuple ) and type( value ) is tuple :
+            return { '__tuple__' : [ self.Encode( item ) for item in value ] }
+        if isinstance( value, ( set, frozenset ) ) :
+            return { '__set__' : [ self.Encode( item ) for item in value ] }
+        if isinstance( value, deque ) :
+            return { '__deque__' : [ self.Encode( item ) for item in value ], 'maxlen' : value.maxlen }
+        if isinstance( value, pd.Timestamp ) :
+            return { '__timestamp__' : value.isoformat() }
+        if isinstance( value, datetime ) :
+            return { '__datetime__' : value.isoformat() }
+        if isinstance( value, np.dtype ) or ( isinstance( value, type ) and issubclass( value, np.generic ) ) :
+            return { '__dtype__' : np.dtype( value ).str, 'type' : isinstance( value, type ) }
+        if type( value ).__name__ == 'IndicatorSnapshot' :
+            return { '__snapshot__' : [ self.Encode( list( value.Names ) ), self.Encode( list( value.Values ) ) ] }
+
+        name = f"{type( value ).__module__}.{type( value ).__name__}"
+        if name not in CLASSES :
+            raise TypeError( f"Checkpoint : can not keep a {name}" )
+        if id( value ) not in self.Seen :
+            self.Seen[ id( value ) ] = len( self.Objects )
+            entry = { 'class' : name, 'state' : None }
+            self.Objects.append( entry )
+            transient      = getattr( type( value ), 'TRANSIENT', () )
+            entry['state'] = { key : self.Encode( item ) for key, item in vars( value ).items() if key not in transient }
+        return { '__object__' : self.Seen[ id( value ) ] }
+
+
+
+class Decoder :
+    def __init__( self, objects : list , arrays : dict ) -> None :
+        """
+            json nodes -> values , objects built once each ( empty first , so shared / circular references resolve )
+        """
+        self.Arrays     = arrays
+        self.Nodes      = objects
+        self.Objects    = []
+        for entry in objects :
+            if entry['class'] not in CLASSES :
+                raise TypeError( f"Checkpoint : can not rebuild a {entry['class']}" )
+            module, name = entry['class'].rsplit( '.', 1 )
+            cls          = getattr( importlib.import_module( module ), name )
+            self.Objects.append( cls.__new__( cls ) )
+        for entry, target in zip( objects, self.Objects ) :
+            target.__dict__.update( { key : {} for key in getattr( type( target ), 'TRANSIENT', () ) } )
+            target.__dict__.update( { key : self.Decode( item ) for key, item in entry['state'].items() } )
+
+
+
+    def Decode( self, node : object ) -> object :
+        """
+            Value of a json node written by Encoder.Encode
+        """
+        if isinstance( node, list ) :
+            return [ self.Decode( item ) for item in node ]
+        if not isinstance( node, dict ) :
+            return node
+        if '__scalar__' in node :
+            return np.dtype( node['__scalar__'] ).type( node['value'] )
+        if '__array__' in node :
+            return np.array( self.Arrays[ node['__array__'] ] )
+        if '__dict__' in node :
+            return { self.Decode( key ) : self.Decode( item ) for key, item in node['__dict__'] }
+        if '__tuple__' in node :
+            return tuple( self.Decode( item ) for item in node['__tuple__'] )
+        if '__set__' in node :
+            return set( self.Decode( item ) for item in node['__set__'] )
+        if '__deque__' in node :
+            return deque( ( self.Decode( item ) for item in node['__deque__'] ), maxlen=node['maxlen'] )
+        if '__timestamp__' in node :
+            return pd.Timestamp( node['__timestamp__'] )
+        if '__datetime__' in node :
+            return datetime.fromisoformat( node['__datetime__'] )
+        if '__dtype__' in node :
+            return np.dtype( node['__dtype__'] ).type if node['type'] else np.dtype( node['__dtype__'] )
+        if '__snapshot__' in node :
+            from IndicatorSnapshot import IndicatorSnapshot
+            return IndicatorSnapshot( *( self.Decode( item ) for item in node['__snapshot__'] ) )
+        if '__object__' in node :
+            return self.Objects[ node['__object__'] ]
+        return { key : self.Decode( item ) for key, item in node.items() }
+
+
+
+def write( file_name : str , root : object , meta : dict = None ) -> str :
+    """
+        Write a state tree to a checkpoint file ( a temporary file first , a reader never sees half a file )
+        ARGS   :
+                    file_name ( str )  - checkpoint file ( .npz )
+                    root      ( any )  - state tree ( dictionaries, lists, numpy arrays, CLASSES objects ...)
+                    meta      ( dict ) - json-able values kept in the header ( run key, position ...)
+        RETURNS:
+                    file_name
+    """
+    encoder = Encoder()
+    header  = { 'format' : FORMAT, 'version' : VERSION, 'created' : datetime.now().isoformat( timespec='seconds' ),
+                'code' : code_version(), 'meta' : meta or {} }
+    header['root']      = encoder.Encode( root )
+    header['objects']   = encoder.Objects
+    text    = np.frombuffer( json.dumps( header ).encode(), dtype=np.uint8 )
+
+    os.makedirs( os.path.dirname( os.path.abspath( file_name ) ), exist_ok=True )
+    with open( file_name + ".tmp", 'wb' ) as file :
+        np.savez_compressed( file, header=text, **encoder.Arrays )
+    os.replace( file_name + ".tmp", file_name )
+    return file_name
+
+
+
+def read( file_name : str ) -> dict :
+    """
+        State tree of a checkpoint file
+        RETURNS:
+                    { root, meta, created, code, version }
+    """
+    with np.load( file_name, allow_pickle=False ) as archive :
+        header  = json.loads( archive['header'].tobytes().decode() )
+        if header.get('format') != FORMAT :
+            raise ValueError( f"Checkpoint : {file_name} is not a checkpoint file" )
+        if header.get('version') != VERSION :
+            raise ValueError( f"Checkpoint : {file_name} is version {header.get('version')} , expected {VERSION}" )
+        arrays  = { name : archive[ name ] for name in archive.files if name != 'header' }
+
+    decoder = Decoder( header['objects'], arrays )
+    return { 'root' : decoder.Decode( header['root'] ), 'meta' : header['meta'], 'created' : header['created'],
+             'code' : header['code'], 'version' : header['version'] }
+
+
+
+class Checkpoint :
+    def __init__( self, key : str , folder : str = CHECKPOINT_FOLDER , every : float = CHECKPOINT_EVERY , kind : str = 'back_test' ) -> None :
+        """
+            INITIALIZE THE CHECKPOINT FILE OF A RUN
+            ARGS   :
+                        key    ( str )   - digest of what identifies the run ( strategy, params, data ...)
+                        folder ( str )   - where the checkpoints are kept
+                        every  ( float ) - seconds between two checkpoints ( 0 never saves on its own )
+                        kind   ( str )   - back_test ...
+            RETURNS:
+                        nothing
+        """
+        self.Key        = str( key )
+        self.Folder     = str( folder )
+        self.Every      = float( every or 0 )
+        self.Kind       = kind
+        self.Last       = time.monotonic()
+        self.Saves      = 0
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"Checkpoint : {self.FileName()}  every : {self.Every}s  saves : {self.Saves}"
+
+
+
+    def FileName( self ) -> str :
+        return os.path.join( self.Folder, f"{self.Kind}_{self.Key[:16]}.npz" )
+
+
+
+    def Due( self ) -> bool :
+        """
+            True once every seconds went by since the last checkpoint
+        """
+        return self.Every > 0 and time.monotonic() - self.Last >= self.Every
+
+
+
+    def Save( self, strategies : object , account : object , position : object , data : dict = None ) -> bool :
+        """
+            Checkpoint the simulation after the bar at position
+            ARGS   :
+                        strategies ( DayTradeStrategy ) - Stocks / Batch and the Indicators under them
+                        account    ( TradeAccount )     - Trades / InPlay / Performance / Funds
+                        position   ( str )              - time of the last bar applied
+                        data       ( dict )             - rows collected so far for summary_report
+            RETURNS:
+                        True when written
+        """
+        try:
+            root = { 'strategy' : { name : getattr( strategies, name ) for name in STRATEGY_FIELDS },
+                     'account'  : { name : getattr( account, name ) for name in ACCOUNT_FIELDS },
+                     'data'     : data or {} }
+            write( self.FileName(), root, meta={ 'key' : self.Key, 'kind' : self.Kind, 'position' : str( position ) } )
+            self.Saves += 1
+            return True
+        except:
+            print("\t\t|EXCEPTION: Checkpoint::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        finally:
+            self.Last = time.monotonic()
+        return False
+
+
+
+    def Load( self ) -> dict :
+        """
+            Last checkpoint of the run ( None when there is none or it is of another run / version )
+            RETURNS:
+                        { position, strategy, account, data , code }
+        """
+        try:
+            if not os.path.exists( self.FileName() ) :
+                return None
+            state = read( self.FileName() )
+            if state['meta'].get('key') != self.Key :
+                print( f"\t\t * {self.FileName()} is the checkpoint of another run" )
+                return None
+            return { **state['root'], 'position' : state['meta']['position'], 'code' : state['code'] }
+        except:
+            print("\t\t|EXCEPTION: Checkpoint::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        return None
+
+
+
+    def Restore( self, state : dict , strategies : object , account : object ) -> None :
+        """
+            Put a loaded checkpoint back on the strategy and the account ( Set() them first , the clock / connection stay )
+        """
+        for name, value in state['strategy'].items() :
+            setattr( strategies, name, value )
+        for name, value in state['account'].items() :
+            setattr( account, name, value )
+
+
+
+    def Remove( self ) -> None :
+        """
+            Drop the checkpoint of a run that completed
+        """
+        if os.path.exists( self.FileName() ) :
+            os.remove( self.FileName() )
@@ -0,0 +1,86 @@
+## ###################################################################################################################
+##  Program :   Clock
+##  Author  :
+##  Install :
+##  Example :
+##              clock = SimulatedClock( start='2025-08-15 09:30:00' )
+##              account = TradeAccount( funds=5000, limit=0.10, app_type='Paper', clock=clock )
+##              Strategies.Set( strategy='ema9', interval=5, account=account, clock=clock )
+##  Notes   :   Where DayTradeStrategy, TradeAccount and trade_center get the time from and how they wait.
+##              Clock is the wall clock of live sessions ; SimulatedClock is moved by the replay / back test ( Set ) and
+##              Sleep only moves it forward, so a simulated session runs the live code paths as fast as the CPU allows
+## ###################################################################################################################
+import time
+
+from datetime   import datetime, timedelta
+
+
+Date_Format     = "%Y-%m-%d %H:%M:%S"
+
+
+
+class Clock :
+    Simulated = False
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"Clock : wall  {self.Now()}"
+
+
+    def Now( self ) -> datetime :
+        return datetime.now()
+
+
+    def Sleep( self, seconds : float ) -> None :
+        time.sleep( max( 0, seconds ) )
+
+
+    def Set( self, when : datetime | str ) -> None :
+        """
+            The wall clock cannot be moved
+        """
+        return
+
+
+
+class SimulatedClock( Clock ) :
+    Simulated = True
+
+    def __init__( self, start : datetime | str = None ) -> None :
+        """
+            INITIALIZE THE SIMULATED TIME
+            ARGS   :
+                        start ( datetime / str ) - time the session starts at ( 'YYYY-MM-DD HH:MM:SS' , default now )
+            RETURNS:
+                        nothing
+        """
+        self.Current = datetime.now()
+        if start is not None :
+            self.Set( start )
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"Clock : simulated  {self.Current}"
+
+
+    def Now( self ) -> datetime :
+        return self.Current
+
+
+    def Sleep( self, seconds : float ) -> None :
+        """
+            Move the time forward instead of waiting
+        """
+        self.Current += timedelta( seconds= max( 0, seconds ) )
+
+
+    def Set( self, when : datetime | str ) -> None :
+        """
+            Move the time to a candle / step of the simulation
+        """
+        self.Current = when if isinstance( when, datetime ) else datetime.strptime( str( when )[:19], Date_Format )
@@ -0,0 +1,189 @@
+## ###################################################################################################################
+##  Program :   Daily Cache
+##  Author  :
+##  Install :   pip3 install pandas numpy
+##  Example :
+##              cache   = DailyCache()
+##              entry   = cache.Load( symbol='AAPL', as_of='2025-08-15', compact=True )       # None when not cached yet
+##              cache.Save( symbol='AAPL', as_of='2025-08-15', entry={'data': data, 'seed': seed_df, 'context': context}, compact=True )
+##  Notes   :   On disk cache of the daily context of a symbol ( daily bars , minute seed and the values derived from
+##              them in Indicators.Set ) keyed by symbol and as-of date - the history before a trading day does not
+##              change, so a restart / replay / extra strategy only reads a file instead of calling the broker again
+##              The compact mode and the volatility window change what is kept ( float32 frames , VolIndex ) , so they
+##              are part of the key. The entries read in the process stay in memory , the least recently used ones
+##              dropped past MEMORY_ENTRIES
+## ###################################################################################################################
+import os
+import sys
+import copy
+import pickle
+import inspect
+
+from collections import OrderedDict
+
+import numpy    as np
+import pandas   as pd
+
+
+DAILY_CACHE_FOLDER  = "../files/daily_cache/"
+MEMORY_ENTRIES      = 512                   # ENTRIES KEPT IN THE PROCESS ( a few hundred KB each )
+
+
+
+def compact_frame( df : pd.DataFrame ) -> pd.DataFrame :
+    """
+        Smallest copy of a bar frame : float32 prices / volumes , integer epoch timestamps and no text or datetime
+        columns ( 'date' / 'full_date' are derived from 'datetime' and cost far more than the prices )
+        ARGS   :
+                    df ( DataFrame ) - bars with open / high / low / close / volume / datetime columns
+        RETURNS:
+                    compacted DataFrame
+    """
+    if not isinstance( df, pd.DataFrame ) :
+        return df
+
+    columns = {}
+    for name in df.columns :
+        if name == 'datetime' :
+            columns[ name ] = df[ name ].astype( np.int64 )
+        elif pd.api.types.is_numeric_dtype( df[ name ] ) :
+            columns[ name ] = df[ name ].astype( np.float32 )
+    return pd.DataFrame( columns ).reset_index( drop=True )
+
+
+
+class DailyCache :
+    Memory      = OrderedDict()             # ( folder, symbol, as_of, compact, vol_window ) -> entry , shared by every instance in the process
+    Capacity    = MEMORY_ENTRIES            # LEAST RECENTLY USED ENTRIES DROPPED PAST IT
+
+    def __init__( self, folder : str = DAILY_CACHE_FOLDER ) -> None :
+        """
+            INITIALIZE THE CACHE FOLDER
+            ARGS   :
+                        folder ( str ) - where the cache files are kept
+            RETURNS:
+                        nothing
+        """
+        self.Folder = folder
+        self.Hits   = 0
+        self.Misses = 0
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"DailyCache : {self.Folder}  hits : {self.Hits}  misses : {self.Misses}"
+
+
+
+    def Nbytes( self, symbol : str = None ) -> int :
+        """
+            Memory held by the entries kept in the process ( of one symbol , or of all of them ) in bytes
+        """
+        total = 0
+        for ( folder, name, *variant ), entry in DailyCache.Memory.items() :
+            if folder != self.Folder or ( symbol is not None and name != symbol ) :
+                continue
+            for value in entry.values() :
+                total += int( value.memory_usage( deep=True ).sum() ) if isinstance( value, pd.DataFrame ) else sys.getsizeof( value )
+        return total
+
+
+
+    def Key( self, symbol : str , as_of : str , compact : bool = False , vol_window : int = None ) -> tuple :
+        """
+            Memory key of a symbol for a trading day in one mode
+        """
+        return ( self.Folder, symbol, str(as_of)[:10], bool( compact ), int( vol_window or 0 ) )
+
+
+
+    def FileName( self, symbol : str , as_of : str , compact : bool = False , vol_window : int = None ) -> str :
+        """
+            Cache file of a symbol for a trading day in one mode
+        """
+        variant = ( "_compact" if compact else "" ) + ( f"_vol{int( vol_window )}" if vol_window else "" )
+        return os.path.join( self.Folder, f"{symbol}_{str(as_of)[:10]}{variant}.pkl" )
+
+
+
+    def Remember( self, key : tuple , entry : dict ) -> None :
+        """
+            Keep an entry in the process , dropping the least recently used ones past Capacity
+        """
+        DailyCache.Memory[ key ] = entry
+        DailyCache.Memory.move_to_end( key )
+        while len( DailyCache.Memory ) > DailyCache.Capacity :
+            DailyCache.Memory.popitem( last=False )
+
+
+
+    def Load( self, symbol : str , as_of : str , compact : bool = False , vol_window : int = None ) -> dict :
+        """
+            Daily context of a symbol for a trading day
+            ARGS   :
+                        symbol     ( str )  - stock symbol
+                        as_of      ( str )  - trading day ( YYYY-MM-DD )
+                        compact    ( bool ) - the entry of the compact mode
+                        vol_window ( int )  - the entry of this volatility window ( None for the whole session )
+            RETURNS:
+                        copy of the cached entry ( dict ) or None when it is not cached
+        """
+        key         = self.Key( symbol, as_of, compact, vol_window )
+        file_name   = self.FileName( symbol, as_of, compact, vol_window )
+        entry       = None
+
+        try:
+            if key in DailyCache.Memory :
+                entry = DailyCache.Memory[ key ]
+                DailyCache.Memory.move_to_end( key )
+            elif os.path.exists( file_name ) :
+                with open( file_name, 'rb' ) as file :
+                    entry = pickle.load( file )
+                self.Remember( key, entry )
+        except:
+            print("\t\t|EXCEPTION: DailyCache::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+            entry = None
+
+        if entry is None :
+            self.Misses += 1
+            return None
+
+        self.Hits += 1
+        return copy.deepcopy( entry )                       # CALLERS ADD COLUMNS TO THE FRAMES , KEEP THE CACHED ONES CLEAN
+
+
+
+    def Save( self, symbol : str , as_of : str , entry : dict , compact : bool = False , vol_window : int = None ) -> bool :
+        """
+            Store the daily context of a symbol for a trading day
+            ARGS   :
+                        symbol     ( str )  - stock symbol
+                        as_of      ( str )  - trading day ( YYYY-MM-DD )
+                        entry      ( dict ) - { 'data' : daily bars, 'seed' : minute seed, 'context' : Indicators.Context() }
+                        compact    ( bool ) - the entry of the compact mode
+                        vol_window ( int )  - the entry of this volatility window ( None for the whole session )
+            RETURNS:
+                        bool of success True/False
+        """
+        success = False
+
+        try:
+            os.makedirs( self.Folder, exist_ok=True )
+            file_name = self.FileName( symbol, as_of, compact, vol_window )
+            with open( file_name + ".tmp", 'wb' ) as file :
+                pickle.dump( entry, file )
+            os.replace( file_name + ".tmp", file_name )                 # READERS NEVER SEE A HALF WRITTEN FILE
+
+            self.Remember( self.Key( symbol, as_of, compact, vol_window ), copy.deepcopy( entry ) )
+            success = True
+        except:
+            print("\t\t|EXCEPTION: DailyCache::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return success
@@ -24,11 +24,19 @@ import requests
 
 
 from datetime       import datetime
+from DailyCache     import DailyCache, compact_frame
+from BarResampler   import BarResampler
 from Indicators     import Indicators
+from IndicatorBatch import IndicatorBatch
 from TradeAccount   import TradeAccount
+from Clock          import Clock
+from Log            import logger
+from Checkpoint     import Checkpoint
+from ResultCache    import code_version
 
 
 Date_Format     = "%Y-%m-%d %H:%M:%S"
+TARGET_GOAL     = 0.025                 # PROFIT ( of the funds ) A SESSION STOPS BUYING AT ( see Set / TradeAccount.SetTargetGoal )
 
 class DayTradeStrategy:
     OpenRange  = { 'high': 0, 'low': 0 , 'vwap' : 0}
@@ -41,15 +49,31 @@ class DayTradeStrategy:
         """
             Initialize the variables for the Trading Account class 
         """
-        self.Strategies = {
-                                'basic'         :{ 'detail' : 'Basic Bitch of the group',                                               'method': self.DayTradeBasic},
-                                'ema9'          :{ 'detail' : 'Use the EMA 9 to decide to buy and sell',                                'method': self.DayTradeEMA9},
-                                'simple'        :{ 'detail' : 'Three candle rule with Chop Index consideration',                        'method': self.DayTradeSimple},
-                                'simple1'       :{ 'detail' : 'Three candle rule with Chop Index consideration - CODE COMPARISON',      'method': self.DayTradeSimple1},
-                                'opening_range' :{ 'detail' : 'Use first candle to provide range of interest',                          'method': self.OpeningRange} # still needs to be worked 
+        self.Strategies = {     # 'indicators' : WHAT THE STRATEGY READS ON EVERY CANDLE , THE REST ARE ONLY COMPUTED FOR Summary()
+                                'basic'         :{ 'detail' : 'Basic Bitch of the group',                                               'method': self.DayTradeBasic,
+                                                   'params' : self.BasicParams,
+                                                   'indicators' : [ 'RSI', 'VolIndex', 'dSMA', 'ChopIndex' ] },
+                                'ema9'          :{ 'detail' : 'Use the EMA 9 to decide to buy and sell',                                'method': self.DayTradeEMA9,
+                                                   'params' : self.EMA9Params,
+                                                   'indicators' : [ 'EMA9', 'ChopIndex', 'RSI', 'BB_Lower', 'BB_Upper' ] },
+                                'simple'        :{ 'detail' : 'Three candle rule with Chop Index consideration',                        'method': self.DayTradeSimple,
+                                                   'params' : self.SimpleParams,
+                                                   'indicators' : [ 'EMA9', 'ChopIndex', 'RSI', 'ADX', 'SMA', 'BB_Lower', 'BB_Upper',
+                                                                    'RangeHigh', 'RangeLow', 'RangeMean', 'RangeMedian' ] },
+                                'simple1'       :{ 'detail' : 'Three candle rule with Chop Index consideration - CODE COMPARISON',      'method': self.DayTradeSimple1,
+                                                   'params' : self.SimpleParams,
+                                                   'indicators' : [ 'ChopIndex', 'RSI', 'BB_Lower', 'BB_Upper' ] },
+                                'opening_range' :{ 'detail' : 'Use first candle to provide range of interest',                          'method': self.OpeningRange, # still needs to be worked 
+                                                   'indicators' : [] }
                           }
         self.Interval   = 1
         self.Stocks     = {}
+        self.Batch      = IndicatorBatch()        # INTRADAY INDICATORS OF THE WHOLE WATCH LIST ( symbols x bars )
+        self.Cache      = DailyCache()            # DAILY HISTORY + DERIVED VALUES PER SYMBOL / DAY ( see PrimeStockEntry )
+        self.Compact    = False                   # FLOAT32 CANDLES BOUNDED TO THE LONGEST LOOK BACK ( see Set / MemoryReport )
+        self.VolWindow  = None                    # LOG RETURNS IN THE INTRADAY VolIndex ( None : THE WHOLE SESSION , see Set )
+        self.Resampler  = BarResampler()          # 3/5/10/15/30 MIN BARS + INDICATORS BUILT LOCALLY FROM THE 1 MIN BARS ( see Resample )
+        self.Clock      = Clock()                 # WALL CLOCK LIVE , SimulatedClock IN REPLAYS / BACK TESTS ( see Set )
        
         self.StrategyName = ""
         
@@ -72,35 +96,47 @@ class DayTradeStrategy:
         return contents
 
 
-    def Set( self, strategy :str , interval : int , account : TradeAccount   )  -> bool :
+    def Set( self, strategy :str , interval : int , account : TradeAccount , compact : bool = False , clock : Clock = None ,
+                vol_window : int = None )  -> bool :
         """
             Do the overhead for the specific strategy
             ARGS    :
                         strategy  ( str )          - name fo the strategy
                         interval  ( int )          - time frame ( minutes )  to use for strategy
                         account   ( TradeAccount ) - trade account for  buy/sell 
+                        compact   ( bool )         - float32 candles bounded to the longest look back ( large watch lists )
+                        clock     ( Clock )        - time of the session ( default the wall clock )
+                        vol_window( int )          - log returns in the intraday volatility ( None for the whole session )
             RETURNS :
                         true/false ( bool )  - indication of success
         """
-        targetGoal  = 0.025  #  This needs to be tied to the strategy so it can change, this is not the right place for it 
+        targetGoal  = TARGET_GOAL  #  This needs to be tied to the strategy so it can change, this is not the right place for it 
 
         
         if not ( strategy in self.Strategies.keys() ):
-            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Strategy does not exist : ", strategy )
+            logger.error( "\t\t|EXCEPTION: DayTradeStrategy::{} - Strategy does not exist :  {}", inspect.currentframe().f_code.co_name, strategy )
             return False
         
         self.StrategyName   = strategy
         self.Interval       = interval
+        vol_window          = int( vol_window ) if vol_window else None
+        if ( compact != self.Compact or vol_window != self.VolWindow ) and len( self.Batch ) == 0 :        # NOTHING PRIMED YET - REBUILD THE SHARED STATE
+            self.Batch      = IndicatorBatch( capacity= 0, dtype= np.float32, vol_window= vol_window ) if compact else IndicatorBatch( vol_window= vol_window )
+            self.Resampler  = BarResampler( vol_window= vol_window )
+        self.Compact        = compact
+        self.VolWindow      = vol_window
+        self.Clock          = clock or Clock()
         account.SetTargetGoal( targetGoal  )
         
         return True
 
     
     def PrimeStockEntry( self, symbol : str, ticker_df : pd.DataFrame, ticker_row : list, current_time : datetime,
-                                 account : TradeAccount, closePos : int = 3, highPos : int = 6, volumePos : int = 5 ) -> dict :
+                                 account : TradeAccount, closePos : int = 3, highPos : int = 6, volumePos : int = 5 , context : dict = None ) -> dict :
         """
             Set the Stock object entry for a new stock symbol
             ARGS  :
+                    context ( dict ) daily values to start from instead of the history ( {} : the intraday candles alone )
             RETURNS :
                     dictionary of values for the self.Stock objec 
         """
@@ -111,20 +147,38 @@ class DayTradeStrategy:
         today_date      = str(current_time)[:10]
         stock_entry     = {}
         
+        required        = self.Strategies.get( self.StrategyName, {} ).get( 'indicators' )
+        
         try:
-            print( f"PrimeStockEntry :: {symbol} - DATA   , SET UP RULES FOR MONDAYS ON HISTORY")
-            data        = account.History ( symbol = symbol, time_range=time_range , today= current_time)           # GET HISTORICAL INFO FOR SYMBOL
-            print( "PrimeStockEntry :: SEED ")
-            seed_df     = account.History( symbol=symbol, time_range=1, period_type="day", time_period='minute')
-            #print(f"DATA : {data}")    
-            if not isinstance(seed_df, pd.DataFrame) or len(seed_df) == 0:
-                seed_df = data
-            #print(f"SEED : {seed_df}")    
-            seed_df['full_date'] = seed_df['datetime'].apply( lambda x: datetime.fromtimestamp(x/1000))                    
-            seed_df = seed_df[seed_df['full_date'] < f"{today_date} 10:00:00"]                
+            if context is None :
+                cached = self.Cache.Load( symbol=symbol, as_of=today_date, compact=self.Compact, vol_window=self.VolWindow )     # SAME DAY ALREADY PRIMED ( RESTART / REPLAY / COMPARE )
+            else:
+                cached = { 'data' : None, 'seed' : None, 'context' : context }
+            if cached is not None :
+                logger.debug( "PrimeStockEntry :: {} - DAILY CONTEXT FROM CACHE ", symbol)
+                data, seed_df   = cached['data'], cached['seed']
+                indicators      = Indicators ( symbol= symbol ,data= data, seed_df=seed_df, required= required, context= cached['context'], compact= self.Compact,
+                                              vol_window= self.VolWindow )
+            else:
+                logger.debug( "PrimeStockEntry :: {} - DATA   , SET UP RULES FOR MONDAYS ON HISTORY", symbol)
+                data        = account.History ( symbol = symbol, time_range=time_range , today= current_time)           # GET HISTORICAL INFO FOR SYMBOL
+                logger.debug( "PrimeStockEntry :: SEED ")
+                seed_df     = account.History( symbol=symbol, time_range=1, period_type="day", time_period='minute', today= current_time)
+                #print(f"DATA : {data}")    
+                if not isinstance(seed_df, pd.DataFrame) or len(seed_df) == 0:
+                    seed_df = data
+                #print(f"SEED : {seed_df}")    
+                seed_df['full_date'] = seed_df['datetime'].apply( lambda x: datetime.fromtimestamp(x/1000))                    
+                seed_df = seed_df[seed_df['full_date'] < f"{today_date} 10:00:00"]                
             
-            # Previous Day's High/Low            
-            indicators = Indicators ( symbol= symbol ,data= data, seed_df=seed_df )                 # CALCULATE THE INDICATORS 
+                # Previous Day's High/Low            
+                indicators = Indicators ( symbol= symbol ,data= data, seed_df=seed_df, required= required, compact= self.Compact, vol_window= self.VolWindow )       # CALCULATE THE INDICATORS 
+                session_open = not self.Clock.Simulated and str( self.Clock.Now() ) < f"{today_date} 16:00:00"   # THE LIVE DAY CAN STILL CHANGE
+                if isinstance( data, pd.DataFrame ) and len( data ) > 0 and not session_open :
+                    if self.Compact :
+                        data, seed_df = compact_frame( data ), compact_frame( seed_df )
+                    self.Cache.Save( symbol=symbol, as_of=today_date, entry={ 'data' : data, 'seed' : seed_df, 'context' : indicators.Context() },
+                                     compact=self.Compact, vol_window=self.VolWindow )
             stock_entry = {
                                     'Previous'      : [0,0,0,0,0,0,0,0,0,0],
                                     'Previous1'     : [0,0,0,0,0,0,0,0,0,0],
@@ -179,25 +233,26 @@ class DayTradeStrategy:
             if self.isORBBuild :
                 return
             
-            print("\t\t\t * Building ORB levels ")
+            logger.debug("\t\t\t * Building ORB levels ")
             if ( current_time.hour < 10  and current_time.minute < 59 ) :  # Pause until 10
                 time_to_sleep = ( 60 - current_time.minute ) *60 #(( 10 - current_time.hour) * 60 * 60) - ( 60 - current_time.minute ) 
-                print(f" Pausing for   { time_to_sleep}")
+                logger.debug(" Pausing for   {}", time_to_sleep)
                 if time_to_sleep > 0 :
-                    print ( f" From {current_time} -> 10am - sleep :{ time_to_sleep }   "+
-                                f"HOURS: {((current_time.hour - 10) * 60)}  MINUTE : {( 60 - current_time.minute )}")
+                    logger.opt( lazy=True ).debug( " From {} -> 10am - sleep :{}   HOURS: {}  MINUTE : {}",
+                                                   lambda : current_time, lambda : time_to_sleep, lambda : (current_time.hour - 10) * 60,
+                                                   lambda : 60 - current_time.minute )
                     if account.Mode.upper() == "TRADE" :# or account.Mode.upper() == "TEST" :
-                        time.sleep( time_to_sleep )
+                        self.Clock.Sleep( time_to_sleep )
             else:
-                print(f"No Need to pause  {current_time}")
+                logger.debug("No Need to pause  {}", current_time)
             
             today_date  = str(current_time)[:10]
             symbols     = [ symbols ] if isinstance( symbols, str) else symbols            
             for symbol in symbols:          
                 current_time    = datetime.strptime( f"{today_date} 10:00:00", date_format)
-                print( "SetORB :: TICKER DF ")
+                logger.debug( "SetORB :: TICKER DF ")
                 ticker_df       = account.History( symbol=symbol, time_range=1, today=current_time)
-                print( "SetORB :: TICKER ROW ")
+                logger.debug( "SetORB :: TICKER ROW ")
                 ticker_row      = account.QuoteByInterval ( symbols= symbol,  frequency= 60*30, endDate = current_time)
                 stock_entry     = self.PrimeStockEntry(  symbol, ticker_df, ticker_row, current_time ,
                                                      account , closePos = 3, highPos = 6, volumePos = 5 )
@@ -211,7 +266,7 @@ class DayTradeStrategy:
             for entry in sys.exc_info():
                 print("\t\t >>   " + str(entry) )
 
-        print (f"STOCKS : {self.Stocks}")
+        logger.debug ("STOCKS : {}", self.Stocks)
 
             
     def Run( self,  ticker_row : list, account : TradeAccount, configs : dict  ) -> (bool, str, int, TradeAccount) :
@@ -225,13 +280,214 @@ class DayTradeStrategy:
                     success : True/False
         """
         if not ( self.StrategyName in  self.Strategies.keys() ):
-            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Strategy does not exist : ", self.StrategyName )
+            logger.error( "\t\t|EXCEPTION: DayTradeStrategy::{} - Strategy does not exist :  {}", inspect.currentframe().f_code.co_name, self.StrategyName )
             return False 
         
         return self.Strategies[ self.StrategyName  ]['method'] ( ticker_row, account, configs  )
 
 
+
+    def UpdateIndicators( self, ticker_rows : list ) -> None :
+        """
+            Fold the current bar of every symbol in the watch list into the indicators with one vectorized pass,
+            the Indicators.Update() inside each strategy then only publishes the values already computed
+            ARGS  :
+                    ticker_rows ( list )  ticker rows of the bar ( one per symbol , same layout as Run() )
+            RETURNS:
+                    nothing
+        """
+        params  = self.BaseParams()
+        bar     = { 'symbols' : [], 'open' : [], 'high' : [], 'low' : [], 'close' : [], 'volume' : [], 'timestamp' : [] }
+
+        try:
+            for ticker_row in ticker_rows :
+                symbol = ticker_row[0]
+                if not ( symbol in self.Stocks ) or not ( 'Indicators' in self.Stocks[ symbol ] ) or symbol in bar['symbols'] :
+                    continue
+                if self.Stocks[ symbol ]['Indicators'].Batch is None :
+                    self.Stocks[ symbol ]['Indicators'].Attach( self.Batch )
+
+                bar['symbols'].append( symbol )
+                bar['open'].append( ticker_row[ params['openPos'] ] )
+                bar['high'].append( ticker_row[ params['highPos'] ] )
+                bar['low'].append( ticker_row[ params['lowPos'] ] )
+                bar['close'].append( ticker_row[ params['closePos'] ] )
+                bar['volume'].append( ticker_row[ params['volumePos'] ] )
+                bar['timestamp'].append( (datetime.strptime( ticker_row[ params['timePos'] ][:19], Date_Format) ).timestamp()  * 1000 )
+
+            if len( bar['symbols'] ) > 0 :
+                self.Batch.Update( **bar )
+        except:
+            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+
+            
+    def BackTest( self, bars : object , account : TradeAccount , configs : dict , checkpoint : Checkpoint = None ) -> dict :
+        """
+            Event loop of a back test : every bar goes through the watch list pass and each of its rows through Run()
+            ARGS  :
+                    bars       ( iterable )      ( bar_time, [ ticker rows ] ) in time order ( CandleMerge.Bars() )
+                    account    ( TradeAccount )  account in TEST mode
+                    configs    ( dictionary )    configurations ( resume : continue after the last checkpoint )
+                    checkpoint ( Checkpoint )    checkpoint of the run , saved between bars when due ( None for none )
+            RETURNS:
+                    { symbol : [ row dictionaries ] } for summary_report
+        """
+        msg         = ""
+        new_data    = {}
+        interval    = 900
+        thorHammer  = { }
+        position    = None
+
+        try:
+            if checkpoint is not None and configs.get('resume') :
+                state = checkpoint.Load()
+                if state is not None and state['code'] != code_version() :             # ANOTHER STRATEGY CODE , ITS STATE WOULD NOT CARRY ON
+                    logger.opt( lazy=True ).warning( "\t\t * The code changed since {} was taken , starting over", lambda : checkpoint.FileName() )
+                    state = None
+                if state is not None :
+                    checkpoint.Restore( state, self, account )
+                    new_data, position = state['data'], state['position']
+                    logger.opt( lazy=True ).info( "\t* Resuming after {} from {}", lambda : position, lambda : checkpoint.FileName() )
+
+            for bar_time, bar in bars :
+                if position is not None and str( bar_time ) <= position :             # ALREADY IN THE CHECKPOINT
+                    continue
+                self.Clock.Set( bar_time )                                          # A SIMULATED CLOCK FOLLOWS THE CANDLES
+                for ticker_row in bar :
+                    if not ( ticker_row[0] in self.Stocks ) :                       # FIRST CANDLE OF THE SYMBOL
+                        self.PrimeBackTest( ticker_row, account )
+                self.UpdateIndicators( [ ticker_row[ :7 ] for ticker_row in bar ] )   # ONE PASS FOR THE WATCH LIST
+                for ticker_row in bar :                                             # EACH BAR REACHES ITS OWN SYMBOL ONCE
+                    symbol = ticker_row[0]
+                    if not ( 'Indicators' in self.Stocks.get( symbol, {} ) ) :      # NOT PRIMED , EVERY ROW WOULD RAISE
+                        continue
+                    if not ( symbol in new_data ):
+                        new_data[  symbol ]       = []
+                        thorHammer [  symbol ]    = { 'high' : -1,'low':-1, 'close': -1,'volume': -1 }
+
+                    logger.debug("\t\t\t->DATA : {} ", ticker_row ) 
+                    """  figure if this is useful at all
+                    if ( row['open'] == row['low']) :
+                        print(f"\t\t\t******* Thor's Hammer : {  configs['stock'] } -> { row }")
+                        thorHammer [  configs['stock'] ]    = {'high' : float(row['high']),'low':float(row['low']), 'close': float(row['close']),'volume': float(row['volume']) }
+                    if ( row['low']  <   thorHammer [  configs['stock'] ].get( 'low', -1)):
+                         print(f"\t\t\t****** TRIGGERED -Less THan  {row['low']}  -> { thorHammer [  configs['stock'] ].get( 'low', -1)}" )
+                    """          
             
+                    #print( f"\t\t Data :  {ticker_row} ")
+                    success , msg , interval,account = self.Run(  ticker_row[ :7 ],  account, configs )   # THE STRATEGY APPENDS ITS EMA AT [7] , NOT AFTER MSG
+                
+                    new_data[symbol].append( {'stock':symbol,'datetime':f"{ticker_row[1]}",'low': float(ticker_row[2]),'quote':float(ticker_row[4]),
+                                                'high':float(ticker_row[6]),'close':float(ticker_row[3]),
+                                              'volume':float(ticker_row[5]), 'interval': interval/60 , 'msg': msg } )
+                    if msg.upper() == "BOUGHT" :
+                        logger.debug("\t\t\t In Play - should shift from 15 -> 5 min  : " )
+                    elif msg.upper() == "CLOSED" :
+                        logger.debug("\t\t\t OUT Play - should shift from 5 -> 15 min  : " )
+
+                if checkpoint is not None and checkpoint.Due() :                    # BETWEEN TWO BARS , THE STATE IS WHOLE
+                    checkpoint.Save( self, account, position=bar_time, data=new_data )
+
+            if checkpoint is not None :                                             # RAN TO THE END , NOTHING TO RESUME
+                checkpoint.Remove()
+        except:
+            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return new_data
+
+
+
+    def PrimeBackTest( self, ticker_row : list , account : TradeAccount ) -> bool :
+        """
+            Stock entry of a symbol a back test meets for the first time : the daily context from the account history
+            ( its CandleStore / the DailyCache ) , or the intraday candles alone when nothing is known before their first day
+            ARGS  :
+                    ticker_row ( list )          first ticker row of the symbol
+                    account    ( TradeAccount )  account in TEST mode
+            RETURNS :
+                    True when the symbol is primed
+        """
+        symbol  = ticker_row[0]
+        entry   = self.PrimeStockEntry( symbol, None, ticker_row, self.Clock.Now(), account )
+        if not ( 'Indicators' in entry ) :
+            logger.debug( "PrimeBackTest :: {} - NO HISTORY BEFORE {} , STARTING FROM THE CANDLES", symbol, ticker_row[1] )
+            entry = self.PrimeStockEntry( symbol, None, ticker_row, self.Clock.Now(), account, context={} )
+        if 'Indicators' in entry :
+            self.Stocks[ symbol ] = entry
+        return symbol in self.Stocks
+
+
+
+    def MemoryReport( self ) -> dict :
+        """
+            Memory held per symbol by the intraday indicators and the cached daily context
+            ARGS  :
+                    nothing
+            RETURNS:
+                    dictionary of symbol -> bytes plus 'total'
+        """
+        report = {}
+
+        try:
+            for symbol, entry in self.Stocks.items() :
+                if 'Indicators' in entry :
+                    report[ symbol ] = entry['Indicators'].Nbytes() + self.Cache.Nbytes( symbol )
+            report['total'] = sum( report.values() )
+
+            logger.opt( lazy=True ).info( "\t* Memory : {} symbols  {:.1f} MB  {:.1f} KB per symbol  ( compact : {} )",
+                                          lambda : len(report) - 1, lambda : report['total'] / 2 ** 20,
+                                          lambda : report['total'] / max(len(report) - 1, 1) / 2 ** 10, lambda : self.Compact )
+        except:
+            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return report
+
+
+
+    def Resample( self, ticker_rows : list , minutes : int ) -> dict :
+        """
+            Fold the 1 minute bar of every symbol into the local timeframes and hand back the bars of the
+            current time interval that closed with it - the indicators of every timeframe stay current, so switching
+            between time_interval and time_interval_bought costs no extra quote and no recalculation
+            ARGS  :
+                    ticker_rows ( list )  1 minute ticker rows of the watch list ( same layout as Run() )
+                    minutes     ( int )   time interval the strategy is running on
+            RETURNS:
+                    dictionary of symbol -> ticker row of the closed bar ( only the symbols whose bar closed , the
+                    newest when a gap closed the one before it on the same minute )
+        """
+        params  = self.BaseParams()
+        rows    = {}
+
+        try:
+            for ticker_row in ticker_rows :
+                symbol  = ticker_row[0]
+                closed  = self.Resampler.Add( symbol, open= ticker_row[ params['openPos'] ], high= ticker_row[ params['highPos'] ],
+                                              low= ticker_row[ params['lowPos'] ], close= ticker_row[ params['closePos'] ],
+                                              volume= ticker_row[ params['volumePos'] ],
+                                              timestamp= (datetime.strptime( ticker_row[ params['timePos'] ][:19], Date_Format) ).timestamp() * 1000 )
+                if not ( int( minutes ) in closed ) :
+                    continue
+
+                if symbol in self.Stocks and 'Indicators' in self.Stocks[ symbol ] :
+                    self.Stocks[ symbol ]['Indicators'].Follow( self.Resampler.Stream( symbol, minutes ) )
+                rows[ symbol ] = self.Resampler.Row( symbol, minutes )
+        except:
+            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+        return rows
+
+
+
     def ProfitTrailStop( self, stock : str, risk_percent : float) -> float :
         """
             Calculates the profit  at the previous price so can see how much of a loss dealing with now
@@ -303,15 +559,13 @@ class DayTradeStrategy:
                    "volume_threshold"       : 70000     # Safety net to consider when appropriate to enter a trade, but may not be necessary 
                 }
 
-    def DayTradeEMA9( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int,TradeAccount) :
+    def EMA9Params( self, configs : dict ) -> dict :
         """
-            Set the params for the DayTrade  version  , then call the function
+            Params of the EMA9 strategy for the configured interval ( shared by the event loop and BackTestEngine )
             ARGS  :
-                        ticker_row ( list ) information about the stock and current price and volume
-                        account    ( TradeAccount )  the trading account for BUYS and SELLS
                         configs    (  dict)    configurations 
             RETURNS:
-                        bool: True/False - in case something breaks or could not complete    
+                        params (dict) - BaseParams() with the values of the interval
         """
         matrix      = {     0  : { 'numOfLosses' : 1 , 'time_interval' : 900 , 'time_interval_bought' : 900 },
                             1  : { 'numOfLosses' : 2 , 'time_interval' : 60 , 'time_interval_bought' : 60 },
@@ -329,6 +583,7 @@ class DayTradeStrategy:
                 params[key]           =  matrix[ interval ][key]
             
             params['volume_threshold']      = configs['volume_threshold']
+            params.update( configs.get('params') or {} )            # OVERRIDES OF A PARAMETER SWEEP ( see ParamSweep )
         
             #print(f"\t *Strategy : Simple {configs['interval']} min ")
         except:
@@ -337,22 +592,17 @@ class DayTradeStrategy:
                 print("\t\t >>   " + str(entry) )
 
                 
-        return self.DayTradeEMA9Module ( ticker_row , account, params  )
+        return params
 
 
 
-
-
-
-    def DayTradeSimple ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int,TradeAccount) :
+    def SimpleParams( self, configs : dict ) -> dict :
         """
-            Set the params for the DayTrade 15 min  version  , then call the function
+            Params of the simple / simple1 strategies for the configured interval
             ARGS  :
-                        ticker_row ( list ) information about the stock and current price and volume
-                        account    ( TradeAccount )  the trading account for BUYS and SELLS
                         configs    (  dict)    configurations 
             RETURNS:
-                        bool: True/False - in case something breaks or could not complete    
+                        params (dict) - BaseParams() with the values of the interval
         """
         matrix      = {     0  : { 'numOfLosses' : 1 , 'time_interval' : 900 , 'time_interval_bought' : 900 },
                             1  : { 'numOfLosses' : 2 , 'time_interval' : 60 , 'time_interval_bought' : 60 },
@@ -370,6 +620,7 @@ class DayTradeStrategy:
                 params[key]           =  matrix[ interval ][key]
             
             params['volume_threshold']      = configs['volume_threshold']
+            params.update( configs.get('params') or {} )            # OVERRIDES OF A PARAMETER SWEEP ( see ParamSweep )
         
             #print(f"\t *Strategy : Simple {configs['interval']} min ")
         except:
@@ -378,51 +629,84 @@ class DayTradeStrategy:
                 print("\t\t >>   " + str(entry) )
 
                 
-        return self.DayTradeSimpleModule ( ticker_row , account, params  )
-
+        return params
 
 
 
-    def DayTradeSimple1 ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int, TradeAccount) :
+    def BasicParams( self, configs : dict ) -> dict :
         """
-            Set the params for the DayTrade 15 min  version  , then call the function
+            Params of the basic strategy for the configured interval
             ARGS  :
-                        ticker_row ( list ) information about the stock and current price and volume
-                        account    ( TradeAccount )  the trading account for BUYS and SELLS
                         configs    (  dict)    configurations 
             RETURNS:
-                        bool: True/False - in case something breaks or could not complete    
+                        params (dict) - BaseParams() with the values of the interval
         """
         matrix      = {     0  : { 'numOfLosses' : 1 , 'time_interval' : 900 , 'time_interval_bought' : 900 },
                             1  : { 'numOfLosses' : 2 , 'time_interval' : 60 , 'time_interval_bought' : 60 },
-                            3  : { 'numOfLosses' : 2 , 'time_interval' : 180 , 'time_interval_bought' : 180 },
                             5  : { 'numOfLosses' : 2 , 'time_interval' : 300 , 'time_interval_bought' : 300 },
                             10 : { 'numOfLosses' : 2 , 'time_interval' : 600 , 'time_interval_bought' : 600 , 'volume_change_avg_ratio' : 0.10 , 'crash_out_percent' :0.85},
                             15 : { 'numOfLosses' : 2 , 'time_interval' : 900 , 'time_interval_bought' : 900 , 'volume_change_avg_ratio' : 0.10 , 'crash_out_percent' :0.85},
                             16 : { 'numOfLosses' : 2 , 'time_interval' : 300 , 'time_interval_bought' : 60 }
                          }
         params      = self.BaseParams()
-        interval    = int( configs.get('interval',1) )
+        interval    =  int( configs.get('interval',1) )
 
-        try:
+        
+
+        try:        
             for key in matrix[ interval ].keys():
                 params[key]           =  matrix[ interval ][key]
             
             params['volume_threshold']      = configs['volume_threshold']
+            params.update( configs.get('params') or {} )            # OVERRIDES OF A PARAMETER SWEEP ( see ParamSweep )
         
-            #print(f"\t *Strategy : Simple {configs['interval']} min ")
+            #print("\t *Strategy : basic bitch 15 min ")
         except:
             print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
             for entry in sys.exc_info():
                 print("\t\t >>   " + str(entry) )
 
                 
-        return self.DayTradeSimpleModule1 ( ticker_row , account, params  )   
+        return params
 
 
 
+    def Params( self, strategy : str , configs : dict ) -> dict :
+        """
+            Params a strategy runs with for the configurations ( interval matrix and sweep overrides applied )
+            ARGS  :
+                        strategy   ( str )     name of the strategy
+                        configs    (  dict)    configurations 
+            RETURNS:
+                        params (dict)
+        """
+        resolve = self.Strategies.get( strategy, {} ).get( 'params' )
+        if resolve is not None :
+            return resolve( configs )
+        return { **self.BaseParams(), **( configs.get('params') or {} ) }
 
-    def DayTradeBasic ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str, int, TradeAccount) :
+
+
+    def DayTradeEMA9( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int,TradeAccount) :
+        """
+            Set the params for the DayTrade  version  , then call the function
+            ARGS  :
+                        ticker_row ( list ) information about the stock and current price and volume
+                        account    ( TradeAccount )  the trading account for BUYS and SELLS
+                        configs    (  dict)    configurations 
+            RETURNS:
+                        bool: True/False - in case something breaks or could not complete    
+        """
+        params      = self.EMA9Params( configs )
+
+        return self.DayTradeEMA9Module ( ticker_row , account, params  )
+
+
+
+
+
+
+    def DayTradeSimple ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int,TradeAccount) :
         """
             Set the params for the DayTrade 15 min  version  , then call the function
             ARGS  :
@@ -432,31 +716,42 @@ class DayTradeStrategy:
             RETURNS:
                         bool: True/False - in case something breaks or could not complete    
         """
-        matrix      = {     0  : { 'numOfLosses' : 1 , 'time_interval' : 900 , 'time_interval_bought' : 900 },
-                            1  : { 'numOfLosses' : 2 , 'time_interval' : 60 , 'time_interval_bought' : 60 },
-                            5  : { 'numOfLosses' : 2 , 'time_interval' : 300 , 'time_interval_bought' : 300 },
-                            10 : { 'numOfLosses' : 2 , 'time_interval' : 600 , 'time_interval_bought' : 600 , 'volume_change_avg_ratio' : 0.10 , 'crash_out_percent' :0.85},
-                            15 : { 'numOfLosses' : 2 , 'time_interval' : 900 , 'time_interval_bought' : 900 , 'volume_change_avg_ratio' : 0.10 , 'crash_out_percent' :0.85},
-                            16 : { 'numOfLosses' : 2 , 'time_interval' : 300 , 'time_interval_bought' : 60 }
-                         }
-        params      = self.BaseParams()
-        interval    =  int( configs.get('interval',1) )
+        params      = self.SimpleParams( configs )
 
-        
+        return self.DayTradeSimpleModule ( ticker_row , account, params  )
 
-        try:        
-            for key in matrix[ interval ].keys():
-                params[key]           =  matrix[ interval ][key]
-            
-            params['volume_threshold']      = configs['volume_threshold']
-        
-            #print("\t *Strategy : basic bitch 15 min ")
-        except:
-            print("\t\t|EXCEPTION: DayTradeStrategy::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
-            for entry in sys.exc_info():
-                print("\t\t >>   " + str(entry) )
 
-                
+
+
+    def DayTradeSimple1 ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str,int, TradeAccount) :
+        """
+            Set the params for the DayTrade 15 min  version  , then call the function
+            ARGS  :
+                        ticker_row ( list ) information about the stock and current price and volume
+                        account    ( TradeAccount )  the trading account for BUYS and SELLS
+                        configs    (  dict)    configurations 
+            RETURNS:
+                        bool: True/False - in case something breaks or could not complete    
+        """
+        params      = self.SimpleParams( configs )
+
+        return self.DayTradeSimpleModule1 ( ticker_row , account, params  )   
+
+
+
+
+    def DayTradeBasic ( self, ticker_row : list, account : TradeAccount , configs : dict ) -> (bool, str, int, TradeAccount) :
+        """
+            Set the params for the DayTrade 15 min  version  , then call the function
+            ARGS  :
+                        ticker_row ( list ) information about the stock and current price and volume
+                        account    ( TradeAccount )  the trading account for BUYS and SELLS
+                        configs    (  dict)    configurations 
+            RETURNS:
+                        bool: True/False - in case something breaks or could not complete    
+        """
+        params      = self.BasicParams( configs )
+
         return self.DayTradeBasicModule ( ticker_row , account, params  )
 
 
@@ -482,7 +777,7 @@ class DayTradeStrategy:
                 self.Stocks[ symbol ]['Price']['High'] = stockHigh
                 
             if stockClose > self.Stocks[ symbol ]['Price']['HighSinceBought'] :
-                print(f"RESETTING HighSinceBought: {self.Stocks[ symbol ]['Price']['HighSinceBought']} -> {stockClose}")
+                logger.debug("RESETTING HighSinceBought: {} -> {}", self.Stocks[symbol]['Price']['HighSinceBought'], stockClose)
                 self.Stocks[ symbol ]['Price']['HighSinceBought'] = stockClose
             
         except:
@@ -531,16 +826,16 @@ class DayTradeStrategy:
             ticker_row.append( self.Stocks[ symbol ]['Indicators'].EMA9 )  # ADX PLACE HOLDER
                 
             # NO BUYING AFTER 3:45
-            current_time    = datetime.now()
+            current_time    = self.Clock.Now()
             if not ( symbol in self.Stocks.keys() )  and ( current_time.hour == 15 and current_time.minute >= 45) :
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
                 return False, action, params["time_interval"]
 
             # ADD MECHANISM FOR DETERMINING THE AVG NUMBER OF MOVES BEFORE PIVOTING AND THE AVG $ MOVES  BEFORE PIVOTING
          
             # ADD STOCK ENTRY IF NOT INPLAY /  THIS SHOULD MAINLY BE DONE IN SETORB (), BUT INCASE SOME GET ADDED ALONG THE WAY             
             if not ( symbol in self.Stocks.keys() ) :
-                print("EMA9 - doing the PrimeEntry")
+                logger.debug("EMA9 - doing the PrimeEntry")
                 ticker_df       = account.History( symbol=ticker_row[0], time_range=1)   
                 self.Stocks[symbol] = self.PrimeStockEntry( symbol=ticker_row[0] , ticker_df=ticker_df,ticker_row=ticker_row , current_time=current_time,
                                                             account=account, closePos = closePos , highPos=highPos , volumePos=volumePos)
@@ -565,9 +860,11 @@ class DayTradeStrategy:
                     """
                     if ((( ticker_row[1][11:13] == '15' and ticker_row[1][14:16] < '45') or ( ticker_row[1][11:13] < '15' ) )  and   # DONT OPEN TRADES TOO LATE IN THE DAY
                                 account.Buy( stock=symbol , price=float(ticker_row[ closePos ])  ,
-                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ) ,
+                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ) ,
                                     volume = ticker_row[volumePos], volume_threshold = params['volume_threshold'], indicators=self.Stocks[symbol]['Indicators']) ):
-                        print(f"{symbol} - BOUGHT @ : UPWARD:{self.Stocks[ symbol]['Price']['Upward']} -> CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex}  RSI :  {self.Stocks[ symbol ]['Indicators'].RSI}   PRICE: {ticker_row[closePos]}")
+                        logger.info( "{} - BOUGHT @ : UPWARD:{} -> CHOP: {}  RSI :  {}   PRICE: {}",
+                                     symbol, self.Stocks[symbol]['Price']['Upward'], self.Stocks[symbol]['Indicators'].ChopIndex,
+                                     self.Stocks[symbol]['Indicators'].RSI, ticker_row[closePos] )
                         success     = True                                               
                         action      = "bought"
                         self.ResetStock( symbol =symbol , stockClose=ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )                    
@@ -579,21 +876,38 @@ class DayTradeStrategy:
                
             
             if action != 'bought' and self.Stocks[ symbol]['Price']['Bought'] > 0 :                                
-                print(f"INSIDE A POSITION:   BOUGHT:{self.Stocks[symbol]['Price']['Bought']} ->{ticker_row[closePos]} --> [PREVIOUS]{self.Stocks[symbol]['Previous'][closePos]} [PREVIOUS1]{self.Stocks[symbol]['Previous1'][closePos]} " +
-                      f"PROFIT : {( ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought']) }    CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex} " +
-                      f"RSI: {self.Stocks[ symbol ]['Indicators'].RSI}  " +
-                      f" BB :  {self.Stocks[ symbol ]['Indicators'].BB_Lower} -> {self.Stocks[ symbol ]['Indicators'].BB_Upper} " )#  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")               
+                logger.opt( lazy=True ).debug( "INSIDE A POSITION:   BOUGHT:{} ->{} --> [PREVIOUS]{} [PREVIOUS1]{} " +
+                                               "PROFIT : {}    CHOP: {} " +
+                                               "RSI: {}  " +
+                                               " BB :  {} -> {} ",
+                                               lambda : self.Stocks[symbol]['Price']['Bought'], lambda : ticker_row[closePos],
+                                               lambda : self.Stocks[symbol]['Previous'][closePos],
+                                               lambda : self.Stocks[symbol]['Previous1'][closePos],
+                                               lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                               lambda : self.Stocks[symbol]['Indicators'].ChopIndex, lambda : self.Stocks[symbol]['Indicators'].RSI,
+                                               lambda : self.Stocks[symbol]['Indicators'].BB_Lower,
+                                               lambda : self.Stocks[symbol]['Indicators'].BB_Upper )  #  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")
                 
                 
                 if (  ticker_row[closePos] < ticker_row[emaPos]   or ticker_row[closePos] <= (  self.Stocks[ symbol ]['Price' ]['Bought'] - 0.16) ) :
-                      print( f"TIME TO SELL PRICE: {ticker_row[closePos]} -> {(self.Stocks[symbol]['Previous'][closePos] - 0.16)} or {( self.Stocks[symbol]['Price']['Bought'] - 0.16 )  } or { (self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16)}  "+
-                             f" VOLUME: {ticker_row[volumePos]} -> { 0.80 * self.Stocks[symbol]['Previous'][volumePos] }  " +
-                              f"VOLATILTIY: {self.Stocks[ symbol ]['Indicators'].Summary()['VolIndex'] }  dSMA : {self.Stocks[ symbol ]['Indicators'].Summary()['dSMA']}  " +
-                             f" HARDCODE PRICE : { ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought'] } or {self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  } "+
-                             f" CHOP :{self.Stocks[ symbol ]['Indicators'].ChopIndex}  RSI:{self.Stocks[ symbol ]['Indicators'].RSI}  ")                      
+                      logger.opt( lazy=True ).debug( "TIME TO SELL PRICE: {} -> {} or {} or {}  " +
+                                                     " VOLUME: {} -> {}  " +
+                                                     "VOLATILTIY: {}  dSMA : {}  " +
+                                                     " HARDCODE PRICE : {} or {} " +
+                                                     " CHOP :{}  RSI:{}  ",
+                                                     lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16, lambda : ticker_row[volumePos],
+                                                     lambda : 0.8 * self.Stocks[symbol]['Previous'][volumePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['VolIndex'],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['dSMA'],
+                                                     lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                     lambda : self.Stocks[symbol]['Indicators'].RSI )
                       
                       if  account.Sell( stock=symbol, new_price=float(ticker_row[ closePos ]) ,
-                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ),
+                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ),
                                        ask_volume=float(ticker_row[ volumePos ] ), indicators=self.Stocks[symbol]['Indicators'] )  :
                          success        = True
                          action         = "closed"
@@ -605,7 +919,7 @@ class DayTradeStrategy:
 
                          for trade in account.Trades[symbol]:
                              #print(f"\t\t\t   Indicators [IN ] : {trade['indicators_in']}  [OUT] {trade['indicators_out']}  ")
-                             print(f"\t\t\t   TIME: {trade['bidTime']}  P&L: {trade['p_l']} ")
+                             logger.info("\t\t\t   TIME: {}  P&L: {} ", trade['bidTime'], trade['p_l'])
 
             #CLEAN UP
             """  MOVED TO THE TOP  
@@ -629,7 +943,7 @@ class DayTradeStrategy:
                 time_interval   =  params['time_interval_bought']  # DROP FROM 5 -> 1 or 3 inside of position 
             else:
                 if action =='closed' :
-                    print("Taking a breathe")
+                    logger.debug("Taking a breathe")
                #     time.sleep(params['time_interval'] ) # After closing a position , take a pause 
                     
                 time_interval   = params['time_interval']
@@ -682,14 +996,13 @@ class DayTradeStrategy:
 
             self.Stocks[ symbol ]['Indicators'].Update( entry = entry)
 
-            print(f"9 EMA : { self.Stocks[ symbol ]['Indicators'].EMA9} " )
+            logger.debug("9 EMA : {} ", self.Stocks[symbol]['Indicators'].EMA9 )
 
             # CURRENT PRICE RANGE  30 MIN - BEFORE INTEGRATING THE CURRENT ENTRY
-            time_frame = 20 #30
-            rangeHigh  = self.Stocks[ symbol ]['Indicators'].Data['high'].rolling(window=time_frame).max().dropna().max()
-            rangeLow   = self.Stocks[ symbol ]['Indicators'].Data['low'].rolling(window=time_frame).min().dropna().min()
-            rangeMean  = self.Stocks[ symbol ]['Indicators'].Data['close'].rolling(window=time_frame).mean().dropna().mean()
-            rangeMedian  = self.Stocks[ symbol ]['Indicators'].Data['close'].rolling(window=time_frame).median().dropna().median()
+            rangeHigh  = self.Stocks[ symbol ]['Indicators'].RangeHigh      # 20 CANDLE WINDOWS , KEPT BY THE INDICATOR STREAM
+            rangeLow   = self.Stocks[ symbol ]['Indicators'].RangeLow
+            rangeMean  = self.Stocks[ symbol ]['Indicators'].RangeMean
+            rangeMedian  = self.Stocks[ symbol ]['Indicators'].RangeMedian
             if (np.isnan( rangeLow ) or rangeLow == 0)  or ( np.isnan( rangeHigh ) or rangeHigh == 0):
                 rangeLow  = np.min( [self.Stocks[symbol]['Previous1'][lowPos],self.Stocks[symbol]['Previous2'][lowPos],self.Stocks[symbol]['Previous3'][lowPos],self.Stocks[symbol]['Previous4'][lowPos]] )
                 rangeHigh = np.max( [self.Stocks[symbol]['Previous1'][highPos],self.Stocks[symbol]['Previous2'][highPos],self.Stocks[symbol]['Previous3'][highPos],self.Stocks[symbol]['Previous4'][highPos]] )
@@ -697,36 +1010,40 @@ class DayTradeStrategy:
                 rangeMedian = np.median( [self.Stocks[symbol]['Previous1'][closePos],self.Stocks[symbol]['Previous2'][closePos],self.Stocks[symbol]['Previous3'][closePos],self.Stocks[symbol]['Previous4'][closePos]] )
             
             rangeBand  = rangeHigh - rangeLow
-            print( rangeHigh )
+            logger.debug( "{}", rangeHigh )
             if rangeBand <= 0.50 and ticker_row[closePos] < rangeHigh:
-                print(f"NARROW RANGING - Should not trade : LOW : { rangeLow} - HI: {rangeHigh} = {rangeHigh - rangeLow}   PRICE : {ticker_row[closePos]}    MEAN : {rangeMean}  MEDIAN: {rangeMedian} ")                
+                logger.opt( lazy=True ).debug( "NARROW RANGING - Should not trade : LOW : {} - HI: {} = {}   PRICE : {}    MEAN : {}  MEDIAN: {} ",
+                                               lambda : rangeLow, lambda : rangeHigh, lambda : rangeHigh - rangeLow, lambda : ticker_row[closePos],
+                                               lambda : rangeMean, lambda : rangeMedian )
             else:
-                print(f"WIDER RANGING OR PRICE OUTSIDE RANGE - CAN  trade : LOW : { rangeLow} - HI: {rangeHigh} = {rangeHigh - rangeLow}   PRICE : {ticker_row[closePos]}  MEAN : {rangeMean}   MEDIAN: {rangeMedian}")
+                logger.opt( lazy=True ).debug( "WIDER RANGING OR PRICE OUTSIDE RANGE - CAN  trade : LOW : {} - HI: {} = {}   PRICE : {}  MEAN : {}   MEDIAN: {}",
+                                               lambda : rangeLow, lambda : rangeHigh, lambda : rangeHigh - rangeLow, lambda : ticker_row[closePos],
+                                               lambda : rangeMean, lambda : rangeMedian )
             
             
             
-            if  self.Stocks[ symbol ]['Indicators'].ADX.shape[0] > 3 : 
-                ticker_row.append( self.Stocks[ symbol ]['Indicators'].ADX.iloc[ -1 ]['ADX']  ) # ticker_row[ len( ticker_row ) - 1] = self.Stocks[ symbol ]['Indicators'].ADX.iloc[ -1 ]['ADX']
+            if  self.Stocks[ symbol ]['Indicators'].Count > 3 : 
+                ticker_row.append( self.Stocks[ symbol ]['Indicators'].ADX  )
             else:
                 ticker_row.append( 0 )  # ADX PLACE HOLDER
             ticker_row.append( self.Stocks[ symbol ]['Indicators'].RSI )
             ticker_row.append( self.Stocks[ symbol ]['Indicators'].ChopIndex )
             ticker_row.append( self.Stocks[ symbol ]['Indicators'].SMA['SMA9'] )
             ticker_row.append( self.Stocks[ symbol ]['Indicators'].SMA['SMA21'] )
-            print(f"HighPos: {highPos}    AdxPos:{adxPos}       Ticker:  {ticker_row}" )
+            logger.debug("HighPos: {}    AdxPos:{}       Ticker:  {}", highPos, adxPos, ticker_row )
 
             
             # NO BUYING AFTER 3:45
-            current_time    = datetime.now()
+            current_time    = self.Clock.Now()
             if not ( symbol in self.Stocks.keys() )  and ( current_time.hour == 15 and current_time.minute >= 45) :
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
                 return False, action, params["time_interval"]
 
             # ADD MECHANISM FOR DETERMINING THE AVG NUMBER OF MOVES BEFORE PIVOTING AND THE AVG $ MOVES  BEFORE PIVOTING
          
             # ADD STOCK ENTRY IF NOT INPLAY /  THIS SHOULD MAINLY BE DONE IN SETORB (), BUT INCASE SOME GET ADDED ALONG THE WAY             
             if not ( symbol in self.Stocks.keys() ) :
-                print("SIMPLE - doing the PrimeEntry")
+                logger.debug("SIMPLE - doing the PrimeEntry")
                 ticker_df       = account.History( symbol=ticker_row[0], time_range=1)   
                 self.Stocks[symbol] = self.PrimeStockEntry( symbol=ticker_row[0] , ticker_df=ticker_df,ticker_row=ticker_row , current_time=current_time,
                                                             account=account, closePos = closePos , highPos=highPos , volumePos=volumePos)
@@ -762,10 +1079,15 @@ class DayTradeStrategy:
                         p += 1
                 pattern += f"{p},"
 
-            print(f"TRADING RANGE : LOW : { rangeLow} - HI: {rangeHigh} = {rangeHigh - rangeLow}   PRICE : {ticker_row[closePos]}    MEAN : {rangeMean}  MEDIAN: {rangeMedian}    AvgCandle:{candle_body_avg}  %:{candle_body_avg/(rangeHigh/rangeLow)}")              
-            print( f"PATTERN : {pattern} CANDLES : {candle_body5} , {candle_body4}, {candle_body3},{candle_body2} "+
-                   f"\n\tCANDLE vs WICK ->  {(ticker_row[highPos ]-ticker_row[closePos ])} < {.20*candle_body} -> { (ticker_row[highPos ]-ticker_row[closePos ]) < 0.20*candle_body} "+
-                   f"\n\tSMA -> {self.Stocks[ symbol ]['Indicators'].SMA} " )
+            logger.opt( lazy=True ).debug( "TRADING RANGE : LOW : {} - HI: {} = {}   PRICE : {}    MEAN : {}  MEDIAN: {}    AvgCandle:{}  %:{}",
+                                           lambda : rangeLow, lambda : rangeHigh, lambda : rangeHigh - rangeLow, lambda : ticker_row[closePos],
+                                           lambda : rangeMean, lambda : rangeMedian, lambda : candle_body_avg,
+                                           lambda : candle_body_avg / (rangeHigh / rangeLow) )
+            logger.opt( lazy=True ).debug( "PATTERN : {} CANDLES : {} , {}, {},{} \n\tCANDLE vs WICK ->  {} < {} -> {} \n\tSMA -> {} ",
+                                           lambda : pattern, lambda : candle_body5, lambda : candle_body4, lambda : candle_body3,
+                                           lambda : candle_body2, lambda : ticker_row[highPos] - ticker_row[closePos], lambda : 0.2 * candle_body,
+                                           lambda : ticker_row[highPos] - ticker_row[closePos] < 0.2 * candle_body,
+                                           lambda : self.Stocks[symbol]['Indicators'].SMA )
                     
 
             # IF RSI DROPS BY 17 POINTS TREND IS OVER 
@@ -823,7 +1145,7 @@ class DayTradeStrategy:
             peiCriteria             = ( (not is_dogee ) and # candle_body >= 0.75* candle_body1   ) and  # SEE IF THE CANDLE SIZE IS NECESSARY
                                         ( morning_rsi or afternoon_rsi )   and self.Stocks[ symbol ]['Indicators'].ChopIndex < 63  and ( morning_bollinger or afternoon_bollinger)  and
                                         (   
-                                            (  ticker_row[volumePos] >=  0.75 * self.Stocks[ symbol]['Previous'][volumePos] ) and  self.Stocks[ symbol ]['Indicators'].ADX.iloc[ -1 ]['ADX']  > 30 and 
+                                            (  ticker_row[volumePos] >=  0.75 * self.Stocks[ symbol]['Previous'][volumePos] ) and  self.Stocks[ symbol ]['Indicators'].ADX  > 30 and 
                                             (  self.Stocks[ symbol]['Previous'][volumePos] >=  0.75 * self.Stocks[ symbol]['Previous1'][volumePos] )
                                             
                                         ) and
@@ -868,41 +1190,54 @@ class DayTradeStrategy:
                                    ( ticker_row[closePos ] > self.Stocks[ symbol ]['Previous'][closePos]  > self.Stocks[ symbol ]['Previous1'][closePos] >self.Stocks[ symbol ]['Previous2'][closePos] ) )
                 """
                 #NOT ALLOWED TO GO IN ON A DOGEE - MAY NEED SPECIAL RULES FOR BIG IMPULSIVE MOVES
-                print(f"CANDLES : {  candle_body} >= 0.12  -> " +
-                          f"  {  candle_body1} >= 0.12  ->  {  candle_body2} >= 0.12  -> {  candle_body3} >= 0.12  -> " +
-                           f" CHOP :  {self.Stocks[ symbol ]['Indicators'].ChopIndex} RSI :  {self.Stocks[ symbol ]['Indicators'].RSI}  DOGEE: {is_dogee}  ")#ADX: {ticker_row[adxPos]}"
-                print(f"FLOATER: [DOGEE]{is_dogee}   UP WICK vs Candle:{ upward_pressure} < {candle_body}  CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex} < 70    RSI:( 82 > {self.Stocks[ symbol ]['Indicators'].RSI} >= 10 )  " +
-                      f"\n\t  CANDLES: {candle_body} >= {candle_body1}   and {candle_body1} >= {candle_body2} and  PRICE: [NEW] {ticker_row[closePos ]} >= {self.Stocks[ symbol ]['Previous'][closePos] } "+
-                      f"\n\tADX DIFF : { adxDiff }>= -3  "+
-                      f"\n\tCANDLE vs WICK ->  {(ticker_row[highPos ]-ticker_row[closePos ])} < {.20*candle_body} -> { (ticker_row[highPos ]-ticker_row[closePos ]) < 0.20*candle_body} ")
+                logger.debug( "CANDLES : {} >= 0.12  ->   {} >= 0.12  ->  {} >= 0.12  -> {} >= 0.12  ->  CHOP :  {} RSI :  {}  DOGEE: {}  ",
+                              candle_body, candle_body1, candle_body2, candle_body3, self.Stocks[symbol]['Indicators'].ChopIndex,
+                              self.Stocks[symbol]['Indicators'].RSI, is_dogee )  #ADX: {ticker_row[adxPos]}"
+                logger.opt( lazy=True ).debug( "FLOATER: [DOGEE]{}   UP WICK vs Candle:{} < {}  CHOP: {} < 70    RSI:( 82 > {} >= 10 )  " +
+                                               "\n\t  CANDLES: {} >= {}   and {} >= {} and  PRICE: [NEW] {} >= {} " +
+                                               "\n\tADX DIFF : {}>= -3  " +
+                                               "\n\tCANDLE vs WICK ->  {} < {} -> {} ",
+                                               lambda : is_dogee, lambda : upward_pressure, lambda : candle_body,
+                                               lambda : self.Stocks[symbol]['Indicators'].ChopIndex, lambda : self.Stocks[symbol]['Indicators'].RSI,
+                                               lambda : candle_body, lambda : candle_body1, lambda : candle_body1, lambda : candle_body2,
+                                               lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos], lambda : adxDiff,
+                                               lambda : ticker_row[highPos] - ticker_row[closePos], lambda : 0.2 * candle_body,
+                                               lambda : ticker_row[highPos] - ticker_row[closePos] < 0.2 * candle_body )
 
 
                 # WHEN PRICE IS OVER THE SMA8 OR SMA9 == GOOD , IF SMA8/9 ABOVE THE SMA20/21 == STRONG UPTREND  
                 if ticker_row[closePos] > self.Stocks[ symbol ]['Indicators'].SMA['SMA9'] > self.Stocks[ symbol ]['Indicators'].SMA['SMA21']:
-                    print(f"**** SMA says should be in UPTREND : {self.Stocks[ symbol ]['Indicators'].SMA['SMA9']} > {self.Stocks[ symbol ]['Indicators'].SMA['SMA21']}" )
+                    logger.debug( "**** SMA says should be in UPTREND : {} > {}",
+                                  self.Stocks[symbol]['Indicators'].SMA['SMA9'], self.Stocks[symbol]['Indicators'].SMA['SMA21'] )
                 elif (ticker_row[closePos] < self.Stocks[ symbol ]['Indicators'].SMA['SMA9']) or  ( self.Stocks[ symbol ]['Indicators'].SMA['SMA9']< self.Stocks[ symbol ]['Indicators'].SMA['SMA21']):
-                    print(f"**** SMA says should be in DOWNTREND : {self.Stocks[ symbol ]['Indicators'].SMA['SMA9']} > {self.Stocks[ symbol ]['Indicators'].SMA['SMA21']}" )
+                    logger.debug( "**** SMA says should be in DOWNTREND : {} > {}",
+                                  self.Stocks[symbol]['Indicators'].SMA['SMA9'], self.Stocks[symbol]['Indicators'].SMA['SMA21'] )
                 else: 
-                    print(f"****  SMA says CONSOLIDATION : {self.Stocks[ symbol ]['Indicators'].SMA['SMA9']} --> {self.Stocks[ symbol ]['Indicators'].SMA['SMA21']}" )
+                    logger.debug( "****  SMA says CONSOLIDATION : {} --> {}",
+                                  self.Stocks[symbol]['Indicators'].SMA['SMA9'], self.Stocks[symbol]['Indicators'].SMA['SMA21'] )
 
                 if  ( impulsiveCandles or floaterCandles or superImpulsiveCandles or 
                              peiCriteria or
                                   basicCriteria ) :
                     if basicCriteria:
                         if volume_increase  < params["volume_change_avg_ratio"] : # 85% starts to see good results, but dont want to be too strict or too loose 
-                            print( f"\t\t\t  *  BUY:: Volume increase isnt enough : {ticker_row[ volumePos ]}  from {self.Stocks[ symbol]['Volume']['Previous'] } ==> {volume_increase}    ***   RETURNING  ***" )
+                            logger.debug( "\t\t\t  *  BUY:: Volume increase isnt enough : {}  from {} ==> {}    ***   RETURNING  ***",
+                                          ticker_row[volumePos], self.Stocks[symbol]['Volume']['Previous'], volume_increase )
                             # THIS SHOULD BE A SUB FUNCTION
                             self.ResetStock( symbol =symbol ,stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )
                             return False, action, time_interval, account
             
                         if ( round(ticker_row[closePos], 2 ) <  round(ticker_row[openPos],2 )  and round(ticker_row[closePos],2) == round(ticker_row[highPos],2)) :  #  PRICE CLOSED LOWER THAN IT OPENED with upward pressure
-                            print( f"\t\t\t  *  BUY:: PRICE CLOSED LOWER THAN IT OPENED WITH NO UPWARD PRESSURE  : CLOSED={ round(ticker_row[ closePos ],5)}  " +
-                                           f"OPENED={ round(ticker_row[openPos], 5) }   LOW={ round(ticker_row[lowPos],5) }  HIGH={ round(ticker_row[highPos],5) }      ***   RETURNING  ***" )                    
+                            logger.opt( lazy=True ).debug( "\t\t\t  *  BUY:: PRICE CLOSED LOWER THAN IT OPENED WITH NO UPWARD PRESSURE  : CLOSED={}  " +
+                                                           "OPENED={}   LOW={}  HIGH={}      ***   RETURNING  ***",
+                                                           lambda : round(ticker_row[closePos], 5), lambda : round(ticker_row[openPos], 5),
+                                                           lambda : round(ticker_row[lowPos], 5), lambda : round(ticker_row[highPos], 5) )
                             self.ResetStock( symbol =symbol , stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )                    
                             return False, action, time_interval ,account           
                 
                         if self.Stocks[symbol]['Price']['Upward']  < params["bounce_up_min"] :  # TWO consecutive upward moves with appropriate volume 
-                            print( f"\t\t\t  *  BUY [TEST SIGNAL ]:: Consecutive upward moves with volumes : {self.Stocks[ symbol]['Price']['Upward']}     ***   RETURNING  ***" )
+                            logger.debug( "\t\t\t  *  BUY [TEST SIGNAL ]:: Consecutive upward moves with volumes : {}     ***   RETURNING  ***",
+                                          self.Stocks[symbol]['Price']['Upward'] )
                             self.ResetStock( symbol =symbol , stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )
                             return False, action, time_interval, account
                     reason = "UNKNOWN"
@@ -917,23 +1252,36 @@ class DayTradeStrategy:
                     elif basicCriteria :
                         reason = "BASIC" 
                         
-                    print( f"\t\t\t  BUY TRIGGERED - {reason} CRITERIA *  BUY:: Volume increase OKAY : {ticker_row[ volumePos ]} " +
-                           f"\n\t\t\t\t   FROM newPrice - previous = ${round( round(float(ticker_row[ closePos ]),5) -  round(float(self.Stocks[ symbol]['Price']['Previous']), 5) , 5) } " +
-                           f"\n\t\t\t\t   Volume :  from { round( self.Stocks[ symbol]['Volume']['Previous'] , 5)  } ==> { round(volume_increase, 5 ) } " +
-                           f"\n\t\t\t\t   PRESSURE :  upward : { round(upward_pressure,5)} ==>  downward :{ round(downward_pressure,5)} " +
-                           f"\n\t\t\t\t   OCCUR : {self.Stocks[symbol]['Price']['Upward'] }  -> {params['bounce_up_min'] } " +
-                           f"\n\t\t\t\t   BODY vs WICK : {round( (ticker_row[closePos] - ticker_row[openPos]) ,5 ) } --> { round( (ticker_row[highPos] - ticker_row[closePos]) , 5 )}  " +
-                           f"\n\t\t\t\t   PATTERN: {pattern}  RANGE: [BAND] {rangeBand} -> [MEAN]{rangeMean}->[MEDIAN]{rangeMedian}  AvgCandle:{candle_body_avg}  %:{candle_body_avg/(rangeHigh/rangeLow)}"+
-                           f"\n\t\t\t\t   ADX: {ticker_row[adxPos]}   ADX DIFF : { adxDiff}>= -4 " +
-                           f"\n\t\t\t\t   CANDLE vs WICK ->  {(ticker_row[highPos ]-ticker_row[closePos ])} < {.20*candle_body} -> { (ticker_row[highPos ]-ticker_row[closePos ]) < 0.20*candle_body} ")
+                    logger.opt( lazy=True ).debug( "\t\t\t  BUY TRIGGERED - {} CRITERIA *  BUY:: Volume increase OKAY : {} " +
+                                                   "\n\t\t\t\t   FROM newPrice - previous = ${} " +
+                                                   "\n\t\t\t\t   Volume :  from {} ==> {} " +
+                                                   "\n\t\t\t\t   PRESSURE :  upward : {} ==>  downward :{} " +
+                                                   "\n\t\t\t\t   OCCUR : {}  -> {} " +
+                                                   "\n\t\t\t\t   BODY vs WICK : {} --> {}  " +
+                                                   "\n\t\t\t\t   PATTERN: {}  RANGE: [BAND] {} -> [MEAN]{}->[MEDIAN]{}  AvgCandle:{}  %:{}" +
+                                                   "\n\t\t\t\t   ADX: {}   ADX DIFF : {}>= -4 " +
+                                                   "\n\t\t\t\t   CANDLE vs WICK ->  {} < {} -> {} ",
+                                                   lambda : reason, lambda : ticker_row[volumePos],
+                                                   lambda : round(round(float(ticker_row[closePos]), 5) - round(float(self.Stocks[symbol]['Price']['Previous']), 5), 5),
+                                                   lambda : round(self.Stocks[symbol]['Volume']['Previous'], 5), lambda : round(volume_increase, 5),
+                                                   lambda : round(upward_pressure, 5), lambda : round(downward_pressure, 5),
+                                                   lambda : self.Stocks[symbol]['Price']['Upward'], lambda : params['bounce_up_min'],
+                                                   lambda : round(ticker_row[closePos] - ticker_row[openPos], 5),
+                                                   lambda : round(ticker_row[highPos] - ticker_row[closePos], 5), lambda : pattern,
+                                                   lambda : rangeBand, lambda : rangeMean, lambda : rangeMedian, lambda : candle_body_avg,
+                                                   lambda : candle_body_avg / (rangeHigh / rangeLow), lambda : ticker_row[adxPos], lambda : adxDiff,
+                                                   lambda : ticker_row[highPos] - ticker_row[closePos], lambda : 0.2 * candle_body,
+                                                   lambda : ticker_row[highPos] - ticker_row[closePos] < 0.2 * candle_body )
                     
                     # 2025-10-21  Playing around to get best results 
                     if ( still_trading_time  and   # DONT OPEN TRADES TOO LATE IN THE DAY
                           (  (rangeBand <= 0.50 and ticker_row[closePos] >= rangeMean) or rangeBand > 0.50 )  ):
                             if ( account.Buy( stock=symbol , price=float(ticker_row[ closePos ])  ,
-                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ) ,
+                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ) ,
                                     volume = ticker_row[volumePos], volume_threshold = params['volume_threshold'], indicators=self.Stocks[symbol]['Indicators']) ) :
-                                print(f"{symbol} - BOUGHT @ : UPWARD:{self.Stocks[ symbol]['Price']['Upward']} -> CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex}  RSI :  {self.Stocks[ symbol ]['Indicators'].RSI}   PRICE: {ticker_row[closePos]} ADX: { self.Stocks[ symbol ]['Indicators'].ADX.iloc[ -1 ]['ADX']}")
+                                logger.info( "{} - BOUGHT @ : UPWARD:{} -> CHOP: {}  RSI :  {}   PRICE: {} ADX: {}",
+                                             symbol, self.Stocks[symbol]['Price']['Upward'], self.Stocks[symbol]['Indicators'].ChopIndex,
+                                             self.Stocks[symbol]['Indicators'].RSI, ticker_row[closePos], self.Stocks[symbol]['Indicators'].ADX )
                                 success     = True                                               
                                 action      = "bought"
                                 self.ResetStock( symbol =symbol , stockClose=ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )                    
@@ -943,7 +1291,8 @@ class DayTradeStrategy:
                                 self.Stocks[ symbol]['Price']['Upward']     =  0
                                 self.Stocks[ symbol]['AvgOccurrVol']        =  0
                     else:
-                        print(f"{symbol} - BUY NOT Triggered : PAST BUYING TIME : {still_trading_time }  or RangeBand : {rangeLow} -> {rangeHigh} = {rangeBand}  RangeMean: {rangeMean}  PRICE :{ticker_row[closePos]}")
+                        logger.debug( "{} - BUY NOT Triggered : PAST BUYING TIME : {}  or RangeBand : {} -> {} = {}  RangeMean: {}  PRICE :{}",
+                                      symbol, still_trading_time, rangeLow, rangeHigh, rangeBand, rangeMean, ticker_row[closePos] )
             
 
             rsiFlipSell         = ( self.Stocks[ symbol ]['Indicators'].RSI > 70  and candle_body < 0.30  and ticker_row[closePos] <= (self.Stocks[symbol]['Previous'][closePos] - 0.16) )
@@ -956,11 +1305,21 @@ class DayTradeStrategy:
             #CONSIDER SELLING   -  spike up in volume ( 2x)  and price 
             if  action != 'bought' and self.Stocks[ symbol]['Price']['Bought'] > 0:  # INSIDE OF A POSITION
                     
-                print(f"INSIDE A POSITION:   BOUGHT:{self.Stocks[symbol]['Price']['Bought']} ->{ticker_row[closePos]} --> [PREVIOUS]{self.Stocks[symbol]['Previous'][closePos]} [PREVIOUS1]{self.Stocks[symbol]['Previous1'][closePos]} " +
-                      f"PROFIT : {( ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought']) }    CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex} " +
-                      f"RSI: {self.Stocks[ symbol ]['Indicators'].RSI}   ADX: { self.Stocks[ symbol ]['Indicators'].ADX.iloc[ -1 ]['ADX']}" +
-                      f" BB :  {self.Stocks[ symbol ]['Indicators'].BB_Lower} -> {self.Stocks[ symbol ]['Indicators'].BB_Upper}   PRESSURE: UPPER:{pressureImbalanceSell} ==> {upward_pressure} -> {downward_pressure} " +
-                      f" HIGH SINCE BOUGHT: {self.Stocks[ symbol ]['Price']['HighSinceBought']} ->{((self.Stocks[ symbol ]['Price']['HighSinceBought'] - self.Stocks[symbol]['Price']['Bought']) /3 )}" )#  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")
+                logger.opt( lazy=True ).debug( "INSIDE A POSITION:   BOUGHT:{} ->{} --> [PREVIOUS]{} [PREVIOUS1]{} " +
+                                               "PROFIT : {}    CHOP: {} " +
+                                               "RSI: {}   ADX: {}" +
+                                               " BB :  {} -> {}   PRESSURE: UPPER:{} ==> {} -> {} " +
+                                               " HIGH SINCE BOUGHT: {} ->{}",
+                                               lambda : self.Stocks[symbol]['Price']['Bought'], lambda : ticker_row[closePos],
+                                               lambda : self.Stocks[symbol]['Previous'][closePos],
+                                               lambda : self.Stocks[symbol]['Previous1'][closePos],
+                                               lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                               lambda : self.Stocks[symbol]['Indicators'].ChopIndex, lambda : self.Stocks[symbol]['Indicators'].RSI,
+                                               lambda : self.Stocks[symbol]['Indicators'].ADX, lambda : self.Stocks[symbol]['Indicators'].BB_Lower,
+                                               lambda : self.Stocks[symbol]['Indicators'].BB_Upper, lambda : pressureImbalanceSell,
+                                               lambda : upward_pressure, lambda : downward_pressure,
+                                               lambda : self.Stocks[symbol]['Price']['HighSinceBought'],
+                                               lambda : (self.Stocks[symbol]['Price']['HighSinceBought'] - self.Stocks[symbol]['Price']['Bought']) / 3 )  #  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")
 
                 highSinceBoughtTrailStop = ((self.Stocks[ symbol ]['Price']['HighSinceBought'] - self.Stocks[symbol]['Price']['Bought']) /2 )
                 #(self.Stocks[ symbol ]['Price']['HighSinceBought'] - () #(self.Stocks[ symbol ]['Price']['HighSinceBought'] - 0.15) # (self.Stocks[ symbol ]['Price']['HighSinceBought'] - ((self.Stocks[ symbol ]['Price']['HighSinceBought'] - self.Stocks[symbol]['Price']['Bought']) /2 ))
@@ -982,7 +1341,9 @@ class DayTradeStrategy:
                               (  0.12 < (self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  )  )       ) :   #AS SOON AS PRICE DIPS -> SELL
                 """
                 if (ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos] ) > 0.16:
-                    print(f"POSSIBLE EXIT POINT : {ticker_row[closePos]} - {self.Stocks[symbol]['Previous'][closePos]} = {ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos]}")
+                    logger.opt( lazy=True ).debug( "POSSIBLE EXIT POINT : {} - {} = {}",
+                                                   lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos],
+                                                   lambda : ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos] )
                     
                 adxSell =  ( (ticker_row[adxPos] < 33) and  
                                ( (ticker_row[volumePos] < 0.70 * self.Stocks[symbol]['Previous'][volumePos] )  ) and # WAS 0.8
@@ -1009,43 +1370,85 @@ class DayTradeStrategy:
                           )
                      )   
                     ):   #AS SOON AS PRICE DIPS -> SELL
-                      print( f"TIME TO SELL PRICE: {ticker_row[closePos]} -> {(self.Stocks[symbol]['Previous'][closePos] - 0.16)} or {( self.Stocks[symbol]['Price']['Bought'] - 0.16 )  } or { (self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16)} or SLIDING  : {highSinceBoughtTrailStop} "+
-                             f" VOLUME: {ticker_row[volumePos]} -> { 0.80 * self.Stocks[symbol]['Previous'][volumePos] }  " +
-                              f"VOLATILTIY: {self.Stocks[ symbol ]['Indicators'].Summary()['VolIndex'] }  dSMA : {self.Stocks[ symbol ]['Indicators'].Summary()['dSMA']}  " +
-                             f" HARDCODE PRICE : { ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought'] } or {self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  } "+
-                             f" CHOP :{self.Stocks[ symbol ]['Indicators'].ChopIndex}  RSI:{self.Stocks[ symbol ]['Indicators'].RSI}  CANDLE BODY: {candle_body}  ")
+                      logger.opt( lazy=True ).debug( "TIME TO SELL PRICE: {} -> {} or {} or {} or SLIDING  : {} " +
+                                                     " VOLUME: {} -> {}  " +
+                                                     "VOLATILTIY: {}  dSMA : {}  " +
+                                                     " HARDCODE PRICE : {} or {} " +
+                                                     " CHOP :{}  RSI:{}  CANDLE BODY: {}  ",
+                                                     lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16,
+                                                     lambda : highSinceBoughtTrailStop, lambda : ticker_row[volumePos],
+                                                     lambda : 0.8 * self.Stocks[symbol]['Previous'][volumePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['VolIndex'],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['dSMA'],
+                                                     lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                     lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body )
                       
                       if  impulsiveCandles :
                           if impulsiveCandleSell:
-                              print (f"->SELL - IMPULSIVE CANDLE: RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}" )
+                              logger.opt( lazy=True ).debug( "->SELL - IMPULSIVE CANDLE: RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}",
+                                                             lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                             lambda : ticker_row[closePos],
+                                                             lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16 )
                       elif ((ticker_row[highPos ]-ticker_row[closePos ]) > .20*candle_body  ) and ticker_row[closePos] <= (self.Stocks[symbol]['Previous'][closePos] - 0.16):
-                          print (f"->SELL - WICK TO BODY - IMPULSIVE CANDLE: {impulsiveCandles} Candle-Wick: {ticker_row[highPos ]-ticker_row[closePos ]} > {.20*candle_body }==>{((ticker_row[highPos ]-ticker_row[closePos ]) > .20*candle_body  )}  "+
-                                 f"RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}" )
+                          logger.opt( lazy=True ).debug( "->SELL - WICK TO BODY - IMPULSIVE CANDLE: {} Candle-Wick: {} > {}==>{}  " +
+                                                         "RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}",
+                                                         lambda : impulsiveCandles, lambda : ticker_row[highPos] - ticker_row[closePos],
+                                                         lambda : 0.2 * candle_body,
+                                                         lambda : ticker_row[highPos] - ticker_row[closePos] > 0.2 * candle_body,
+                                                         lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16 )
                       elif (ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos] ) > 0.16 :
-                          print (f"->SELL - HARD CODE: {(ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos] )} > 0.16 -> {self.Stocks[ symbol ]['Indicators'].ChopIndex} > 70  RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}" )
+                          logger.opt( lazy=True ).debug( "->SELL - HARD CODE: {} > 0.16 -> {} > 70  RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}",
+                                                         lambda : ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos],
+                                                         lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                         lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16 )
                       elif self.Stocks[ symbol ]['Indicators'].ChopIndex > 70 :
-                          print (f"->SELL - CHOP INDEX:  {self.Stocks[ symbol ]['Indicators'].ChopIndex} > 70  RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}" )
+                          logger.opt( lazy=True ).debug( "->SELL - CHOP INDEX:  {} > 70  RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}",
+                                                         lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                         lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16 )
                       elif rsiFlipSell:
-                          print (f"->SELL - RSI FLIP CANDLE;  RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}" )
+                          logger.opt( lazy=True ).debug( "->SELL - RSI FLIP CANDLE;  RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}",
+                                                         lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16 )
                       elif pressureImbalanceSell:
-                          print (f"->SELL - PressureImbalance :  RSI : {self.Stocks[ symbol ]['Indicators'].RSI} > 80  and CANDLE : {candle_body} > 0.30  and CLOSE: {ticker_row[closePos]} <= {(self.Stocks[symbol]['Previous'][closePos] - 0.16)}  PRESSURE: {pressureImbalanceSell} ==> {upward_pressure} -> {downward_pressure}" )
+                          logger.opt( lazy=True ).debug( "->SELL - PressureImbalance :  RSI : {} > 80  and CANDLE : {} > 0.30  and CLOSE: {} <= {}  PRESSURE: {} ==> {} -> {}",
+                                                         lambda : self.Stocks[symbol]['Indicators'].RSI, lambda : candle_body,
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16,
+                                                         lambda : pressureImbalanceSell, lambda : upward_pressure, lambda : downward_pressure )
                       elif trailStopSell:
-                          print(f"->SELL - TRAIL STOP : CLOSE : {ticker_row[closePos]} <  {( self.Stocks[symbol]['Price']['Bought'] - 0.16 )}  CANDLE BODY : {candle_body} < 0.30 ") # and candle less than impulsive 
+                          logger.opt( lazy=True ).debug( "->SELL - TRAIL STOP : CLOSE : {} <  {}  CANDLE BODY : {} < 0.30 ",
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Price']['Bought'] - 0.16,
+                                                         lambda : candle_body ) # and candle less than impulsive
                       elif adxSell:
-                          print(f"->SELL - ADX <35 : CLOSE : {ticker_row[closePos]} <  {( self.Stocks[symbol]['Price']['Bought'] - 0.16 )}   ADX : { ticker_row[adxPos]} ")
+                          logger.opt( lazy=True ).debug( "->SELL - ADX <35 : CLOSE : {} <  {}   ADX : {} ",
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Price']['Bought'] - 0.16,
+                                                         lambda : ticker_row[adxPos] )
                       elif (ticker_row[volumePos] < 0.80 * self.Stocks[symbol]['Previous'][volumePos] ) and (self.Stocks[symbol]['Previous'][volumePos] < self.Stocks[symbol]['Previous1'][volumePos] ) :
-                          print(f"->SELL - VOLUME DROP : CLOSE : {ticker_row[volumePos]} <  { 0.80 * self.Stocks[symbol]['Previous'][volumePos]}   ADX : { ticker_row[adxPos]} ")
+                          logger.opt( lazy=True ).debug( "->SELL - VOLUME DROP : CLOSE : {} <  {}   ADX : {} ",
+                                                         lambda : ticker_row[volumePos], lambda : 0.8 * self.Stocks[symbol]['Previous'][volumePos],
+                                                         lambda : ticker_row[adxPos] )
                       elif  ( ( ticker_row[closePos] < self.Stocks[symbol]['Previous'][closePos] )  and ( self.Stocks[symbol]['Previous1'][closePos] < self.Stocks[symbol]['Previous1'][closePos] )  ):
-                          print(f"->SELL - PRICE DROP: CLOSE : {ticker_row[closePos]} < {self.Stocks[symbol]['Previous'][closePos]} ->  { self.Stocks[symbol]['Previous1'][closePos]} < {self.Stocks[symbol]['Previous1'][closePos]} ")
+                          logger.debug( "->SELL - PRICE DROP: CLOSE : {} < {} ->  {} < {} ",
+                                        ticker_row[closePos], self.Stocks[symbol]['Previous'][closePos], self.Stocks[symbol]['Previous1'][closePos],
+                                        self.Stocks[symbol]['Previous1'][closePos] )
                       elif  highSinceBoughtTrailStop :
-                          print(f"->SELL - BELOW HIGH-SINCE-BOUGHT: CLOSE : {ticker_row[closePos]}  HIGH/BOUGHT {self.Stocks[ symbol ]['Price']['HighSinceBought']} ->  {highSinceBoughtTrailStop} ")
+                          logger.debug( "->SELL - BELOW HIGH-SINCE-BOUGHT: CLOSE : {}  HIGH/BOUGHT {} ->  {} ",
+                                        ticker_row[closePos], self.Stocks[symbol]['Price']['HighSinceBought'], highSinceBoughtTrailStop )
                       elif  (  0.12 < (self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  )  )  :
-                          print(f"->SELL - BELOW  BOUGHT: CLOSE : {ticker_row[closePos]} BOUGHT {self.Stocks[symbol]['Price']['Bought']} ->  {(self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  )} ")
+                          logger.opt( lazy=True ).debug( "->SELL - BELOW  BOUGHT: CLOSE : {} BOUGHT {} ->  {} ",
+                                                         lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Price']['Bought'],
+                                                         lambda : self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos] )
                       
 
                       
                       if  account.Sell( stock=symbol, new_price=float(ticker_row[ closePos ]) ,
-                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ),
+                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ),
                                        ask_volume=float(ticker_row[ volumePos ] ), indicators=self.Stocks[symbol]['Indicators'] )  :
                          success        = True
                          action         = "closed"
@@ -1060,7 +1463,7 @@ class DayTradeStrategy:
 
                          for trade in account.Trades[symbol]:
                              #print(f"\t\t\t   Indicators [IN ] : {trade['indicators_in']}  [OUT] {trade['indicators_out']}  ")
-                             print(f"\t\t\t   TIME: {trade['bidTime']}  P&L: {trade['p_l']} ")
+                             logger.info("\t\t\t   TIME: {}  P&L: {} ", trade['bidTime'], trade['p_l'])
 
             #CLEAN UP            
             # UPDATE THE STOCK INFO WITH THE CURRENT PRICE / VOLUME
@@ -1076,7 +1479,7 @@ class DayTradeStrategy:
                 time_interval   =  params['time_interval_bought']  # DROP FROM 5 -> 1 or 3 inside of position 
             else:
                 if action =='closed' :
-                    print(f"Taking a breathe   LOSSES : {self.Stocks[ symbol ]['Losses']}")
+                    logger.debug("Taking a breathe   LOSSES : {}", self.Stocks[symbol]['Losses'])
                     self.Stocks[ symbol ]['Price']['HighSinceBought'] = 0
                #     time.sleep(params['time_interval'] ) # After closing a position , take a pause 
                     
@@ -1123,16 +1526,16 @@ class DayTradeStrategy:
 
         try:            
             # NO BUYING AFTER 3:45
-            current_time    = datetime.now()
+            current_time    = self.Clock.Now()
             if not ( symbol in self.Stocks.keys() )  and ( current_time.hour == 15 and current_time.minute >= 45) :
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
                 return False, action, params["time_interval"],account
 
             # ADD MECHANISM FOR DETERMINING THE AVG NUMBER OF MOVES BEFORE PIVOTING AND THE AVG $ MOVES  BEFORE PIVOTING
          
             # ADD STOCK ENTRY IF NOT INPLAY /  THIS SHOULD MAINLY BE DONE IN SETORB (), BUT INCASE SOME GET ADDED ALONG THE WAY             
             if not ( symbol in self.Stocks.keys() ) :
-                print("SIMPLE - doing the PrimeEntry")
+                logger.debug("SIMPLE - doing the PrimeEntry")
                 ticker_df       = account.History( symbol=ticker_row[0], time_range=1)   
                 self.Stocks[symbol] = self.PrimeStockEntry( symbol=ticker_row[0] , ticker_df=ticker_df,ticker_row=ticker_row , current_time=current_time,
                                                             account=account, closePos = closePos , highPos=highPos , volumePos=volumePos)
@@ -1146,19 +1549,24 @@ class DayTradeStrategy:
                 if ( (round(ticker_row[closePos],2) < round(self.Stocks[symbol]['Previous'][closePos] - 0.10,2)  and self.Stocks[ symbol]['Price']['Upward'] > 0) or ( self.Stocks[ symbol]['Price']['Upward'] >= 5) ):
                     self.Stocks[ symbol]['Price']['Upward']     = 1
                     self.Stocks[ symbol]['AvgOccurrVol']        = ticker_row[volumePos]
-                    print(f"\t\t\t\t\t{symbol} - PRICE DIPPED - RESET SOLDIERS :: {ticker_row[closePos]} -> { self.Stocks[symbol]['Previous'][closePos] - 0.10 } OR {self.Stocks[ symbol]['Price']['Upward']}")                  
+                    logger.opt( lazy=True ).debug( "\t\t\t\t\t{} - PRICE DIPPED - RESET SOLDIERS :: {} -> {} OR {}",
+                                                   lambda : symbol, lambda : ticker_row[closePos],
+                                                   lambda : self.Stocks[symbol]['Previous'][closePos] - 0.1,
+                                                   lambda : self.Stocks[symbol]['Price']['Upward'] )
                 elif round(ticker_row[closePos],2) >= round(self.Stocks[symbol]['Previous'][closePos] - 0.5,2)  or candle_is_big_enough: #only look at $0.20+ candles
                     self.Stocks[ symbol]['Price']['Upward']  += 1
                     self.Stocks[ symbol]['AvgOccurrVol']     += ticker_row[volumePos]
                     if  self.Stocks[ symbol]['Price']['Upward']  == 1 :
-                        print(f"\t\t\t\t\t{symbol} - SIMPLE : FIRST SOLDIER ")                        
+                        logger.debug("\t\t\t\t\t{} - SIMPLE : FIRST SOLDIER ", symbol)                        
 
                     #OBSOLETE     
                     if self.Stocks[ symbol]['Price']['Upward']  == 2 : #RESHIFT THE SIGNAL CANDLE 
                         if (round(ticker_row[closePos],2) < round(self.Stocks[symbol]['Previous'][highPos] - 0.10,2) ) and (not candle_is_big_enough or is_dogee):
                             self.Stocks[ symbol]['Price']['Upward']  -= 1
                             self.Stocks[ symbol]['AvgOccurrVol'] -= ( self.Stocks[ symbol]['AvgOccurrVol'] - ticker_row[volumePos] )
-                            print(f"\t\t\t\t\t{symbol} - DAYTRADESIMPLE::Second Soldier Failed  Candle Body : { candle_body} == {ticker_row[closePos] - ticker_row[openPos]}  {candle_is_big_enough}")
+                            logger.opt( lazy=True ).debug( "\t\t\t\t\t{} - DAYTRADESIMPLE::Second Soldier Failed  Candle Body : {} == {}  {}",
+                                                           lambda : symbol, lambda : candle_body,
+                                                           lambda : ticker_row[closePos] - ticker_row[openPos], lambda : candle_is_big_enough )
                         #else:
                         #    print(f"{symbol} - DAYTRADESIMPLE::Second Soldier  ")
                         
@@ -1170,26 +1578,42 @@ class DayTradeStrategy:
                                       #   ticker_row[volumePos]   <  (0.75* self.Stocks[symbol]['Previous'][volumePos] )  ) :
                             self.Stocks[ symbol]['Price']['Upward']     = 1
                             self.Stocks[ symbol]['AvgOccurrVol']        = ticker_row[volumePos]
-                            print(f"{symbol} - DAYTRADESIMPLE::San Pei failed  CANDLE BODY : {candle_body} -> {0.5*( previous_candle_body ) } Candle Is BIG :{candle_is_big_enough} "+
-                                  f"CANDLE WICK : {ticker_row[closePos]}   <  {0.99 *self.Stocks[symbol]['Previous'][highPos]}   VOLUME: {ticker_row[volumePos]} -> {0.75*( self.Stocks[symbol]['Previous'][volumePos] ) }" +
-                                  f" CHOP :  {self.Stocks[ symbol ]['Indicators'].ChopIndex} RSI :  {self.Stocks[ symbol ]['Indicators'].RSI} ")
+                            logger.opt( lazy=True ).debug( "{} - DAYTRADESIMPLE::San Pei failed  CANDLE BODY : {} -> {} Candle Is BIG :{} " +
+                                                           "CANDLE WICK : {}   <  {}   VOLUME: {} -> {}" +
+                                                           " CHOP :  {} RSI :  {} ",
+                                                           lambda : symbol, lambda : candle_body, lambda : 0.5 * previous_candle_body,
+                                                           lambda : candle_is_big_enough, lambda : ticker_row[closePos],
+                                                           lambda : 0.99 * self.Stocks[symbol]['Previous'][highPos], lambda : ticker_row[volumePos],
+                                                           lambda : 0.75 * self.Stocks[symbol]['Previous'][volumePos],
+                                                           lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                           lambda : self.Stocks[symbol]['Indicators'].RSI )
                         #else:
                         #    print(f"{symbol} - DAYTRADESIMPLE::San Pei  ")
                     
-                    print( f"{symbol} - INDICATOR : CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex}   RSI: {self.Stocks[ symbol ]['Indicators'].RSI} ")
+                    logger.debug( "{} - INDICATOR : CHOP: {}   RSI: {} ",
+                                  symbol, self.Stocks[symbol]['Indicators'].ChopIndex, self.Stocks[symbol]['Indicators'].RSI )
 
                     #CAN GO IN ON  A DOGEE 
                     if ( self.Stocks[ symbol]['Price']['Upward']  > 3  and
                              self.Stocks[ symbol ]['Indicators'].ChopIndex < 60   and
                                  (( 70 > self.Stocks[ symbol ]['Indicators'].RSI >= 10 ) or candle_body > 0.40 ) and
                                      ( ticker_row[volumePos] > (0.60 * self.Stocks[symbol]['Previous'][volumePos])   )  ) : #0.9*(self.Stocks[ symbol]['AvgOccurrVol']/(self.Stocks[ symbol]['Price']['Upward'] - 1)) ): # SAN PEI AND CHOPINDEX < 60 and volume 
-                        print(f"\t\t\t\t\t{symbol} - It took {self.Stocks[ symbol]['Price']['Upward']} soldiers  with ChopIndex : {self.Stocks[ symbol ]['Indicators'].ChopIndex} "+
-                              f"VOLATILTIY: {self.Stocks[ symbol ]['Indicators'].Summary()['VolIndex'] }  dSMA : {self.Stocks[ symbol ]['Indicators'].Summary()['dSMA']}  " +
-                              f" RSI :  {self.Stocks[ symbol ]['Indicators'].RSI}  BB :  {self.Stocks[ symbol ]['Indicators'].BB_Lower} -> {self.Stocks[ symbol ]['Indicators'].BB_Upper}  to finally break through ")
+                        logger.opt( lazy=True ).debug( "\t\t\t\t\t{} - It took {} soldiers  with ChopIndex : {} " +
+                                                       "VOLATILTIY: {}  dSMA : {}  " +
+                                                       " RSI :  {}  BB :  {} -> {}  to finally break through ",
+                                                       lambda : symbol, lambda : self.Stocks[symbol]['Price']['Upward'],
+                                                       lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                       lambda : self.Stocks[symbol]['Indicators'].Summary()['VolIndex'],
+                                                       lambda : self.Stocks[symbol]['Indicators'].Summary()['dSMA'],
+                                                       lambda : self.Stocks[symbol]['Indicators'].RSI,
+                                                       lambda : self.Stocks[symbol]['Indicators'].BB_Lower,
+                                                       lambda : self.Stocks[symbol]['Indicators'].BB_Upper )
                         if ( account.Buy( stock=symbol , price=float(ticker_row[ closePos ])  ,
-                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ) ,
+                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ) ,
                                     volume = ticker_row[volumePos], volume_threshold = params['volume_threshold'], indicators=self.Stocks[symbol]['Indicators'])   ) :
-                            print(f"{symbol} - BOUGHT @ : UPWARD:{self.Stocks[ symbol]['Price']['Upward']} -> CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex} RSI :  {self.Stocks[ symbol ]['Indicators'].RSI}  PRICE: {ticker_row[closePos]}")
+                            logger.info( "{} - BOUGHT @ : UPWARD:{} -> CHOP: {} RSI :  {}  PRICE: {}",
+                                         symbol, self.Stocks[symbol]['Price']['Upward'], self.Stocks[symbol]['Indicators'].ChopIndex,
+                                         self.Stocks[symbol]['Indicators'].RSI, ticker_row[closePos] )
                             success     = True                                               
                             action      = "bought"
                             self.ResetStock( symbol =symbol , stockClose=ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )                    
@@ -1200,14 +1624,21 @@ class DayTradeStrategy:
                             self.Stocks[ symbol]['AvgOccurrVol']        =  0
                     else:
                         if self.Stocks[ symbol]['Price']['Upward']  > 3 :
-                            print(f"{symbol} - BUY NOT Triggered : {self.Stocks[ symbol]['Price']['Upward']} -> {self.Stocks[ symbol ]['Indicators'].ChopIndex} " +
-                                  f"VOLUME :{ticker_row[volumePos]} -> {0.80 * self.Stocks[symbol]['Previous'][volumePos] } ::" +
-                                  f"{self.Stocks[ symbol]['Price']['Upward']} -> {self.Stocks[ symbol]['AvgOccurrVol']}   RSI : {self.Stocks[ symbol ]['Indicators'].RSI}")
+                            logger.opt( lazy=True ).debug( "{} - BUY NOT Triggered : {} -> {} VOLUME :{} -> {} ::{} -> {}   RSI : {}",
+                                                           lambda : symbol, lambda : self.Stocks[symbol]['Price']['Upward'],
+                                                           lambda : self.Stocks[symbol]['Indicators'].ChopIndex, lambda : ticker_row[volumePos],
+                                                           lambda : 0.8 * self.Stocks[symbol]['Previous'][volumePos],
+                                                           lambda : self.Stocks[symbol]['Price']['Upward'],
+                                                           lambda : self.Stocks[symbol]['AvgOccurrVol'],
+                                                           lambda : self.Stocks[symbol]['Indicators'].RSI )
                 else:
                     self.Stocks[ symbol]['Price']['Upward']  = 1
                     self.Stocks[ symbol]['AvgOccurrVol']     = ticker_row[volumePos]
-                    print(f"\t\t\t\t\t{symbol} - PRICE DIPPED - SOLDIERS NULLIFIED  : {self.Stocks[ symbol]['Price']['Upward']} -> {self.Stocks[ symbol ]['Indicators'].ChopIndex} " +
-                          f"PRICE : {self.Stocks[ symbol]['Previous'][closePos]} ->{ticker_row[closePos]}  ->{ round( ticker_row[closePos] - self.Stocks[ symbol]['Previous'][closePos] ,5 ) }")
+                    logger.opt( lazy=True ).debug( "\t\t\t\t\t{} - PRICE DIPPED - SOLDIERS NULLIFIED  : {} -> {} PRICE : {} ->{}  ->{}",
+                                                   lambda : symbol, lambda : self.Stocks[symbol]['Price']['Upward'],
+                                                   lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                   lambda : self.Stocks[symbol]['Previous'][closePos], lambda : ticker_row[closePos],
+                                                   lambda : round(ticker_row[closePos] - self.Stocks[symbol]['Previous'][closePos], 5) )
             
             if action != 'bought' and self.Stocks[ symbol]['Price']['Bought'] > 0 :                
                 upward_pressure        =  ( round( float(ticker_row[highPos])  - float(ticker_row[closePos]), 3) if round( float(ticker_row[highPos])  - float(ticker_row[closePos]), 3) > 0 else 1 )
@@ -1221,10 +1652,17 @@ class DayTradeStrategy:
             
             #CONSIDER SELLING   -  spike up in volume ( 2x)  and price 
             if  action != 'bought' and self.Stocks[ symbol]['Price']['Bought'] > 0:  # INSIDE OF A POSITION
-                print(f"INSIDE A POSITION:   BOUGHT:{self.Stocks[symbol]['Price']['Bought']} ->{ticker_row[closePos]} --> [PREVIOUS]{self.Stocks[symbol]['Previous'][closePos]} [PREVIOUS1]{self.Stocks[symbol]['Previous1'][closePos]} " +
-                      f"PROFIT : {( ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought']) }    CHOP: {self.Stocks[ symbol ]['Indicators'].ChopIndex} " +
-                      f"RSI: {self.Stocks[ symbol ]['Indicators'].RSI}    CANDLE BODY : {candle_body} " +
-                      f" BB :  {self.Stocks[ symbol ]['Indicators'].BB_Lower} -> {self.Stocks[ symbol ]['Indicators'].BB_Upper} ") #  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")
+                logger.opt( lazy=True ).debug( "INSIDE A POSITION:   BOUGHT:{} ->{} --> [PREVIOUS]{} [PREVIOUS1]{} " +
+                                               "PROFIT : {}    CHOP: {} " +
+                                               "RSI: {}    CANDLE BODY : {} " +
+                                               " BB :  {} -> {} ",
+                                               lambda : self.Stocks[symbol]['Price']['Bought'], lambda : ticker_row[closePos],
+                                               lambda : self.Stocks[symbol]['Previous'][closePos],
+                                               lambda : self.Stocks[symbol]['Previous1'][closePos],
+                                               lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                               lambda : self.Stocks[symbol]['Indicators'].ChopIndex, lambda : self.Stocks[symbol]['Indicators'].RSI,
+                                               lambda : candle_body, lambda : self.Stocks[symbol]['Indicators'].BB_Lower,
+                                               lambda : self.Stocks[symbol]['Indicators'].BB_Upper ) #  ATR : {self.Stocks[ symbol ]['Indicators'].AvgTrueRange()} ")
                 if ( ( ticker_row[closePos] < (self.Stocks[symbol]['Previous'][closePos] - 0.16) ) or
                          self.Stocks[ symbol ]['Indicators'].ChopIndex > 70  or
                          ( self.Stocks[ symbol ]['Indicators'].RSI > 70  and candle_body < 0.40) or 
@@ -1235,12 +1673,22 @@ class DayTradeStrategy:
                          ((ticker_row[volumePos] < 0.80 * self.Stocks[symbol]['Previous'][volumePos] )  and  (  0.05 < ( ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought']   )  ) ) or          # $0.07 take profit                          
                               (  0.12 < (self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  )  )       ) :   #AS SOON AS PRICE DIPS -> SELL
                      
-                      print( f"TIME TO SELL PRICE: {ticker_row[closePos]} -> {(self.Stocks[symbol]['Previous'][closePos] - 0.16)} or {( self.Stocks[symbol]['Price']['Bought'] - 0.16 )  } or { (self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16)}  "+
-                             f" VOLUME: {ticker_row[volumePos]} -> { 0.80 * self.Stocks[symbol]['Previous'][volumePos] }  " +
-                             f"VOLATILTIY: {self.Stocks[ symbol ]['Indicators'].Summary()['VolIndex'] }  dSMA : {self.Stocks[ symbol ]['Indicators'].Summary()['dSMA']}  " +
-                             f" HARDCODE PRICE : { ticker_row[closePos]  - self.Stocks[symbol]['Price']['Bought'] } or {self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos]  }  CHOP :  {self.Stocks[ symbol ]['Indicators'].ChopIndex} RSI :  {self.Stocks[ symbol ]['Indicators'].RSI} ")
+                      logger.opt( lazy=True ).debug( "TIME TO SELL PRICE: {} -> {} or {} or {}  " +
+                                                     " VOLUME: {} -> {}  " +
+                                                     "VOLATILTIY: {}  dSMA : {}  " +
+                                                     " HARDCODE PRICE : {} or {}  CHOP :  {} RSI :  {} ",
+                                                     lambda : ticker_row[closePos], lambda : self.Stocks[symbol]['Previous'][closePos] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - 0.16,
+                                                     lambda : self.Stocks[symbol]['Price']['HighSinceBought'] - 0.16, lambda : ticker_row[volumePos],
+                                                     lambda : 0.8 * self.Stocks[symbol]['Previous'][volumePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['VolIndex'],
+                                                     lambda : self.Stocks[symbol]['Indicators'].Summary()['dSMA'],
+                                                     lambda : ticker_row[closePos] - self.Stocks[symbol]['Price']['Bought'],
+                                                     lambda : self.Stocks[symbol]['Price']['Bought'] - ticker_row[closePos],
+                                                     lambda : self.Stocks[symbol]['Indicators'].ChopIndex,
+                                                     lambda : self.Stocks[symbol]['Indicators'].RSI )
                       if  account.Sell( stock=symbol, new_price=float(ticker_row[ closePos ]) ,
-                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ),
+                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ),
                                        ask_volume=float(ticker_row[ volumePos ] ), indicators=self.Stocks[symbol]['Indicators'] )  :
                          success        = True
                          action         = "closed"
@@ -1252,7 +1700,7 @@ class DayTradeStrategy:
 
                          for trade in account.Trades[symbol]:
                              #print(f"\t\t\t   Indicators [IN ] : {trade['indicators_in']}  [OUT] {trade['indicators_out']}  ")
-                             print(f"\t\t\t   TIME: {trade['bidTime']}  P&L: {trade['p_l']} ")
+                             logger.info("\t\t\t   TIME: {}  P&L: {} ", trade['bidTime'], trade['p_l'])
 
             #CLEAN UP
             
@@ -1272,7 +1720,7 @@ class DayTradeStrategy:
                 time_interval   = params['time_interval_bought']
             else:
                 if action =='closed' :
-                    print("Taking a breathe")
+                    logger.debug("Taking a breathe")
                #     time.sleep(params['time_interval'] ) # After closing a position , take a pause 
                     
                 time_interval   = params['time_interval']
@@ -1320,9 +1768,9 @@ class DayTradeStrategy:
         
         try :            
             # NO BUYING AFTER 3:45
-            current_time    = datetime.now()
+            current_time    = self.Clock.Now()
             if not ( symbol in self.Stocks.keys() )  and ( current_time.hour == 15 and current_time.minute >= 45) :
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO LATE TO CONSIDER MAKING BIDS " )
                 return 
 
             # ADD MECHANISM FOR DETERMINING THE AVG NUMBER OF MOVES BEFORE PIVOTING AND THE AVG $ MOVES  BEFORE PIVOTING
@@ -1338,18 +1786,20 @@ class DayTradeStrategy:
             entry ={0:{'close': ticker_row[closePos], 'open' : ticker_row[openPos] ,'low' : ticker_row[lowPos], 'high' : ticker_row[highPos],
                        'datetime' : (datetime.strptime( ticker_row[timePos][:19], Date_Format) ).timestamp()  * 1000 , 'volume' : ticker_row[volumePos]}}
             self.Stocks[ symbol ]['Indicators'].Update( entry = entry)            
-            print(f"\t\t\t\t + INDICATORS:    RSI : {self.Stocks[ symbol ]['Indicators'].Summary()['RSI'] }    "+
-                  f"VOLATILTIY: {self.Stocks[ symbol ]['Indicators'].Summary()['VolIndex'] }  dSMA : {self.Stocks[ symbol ]['Indicators'].Summary()['dSMA']}  " +
-                  f"ChopIndex : {self.Stocks[ symbol ]['Indicators'].Summary()['ChopIndex'] } " )
+            logger.opt( lazy=True ).debug( "\t\t\t\t + INDICATORS:    RSI : {}    VOLATILTIY: {}  dSMA : {}  ChopIndex : {} ",
+                                           lambda : self.Stocks[symbol]['Indicators'].Summary()['RSI'],
+                                           lambda : self.Stocks[symbol]['Indicators'].Summary()['VolIndex'],
+                                           lambda : self.Stocks[symbol]['Indicators'].Summary()['dSMA'],
+                                           lambda : self.Stocks[symbol]['Indicators'].Summary()['ChopIndex'] )
             
             #IF MORE THAN 3 LOSSES THEN DONT DO ANY MORE BUYING - NEED TO ADD TO PARAMS 
             if ( not (symbol in account.InPlay) and   self.Stocks[symbol]['Losses'] > max_num_of_losses ):
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO MANY LOSSES TO TRADE :   {self.Stocks[symbol]['Losses'] } " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> TOO MANY LOSSES TO TRADE :   {} ", self.Stocks[symbol]['Losses'] )
                 return False, action, time_interval,account
             
             # if volume is less than pre-determined threshold  there is no point in playing with it --  SHOULD THIS ONLY BE FOR THE BUYS / STOP FROM BUYING WHEN VOLUME IS TOO LOW ???
             if ticker_row[volumePos] < int(params['volume_threshold'])   and float(self.Stocks[ symbol]['Price']['Bought']) == 0  : 
-                print(f"\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> volume too low   {ticker_row[volumePos] } " )
+                logger.debug("\t\t\t -> DayTradeStrategy:: DayTradeBasic () -> volume too low   {} ", ticker_row[volumePos] )
                 return False, action, time_interval, account
             
 
@@ -1398,44 +1848,56 @@ class DayTradeStrategy:
             
             if (not (symbol in account.InPlay)  and   criteria ) :
                 if potential_switch :
-                    print(f"\t[POTENTIAL] BUY - Price : {round(float(ticker_row[ closePos]),2)}  " +
-                          f" Previous: {round(float(self.Stocks[ symbol]['Price']['Previous']),2)}  " +
-                              f" Upward: {round(upward_pressure, 5) }  Down : {  round(downward_pressure, 5 ) }" )
+                    logger.opt( lazy=True ).debug( "\t[POTENTIAL] BUY - Price : {}   Previous: {}   Upward: {}  Down : {}",
+                                                   lambda : round(float(ticker_row[closePos]), 2),
+                                                   lambda : round(float(self.Stocks[symbol]['Price']['Previous']), 2),
+                                                   lambda : round(upward_pressure, 5), lambda : round(downward_pressure, 5) )
                 else:
-                    print(f"\t[REGULAR] BUY - Price : {round(float(ticker_row[ closePos]),2)}  " +
-                          f" Previous: {round(float(self.Stocks[ symbol]['Price']['Previous']),2)}  " +
-                              f" Upward: {round(upward_pressure, 5) }  Down : {  round(downward_pressure, 5 ) }" )
+                    logger.opt( lazy=True ).debug( "\t[REGULAR] BUY - Price : {}   Previous: {}   Upward: {}  Down : {}",
+                                                   lambda : round(float(ticker_row[closePos]), 2),
+                                                   lambda : round(float(self.Stocks[symbol]['Price']['Previous']), 2),
+                                                   lambda : round(upward_pressure, 5), lambda : round(downward_pressure, 5) )
                 volume_increase = (float( ticker_row[ volumePos]) - float(self.Stocks[ symbol]['Volume']['Previous'] ) ) / float(self.Stocks[ symbol]['Volume']['Previous'] )                
                 if volume_increase  < params["volume_change_avg_ratio"] : # 85% starts to see good results, but dont want to be too strict or too loose 
-                    print( f"\t\t\t  *  BUY:: Volume increase isnt enough : {ticker_row[ volumePos ]}  from {self.Stocks[ symbol]['Volume']['Previous'] } ==> {volume_increase} " )
+                    logger.debug( "\t\t\t  *  BUY:: Volume increase isnt enough : {}  from {} ==> {} ",
+                                  ticker_row[volumePos], self.Stocks[symbol]['Volume']['Previous'], volume_increase )
                     # THIS SHOULD BE A SUB FUNCTION
                     self.ResetStock( symbol =symbol ,stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )
                     return False, action, time_interval,account
             
                 if ( round(ticker_row[closePos], 2 ) <  round(ticker_row[openPos],2 )  and round(ticker_row[closePos],2) == round(ticker_row[highPos],2)) :  #  PRICE CLOSED LOWER THAN IT OPENED with upward pressure
-                    print( f"\t\t\t  *  BUY:: PRICE CLOSED LOWER THAN IT OPENED WITH NO UPWARD PRESSURE  : CLOSED={ round(ticker_row[ closePos ],5)}  " +
-                               f"OPENED={ round(ticker_row[openPos], 5) }   LOW={ round(ticker_row[lowPos],5) }  HIGH={ round(ticker_row[highPos],5) }  " )                    
+                    logger.opt( lazy=True ).debug( "\t\t\t  *  BUY:: PRICE CLOSED LOWER THAN IT OPENED WITH NO UPWARD PRESSURE  : CLOSED={}  " +
+                                                   "OPENED={}   LOW={}  HIGH={}  ",
+                                                   lambda : round(ticker_row[closePos], 5), lambda : round(ticker_row[openPos], 5),
+                                                   lambda : round(ticker_row[lowPos], 5), lambda : round(ticker_row[highPos], 5) )
                     self.ResetStock( symbol =symbol , stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )                    
                     return False, action, time_interval,account
             
                 
                 if self.Stocks[symbol]['Price']['Upward']  < params["bounce_up_min"] :  # TWO consecutive upward moves with appropriate volume 
-                    print( f"\t\t\t  *  BUY [TEST SIGNAL ]:: Consecutive upward moves with volumes : {self.Stocks[ symbol]['Price']['Upward']} " )
+                    logger.debug( "\t\t\t  *  BUY [TEST SIGNAL ]:: Consecutive upward moves with volumes : {} ", self.Stocks[symbol]['Price']['Upward'] )
                     self.ResetStock( symbol =symbol , stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )
                     return False, action, time_interval,account
                 
                 
-                print( f"\t\t\t  *  BUY:: Volume increase OKAY : {ticker_row[ volumePos ]} from" +
-                       f" newPrice - previous = ${round( round(float(ticker_row[ closePos ]),5) -  round(float(self.Stocks[ symbol]['Price']['Previous']), 5) , 5) } " +
-                       f" Volume :  from { round( self.Stocks[ symbol]['Volume']['Previous'] , 5)  } ==> { round(volume_increase, 5 ) } " +
-                       f" PRESSURE :  upward : { round(upward_pressure,5)} ==>  downward :{ round(downward_pressure,5)} " +
-                       f" OCCUR : {self.Stocks[symbol]['Price']['Upward'] }  -> {params['bounce_up_min'] } " +
-                       f" BODY vs WICK : {round( (ticker_row[closePos] - ticker_row[openPos]) ,5 ) } --> { round( (ticker_row[highPos] - ticker_row[closePos]) , 5 )} "    )
+                logger.opt( lazy=True ).debug( "\t\t\t  *  BUY:: Volume increase OKAY : {} from" +
+                                               " newPrice - previous = ${} " +
+                                               " Volume :  from {} ==> {} " +
+                                               " PRESSURE :  upward : {} ==>  downward :{} " +
+                                               " OCCUR : {}  -> {} " +
+                                               " BODY vs WICK : {} --> {} ",
+                                               lambda : ticker_row[volumePos],
+                                               lambda : round(round(float(ticker_row[closePos]), 5) - round(float(self.Stocks[symbol]['Price']['Previous']), 5), 5),
+                                               lambda : round(self.Stocks[symbol]['Volume']['Previous'], 5), lambda : round(volume_increase, 5),
+                                               lambda : round(upward_pressure, 5), lambda : round(downward_pressure, 5),
+                                               lambda : self.Stocks[symbol]['Price']['Upward'], lambda : params['bounce_up_min'],
+                                               lambda : round(ticker_row[closePos] - ticker_row[openPos], 5),
+                                               lambda : round(ticker_row[highPos] - ticker_row[closePos], 5) )
                 # 2025-10-21  Playing around to get best results 
                 if upward_pressure > downward_pressure : # (ticker_row[closePos] - ticker_row[openPos]) > (ticker_row[highPos] - ticker_row[closePos]) or upward_pressure > downward_pressure :
-                    print( f"\t\t\t\t  -  BUY:: ATTEMPTING to Submit a BUY" )
+                    logger.debug( "\t\t\t\t  -  BUY:: ATTEMPTING to Submit a BUY" )
                     if ( account.Buy( stock=symbol , price=float(ticker_row[ closePos ])  ,
-                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ) ,
+                                 current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ) ,
                                     volume = ticker_row[volumePos], volume_threshold = params['volume_threshold'], indicators=self.Stocks[symbol]['Indicators'])   ) :
                     
                         success     = True                                               
@@ -1445,24 +1907,27 @@ class DayTradeStrategy:
                         self.Stocks[ symbol ]['Price' ]['Previous'] =  ticker_row[ closePos ]
                         self.Stocks[ symbol ]['Volume']['Bought']   =  ticker_row[volumePos] 
                 else:    
-                    print( f"\t\t\t  *  BUY::  Upward {upward_pressure}  less than downward pressure  {downward_pressure}" )
+                    logger.debug( "\t\t\t  *  BUY::  Upward {}  less than downward pressure  {}", upward_pressure, downward_pressure )
                     
             if action != 'bought' and self.Stocks[ symbol]['Price']['Bought'] > 0 :
-                print( f"CURRENT : { round(ticker_row [closePos], 5)}   " +
-                       f"BOUGHT AT : { round(self.Stocks[ symbol]['Price']['Bought'],5)}  " +
-                       f"PREVIOUS AT: {round(self.Stocks[ symbol]['Price']['Previous'] ,5)}  " +
-                       f"OPEN: {round(ticker_row[openPos],5)}   CLOSE :{ round(ticker_row[closePos],5)} " +
-                       f" PRESSURE: {upward_pressure} -> {downward_pressure} %{upward_pressure /downward_pressure}  " )
+                logger.opt( lazy=True ).debug( "CURRENT : {}   BOUGHT AT : {}  PREVIOUS AT: {}  OPEN: {}   CLOSE :{}  PRESSURE: {} -> {} %{}  ",
+                                               lambda : round(ticker_row[closePos], 5), lambda : round(self.Stocks[symbol]['Price']['Bought'], 5),
+                                               lambda : round(self.Stocks[symbol]['Price']['Previous'], 5), lambda : round(ticker_row[openPos], 5),
+                                               lambda : round(ticker_row[closePos], 5), lambda : upward_pressure, lambda : downward_pressure,
+                                               lambda : upward_pressure / downward_pressure )
 
 
             #SELL : In profit territory 
             if ( action != 'bought' and
                      round(float(self.Stocks[ symbol]['Price']['Bought']) ,3) > 0 and
                      ( round(float(ticker_row[ closePos ]),3) >  round(float(self.Stocks[ symbol]['Price']['Bought']),3) )  ): 
-                 print( f"\t\t\t  * SELL SIGNAL EVALUATION :CurrentToPrevious: {current_to_previous}  PROFIT_STOP :{ profit_trail_stop } " +
-                                f"STRIKE_PRICE_STOP : { strike_price_stop}   BOUGHT : {round(self.Stocks[ symbol]['Price']['Bought'] , 3 )}    " +
-                                f" NEW PRICE : { round(ticker_row[ closePos ],3) }  " +
-                                f" PRESSURE: {upward_pressure} -> {downward_pressure} %{upward_pressure /downward_pressure}  "   )                 
+                 logger.opt( lazy=True ).debug( "\t\t\t  * SELL SIGNAL EVALUATION :CurrentToPrevious: {}  PROFIT_STOP :{} " +
+                                                "STRIKE_PRICE_STOP : {}   BOUGHT : {}    " +
+                                                " NEW PRICE : {}  " +
+                                                " PRESSURE: {} -> {} %{}  ",
+                                                lambda : current_to_previous, lambda : profit_trail_stop, lambda : strike_price_stop,
+                                                lambda : round(self.Stocks[symbol]['Price']['Bought'], 3), lambda : round(ticker_row[closePos], 3),
+                                                lambda : upward_pressure, lambda : downward_pressure, lambda : upward_pressure / downward_pressure )
                  #  THERE IS SOMETHING ABOUT THE UPWARD PRESSURE == 0 THAT SIGNALS A TURNAROUND TO MAXIMIZE PROFITS , FIGURE IT OUT
                  # MAYBE NEEDS ALL 3   CURRENT TO PREVIOUS > 95  AND CLOSE > OPEN AND UPPER PRESSURE MORE THAN DOWNWARD FOR IT TO TRIGGER
                  if  round(float(ticker_row[ closePos ]), 5) < round( float(self.Stocks[ symbol]['Price']['Previous']) , 5)  :
@@ -1473,9 +1938,11 @@ class DayTradeStrategy:
                      
 
                  if (   ( current_to_previous > 0.95)  and (upward_pressure /downward_pressure > 0.65) and self.Stocks[ symbol]['Price']['Downward'] < 2 ):               #and ( ticker_row[closePos] > ticker_row[openPos])         
-                     print( f"\t\t\t  \\-> SELL SIGNAL [ RESCIND ] IN PROFIT  : " +
-                            f" More upward than downward pressure : { round( float(ticker_row[highPos]) - float(ticker_row[closePos]), 5) } -> " +
-                            f"{ round(float( ticker_row[openPos]) - float(ticker_row[lowPos]) , 5 )} "  )
+                     logger.opt( lazy=True ).debug( "\t\t\t  \\-> SELL SIGNAL [ RESCIND ] IN PROFIT  : " +
+                                                    " More upward than downward pressure : {} -> " +
+                                                    "{} ",
+                                                    lambda : round(float(ticker_row[highPos]) - float(ticker_row[closePos]), 5),
+                                                    lambda : round(float(ticker_row[openPos]) - float(ticker_row[lowPos]), 5) )
                  #ticker_row[volumePos] < self.Stocks[ symbol ]['Volume' ]['Bought'] :  # VOLUME IS STILL MOVING UP SO DONT SELL RIGHT NOW
                      self.ResetStock( symbol =symbol , stockClose= ticker_row[ closePos] , stockVolume=ticker_row[ volumePos], stockHigh = ticker_row[ highPos]  )
                      return False, action, params["time_interval"],account
@@ -1485,9 +1952,10 @@ class DayTradeStrategy:
                  if ( True or
                       ( round(float(ticker_row[ closePos ]), 5)  <  round( float(self.Stocks[ symbol]['Price']['Previous']) , 5)     ) and
                       ( round( float(ticker_row[ closePos ]) , 5 )   >=  profit_trail_stop     )   ) : # or   ( profit_trail_stop >  float(ticker_row[ closePos ]) )  ):
-                     print( f"\t\t\t   \\-> SELL SIGNAL : {self.Stocks[ symbol]['Price']['Bought']}  > {ticker_row[ closePos]}  : Profit_Trail_Stop : {profit_trail_stop} " )
+                     logger.debug( "\t\t\t   \\-> SELL SIGNAL : {}  > {}  : Profit_Trail_Stop : {} ",
+                                   self.Stocks[symbol]['Price']['Bought'], ticker_row[closePos], profit_trail_stop )
                      if  account.Sell( stock=symbol, new_price=float(ticker_row[ closePos ])  ,
-                                       current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ) ,
+                                       current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ) ,
                                            ask_volume=float(ticker_row[ volumePos ] ),  indicators=self.Stocks[symbol]['Indicators'])  :
                          success    = True                         
                          action     = "closed"
@@ -1498,7 +1966,7 @@ class DayTradeStrategy:
 
                          for trade in account.Trades[symbol]:
                              #print(f"\t\t\t   Indicators [IN ] : {trade['indicators_in']}  [OUT] {trade['indicators_out']}  ")
-                             print(f"\t\t\t   TIME: {trade['bidTime']}  P&L: {trade['p_l']} ")
+                             logger.info("\t\t\t   TIME: {}  P&L: {} ", trade['bidTime'], trade['p_l'])
 
 
                         
@@ -1511,14 +1979,17 @@ class DayTradeStrategy:
                                   ( round(float(ticker_row[ closePos ]) ,5) <  round(float(ticker_row[ openPos ]) ,5) )  ))) :
                         #and
                         # (float(ticker_row[ volumePos ]) <  float(self.Stocks[ symbol]['Volume']['Previous']) ) )  ):
-                 print( f"\t\t\t  \\-> SELL SIGNAL (SAFETY) : Current price is below what we bought for  or  ( lower than previous and the volume is lower than previous) "   )
+                 logger.debug( "\t\t\t  \\-> SELL SIGNAL (SAFETY) : Current price is below what we bought for  or  ( lower than previous and the volume is lower than previous) " )
                  # dont sell unless crashing AND atleast 80% purchase, try to wait it out , BOXL fell fast and did not trigger this  so need to FIX
-                 print( f"\t\t\t  \\-> SELL SIGNAL (SAFETY) : CHECKING PROFIT_STOP :  STRIKE_PRICE_STOP : { strike_price_stop}   profit_trail_stop: { profit_trail_stop}   CRASH_TRAIL_STOP: { crash_trail_stop}   BOUGHT : {self.Stocks[ symbol]['Price']['Bought']}   NEW PRICE : {ticker_row[ closePos ]} "   )
+                 logger.debug( "\t\t\t  \\-> SELL SIGNAL (SAFETY) : CHECKING PROFIT_STOP :  STRIKE_PRICE_STOP : {}   profit_trail_stop: {}   CRASH_TRAIL_STOP: {}   BOUGHT : {}   NEW PRICE : {} ",
+                               strike_price_stop, profit_trail_stop, crash_trail_stop, self.Stocks[symbol]['Price']['Bought'], ticker_row[closePos] )
                  #if  (round(float(ticker_row[ closePos ]),5) <= crash_trail_stop  ) or (  round(float(ticker_row[ closePos ] ),5) <=  strike_price_stop    ):
                  if  (round(float(ticker_row[ closePos ]),5) <= round(float(self.Stocks[ symbol]['Price']['Bought']) - 0.20 , 5)   ):
-                     print( f"\t\t\t  \\-> SELL SIGNAL (SAFETY) : PROFIT_STOP : SAFETY SELL  -> { profit_trail_stop }   STRIKE_PRICE_STOP : { strike_price_stop}    CRASH_TRAIL_STOP: { crash_trail_stop}   BOUGHT : {self.Stocks[ symbol]['Price']['Bought']}   NEW PRICE : {ticker_row[ closePos ]} "   )
+                     logger.debug( "\t\t\t  \\-> SELL SIGNAL (SAFETY) : PROFIT_STOP : SAFETY SELL  -> {}   STRIKE_PRICE_STOP : {}    CRASH_TRAIL_STOP: {}   BOUGHT : {}   NEW PRICE : {} ",
+                                   profit_trail_stop, strike_price_stop, crash_trail_stop, self.Stocks[symbol]['Price']['Bought'],
+                                   ticker_row[closePos] )
                      if  account.Sell( stock=symbol, new_price=float(ticker_row[ closePos ]) ,
-                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else datetime.now()   ),
+                                           current_time=str( ticker_row[timePos] if account.Mode.lower() =="test" else self.Clock.Now()   ),
                                        ask_volume=float(ticker_row[ volumePos ] ), indicators=self.Stocks[symbol]['Indicators'] )  :
                          success        = True
                          action         = "closed"
@@ -1529,7 +2000,7 @@ class DayTradeStrategy:
 
                          for trade in account.Trades[symbol]:
                              #print(f"\t\t\t   Indicators [IN ] : {trade['indicators_in']}  [OUT] {trade['indicators_out']}  ")
-                             print(f"\t\t\t   TIME: {trade['bidTime']}  P&L: {trade['p_l']} ")
+                             logger.info("\t\t\t   TIME: {}  P&L: {} ", trade['bidTime'], trade['p_l'])
 
             
             
@@ -1547,7 +2018,7 @@ class DayTradeStrategy:
                 time_interval   = params['time_interval_bought']
             else:
                 if action =='closed' :
-                    print("Taking a breathe")
+                    logger.debug("Taking a breathe")
                #     time.sleep(params['time_interval'] ) # After closing a position , take a pause 
                     
                 time_interval   = params['time_interval']
@@ -1583,7 +2054,7 @@ class DayTradeStrategy:
         
         try:
             vwap = ( ((ticker_row[2] + ticker_row[3] + ticker_row[4])/3) * ticker_row[5] ) / ticker_row[5]
-            print(f"\t\t\t\t\t {ticker_row } -> {vwap}  <- {self.OpenRange['vwap']}" )
+            logger.debug("\t\t\t\t\t {} -> {}  <- {}", ticker_row, vwap, self.OpenRange['vwap'] )
             if self.OpenRange['high'] == 0 :
                 account.Performance[ticker_row[0] ] = []
                 self.OpenRange['vwap']  = vwap
@@ -1596,18 +2067,20 @@ class DayTradeStrategy:
                         self.Occurrence += 1
                         interval = 300
                         self.WatchAlert = 'ALERT'
-                        print( f'\t WATCHING: Broke Above  : {self.Occurrence}   {ticker_row[3]}   {ticker_row[5]}   VWAP: {vwap} <- {self.OpenRange["vwap"]}'   ) 
+                        logger.debug( "\t WATCHING: Broke Above  : {}   {}   {}   VWAP: {} <- {}",
+                                      self.Occurrence, ticker_row[3], ticker_row[5], vwap, self.OpenRange['vwap'] )
                     else:
                         self.Occurrence  = 0
-                        print( f'\t Broke BELOW  {self.Occurrence}   {ticker_row[3]}   {ticker_row[5]}    VWAP:{vwap}<- {self.OpenRange["vwap"]}') 
+                        logger.debug( "\t Broke BELOW  {}   {}   {}    VWAP:{}<- {}",
+                                      self.Occurrence, ticker_row[3], ticker_row[5], vwap, self.OpenRange['vwap'] )
                     self.AvgVolume          = (float(self.AvgVolume) + float(ticker_row[5]) ) / 2
                     if self.Occurrence > 3  and float(ticker_row[5]) > self.AvgVolume:    # should add something about the volume
-                        print( 'Looks like going up : should shift to  minute or buy into this ')
+                        logger.debug( 'Looks like going up : should shift to  minute or buy into this ')
                         self.WatchAlert = 'ALERT'
-                    print(f"\t Volume  {self.AvgVolume}   -> {ticker_row[5]} ")
+                    logger.debug("\t Volume  {}   -> {} ", self.AvgVolume, ticker_row[5])
                 else:
                     if  float(ticker_row[3]) <  self.OpenRange['high'] :
-                        print('\t  NOT WATCHING ANYMORE '  )
+                        logger.debug('\t  NOT WATCHING ANYMORE '  )
                         self.WatchAlert = ''
                 account.Performance[ticker_row[0] ].append( 'WIN')
             return success , action, interval                
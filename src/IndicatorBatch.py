@@ -0,0 +1,621 @@
+## ###################################################################################################################
+##  Program :   Indicator Batch
+##  Author  :
+##  Install :   pip3 install numpy
+##  Example :
+##              batch = IndicatorBatch( symbols = ['AAPL','MSFT'] )
+##              batch.Update( symbols = ['AAPL','MSFT'], open=[1.0,2.0], high=[1.2,2.2], low=[0.9,1.9], close=[1.1,2.1],
+##                            volume=[1000,2000], timestamp=[1754400000000,1754400000000] )
+##              values = batch.Values( 'AAPL' )                # same names as IndicatorStream / Indicators
+##  Notes   :   The whole watch list as 2-D arrays ( symbols x bars ) - one vectorized pass per bar updates every
+##              intraday indicator for every symbol that received a candle.
+##              Same recursions and windows as IndicatorStream, a row can be loaded from ( or started as ) a stream
+##              The bar is folded along the plan of IndicatorPlan : the same intermediates and update steps as the
+##              stream , each one an array over the rows ( NaN where a row has no prior candle yet )
+##              Only the Require()d groups are folded on every bar ; the others catch up row by row from the ring when
+##              Values() reads them , or on the bar the ring would overwrite a candle they still read ( see Fold )
+## ###################################################################################################################
+import sys
+import math
+import inspect
+
+import numpy            as np
+
+from CandleBuffer       import CANDLES_PER_DAY
+from IndicatorSeries    import ZERO, MINUTES_PER_YEAR
+from IndicatorStream    import IndicatorStream, fibonacci_levels, median_push
+from IndicatorPlan      import GROUPS, groups_of, resolve, bind, lookbacks
+
+
+
+class IndicatorBatch :
+    FIELDS      = ( 'open', 'high', 'low', 'close', 'volume', 'timestamp', 'tr' )
+    PUBLISHED   = ( 'RSI', 'VWAP', 'dSMA', 'High', 'Low', 'EMA9', 'ADX', 'PlusDI', 'MinusDI', 'BB_Lower', 'BB_Upper',
+                    'VolIndex', 'VolAnnual', 'ChopIndex', 'RangeHigh', 'RangeLow', 'RangeMean', 'RangeMedian' )
+    RUNNING     = ( 'Timestamp', 'PrevClose', 'PrevHigh', 'PrevLow', 'SumClose', 'SumPV', 'SumVolume', 'AvgGain', 'AvgLoss',
+                    'Returns', 'ReturnMean', 'ReturnM2', 'LastReturn', 'SmoothTR', 'SmoothPlusDM', 'SmoothMinusDM', 'SumDX', 'SumRangeMean',
+                    'BBSum', 'BBSumSq', 'RangeSum' )
+    TRANSIENT   = ( 'Plans', )                                          # CACHES A CHECKPOINT LEAVES OUT ( restored empty )
+
+    def __init__( self, symbols : list = None, rsi_window : int = 14, ema_span : int = 9, bb_window : int = 15, chop_window : int = 4,
+                        adx_period : int = 7, range_window : int = 20, sma_windows : tuple = (9, 14, 21, 50, 200),
+                        vol_window : int = None, vol_periods : float = MINUTES_PER_YEAR, capacity : int = CANDLES_PER_DAY,
+                        dtype : object = np.float64 ) -> None :
+        """
+            INITIALIZE AN EMPTY ROW FOR EVERY SYMBOL
+            ARGS   :
+                        symbols      ( list )  - stock symbols of the watch list ( more can be added with Add() )
+                        rsi_window .. capacity - same look backs as IndicatorStream
+                        dtype        ( dtype ) - storage type of the candle columns ( np.float32 for large watch lists ,
+                                                 the running sums stay float64 )
+            RETURNS:
+                        nothing
+        """
+        self.Settings       = { 'rsi_window' : rsi_window, 'ema_span' : ema_span, 'bb_window' : bb_window, 'chop_window' : chop_window,
+                                'adx_period' : adx_period, 'range_window' : range_window, 'sma_windows' : sma_windows,
+                                'vol_window' : vol_window, 'vol_periods' : vol_periods, 'capacity' : capacity, 'dtype' : dtype }
+        self.RSIWindow      = rsi_window
+        self.EMAAlpha       = 2 / ( ema_span + 1 )
+        self.BBWindow       = bb_window
+        self.ChopWindow     = chop_window
+        self.ADXPeriod      = adx_period
+        self.RangeWindow    = range_window
+        self.SMAWindows     = sma_windows
+        self.VolWindow      = vol_window
+        self.VolPeriods     = vol_periods
+        self.Dtype          = dtype
+        self.Capacity       = max( capacity, max(sma_windows) + 1, bb_window + 1, chop_window, range_window + 1, ( vol_window or 0 ) + 2 )
+
+        self.Symbols        = []
+        self.Index          = {}                                        # symbol -> row
+        self.Count          = np.zeros( 0, dtype=np.int64 )             # candles seen this session ( per symbol )
+        self.SMA            = np.zeros( ( len(sma_windows), 0 ) )
+        self.SMASums        = np.zeros( ( len(sma_windows), 0 ) )
+        self.Candles        = { field : np.zeros( ( 0, 2 * self.Capacity ), dtype= np.int64 if field == 'timestamp' else dtype )
+                                                                                    for field in self.FIELDS }
+        for name in self.PUBLISHED + self.RUNNING :
+            setattr( self, name, np.zeros( 0 ) )
+        self.Medians        = []                                        # ( lower, upper ) heaps of the window medians per row ( see median_push )
+        self.Plans          = {}                                        # groups -> steps bound to this batch ( see Plan )
+        self.Required       = set( GROUPS )                             # groups folded on every bar ( see Require )
+        self.Folded         = { group : np.zeros( 0, dtype=np.int64 ) for group in GROUPS }    # candles each lazy group has folded per row
+        self.Lookback       = lookbacks( sma_windows, bb_window, chop_window, range_window, vol_window )
+
+        for symbol in ( symbols or [] ) :
+            self.Add( symbol )
+
+
+
+    def __len__( self ) -> int :
+        """
+            Number of symbols held
+        """
+        return len( self.Symbols )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"IndicatorBatch : {len(self)} symbols  {self.Capacity} candles each  {int( self.Count.sum() )} candles applied"
+
+
+
+    def Add( self, symbol : str , stream : IndicatorStream = None ) -> int :
+        """
+            Add a row for a symbol, continuing from the state of a stream when one is given
+            ARGS   :
+                        symbol ( str )             - stock symbol
+                        stream ( IndicatorStream ) - state to continue from ( default a fresh session )
+            RETURNS:
+                        row of the symbol
+        """
+        if symbol in self.Index :
+            row = self.Index[ symbol ]
+        else :
+            row = len( self.Symbols )
+            if row == len( self.Count ) :
+                self.Grow( max( 8, 2 * row ) )
+            self.Symbols.append( symbol )
+            self.Index[ symbol ]    = row
+
+        self.Load( row, stream if stream is not None else IndicatorStream( **self.Settings ) )
+        return row
+
+
+
+    def Grow( self, rows : int ) -> None :
+        """
+            Make room for more symbols - the arrays double when full so adding a large watch list one symbol at a time
+            copies every row a constant number of times ( rows past len( Symbols ) are never read )
+        """
+        extra           = rows - len( self.Count )
+        self.Count      = np.concatenate( [ self.Count, np.zeros( extra, dtype=np.int64 ) ] )
+        self.SMA        = np.hstack( [ self.SMA, np.zeros( ( len(self.SMAWindows), extra ) ) ] )
+        self.SMASums    = np.hstack( [ self.SMASums, np.zeros( ( len(self.SMAWindows), extra ) ) ] )
+        for field in self.FIELDS :
+            self.Candles[ field ] = np.vstack( [ self.Candles[ field ], np.zeros( ( extra, 2 * self.Capacity ), dtype= self.Candles[ field ].dtype ) ] )
+        for name in self.PUBLISHED + self.RUNNING :
+            setattr( self, name, np.concatenate( [ getattr( self, name ), np.full( extra, np.nan ) ] ) )
+        self.Medians   += [ ( [], [] ) for _ in range( extra ) ]
+        for group in GROUPS :
+            self.Folded[ group ] = np.concatenate( [ self.Folded[ group ], np.zeros( extra, dtype=np.int64 ) ] )
+
+
+
+    def Nbytes( self ) -> int :
+        """
+            Memory held by the arrays in bytes
+        """
+        arrays = ( [ self.Count, self.SMA, self.SMASums ] + list( self.Candles.values() ) + list( self.Folded.values() ) +
+                   [ getattr( self, name ) for name in self.PUBLISHED + self.RUNNING ] )
+        return sum( array.nbytes for array in arrays )
+
+
+
+    def Load( self, row : int , stream : IndicatorStream ) -> None :
+        """
+            Copy the state of a single symbol stream into a row
+            ARGS   :
+                        row    ( int )             - row of the symbol
+                        stream ( IndicatorStream ) - state to copy
+            RETURNS:
+                        nothing
+        """
+        stream.Refresh()                                                # LAZY GROUPS OF THE STREAM CATCH UP FIRST
+        for name in self.PUBLISHED + self.RUNNING :
+            value = getattr( stream, name )
+            getattr( self, name )[ row ] = np.nan if value is None else value
+
+        self.Count[ row ]   = stream.Count
+        for group in GROUPS :
+            self.Folded[ group ][ row ] = stream.Count
+        self.Medians[ row ] = ( list( stream.MedianLower ), list( stream.MedianUpper ) )
+        for pos, window in enumerate( self.SMAWindows ) :
+            self.SMA[ pos, row ]        = stream.SMA[ f'SMA{window}' ]
+            self.SMASums[ pos, row ]    = stream.SMASums[ window ]
+
+        available = min( len( stream.Candles ), self.Capacity )
+        for field in self.FIELDS :
+            self.Candles[ field ][ row ] = 0
+            if field == 'tr' :
+                values = np.array( list( stream.TrueRanges ) )[ -available: ]
+            else :
+                values = stream.Candles.View( field, available )
+            slots = ( stream.Count - len( values ) + np.arange( len( values ) ) ) % self.Capacity
+            self.Candles[ field ][ row, slots ]                 = values
+            self.Candles[ field ][ row, slots + self.Capacity ] = values
+
+
+
+    def Applied( self, symbol : str , timestamp : float ) -> bool :
+        """
+            True when the candle with this timestamp was already folded into the symbol's row
+        """
+        return symbol in self.Index and self.Timestamp[ self.Index[ symbol ] ] == timestamp
+
+
+
+    def Require( self, names : list = None ) -> None :
+        """
+            Keep only the groups behind these indicator names current on every bar for the whole watch list ,
+            the others catch up from the ring when they are read ( see Values )
+            ARGS   :
+                        names ( list ) - published names ( RSI, EMA9 ...) , None for every indicator
+            RETURNS:
+                        nothing
+        """
+        required    = set( groups_of( names ) )
+        rows        = np.arange( len( self.Symbols ) )
+        self.Fold( required - self.Required, rows )                    # NEWLY REQUIRED GROUPS CATCH UP FIRST
+        for group in self.Required - required :
+            self.Folded[ group ][ rows ] = self.Count[ rows ]
+        self.Required = required
+
+
+
+    def Fold( self, groups : list , rows : np.ndarray ) -> None :
+        """
+            Bring lazy groups up to the newest candle of the rows , candle by candle : Count is set back to the candle
+            being folded so the Calc / Update steps read the ring exactly as they did on that bar ( nothing to do when
+            they are current ) - Raises ValueError when a candle a group still needs was already overwritten in the ring
+        """
+        latest = self.Count[ rows ].copy()
+        try:
+            for group in [ group for group in GROUPS if group in groups and not ( group in self.Required ) ] :
+                folded = self.Folded[ group ]
+                if np.any( latest - folded[ rows ] > self.Capacity - self.Lookback[ group ] ) :
+                    raise ValueError( f"IndicatorBatch : {group} is further behind than the {self.Capacity} candles of the ring" )
+                while True :
+                    behind = rows[ folded[ rows ] < latest ]
+                    if len( behind ) == 0 :
+                        break
+                    self.Count[ behind ] = folded[ behind ] + 1
+                    self.Apply( ( group, ), behind )
+                    folded[ behind ] += 1
+        finally:
+            self.Count[ rows ] = latest
+
+
+
+    def Values( self, symbol : str , names : list = None ) -> dict :
+        """
+            Current indicator values of one symbol under the IndicatorStream / Indicators attribute names , bringing
+            their groups up to the newest candle first
+            ARGS   :
+                        symbol ( str )  - stock symbol
+                        names  ( list ) - published names wanted , None for every indicator
+            RETURNS:
+                        dictionary of the published values ( and the candle Count )
+        """
+        row     = self.Index[ symbol ]
+        self.Fold( groups_of( names ), np.array( [ row ] ) )
+        values  = { name : float( getattr( self, name )[ row ] ) for name in self.PUBLISHED }
+        values |= { 'SMA'   : { f'SMA{window}' : float( self.SMA[ pos, row ] ) for pos, window in enumerate( self.SMAWindows ) },
+                    'dFib'  : fibonacci_levels( values['High'], values['Low'] ) if self.Count[ row ] > 0 else {},
+                    'Count' : int( self.Count[ row ] ) }
+        if self.Count[ row ] == 0 :
+            values |= { 'EMA9' : None, 'High' : 0, 'Low' : 0, 'dSMA' : 0 }
+
+        return values if names is None else { name : values[ name ] for name in names if name in values } | { 'Count' : values['Count'] }
+
+
+
+    def Update( self, symbols : list , open : list , high : list , low : list , close : list , volume : list , timestamp : list = None ) -> None :
+        """
+            Fold one bar into every listed symbol at once ( one vectorized pass , no loop over the symbols )
+            ARGS   :
+                        symbols                   ( list ) - symbols that received a candle this bar
+                        open / high / low / close ( list ) - candle prices ( same order as symbols )
+                        volume                    ( list ) - candle volumes
+                        timestamp                 ( list ) - epoch milliseconds of the candles
+            RETURNS:
+                        nothing
+        """
+        try:
+            for symbol in symbols :
+                if not ( symbol in self.Index ) :
+                    self.Add( symbol )
+
+            rows    = np.array( [ self.Index[ symbol ] for symbol in symbols ], dtype=np.int64 )
+            open, high, low, close, volume = ( np.asarray( values, dtype=self.Dtype ).astype( np.float64 ) for values in ( open, high, low, close, volume ) )   # AS STORED
+            timestamp = np.zeros( len( rows ) ) if timestamp is None else np.asarray( timestamp, dtype=np.float64 )
+
+            prev            = self.PrevClose[ rows ]
+            true_range      = high - low
+            has_prev        = ~np.isnan( prev )
+            true_range[ has_prev ] = np.maximum.reduce( [ true_range[ has_prev ], np.abs( high - prev )[ has_prev ], np.abs( low - prev )[ has_prev ] ] )
+
+            self.Count[ rows ]     += 1
+            self.Timestamp[ rows ]  = timestamp
+            self.Append( rows, open, high, low, close, volume, timestamp, true_range )
+            self.Apply( tuple( group for group in GROUPS if group in self.Required ), rows )
+
+            lazy    = [ group for group in GROUPS if not ( group in self.Required ) ]
+            if lazy :                                                   # ROWS WHERE THE RING IS ABOUT TO OVERWRITE A CANDLE A LAZY GROUP READS
+                stale = np.any( [ self.Count[ rows ] - self.Folded[ group ][ rows ] >= self.Capacity - self.Lookback[ group ] for group in lazy ], axis=0 )
+                self.Fold( lazy, rows[ stale ] )
+
+            self.PrevClose[ rows ]  = close
+            self.PrevHigh[ rows ]   = high
+            self.PrevLow[ rows ]    = low
+        except:
+            print("\t\t|EXCEPTION: IndicatorBatch::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+
+
+    def Plan( self, groups : tuple ) -> tuple :
+        """
+            Steps that fold one bar into these groups - resolved and bound once per set of groups ( see IndicatorPlan )
+        """
+        plan = self.Plans.get( groups )
+        if plan is None :
+            plan = self.Plans[ groups ] = bind( resolve( groups ), self )
+        return plan
+
+
+
+    def Apply( self, groups : tuple , rows : np.ndarray ) -> None :
+        """
+            Fold the newest candle of the rows into the groups ( the intermediates are computed once for all of them )
+        """
+        calcs, updates  = self.Plan( groups )
+        values          = []
+        for calc, inputs in calcs :
+            values.append( calc( rows, *[ values[ pos ] for pos in inputs ] ) )
+        for update, inputs in updates :
+            update( rows, *[ values[ pos ] for pos in inputs ] )
+
+
+
+    def Append( self, rows : np.ndarray , *columns : np.ndarray ) -> None :
+        """
+            Write the candle of every row at its ring slot ( and the mirrored slot ) - Count is already advanced
+        """
+        slots = ( self.Count[ rows ] - 1 ) % self.Capacity
+        for field, values in zip( self.FIELDS, columns ) :
+            self.Candles[ field ][ rows, slots ]                    = values
+            self.Candles[ field ][ rows, slots + self.Capacity ]    = values
+
+
+
+    def Last( self, field : str , rows : np.ndarray , back : int = 0 ) -> np.ndarray :
+        """
+            Value of a column 'back' candles before the newest one for each row ( float64 whatever the storage type )
+        """
+        return self.Candles[ field ][ rows, ( self.Count[ rows ] - 1 - back ) % self.Capacity ].astype( np.float64 )
+
+
+
+    def Window( self, field : str , rows : np.ndarray , length : int ) -> np.ndarray :
+        """
+            Newest 'length' entries of a column for each row ( rows x length , oldest first , float64 )
+        """
+        end = ( self.Count[ rows ] - 1 ) % self.Capacity + self.Capacity + 1
+        return self.Candles[ field ][ rows[ :, None ], end[ :, None ] - length + np.arange( length ) ].astype( np.float64 )
+
+
+
+    def CalcHigh( self, rows : np.ndarray ) -> np.ndarray :
+        return self.Last( 'high', rows )
+
+
+    def CalcLow( self, rows : np.ndarray ) -> np.ndarray :
+        return self.Last( 'low', rows )
+
+
+    def CalcClose( self, rows : np.ndarray ) -> np.ndarray :
+        return self.Last( 'close', rows )
+
+
+    def CalcVolume( self, rows : np.ndarray ) -> np.ndarray :
+        return self.Last( 'volume', rows )
+
+
+    def CalcPriorCandle( self, rows : np.ndarray ) -> tuple :
+        """
+            ( high, low, close ) of the candle before the newest one ( NaN on the first candle of a row )
+        """
+        first = self.Count[ rows ] <= 1
+        return tuple( np.where( first, np.nan, self.Last( field, rows, 1 ) ) for field in ( 'high', 'low', 'close' ) )
+
+
+    def CalcTrueRange( self, rows : np.ndarray , high : np.ndarray , low : np.ndarray , prior : tuple ) -> np.ndarray :
+        """
+            max( high - low , |high - prior close| , |low - prior close| ) ( high - low on the first candle )
+        """
+        return np.fmax( high - low, np.fmax( np.abs( high - prior[2] ), np.abs( low - prior[2] ) ) )
+
+
+    def CalcCloseDelta( self, rows : np.ndarray , close : np.ndarray , prior : tuple ) -> np.ndarray :
+        return close - prior[2]
+
+
+    def CalcLogReturn( self, rows : np.ndarray , close : np.ndarray , prior : tuple ) -> np.ndarray :
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            valid = ( prior[2] > 0 ) & ( close > 0 )
+            return np.where( valid, np.log( np.where( valid, close / prior[2], 1.0 ) ), np.nan )
+
+
+    def CalcTypicalPrice( self, rows : np.ndarray , high : np.ndarray , low : np.ndarray , close : np.ndarray ) -> np.ndarray :
+        return ( high + low + close ) / 3
+
+
+    def CalcDirectionalMove( self, rows : np.ndarray , high : np.ndarray , low : np.ndarray , prior : tuple ) -> tuple :
+        """
+            ( +DM, -DM ) against the prior candle ( NaN on the first candle of a row )
+        """
+        up_move     = high - prior[0]
+        down_move   = prior[1] - low
+        first       = np.isnan( prior[0] )
+        return ( np.where( first, np.nan, np.where( ( up_move > down_move ) & ( up_move > 0 ), up_move, 0.0 ) ),
+                 np.where( first, np.nan, np.where( ( down_move > up_move ) & ( down_move > 0 ), down_move, 0.0 ) ) )
+
+
+    def CalcWindowExtrema( self, rows : np.ndarray ) -> tuple :
+        """
+            ( highest high, lowest low ) over the Chop Index window ( NaN until the window is full )
+        """
+        full = self.Count[ rows ] >= self.ChopWindow
+        return ( np.where( full, self.Window( 'high', rows, self.ChopWindow ).max( axis=1 ), np.nan ),
+                 np.where( full, self.Window( 'low', rows, self.ChopWindow ).min( axis=1 ), np.nan ) )
+
+
+
+    def UpdateSession( self, rows : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Session high/low/mean of the close ( the Fibonacci levels are built in Values() )
+        """
+        first                   = self.Count[ rows ] == 1
+        self.SumClose[ rows ]  += close
+        self.dSMA[ rows ]       = self.SumClose[ rows ] / self.Count[ rows ]
+        self.High[ rows ]       = np.where( first, close, np.fmax( self.High[ rows ], close ) )
+        self.Low[ rows ]        = np.where( first, close, np.fmin( self.Low[ rows ] , close ) )
+
+
+
+    def UpdateVWAP( self, rows : np.ndarray , typical_price : np.ndarray , volume : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Running sums of typical price * volume and volume
+        """
+        self.SumPV[ rows ]     += typical_price * volume
+        self.SumVolume[ rows ] += volume
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            self.VWAP[ rows ]   = np.where( self.SumVolume[ rows ] > 0, self.SumPV[ rows ] / self.SumVolume[ rows ], close )
+
+
+
+    def UpdateRSI( self, rows : np.ndarray , delta : np.ndarray ) -> None :
+        """
+            Wilder RSI : simple average of the gains/losses until the window is full, then Wilder smoothing
+        """
+        has_prev    = ~np.isnan( delta )
+        rows, delta = rows[ has_prev ], delta[ has_prev ]
+
+        gain        = np.clip( delta, 0, None )
+        loss        = np.clip( -delta, 0, None )
+        seen        = self.Count[ rows ] - 1
+        head        = seen < self.RSIWindow
+        avg_gain    = self.AvgGain[ rows ]
+        avg_loss    = self.AvgLoss[ rows ]
+
+        avg_gain    = np.where( head, avg_gain + ( gain - avg_gain ) / seen, ( avg_gain * (self.RSIWindow - 1) + gain ) / self.RSIWindow )
+        avg_loss    = np.where( head, avg_loss + ( loss - avg_loss ) / seen, ( avg_loss * (self.RSIWindow - 1) + loss ) / self.RSIWindow )
+        self.AvgGain[ rows ] = avg_gain
+        self.AvgLoss[ rows ] = avg_loss
+
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            rsi = np.round( 100 - (100 / (1 + avg_gain / avg_loss)), 2 )
+        self.RSI[ rows ] = np.where( avg_loss == 0, np.where( avg_gain == 0, np.nan, 100.0 ), rsi )
+
+
+
+    def UpdateVolatility( self, rows : np.ndarray , log_return : np.ndarray ) -> None :
+        """
+            Standard deviation of the log returns with Welford's online mean / variance ( see IndicatorStream.UpdateVolatility )
+        """
+        if self.VolWindow is None :
+            dropped                 = np.full( len( rows ), np.nan )
+        else:
+            full                    = self.Count[ rows ] - 1 > self.VolWindow
+            dropped                 = np.where( full, self.CalcLogReturn( rows, self.Last( 'close', rows, self.VolWindow ),
+                                                                          ( None, None, self.Last( 'close', rows, self.VolWindow + 1 ) ) ), np.nan )
+        drop, add                   = ~np.isnan( dropped ), ~np.isnan( log_return )
+        changed                     = drop | add
+        rows, dropped, log_return   = rows[ changed ], dropped[ changed ], log_return[ changed ]
+        drop, add                   = drop[ changed ], add[ changed ]
+
+        mean                        = self.ReturnMean[ rows ]
+        returns                     = self.Returns[ rows ] - drop
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            kept                    = np.where( returns > 0, mean - ( dropped - mean ) / returns, 0.0 )
+            spread                  = np.where( returns > 0, self.ReturnM2[ rows ] - ( dropped - mean ) * ( dropped - kept ), 0.0 )
+        self.ReturnM2[ rows ]       = np.where( drop, spread, self.ReturnM2[ rows ] )
+        mean                        = np.where( drop, kept, mean )
+
+        returns                     = returns + add
+        delta                       = np.where( add, log_return - mean, 0.0 )
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            mean                    = np.where( add, mean + delta / returns, mean )
+        self.ReturnM2[ rows ]      += np.where( add, delta * ( log_return - mean ), 0.0 )
+        self.ReturnMean[ rows ]     = mean
+        self.Returns[ rows ]        = returns
+        self.LastReturn[ rows ]     = np.where( add, log_return, self.LastReturn[ rows ] )
+
+        last_return                 = self.LastReturn[ rows ]
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            deviation = np.sqrt( np.fmax( self.ReturnM2[ rows ] / ( returns - 1 ), 0.0 ) )
+        deviation = np.where( returns == 0, 0.0, np.where( returns < 2, last_return, deviation ) )
+        self.VolIndex[ rows ]   = np.round( deviation, 4 )
+        self.VolAnnual[ rows ]  = np.round( np.abs( deviation ) * np.sqrt( self.VolPeriods ), 4 )
+
+
+
+    def UpdateEMA( self, rows : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Recursive EMA ( same as ewm( span, adjust=False ) )
+        """
+        ema = self.EMA9[ rows ]
+        self.EMA9[ rows ] = np.where( np.isnan( ema ), close, self.EMAAlpha * close + ( 1 - self.EMAAlpha ) * ema )
+
+
+
+    def UpdateWindows( self, rows : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Fixed windows over the close : SMA dictionary and Bollinger Bands ( values leaving a window are read from the ring )
+        """
+        length = np.minimum( self.Count[ rows ], self.Capacity )
+
+        for pos, window in enumerate( self.SMAWindows ) :
+            sums                    = self.SMASums[ pos, rows ] + close
+            drop                    = length > window
+            sums[ drop ]           -= self.Last( 'close', rows[ drop ], window )
+            self.SMASums[ pos, rows ] = sums
+            self.SMA[ pos, rows ]   = sums / np.minimum( length, window )
+
+        self.BBSum[ rows ]         += close
+        self.BBSumSq[ rows ]       += close * close
+        drop                        = rows[ length > self.BBWindow ]
+        dropped                     = self.Last( 'close', drop, self.BBWindow )
+        self.BBSum[ drop ]         -= dropped
+        self.BBSumSq[ drop ]       -= dropped * dropped
+
+        full                        = rows[ self.Count[ rows ] >= self.BBWindow ]
+        mean                        = self.BBSum[ full ] / self.BBWindow
+        variance                    = ( self.BBSumSq[ full ] - self.BBWindow * mean * mean ) / ( self.BBWindow - 1 )
+        deviation                   = np.sqrt( np.fmax( variance, 0.0 ) )
+        self.BB_Lower[ full ]       = np.round( mean - 2 * deviation, 2 )
+        self.BB_Upper[ full ]       = np.round( mean + 2 * deviation, 2 )
+
+
+
+    def UpdateChop( self, rows : np.ndarray , true_range : np.ndarray , extrema : tuple ) -> None :
+        """
+            CHOP = 100 * LOG10( SUM(TR, n) / ( MaxHi(n) - MinLo(n) ) ) / LOG10(n) ( the true ranges of the window are in the ring )
+        """
+        full                    = ~np.isnan( extrema[0] )
+        self.ChopIndex[ rows[ ~full ] ] = 50
+        rows                    = rows[ full ]
+
+        spread                  = extrema[0][ full ] - extrema[1][ full ]
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            numerator           = np.where( spread > 0, self.Window( 'tr', rows, self.ChopWindow ).sum( axis=1 ) / spread, 0 )
+            chop                = np.round( 100 * np.log10( numerator ) / math.log10( self.ChopWindow ), 2 )
+        self.ChopIndex[ rows ]  = np.where( numerator > 0, chop, -np.inf )
+
+
+
+    def UpdateADX( self, rows : np.ndarray , true_range : np.ndarray , directional : tuple ) -> None :
+        """
+            TA-Lib's ADX recursion ( see IndicatorStream.UpdateADX )
+        """
+        period      = self.ADXPeriod
+        has_prev    = ~np.isnan( directional[0] )
+        rows, true_range, plus_dm, minus_dm = rows[ has_prev ], true_range[ has_prev ], directional[0][ has_prev ], directional[1][ has_prev ]
+        seeding     = self.Count[ rows ] <= period
+
+        for name, value in ( ( 'SmoothTR', true_range ), ( 'SmoothPlusDM', plus_dm ), ( 'SmoothMinusDM', minus_dm ) ) :
+            smooth          = getattr( self, name )
+            smooth[ rows ]  = np.where( seeding, smooth[ rows ] + value, smooth[ rows ] + value - smooth[ rows ] / period )
+
+        rows        = rows[ ~seeding ]
+        count       = self.Count[ rows ]
+        has_range   = np.abs( self.SmoothTR[ rows ] ) >= ZERO
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            self.PlusDI[ rows ]     = np.where( has_range, 100 * self.SmoothPlusDM[ rows ]  / self.SmoothTR[ rows ], 0.0 )
+            self.MinusDI[ rows ]    = np.where( has_range, 100 * self.SmoothMinusDM[ rows ] / self.SmoothTR[ rows ], 0.0 )
+            total                   = self.PlusDI[ rows ] + self.MinusDI[ rows ]
+            valid                   = has_range & ( np.abs( total ) >= ZERO )
+            dx                      = np.where( valid, 100 * np.abs( self.PlusDI[ rows ] - self.MinusDI[ rows ] ) / total, 0.0 )
+
+        warming                     = count <= 2 * period
+        self.SumDX[ rows[ warming ] ] += dx[ warming ]
+        adx                         = self.ADX[ rows ]
+        adx                         = np.where( count == 2 * period, self.SumDX[ rows ] / period, adx )
+        adx                         = np.where( ~warming & valid, ( adx * (period - 1) + dx ) / period, adx )
+        self.ADX[ rows ]            = adx
+
+
+
+    def UpdateRange( self, rows : np.ndarray , high : np.ndarray , low : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Trading range of the session once a full window is available ( see IndicatorStream.UpdateRange )
+        """
+        window                  = self.RangeWindow
+        self.RangeSum[ rows ]  += close
+        drop                    = rows[ np.minimum( self.Count[ rows ], self.Capacity ) > window ]
+        self.RangeSum[ drop ]  -= self.Last( 'close', drop, window )
+
+        full                    = self.Count[ rows ] >= window
+        rows, high, low         = rows[ full ], high[ full ], low[ full ]
+        first                   = self.Count[ rows ] == window
+
+        self.SumRangeMean[ rows ]  += self.RangeSum[ rows ] / window
+        self.RangeMean[ rows ]      = self.SumRangeMean[ rows ] / ( self.Count[ rows ] - window + 1 )
+        self.RangeHigh[ rows ]      = np.where( first, self.Window( 'high', rows, window ).max( axis=1 ), np.fmax( self.RangeHigh[ rows ], high ) )
+        self.RangeLow[ rows ]       = np.where( first, self.Window( 'low' , rows, window ).min( axis=1 ), np.fmin( self.RangeLow[ rows ] , low ) )
+        for row, median in zip( rows, np.median( self.Window( 'close', rows, window ), axis=1 ) ) :
+            self.RangeMedian[ row ] = median_push( *self.Medians[ row ], float( median ) )
@@ -0,0 +1,138 @@
+## ###################################################################################################################
+##  Program :   Indicator Plan
+##  Author  :
+##  Install :
+##  Example :
+##              plan = resolve( ( 'RSI', 'Chop' ) )            # ( intermediates , groups ) in evaluation order
+##              calcs, updates = bind( plan, stream )          # the same plan on the methods of a stream / batch / series
+##  Notes   :   Registry of the intraday indicators shared by IndicatorStream ( one candle ) , IndicatorBatch ( one bar of
+##              the watch list ) and SeriesIndicators ( the whole series ) :
+##                  GROUPS        - update method -> published indicators
+##                  INPUTS        - update method -> shared intermediates it reads ( in argument order )
+##                  INTERMEDIATES - intermediate  -> intermediates it is built from ( Calc<name> )
+##              resolve() walks the dependencies once for a set of groups and returns a flat list of steps whose
+##              inputs are positions of earlier steps , so evaluating a candle is a plain loop - no lookups , no memo
+##              lookbacks() bounds how far behind a lazy group may fall before the ring overwrites a candle it still reads
+## ###################################################################################################################
+from functools  import lru_cache
+
+
+GROUPS = {                                                              # UPDATE METHOD -> INDICATORS IT PUBLISHES
+            'Session'   : ( 'dSMA', 'High', 'Low', 'dFib' ),
+            'VWAP'      : ( 'VWAP', ),
+            'RSI'       : ( 'RSI', ),
+            'Volatility': ( 'VolIndex', 'VolAnnual' ),
+            'EMA'       : ( 'EMA9', ),
+            'Windows'   : ( 'SMA', 'BB_Lower', 'BB_Upper' ),
+            'Chop'      : ( 'ChopIndex', ),
+            'ADX'       : ( 'ADX', 'PlusDI', 'MinusDI' ),
+            'Range'     : ( 'RangeHigh', 'RangeLow', 'RangeMean', 'RangeMedian' )
+         }
+
+INPUTS = {                                                              # UPDATE METHOD -> SHARED INTERMEDIATES IT READS ( in argument order )
+            'Session'   : ( 'Close', ),
+            'VWAP'      : ( 'TypicalPrice', 'Volume', 'Close' ),
+            'RSI'       : ( 'CloseDelta', ),
+            'Volatility': ( 'LogReturn', ),
+            'EMA'       : ( 'Close', ),
+            'Windows'   : ( 'Close', ),
+            'Chop'      : ( 'TrueRange', 'WindowExtrema' ),
+            'ADX'       : ( 'TrueRange', 'DirectionalMove' ),
+            'Range'     : ( 'High', 'Low', 'Close' )
+         }
+
+INTERMEDIATES = {                                                       # INTERMEDIATE -> INTERMEDIATES IT IS BUILT FROM ( Calc<name> )
+            'High'          : (),
+            'Low'           : (),
+            'Close'         : (),
+            'Volume'        : (),
+            'PriorCandle'   : (),
+            'TrueRange'     : ( 'High', 'Low', 'PriorCandle' ),
+            'CloseDelta'    : ( 'Close', 'PriorCandle' ),
+            'LogReturn'     : ( 'Close', 'PriorCandle' ),
+            'TypicalPrice'  : ( 'High', 'Low', 'Close' ),
+            'DirectionalMove': ( 'High', 'Low', 'PriorCandle' ),
+            'WindowExtrema' : ()
+         }
+
+
+
+def group_of( name : str ) -> str :
+    """
+        Group that publishes an indicator name ( None when the name is not an intraday indicator )
+    """
+    for group, names in GROUPS.items() :
+        if name in names :
+            return group
+    return None
+
+
+
+def groups_of( names : list = None ) -> tuple :
+    """
+        Groups behind a list of indicator names in declaration order ( None for every group )
+    """
+    if names is None :
+        return tuple( GROUPS )
+    wanted = { group_of( name ) for name in names }
+    return tuple( group for group in GROUPS if group in wanted )
+
+
+
+@lru_cache( maxsize=None )
+def resolve( groups : tuple ) -> tuple :
+    """
+        Flat evaluation order of a set of groups
+        ARGS   :
+                    groups ( tuple ) - group names ( declaration order is kept )
+        RETURNS:
+                    ( intermediates , updates ) - ( name , positions of its inputs in intermediates ) each ,
+                    every intermediate listed once and after the ones it is built from
+    """
+    order = []
+
+    def visit( name : str ) -> int :
+        if name not in order :
+            for dependency in INTERMEDIATES[ name ] :
+                visit( dependency )
+            order.append( name )
+        return order.index( name )
+
+    updates         = tuple( ( group, tuple( visit( name ) for name in INPUTS[ group ] ) ) for group in GROUPS if group in groups )
+    intermediates   = tuple( ( name, tuple( order.index( dependency ) for dependency in INTERMEDIATES[ name ] ) ) for name in order )
+    return intermediates, updates
+
+
+
+def bind( plan : tuple , owner : object ) -> tuple :
+    """
+        A resolved plan on the Calc<name> / Update<group> methods of an object
+        RETURNS:
+                    ( ( ( calc method , input positions ) ...) , ( ( update method , input positions ) ...) )
+    """
+    intermediates, updates = plan
+    return ( tuple( ( getattr( owner, 'Calc' + name ), inputs ) for name, inputs in intermediates ),
+             tuple( ( getattr( owner, 'Update' + group ), inputs ) for group, inputs in updates ) )
+
+
+
+def lookbacks( sma_windows : tuple , bb_window : int , chop_window : int , range_window : int , vol_window : int = None ) -> dict :
+    """
+        Candles before the one being folded that each group reads back from the ring - a group folding candle n needs
+        candles n - lookback .. n , so it can lag at most capacity - lookback candles behind the newest one
+        ARGS   :
+                    sma_windows .. vol_window - look backs of the stream / batch
+        RETURNS:
+                    dictionary of group -> candles read back
+    """
+    return {
+            'Session'   : 0,
+            'VWAP'      : 0,
+            'RSI'       : 1,                                            # PRIOR CANDLE
+            'Volatility': ( vol_window or 0 ) + 1,                      # RETURN LEAVING THE WINDOW
+            'EMA'       : 0,
+            'Windows'   : max( max( sma_windows ), bb_window ),         # CLOSE LEAVING THE LONGEST WINDOW
+            'Chop'      : max( chop_window - 1, 1 ),
+            'ADX'       : 1,
+            'Range'     : range_window
+           }
@@ -0,0 +1,470 @@
+## ###################################################################################################################
+##  Program :   Indicator Series
+##  Author  :
+##  Install :   pip3 install numpy
+##  Example :
+##              rsi = rsi_series( close = np.array([...]), window = 14 )
+##  Notes   :   Whole series ( vectorized ) versions of the indicators for back tests over long histories.
+##              Live trading uses IndicatorStream ( one candle at a time ), these must produce the same values
+## ###################################################################################################################
+import heapq
+
+import numpy as np
+
+from IndicatorPlan  import groups_of, resolve, bind
+
+
+WILDER_BLOCK = 128          # longest block for the closed form of the Wilder recursion ( keeps decay**-k well inside float range )
+WILDER_FLOOR = 1e-6         # smallest decay**k allowed inside a block ( bounds the cancellation error of the closed form )
+ZERO         = 1e-8         # TA-Lib's TA_IS_ZERO tolerance
+
+TRADING_MINUTES_PER_DAY = 5.5 * 60                                  # minute bars of a session ( incl. the pre-market seed )
+TRADING_DAYS_PER_YEAR   = 252
+MINUTES_PER_YEAR        = TRADING_MINUTES_PER_DAY * TRADING_DAYS_PER_YEAR
+
+
+
+def median_push( lower : list , upper : list , value : float ) -> float :
+    """
+        Add a value to a running median kept as two heaps - O(log n) per value
+        ARGS   :
+                    lower ( list )  - max heap ( negated ) of the lower half of the values
+                    upper ( list )  - min heap of the upper half
+                    value ( float ) - value to add
+        RETURNS:
+                    median of every value added so far
+    """
+    if lower and value > -lower[0] :
+        heapq.heappush( upper, value )
+    else :
+        heapq.heappush( lower, -value )
+
+    if len( lower ) > len( upper ) + 1 :
+        heapq.heappush( upper, -heapq.heappop( lower ) )
+    elif len( upper ) > len( lower ) :
+        heapq.heappush( lower, -heapq.heappop( upper ) )
+    return -lower[0] if len( lower ) > len( upper ) else ( upper[0] - lower[0] ) / 2
+
+
+
+def linear_recursion( last : float , decays : np.ndarray , inputs : np.ndarray ) -> np.ndarray :
+    """
+        First order recursion without a python loop over the values
+            y[i] = decays[i] * y[i-1] + inputs[i]        ( y[-1] = last )
+        inside a block of k values it has the closed form
+            y[k] = prod( decays[..k] ) * ( last + cumsum( inputs[j] / prod( decays[..j] ) ) )
+        which is evaluated with numpy one block at a time
+        a zero decay forgets everything before it ( wilder_smooth with window 1 ) , the recursion restarts there
+        ARGS   :
+                    last   ( float )      - value before the first input
+                    decays ( np.ndarray ) - multiplier of the previous value at every step ( 0 <= decay <= 1 )
+                    inputs ( np.ndarray ) - value added at every step
+        RETURNS:
+                    np.ndarray of the recursion ( same length as inputs )
+    """
+    output      = np.empty( len( inputs ) )
+    smallest    = np.min( decays ) if len( decays ) > 0 else 1.0
+    if smallest <= 0 :                                                  # NO CLOSED FORM ACROSS A ZERO ( log / division by 0 )
+        output[:]   = inputs
+        restarts    = np.flatnonzero( decays <= 0 )
+        if len( restarts ) == len( decays ) :
+            return output
+        for start, end in zip( np.r_[ -1, restarts ], np.r_[ restarts, len( inputs ) ] ) :
+            if end > start + 1 :
+                output[ start + 1 : end ] = linear_recursion( last if start < 0 else output[ start ], decays[ start + 1 : end ], inputs[ start + 1 : end ] )
+        return output
+
+    block       = WILDER_BLOCK if smallest >= 1 else int( max( 1, min( WILDER_BLOCK, np.log( WILDER_FLOOR ) / np.log( smallest ) ) ) )
+
+    for start in range( 0, len( inputs ), block ):
+        scale   = np.cumprod( decays[ start : start + block ] )
+        values  = scale * ( last + np.cumsum( inputs[ start : start + block ] / scale ) )
+        output[ start : start + len( values ) ] = values
+        last    = values[-1]
+
+    return output
+
+
+
+def wilder_smooth( values : np.ndarray , window : int = 14 ) -> np.ndarray :
+    """
+        Wilder smoothing without a python loop over the values
+            avg[i] = mean( values[..i] )                          i <  window  ( NaN entries ignored, like rolling( min_periods=1 ) )
+            avg[i] = ( avg[i-1] * (window-1) + values[i] ) / window  i >= window
+        The tail is a first order filter evaluated by linear_recursion
+        ARGS   :
+                    values ( np.ndarray ) - series to smooth ( gains / losses / true range ...)
+                    window ( int )        - Wilder period
+        RETURNS:
+                    np.ndarray of the smoothed values ( same length as values )
+    """
+    values  = np.asarray( values, dtype=float )
+    smooth  = np.full( len( values ), np.nan )
+    if len( values ) == 0 :
+        return smooth
+
+    head    = values[ :window ]
+    valid   = ~np.isnan( head )
+    counts  = np.cumsum( valid )
+    sums    = np.cumsum( np.where( valid, head, 0.0 ) )
+    with np.errstate( invalid='ignore', divide='ignore' ):
+        smooth[ :len(head) ] = np.where( counts > 0, sums / np.maximum( counts, 1 ), np.nan )
+
+    if len( values ) <= window :
+        return smooth
+
+    rest                = values[ window: ]
+    smooth[ window: ]   = linear_recursion( smooth[ window - 1 ], np.full( len( rest ), ( window - 1 ) / window ), rest / window )
+
+    return smooth
+
+
+
+def rsi_series( close : np.ndarray , window : int = 14 ) -> np.ndarray :
+    """
+        Wilder RSI over the whole close series ( rounded to 2 decimals like Indicators.CalculateRSI )
+        ARGS   :
+                    close  ( np.ndarray ) - close prices in time order
+                    window ( int )        - RSI period
+        RETURNS:
+                    np.ndarray of the RSI values , NaN where it is not defined yet
+    """
+    close       = np.asarray( close, dtype=float )
+    return delta_rsi_series( np.diff( close, prepend=np.nan ), window )
+
+
+
+def delta_rsi_series( delta : np.ndarray , window : int = 14 ) -> np.ndarray :
+    """
+        Wilder RSI from the close to close changes ( NaN where there is no prior close ) - see rsi_series
+    """
+    avg_gain    = wilder_smooth( np.where( np.isnan( delta ), np.nan, np.clip( delta, 0, None ) ), window )
+    avg_loss    = wilder_smooth( np.where( np.isnan( delta ), np.nan, np.clip( -delta, 0, None ) ), window )
+
+    with np.errstate( invalid='ignore', divide='ignore' ):
+        rsi = 100 - ( 100 / ( 1 + avg_gain / avg_loss ) )
+
+    return np.round( rsi, 2 )
+
+
+
+def ema_series( close : np.ndarray , span : int = 9 ) -> np.ndarray :
+    """
+        Recursive EMA over the whole close series ( ewm( span, adjust=False ) ) with linear_recursion
+            EMA[i] = ( 1 - alpha ) * EMA[i-1] + alpha * close[i]        ( EMA[0] = close[0] )
+        agrees with IndicatorStream.UpdateEMA to ~1e-12 , a close within rounding of its EMA ( long flat runs ) can
+        compare the other way
+        ARGS   :
+                    close ( np.ndarray ) - close prices in time order
+                    span  ( int )        - EMA span ( 9 -> EMA9 )
+        RETURNS:
+                    np.ndarray of the EMA values
+    """
+    close   = np.asarray( close, dtype=float )
+    alpha   = 2 / ( span + 1 )
+    if len( close ) == 0 :
+        return np.empty( 0 )
+
+    return np.r_[ close[0], linear_recursion( close[0], np.full( len( close ) - 1, 1 - alpha ), alpha * close[1:] ) ]
+
+
+
+def chop_series( high : np.ndarray , low : np.ndarray , close : np.ndarray , window : int = 4 ) -> np.ndarray :
+    """
+        Chop Index over the whole series ( same values as IndicatorStream.UpdateChop )
+            CHOP = 100 * LOG10( SUM(TR, n) / ( MaxHi(n) - MinLo(n) ) ) / LOG10(n)
+        50 until the window is full , -inf when the true range sums to zero
+        ARGS   :
+                    high / low / close ( np.ndarray ) - candle prices in time order
+                    window             ( int )        - look back
+        RETURNS:
+                    np.ndarray of the Chop Index values
+    """
+    return SeriesIndicators( high, low, close, chop_window=window ).Values( [ 'ChopIndex' ] )['ChopIndex']
+
+
+
+def adx_series( high : np.ndarray , low : np.ndarray , close : np.ndarray , period : int = 7 ) -> (np.ndarray, np.ndarray, np.ndarray) :
+    """
+        ADX / +DI / -DI over the whole series with TA-Lib's recursion ( same values as talib.ADX / PLUS_DI / MINUS_DI )
+            TR, +DM, -DM    - summed over the first period-1 changes, then S = S - S/period + x
+            +DI / -DI       - 100 * smoothed DM / smoothed TR                       ( from index period )
+            ADX             - mean of the first period DX values, then Wilder smoothed ( from index 2*period-1 )
+        ARGS   :
+                    high / low / close ( np.ndarray ) - candle prices in time order
+                    period             ( int )        - Wilder period
+        RETURNS:
+                    ( adx, plus_di, minus_di ) np.ndarrays , NaN where they are not defined yet
+    """
+    values = SeriesIndicators( high, low, close, adx_period=period ).Values( [ 'ADX', 'PlusDI', 'MinusDI' ] )
+    return values['ADX'], values['PlusDI'], values['MinusDI']
+
+
+
+def return_volatility( close : np.ndarray , window : int = None ) -> (float, int) :
+    """
+        Sample standard deviation of the log returns ( np.std with ddof=1 ) over the last window - the value
+        IndicatorStream.UpdateVolatility reaches one candle at a time
+        ARGS   :
+                    close  ( np.ndarray ) - closes, oldest first
+                    window ( int )        - only the last 'window' returns ( None for all of them )
+        RETURNS:
+                    ( standard deviation , number of returns it covers ) - nan when fewer than 2 returns
+    """
+    close   = np.asarray( close, dtype=np.float64 )
+    with np.errstate( invalid='ignore', divide='ignore' ):
+        returns = np.log( close[1:] / close[:-1] )
+    returns = returns[ np.isfinite( returns ) ]
+    if window is not None :
+        returns = returns[ -window: ]
+
+    if len( returns ) < 2 :
+        return np.nan, len( returns )
+    return float( np.std( returns, ddof=1 ) ), len( returns )
+
+
+
+class SeriesIndicators :
+    def __init__( self, high : np.ndarray , low : np.ndarray , close : np.ndarray , volume : np.ndarray = None ,
+                        rsi_window : int = 14, ema_span : int = 9, bb_window : int = 15, chop_window : int = 4,
+                        adx_period : int = 7, range_window : int = 20, sma_windows : tuple = (9, 14, 21, 50, 200),
+                        vol_window : int = None, vol_periods : float = MINUTES_PER_YEAR ) -> None :
+        """
+            Intraday indicators of a whole series along the plan of IndicatorStream ( same intermediates , same
+            groups ) , every step one numpy operation over the series instead of one call per candle
+            ARGS   :
+                        high / low / close / volume ( np.ndarray ) - candles in time order ( volume only for the VWAP )
+                        rsi_window .. vol_periods                  - same look backs as IndicatorStream
+            RETURNS:
+                        nothing
+        """
+        self.Columns    = { 'high' : np.asarray( high, dtype=float ), 'low' : np.asarray( low, dtype=float ), 'close' : np.asarray( close, dtype=float ) }
+        self.Columns['volume'] = np.zeros( len( self.Columns['close'] ) ) if volume is None else np.asarray( volume, dtype=float )
+        self.RSIWindow  = rsi_window
+        self.EMASpan    = ema_span
+        self.BBWindow   = bb_window
+        self.ChopWindow = chop_window
+        self.ADXPeriod  = adx_period
+        self.RangeWindow= range_window
+        self.SMAWindows = sma_windows
+        self.VolWindow  = vol_window
+        self.VolPeriods = vol_periods
+        self.Output     = {}                                            # published name -> np.ndarray ( one value per candle )
+
+
+
+    def Values( self, names : list = None ) -> dict :
+        """
+            Arrays of the indicators , only the groups behind the names are calculated ( NaN where not defined yet )
+            ARGS   :
+                        names ( list ) - published names ( RSI, EMA9, SMA ...) , None for every one ( dFib is not a series )
+            RETURNS:
+                        dictionary of name -> np.ndarray ( SMA -> { SMA9 : np.ndarray ...} )
+        """
+        calcs, updates  = bind( resolve( groups_of( names ) ), self )
+        values          = []
+        for calc, inputs in calcs :
+            values.append( calc( *[ values[ pos ] for pos in inputs ] ) )
+        for update, inputs in updates :
+            update( *[ values[ pos ] for pos in inputs ] )
+        return dict( self.Output ) if names is None else { name : self.Output[ name ] for name in names if name in self.Output }
+
+
+
+    def Shifted( self, field : str ) -> np.ndarray :
+        """
+            Column one candle later ( NaN on the first candle )
+        """
+        return np.concatenate( [ [ np.nan ], self.Columns[ field ][ :-1 ] ] )
+
+
+
+    def Windows( self, values : np.ndarray , window : int ) -> np.ndarray :
+        """
+            Sliding windows over a column ( one row per full window , read only view )
+        """
+        return np.lib.stride_tricks.sliding_window_view( values, window ) if len( values ) >= window else np.empty( ( 0, window ) )
+
+
+    def CalcHigh( self ) -> np.ndarray :
+        return self.Columns['high']
+
+
+    def CalcLow( self ) -> np.ndarray :
+        return self.Columns['low']
+
+
+    def CalcClose( self ) -> np.ndarray :
+        return self.Columns['close']
+
+
+    def CalcVolume( self ) -> np.ndarray :
+        return self.Columns['volume']
+
+
+    def CalcPriorCandle( self ) -> tuple :
+        return tuple( self.Shifted( field ) for field in ( 'high', 'low', 'close' ) )
+
+
+    def CalcTrueRange( self, high : np.ndarray , low : np.ndarray , prior : tuple ) -> np.ndarray :
+        return np.fmax( high - low, np.fmax( np.abs( high - prior[2] ), np.abs( low - prior[2] ) ) )
+
+
+    def CalcCloseDelta( self, close : np.ndarray , prior : tuple ) -> np.ndarray :
+        return close - prior[2]
+
+
+    def CalcLogReturn( self, close : np.ndarray , prior : tuple ) -> np.ndarray :
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            valid = ( prior[2] > 0 ) & ( close > 0 )
+            return np.where( valid, np.log( np.where( valid, close / prior[2], 1.0 ) ), np.nan )
+
+
+    def CalcTypicalPrice( self, high : np.ndarray , low : np.ndarray , close : np.ndarray ) -> np.ndarray :
+        return ( high + low + close ) / 3
+
+
+    def CalcDirectionalMove( self, high : np.ndarray , low : np.ndarray , prior : tuple ) -> tuple :
+        up_move     = high - prior[0]
+        down_move   = prior[1] - low
+        first       = np.isnan( prior[0] )
+        return ( np.where( first, np.nan, np.where( ( up_move > down_move ) & ( up_move > 0 ), up_move, 0.0 ) ),
+                 np.where( first, np.nan, np.where( ( down_move > up_move ) & ( down_move > 0 ), down_move, 0.0 ) ) )
+
+
+    def CalcWindowExtrema( self ) -> tuple :
+        """
+            ( highest high, lowest low ) over the Chop Index window ( NaN until the window is full )
+        """
+        highest, lowest = np.full( len( self.Columns['close'] ), np.nan ), np.full( len( self.Columns['close'] ), np.nan )
+        highest[ self.ChopWindow - 1: ] = self.Windows( self.Columns['high'], self.ChopWindow ).max( axis=1 )
+        lowest[ self.ChopWindow - 1: ]  = self.Windows( self.Columns['low'], self.ChopWindow ).min( axis=1 )
+        return highest, lowest
+
+
+
+    def UpdateSession( self, close : np.ndarray ) -> None :
+        self.Output['dSMA'] = np.cumsum( close ) / np.arange( 1, len( close ) + 1 )
+        self.Output['High'] = np.maximum.accumulate( close ) if len( close ) > 0 else close
+        self.Output['Low']  = np.minimum.accumulate( close ) if len( close ) > 0 else close
+
+
+    def UpdateVWAP( self, typical_price : np.ndarray , volume : np.ndarray , close : np.ndarray ) -> None :
+        price_volume, total = np.cumsum( typical_price * volume ), np.cumsum( volume )
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            self.Output['VWAP'] = np.where( total > 0, price_volume / total, close )
+
+
+    def UpdateRSI( self, delta : np.ndarray ) -> None :
+        self.Output['RSI'] = delta_rsi_series( delta, self.RSIWindow )
+
+
+    def UpdateVolatility( self, log_return : np.ndarray ) -> None :
+        """
+            Sample standard deviation of the returns so far ( or of the last vol_window ) - std( ddof=1 ) over sliding
+            windows , running sums for the expanding part ; the log return itself while there are fewer than 2
+        """
+        deviation   = np.zeros( len( log_return ) )
+        returns     = log_return[ 1: ]
+        if len( returns ) > 0 :
+            count           = np.arange( 1, len( returns ) + 1 )
+            shifted         = returns - returns[0]                      # RUNNING SUMS OF THE OFFSETS , NO CANCELLATION ON THE MEAN
+            with np.errstate( invalid='ignore', divide='ignore' ):
+                expanding   = np.sqrt( np.fmax( ( np.cumsum( shifted * shifted ) - np.cumsum( shifted ) ** 2 / count ) / ( count - 1 ), 0.0 ) )
+            expanding[ count < 2 ] = returns[ count < 2 ]
+            if self.VolWindow is not None and len( returns ) > self.VolWindow :
+                expanding[ self.VolWindow: ] = self.Windows( returns, self.VolWindow )[ 1: ].std( axis=1, ddof=1 )
+            deviation[ 1: ] = expanding
+        self.Output['VolIndex']     = np.round( deviation, 4 )
+        self.Output['VolAnnual']    = np.round( np.abs( deviation ) * np.sqrt( self.VolPeriods ), 4 )
+
+
+    def UpdateEMA( self, close : np.ndarray ) -> None :
+        self.Output['EMA9'] = ema_series( close, self.EMASpan )
+
+
+    def UpdateWindows( self, close : np.ndarray ) -> None :
+        """
+            SMA dictionary ( the mean of what is there until a window is full ) and Bollinger Bands
+        """
+        total       = np.concatenate( [ [ 0.0 ], np.cumsum( close ) ] )
+        count       = np.arange( 1, len( close ) + 1 )
+        sma         = {}
+        for window in self.SMAWindows :
+            start               = np.maximum( count - window, 0 )
+            sma[ f'SMA{window}' ] = ( total[ count ] - total[ start ] ) / ( count - start )
+        self.Output['SMA'] = sma
+
+        lower, upper    = np.full( len( close ), np.nan ), np.full( len( close ), np.nan )
+        windows         = self.Windows( close, self.BBWindow )
+        mean, deviation = windows.mean( axis=1 ), windows.std( axis=1, ddof=1 )
+        lower[ self.BBWindow - 1: ] = np.round( mean - 2 * deviation, 2 )
+        upper[ self.BBWindow - 1: ] = np.round( mean + 2 * deviation, 2 )
+        self.Output['BB_Lower'], self.Output['BB_Upper'] = lower, upper
+
+
+    def UpdateChop( self, true_range : np.ndarray , extrema : tuple ) -> None :
+        """
+            CHOP = 100 * LOG10( SUM(TR, n) / ( MaxHi(n) - MinLo(n) ) ) / LOG10(n) , 50 until the window is full
+        """
+        window  = self.ChopWindow
+        chop    = np.full( len( true_range ), 50.0 )
+        if len( true_range ) >= window :
+            total   = self.Windows( true_range, window ).sum( axis=1 )
+            spread  = extrema[0][ window-1: ] - extrema[1][ window-1: ]
+            with np.errstate( invalid='ignore', divide='ignore' ):
+                numerator           = np.where( spread > 0, total / spread, 0.0 )
+                chop[ window-1: ]   = np.where( numerator > 0, np.round( 100 * np.log10( numerator ) / np.log10( window ), 2 ), -np.inf )
+        self.Output['ChopIndex'] = chop
+
+
+    def UpdateADX( self, true_range : np.ndarray , directional : tuple ) -> None :
+        """
+            TA-Lib's recursion ( see adx_series ) on the changes from the second candle on
+        """
+        period  = self.ADXPeriod
+        length  = len( true_range )
+        adx, plus_di, minus_di = np.full( length, np.nan ), np.full( length, np.nan ), np.full( length, np.nan )
+        self.Output['ADX'], self.Output['PlusDI'], self.Output['MinusDI'] = adx, plus_di, minus_di
+        if length <= period :
+            return
+
+        decays      = np.full( length - period, ( period - 1 ) / period )
+        smooth_tr, smooth_plus, smooth_minus = ( linear_recursion( values[ :period-1 ].sum(), decays, values[ period-1: ] )
+                                                        for values in ( true_range[1:], directional[0][1:], directional[1][1:] ) )
+
+        has_range   = np.abs( smooth_tr ) >= ZERO
+        with np.errstate( invalid='ignore', divide='ignore' ):
+            plus        = np.where( has_range, 100 * smooth_plus  / smooth_tr, 0.0 )
+            minus       = np.where( has_range, 100 * smooth_minus / smooth_tr, 0.0 )
+            total       = plus + minus
+            valid       = has_range & ( np.abs( total ) >= ZERO )
+            dx          = np.where( valid, 100 * np.abs( plus - minus ) / total, 0.0 )
+        plus_di[ period: ], minus_di[ period: ] = plus, minus
+
+        if length < 2 * period :
+            return
+        first       = dx[ :period ].sum() / period
+        rest        = slice( period, None )
+        adx[ 2*period - 1 ] = first
+        adx[ 2*period: ]    = linear_recursion( first, np.where( valid[ rest ], ( period - 1 ) / period, 1.0 ), np.where( valid[ rest ], dx[ rest ] / period, 0.0 ) )
+
+
+    def UpdateRange( self, high : np.ndarray , low : np.ndarray , close : np.ndarray ) -> None :
+        """
+            Trading range once a full window is available ( see IndicatorStream.UpdateRange ) - the median of the
+            window medians is the one step that stays a loop ( a running median , two heaps )
+        """
+        window  = self.RangeWindow
+        names   = ( 'RangeHigh', 'RangeLow', 'RangeMean', 'RangeMedian' )
+        for name in names :
+            self.Output[ name ] = np.full( len( close ), np.nan )
+        if len( close ) < window :
+            return
+
+        self.Output['RangeHigh'][ window-1: ]   = np.maximum.accumulate( high )[ window-1: ]
+        self.Output['RangeLow'][ window-1: ]    = np.minimum.accumulate( low )[ window-1: ]
+        means                                   = self.Windows( close, window ).mean( axis=1 )
+        self.Output['RangeMean'][ window-1: ]   = np.cumsum( means ) / np.arange( 1, len( means ) + 1 )
+        lower, upper                            = [], []
+        self.Output['RangeMedian'][ window-1: ] = [ median_push( lower, upper, float( median ) ) for median in np.median( self.Windows( close, window ), axis=1 ) ]
@@ -0,0 +1,88 @@
+## ###################################################################################################################
+##  Program :   Indicator Snapshot
+##  Author  :
+##  Install :
+##  Example :
+##              snapshot = indicators.Summary()                 # same object until the next candle is applied
+##              snapshot['RSI'] , snapshot.get( 'VWAP' ) , list( snapshot.keys() )
+##  Notes   :   Immutable, read only view of the indicator values of one bar.
+##              The names are a tuple shared by every snapshot with the same layout ( one name -> position index per
+##              layout ) and the values a tuple in the same order, so a snapshot costs two references and behaves like
+##              the dictionary Summary() used to return ( TradeAccount order records, TraderDB.InsertOrderIndicators )
+## ###################################################################################################################
+from collections.abc    import Mapping
+
+
+
+class IndicatorSnapshot( Mapping ) :
+    __slots__   = ( 'Names', 'Values', 'Index' )
+    Layouts     = {}                    # names tuple -> ( names, { name : position } ) , shared by every snapshot
+
+    def __init__( self, names : tuple , values : tuple ) -> None :
+        """
+            INITIALIZE THE SNAPSHOT
+            ARGS   :
+                        names  ( tuple ) - indicator names in a fixed order
+                        values ( tuple ) - values in the same order
+            RETURNS:
+                        nothing
+        """
+        names = tuple( names )
+        if not ( names in IndicatorSnapshot.Layouts ) :
+            IndicatorSnapshot.Layouts[ names ] = ( names, { name : pos for pos, name in enumerate( names ) } )
+        names, index = IndicatorSnapshot.Layouts[ names ]
+
+        if len( values ) != len( names ) :
+            raise ValueError( f"IndicatorSnapshot : {len(names)} names for {len(values)} values" )
+
+        object.__setattr__( self, 'Names' , names )
+        object.__setattr__( self, 'Values', tuple( values ) )
+        object.__setattr__( self, 'Index' , index )
+
+
+
+    def __setattr__( self, name : str , value : object ) -> None :
+        raise AttributeError( "IndicatorSnapshot is read only" )
+
+
+
+    def __delattr__( self, name : str ) -> None :
+        raise AttributeError( "IndicatorSnapshot is read only" )
+
+
+
+    def __reduce__( self ) -> tuple :
+        """
+            Pickle through the constructor ( the slots can not be set once built )
+        """
+        return ( IndicatorSnapshot, ( self.Names, self.Values ) )
+
+
+
+    def __getitem__( self, name : str ) -> object :
+        return self.Values[ self.Index[ name ] ]
+
+
+
+    def __iter__( self ) :
+        return iter( self.Names )
+
+
+
+    def __len__( self ) -> int :
+        return len( self.Names )
+
+
+
+    def __contains__( self, name : object ) -> bool :
+        return name in self.Index
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return str( dict( zip( self.Names, self.Values ) ) )
+
+    __repr__ = __str__
@@ -0,0 +1,557 @@
+## ###################################################################################################################
+##  Program :   Indicator Stream
+##  Author  :
+##  Install :
+##  Example :
+##              stream = IndicatorStream()
+##              stream.Update( open=1.0, high=1.2, low=0.9, close=1.1, volume=1000, timestamp=1754400000000 )
+##  Notes   :   Stateful, constant time per candle version of the intraday indicators in Indicators.Calculate()
+##              Every indicator keeps only the running sums / recursive state / fixed window it needs, so the
+##              cost of a new candle does not grow with the length of the session
+##              Groups that are not Require()d are folded lazily from the CandleBuffer when read ; one that falls so far
+##              behind that the buffer is about to overwrite a candle it still reads is folded on that candle instead
+##              ( see Limit ) , so a lazy indicator is never computed over a gap
+##              Quantities several indicators read ( true range, close change, directional move ... ) are declared in
+##              IndicatorPlan.INTERMEDIATES and computed once per candle for every group folding that candle , along a
+##              plan resolved once per set of groups ( see Plan )
+## ###################################################################################################################
+import sys
+import math
+import inspect
+
+import numpy        as np
+
+from collections    import deque
+from CandleBuffer   import CandleBuffer, CANDLES_PER_DAY
+from IndicatorSeries import ZERO, MINUTES_PER_YEAR, median_push
+from IndicatorPlan   import GROUPS, INPUTS, INTERMEDIATES, group_of, groups_of, resolve, bind, lookbacks
+
+
+def fibonacci_levels( high : float , low : float ) -> dict :
+    """
+        Calculate the Fibonacci levels based on the high and low given
+        ARGS   :
+                    high ( float ) - highest value of data series
+                    low  ( float ) - lowest values of data series
+        RETURNS:
+                    dictionary of fib levels
+    """
+    diff = high - low
+    return {
+            '0%'    : low,
+            '23.6%' : high - (diff * 0.236),
+            '38.2%' : high - (diff * 0.382),
+            '50%'   : high - (diff * 0.5),      # 50% is commonly used but not a true Fibonacci ratio
+            '61.8%' : high - (diff * 0.618),
+            '78.6%' : high - (diff * 0.786),
+            '100%'  : high
+            }
+
+
+
+class IndicatorStream :
+    GROUPS          = GROUPS                                            # SHARED REGISTRY ( see IndicatorPlan )
+    INPUTS          = INPUTS
+    INTERMEDIATES   = INTERMEDIATES
+    TRANSIENT       = ( 'Plans', )                                      # CACHES A CHECKPOINT LEAVES OUT ( restored empty )
+
+    def __init__( self, rsi_window : int = 14, ema_span : int = 9, bb_window : int = 15, chop_window : int = 4,
+                        adx_period : int = 7, range_window : int = 20, sma_windows : tuple = (9, 14, 21, 50, 200),
+                        vol_window : int = None, vol_periods : float = MINUTES_PER_YEAR, capacity : int = CANDLES_PER_DAY,
+                        dtype : object = np.float64 ) -> None :
+        """
+            INITIALIZE THE RUNNING STATE FOR EVERY INTRADAY INDICATOR
+            ARGS   :
+                        rsi_window   ( int )   - Wilder period for the RSI
+                        ema_span     ( int )   - span of the EMA ( 9 -> EMA9 )
+                        bb_window    ( int )   - look back for the Bollinger Bands
+                        chop_window  ( int )   - look back for the Chop Index
+                        adx_period   ( int )   - Wilder period for the ADX
+                        range_window ( int )   - look back for the trading range ( RangeHigh / RangeLow ...)
+                        sma_windows  ( tuple ) - look backs for the SMA dictionary
+                        vol_window   ( int )   - log returns in the volatility ( None for the whole session )
+                        vol_periods  ( float ) - bars per year used to annualize the volatility ( minute bars by default )
+                        capacity     ( int )   - candles kept in the CandleBuffer ( never less than the longest look back )
+                        dtype        ( dtype ) - storage type of the candle prices ( np.float32 for large watch lists )
+            RETURNS:
+                        nothing
+        """
+        self.RSIWindow      = rsi_window
+        self.EMAAlpha       = 2 / ( ema_span + 1 )
+        self.BBWindow       = bb_window
+        self.ChopWindow     = chop_window
+        self.ADXPeriod      = adx_period
+        self.RangeWindow    = range_window
+        self.SMAWindows     = sma_windows
+        self.VolWindow      = vol_window
+        self.VolPeriods     = vol_periods
+
+        # PUBLISHED VALUES - SAME NAMES AS THE Indicators CLASS
+        self.SMA            = { f'SMA{window}' : 0 for window in sma_windows }
+        self.RSI            = math.nan
+        self.VWAP           = 0
+        self.dSMA           = 0
+        self.dFib           = {}
+        self.EMA9           = None
+        self.High           = 0
+        self.Low            = 0
+        self.ADX            = 0
+        self.PlusDI         = 0
+        self.MinusDI        = 0
+        self.BB_Lower       = math.nan
+        self.BB_Upper       = math.nan
+        self.VolIndex       = 0                                         # standard deviation of the bar log returns
+        self.VolAnnual      = 0                                         # VolIndex * sqrt( vol_periods )
+        self.ChopIndex      = 50
+        self.RangeHigh      = math.nan
+        self.RangeLow       = math.nan
+        self.RangeMean      = math.nan
+        self.RangeMedian    = math.nan
+
+        # RUNNING STATE
+        self.Count          = 0                                         # candles seen this session
+        self.Timestamp      = None                                      # epoch ms of the last candle applied
+        self.PrevClose      = None
+        self.PrevHigh       = None
+        self.PrevLow        = None
+        self.SumClose       = 0.0
+        self.SumPV          = 0.0                                       # VWAP : sum( typical price * volume )
+        self.SumVolume      = 0.0                                       # VWAP : sum( volume )
+        self.AvgGain        = 0.0                                       # RSI  : Wilder average gain
+        self.AvgLoss        = 0.0                                       # RSI  : Wilder average loss
+        self.Returns        = 0                                         # Volatility : log returns folded ( in the window )
+        self.ReturnMean     = 0.0                                       # Volatility : Welford mean of the log returns
+        self.ReturnM2       = 0.0                                       # Volatility : Welford sum of squared deviations
+        self.LastReturn     = math.nan
+        self.SmoothTR       = 0.0                                       # ADX  : TA-Lib smoothed ( summed ) true range
+        self.SmoothPlusDM   = 0.0
+        self.SmoothMinusDM  = 0.0
+        self.SumDX          = 0.0                                       # ADX  : sum of the first period DX values
+        self.SumRangeMean   = 0.0                                       # Range: sum of every full window mean
+        self.MedianLower    = []                                        # Range: lower / upper half of every full window median
+        self.MedianUpper    = []
+        self.Candles        = CandleBuffer( capacity = max( capacity, max(sma_windows) + 1, bb_window + 1, chop_window, range_window + 1, ( vol_window or 0 ) + 2 ), dtype = dtype )
+        self.TrueRanges     = deque( maxlen = chop_window )
+        self.SMASums        = { window : 0.0 for window in sma_windows }
+        self.BBSum          = 0.0
+        self.BBSumSq        = 0.0
+        self.RangeSum       = 0.0
+        self.Required       = set( self.GROUPS )                        # groups folded on every candle ( see Require )
+        self.Applied        = { group : 0 for group in self.GROUPS }    # candles each group has folded
+        self.Lookback       = lookbacks( sma_windows, bb_window, chop_window, range_window, vol_window )
+        self.Horizon        = math.inf                                  # candle on which the lazy groups must be folded ( see Limit )
+        self.Plans          = {}                                        # groups -> steps bound to this stream ( see Plan )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"Candles : {self.Count}  VWAP : {self.VWAP}  RSI : {self.RSI}  EMA9 : {self.EMA9}  ADX : {self.ADX}" +
+                 f"\n Bollinger Bands : {self.BB_Lower} -> {self.BB_Upper}    Chop_Index : {self.ChopIndex}  Volatility : {self.VolIndex}" )
+
+
+
+    def Nbytes( self ) -> int :
+        """
+            Memory held by the candles and the fixed windows in bytes ( the running sums are a few dozen floats )
+        """
+        return self.Candles.Nbytes() + 8 * len( self.TrueRanges )
+
+
+
+    def Require( self, names : list = None ) -> None :
+        """
+            Keep only the groups behind these indicator names current on every candle, the others catch up
+            from the CandleBuffer the first time they are read ( see Values )
+            ARGS   :
+                        names ( list ) - published names ( RSI, EMA9 ...) , None for every indicator
+            RETURNS:
+                        nothing
+        """
+        self.Required = set( groups_of( names ) )
+        self.Horizon  = self.Limit()
+
+
+
+    def Limit( self ) -> float :
+        """
+            Newest candle the lazy groups can let go by unread : past it the CandleBuffer overwrites a candle one of them
+            still reads ( Applied + capacity - lookback , see IndicatorPlan.lookbacks )
+        """
+        return min( [ self.Applied[ group ] + self.Candles.Capacity - self.Lookback[ group ] for group in self.GROUPS if group not in self.Required ],
+                    default = math.inf )
+
+
+
+    def Group( self, name : str ) -> str :
+        """
+            Group that publishes an indicator name ( None when the name is not an intraday indicator )
+        """
+        return group_of( name )
+
+
+
+    def Plan( self, groups : tuple ) -> tuple :
+        """
+            Steps that fold one candle into these groups - resolved and bound once per set of groups
+            ( see IndicatorPlan.resolve ) , a cache rebuilt on first use after a Checkpoint restore
+        """
+        plan = self.Plans.get( groups )
+        if plan is None :
+            plan = self.Plans[ groups ] = bind( resolve( groups ), self )
+        return plan
+
+
+
+    def Values( self, names : list = None ) -> dict :
+        """
+            Current values of the indicators, bringing their groups up to the last candle first ( memoized per candle )
+            ARGS   :
+                        names ( list ) - published names wanted , None for every indicator
+            RETURNS:
+                        dictionary of name -> value
+        """
+        names = [ name for group in self.GROUPS.values() for name in group ] if names is None else names
+        self.Fold( { self.Group( name ) for name in names } - { None } )
+        return { name : getattr( self, name ) for name in names }
+
+
+
+    def Refresh( self ) -> None :
+        """
+            Bring every group up to the last candle
+        """
+        self.Fold( self.GROUPS )
+
+
+
+    def Fold( self, groups : list ) -> None :
+        """
+            Apply the candles the groups have not seen yet , oldest first and candle by candle so that the
+            groups folding the same candle share its intermediates ( nothing to do when they are current )
+            Raises ValueError when a candle a group still needs was already overwritten in the CandleBuffer
+        """
+        groups  = [ group for group in self.GROUPS if group in groups ]  # KEEP THE DECLARATION ORDER
+        for group in groups :
+            if self.Count - self.Applied[ group ] > self.Candles.Capacity - self.Lookback[ group ] :
+                raise ValueError( f"IndicatorStream : {group} is {self.Count - self.Applied[ group ]} candles behind , "
+                                  f"past the {self.Candles.Capacity} candles of the buffer" )
+
+        for count in range( min( [ self.Count ] + [ self.Applied[ group ] for group in groups ] ) + 1, self.Count + 1 ) :
+            due             = tuple( group for group in groups if self.Applied[ group ] < count )
+            calcs, updates  = self.Plan( due )
+            back            = self.Count - count
+            values          = []
+            for calc, inputs in calcs :
+                values.append( calc( count, back, *[ values[ pos ] for pos in inputs ] ) )
+            for update, inputs in updates :
+                update( count, back, *[ values[ pos ] for pos in inputs ] )
+            for group in due :
+                self.Applied[ group ] = count
+
+        if not self.Required.issuperset( groups ) :
+            self.Horizon = self.Limit()
+
+
+
+    def Update( self, open : float, high : float, low : float, close : float, volume : float, timestamp : int = None ) -> None :
+        """
+            Store one candle and fold it into the required indicators - O(1) regardless of session length
+            ARGS   :
+                        open / high / low / close ( float ) - candle prices
+                        volume                    ( float ) - candle volume
+                        timestamp                 ( int )   - epoch milliseconds of the candle
+            RETURNS:
+                        nothing
+        """
+        try:
+            open, high, low, close, volume = float(open), float(high), float(low), float(close), float(volume)
+
+            self.Count     += 1
+            self.Timestamp  = timestamp
+            self.Candles.Append( open, high, low, close, volume, timestamp )
+
+            self.Fold( self.Required )
+            if self.Count >= self.Horizon :                             # A LAZY GROUP IS ABOUT TO LOSE A CANDLE IT READS
+                self.Refresh()
+
+            self.PrevClose  = float( self.Candles.Last( 'close' ) )     # AS STORED ( float32 in compact mode )
+            self.PrevHigh   = float( self.Candles.Last( 'high' ) )
+            self.PrevLow    = float( self.Candles.Last( 'low' ) )
+        except:
+            print("\t\t|EXCEPTION: IndicatorStream::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+
+
+    def CalcHigh( self, count : int , back : int ) -> float :
+        return float( self.Candles.Last( 'high', back ) )          # PYTHON FLOATS , THE RUNNING SUMS STAY float64 WITH float32 CANDLES
+
+
+    def CalcLow( self, count : int , back : int ) -> float :
+        return float( self.Candles.Last( 'low', back ) )
+
+
+    def CalcClose( self, count : int , back : int ) -> float :
+        return float( self.Candles.Last( 'close', back ) )
+
+
+    def CalcVolume( self, count : int , back : int ) -> float :
+        return float( self.Candles.Last( 'volume', back ) )
+
+
+    def CalcPriorCandle( self, count : int , back : int ) -> tuple :
+        """
+            ( high, low, close ) of the candle before the one being folded ( None on the first candle of the session )
+        """
+        if count == 1 or back + 1 >= len( self.Candles ) :
+            return None
+        return tuple( float( self.Candles.Last( field, back + 1 ) ) for field in ( 'high', 'low', 'close' ) )
+
+
+    def CalcTrueRange( self, count : int , back : int , high : float , low : float , prior : tuple ) -> float :
+        """
+            max( high - low , |high - prior close| , |low - prior close| )
+        """
+        if prior is None :
+            return high - low
+        return max( high - low, abs( high - prior[2] ), abs( low - prior[2] ) )
+
+
+    def CalcCloseDelta( self, count : int , back : int , close : float , prior : tuple ) -> float :
+        return None if prior is None else close - prior[2]
+
+
+    def CalcLogReturn( self, count : int , back : int , close : float , prior : tuple ) -> float :
+        return None if prior is None or prior[2] <= 0 or close <= 0 else math.log( close / prior[2] )
+
+
+    def CalcTypicalPrice( self, count : int , back : int , high : float , low : float , close : float ) -> float :
+        return ( high + low + close ) / 3
+
+
+    def CalcDirectionalMove( self, count : int , back : int , high : float , low : float , prior : tuple ) -> tuple :
+        """
+            ( +DM, -DM ) against the prior candle ( None on the first candle of the session )
+        """
+        if prior is None :
+            return None
+        up_move     = high - prior[0]
+        down_move   = prior[1] - low
+        return ( up_move   if ( up_move > down_move and up_move > 0 )   else 0.0,
+                 down_move if ( down_move > up_move and down_move > 0 ) else 0.0 )
+
+
+    def CalcWindowExtrema( self, count : int , back : int ) -> tuple :
+        """
+            ( highest high, lowest low ) over the Chop Index window ( None until the window is full )
+        """
+        if count < self.ChopWindow :
+            return None
+        return ( float( self.Candles.View( 'high', self.ChopWindow, back ).max() ), float( self.Candles.View( 'low', self.ChopWindow, back ).min() ) )
+
+
+
+    def UpdateSession( self, count : int , back : int , close : float ) -> None :
+        """
+            Session high/low/mean of the close and the session Fibonacci levels
+        """
+        self.SumClose  += close
+        self.dSMA       = self.SumClose / count
+        self.High       = close if count == 1 else max( self.High, close )
+        self.Low        = close if count == 1 else min( self.Low , close )
+        self.dFib       = fibonacci_levels( self.High, self.Low )
+
+
+
+    def UpdateVWAP( self, count : int , back : int , typical_price : float , volume : float , close : float ) -> None :
+        """
+            Running sums of typical price * volume and volume - the session VWAP ( the pandas Calculate() read row 0 of
+            its newest first cumsum , i.e. the typical price of the newest candle only )
+        """
+        self.SumPV      += typical_price * volume
+        self.SumVolume  += volume
+        self.VWAP        = self.SumPV / self.SumVolume if self.SumVolume > 0 else close
+
+
+
+    def UpdateRSI( self, count : int , back : int , delta : float ) -> None :
+        """
+            Wilder RSI : simple average of the gains/losses until the window is full, then Wilder smoothing
+            ( same values as Indicators.CalculateRSI over the whole session - the pandas Calculate() passed it only
+            the newest 14 candles , i.e. a plain average of the last 13 changes )
+        """
+        if delta is None :
+            return
+
+        gain    = delta if delta > 0 else 0.0
+        loss    = -delta if delta < 0 else 0.0
+        seen    = count - 1                                             # number of price changes so far
+
+        if seen < self.RSIWindow :
+            self.AvgGain   += ( gain - self.AvgGain ) / seen
+            self.AvgLoss   += ( loss - self.AvgLoss ) / seen
+        else:
+            self.AvgGain    = ( self.AvgGain * (self.RSIWindow - 1) + gain ) / self.RSIWindow
+            self.AvgLoss    = ( self.AvgLoss * (self.RSIWindow - 1) + loss ) / self.RSIWindow
+
+        if self.AvgLoss == 0 :
+            self.RSI = math.nan if self.AvgGain == 0 else 100.0
+        else:
+            self.RSI = round( 100 - (100 / (1 + self.AvgGain / self.AvgLoss)), 2 )
+
+
+
+    def UpdateVolatility( self, count : int , back : int , log_return : float ) -> None :
+        """
+            Standard deviation of the log returns with Welford's online mean / variance - over the whole session or,
+            with vol_window, over the returns of the last vol_window candles ( the one leaving the window is read back
+            from the CandleBuffer ) ; a return CalcLogReturn skipped ( close <= 0 ) is neither folded nor dropped
+        """
+        dropped = None
+        if self.VolWindow is not None and count - 1 > self.VolWindow :                 # THE RETURN OF THE CANDLE LEAVING THE WINDOW
+            dropped = self.CalcLogReturn( count, back + self.VolWindow, float( self.Candles.Last( 'close', back + self.VolWindow ) ),
+                                          ( None, None, float( self.Candles.Last( 'close', back + self.VolWindow + 1 ) ) ) )
+        if dropped is None and log_return is None :
+            return
+
+        if dropped is not None :
+            mean                = self.ReturnMean
+            self.Returns       -= 1
+            self.ReturnMean     = mean - ( dropped - mean ) / self.Returns if self.Returns > 0 else 0.0
+            self.ReturnM2       = self.ReturnM2 - ( dropped - mean ) * ( dropped - self.ReturnMean ) if self.Returns > 0 else 0.0
+        if log_return is not None :
+            self.LastReturn     = log_return
+            self.Returns       += 1
+            delta               = log_return - self.ReturnMean
+            self.ReturnMean    += delta / self.Returns
+            self.ReturnM2      += delta * ( log_return - self.ReturnMean )
+
+        if self.Returns == 0 :
+            self.VolIndex   = 0
+            self.VolAnnual  = 0
+        elif self.Returns < 2 :
+            self.VolIndex   = round( self.LastReturn, 4 )
+            self.VolAnnual  = round( abs( self.LastReturn ) * math.sqrt( self.VolPeriods ), 4 )
+        else:
+            deviation       = math.sqrt( max( self.ReturnM2 / ( self.Returns - 1 ), 0.0 ) )
+            self.VolIndex   = round( deviation, 4 )
+            self.VolAnnual  = round( deviation * math.sqrt( self.VolPeriods ), 4 )
+
+
+
+    def UpdateEMA( self, count : int , back : int , close : float ) -> None :
+        """
+            Recursive EMA ( same as ewm( span, adjust=False ) )
+        """
+        self.EMA9   = close if self.EMA9 is None else self.EMAAlpha * close + ( 1 - self.EMAAlpha ) * self.EMA9
+
+
+
+    def UpdateWindows( self, count : int , back : int , close : float ) -> None :
+        """
+            Fixed windows over the close : SMA dictionary and Bollinger Bands ( values leaving a window are read from the CandleBuffer )
+        """
+        length = min( count, self.Candles.Capacity )
+
+        for window in self.SMAWindows :
+            self.SMASums[ window ] += close
+            if count > window :
+                self.SMASums[ window ] -= float( self.Candles.Last( 'close', back + window ) )
+            self.SMA[ f'SMA{window}' ] = self.SMASums[ window ] / min( length, window )
+
+        self.BBSum     += close
+        self.BBSumSq   += close * close
+        if count > self.BBWindow :
+            dropped         = float( self.Candles.Last( 'close', back + self.BBWindow ) )
+            self.BBSum     -= dropped
+            self.BBSumSq   -= dropped * dropped
+
+        if count >= self.BBWindow :
+            mean            = self.BBSum / self.BBWindow
+            variance        = ( self.BBSumSq - self.BBWindow * mean * mean ) / ( self.BBWindow - 1 )
+            deviation       = math.sqrt( max( variance, 0.0 ) )
+            self.BB_Lower   = round( mean - 2 * deviation, 2 )
+            self.BB_Upper   = round( mean + 2 * deviation, 2 )
+
+
+
+    def UpdateChop( self, count : int , back : int , true_range : float , extrema : tuple ) -> None :
+        """
+            CHOP = 100 * LOG10( SUM(TR, n) / ( MaxHi(n) - MinLo(n) ) ) / LOG10(n)
+        """
+        self.TrueRanges.append( true_range )
+
+        if extrema is None :
+            self.ChopIndex = 50
+            return
+
+        spread      = extrema[0] - extrema[1]
+        numerator   = sum( self.TrueRanges ) / spread if spread > 0 else 0
+        self.ChopIndex = round( 100 * math.log10( numerator ) / math.log10( self.ChopWindow ), 2 ) if numerator > 0 else -math.inf
+
+
+
+    def UpdateADX( self, count : int , back : int , true_range : float , directional : tuple ) -> None :
+        """
+            TA-Lib's ADX recursion ( same values as talib.ADX / PLUS_DI / MINUS_DI , see IndicatorSeries.adx_series )
+                TR, +DM, -DM    - summed over the first period-1 changes, then S = S - S/period + x
+                +DI / -DI -> DX - from candle period+1
+                ADX             - mean of the first period DX values, then Wilder smoothed ( from candle 2*period )
+        """
+        period = self.ADXPeriod
+        if directional is None :
+            return
+
+        plus_dm, minus_dm = directional
+        if count <= period :
+            self.SmoothTR       += true_range
+            self.SmoothPlusDM   += plus_dm
+            self.SmoothMinusDM  += minus_dm
+            return
+
+        self.SmoothTR       += true_range - self.SmoothTR / period
+        self.SmoothPlusDM   += plus_dm    - self.SmoothPlusDM / period
+        self.SmoothMinusDM  += minus_dm   - self.SmoothMinusDM / period
+
+        dx = None
+        if abs( self.SmoothTR ) < ZERO :
+            self.PlusDI, self.MinusDI = 0.0, 0.0
+        else:
+            self.PlusDI     = 100 * self.SmoothPlusDM  / self.SmoothTR
+            self.MinusDI    = 100 * self.SmoothMinusDM / self.SmoothTR
+            total           = self.PlusDI + self.MinusDI
+            dx              = 100 * abs( self.PlusDI - self.MinusDI ) / total if abs( total ) >= ZERO else None
+
+        if count <= 2 * period :
+            self.SumDX     += dx if dx is not None else 0.0
+            if count == 2 * period :
+                self.ADX    = self.SumDX / period
+        elif dx is not None :
+            self.ADX        = ( self.ADX * (period - 1) + dx ) / period
+
+
+
+    def UpdateRange( self, count : int , back : int , high : float , low : float , close : float ) -> None :
+        """
+            Trading range of the session once a full window is available ( used by DayTradeSimpleModule )
+                RangeHigh / RangeLow - extremes of every full window ( session high / low )
+                RangeMean            - average of the rolling window means
+                RangeMedian          - median of the rolling window medians ( running median of the session , two heaps )
+        """
+        window  = self.RangeWindow
+        self.RangeSum += close
+        if count > window :
+            self.RangeSum -= float( self.Candles.Last( 'close', back + window ) )
+
+        if count < window :
+            return
+
+        self.SumRangeMean  += self.RangeSum / window
+        self.RangeMean      = self.SumRangeMean / ( count - window + 1 )
+        self.RangeHigh      = float( self.Candles.View( 'high', window, back ).max() ) if count == window else max( self.RangeHigh, high )
+        self.RangeLow       = float( self.Candles.View( 'low' , window, back ).min() ) if count == window else min( self.RangeLow,  low )
+        self.RangeMedian    = median_push( self.MedianLower, self.MedianUpper, float( np.median( self.Candles.View( 'close', window, back ) ) ) )
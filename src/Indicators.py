@@ -12,9 +12,9 @@
 import os
 import re
 import sys
+import copy
 import json
 import time
-import talib    # Calculate ADX
 import base64
 import getpass
 import inspect
@@ -28,6 +28,10 @@ import numpy        as      np
 
 from datetime           import datetime
 from pythonnet import load
+from IndicatorSeries    import rsi_series, adx_series, return_volatility, MINUTES_PER_YEAR
+from IndicatorBatch     import IndicatorBatch
+from IndicatorSnapshot  import IndicatorSnapshot
+from IndicatorStream    import IndicatorStream, fibonacci_levels
 #import clr
 #from stock_indicators   import indicators
 
@@ -52,13 +56,24 @@ from stock_indicators import indicators
 print("stock-indicators successfully imported.")
 """
 class Indicators :
-    def __init__( self, symbol : str , data : dict , seed_df : pd.DataFrame  ) -> None :
+    INTRADAY = [ 'SMA', 'RSI', 'VWAP', 'dSMA', 'dFib', 'EMA9', 'High', 'Low', 'ADX', 'PlusDI', 'MinusDI', 'BB_Lower', 'BB_Upper',
+                 'VolIndex', 'VolAnnual', 'ChopIndex', 'RangeHigh', 'RangeLow', 'RangeMean', 'RangeMedian' ]
+
+    DAILY    = [ 'SMA', 'ATH', 'ATL', 'Fib', 'dSMA', 'High', 'Low', 'VWAP', 'RSI', 'VolIndex', 'VolAnnual', 'dFib', 'BB_Lower', 'BB_Upper',
+                 'ChopIndex', 'ADX', 'PlusDI', 'MinusDI', 'EMA9' ]
+
+    def __init__( self, symbol : str , data : dict , seed_df : pd.DataFrame , required : list = None , context : dict = None ,
+                        compact : bool = False , vol_window : int = None ) -> None :
         """
             INITIALIZE THE VARIABLES TO WORK WITH THIS CLASS 
             ARGS   :
-                        symbol  ( str )    - stock symbol 
-                        data    (Dataframe ) - historical entries for the selected stock symbol 
-                        seed_df ( DataFrame) - Open Range Entries - quotes from the first 30 minutes of market open 
+                        symbol   ( str )    - stock symbol 
+                        data     (Dataframe ) - historical entries for the selected stock symbol 
+                        seed_df  ( DataFrame) - Open Range Entries - quotes from the first 30 minutes of market open 
+                        required ( list )   - intraday indicators the strategy reads on every candle ( None for all )
+                        context  ( dict )   - values of a previous Context() for the same day ( skips the daily calculations )
+                        compact  ( bool )   - float32 candles bounded to the longest look back ( large watch lists )
+                        vol_window ( int )  - log returns in the intraday volatility ( None for the whole session )
             RETURNS:
                         nothing 
         """
@@ -75,11 +90,29 @@ class Indicators :
         self.BB_Lower   = 0
         self.BB_Upper   = 0
         self.VolIndex   = 0
+        self.VolAnnual  = 0                                 # VolIndex ANNUALIZED
         self.ChopIndex  = 0
         self.ADX        = 0
+        self.PlusDI     = 0
+        self.MinusDI    = 0
         self.Data       = None 
+        self.RangeHigh  = np.nan                            # TRADING RANGE OVER THE LAST 20 CANDLES ( DayTradeSimpleModule )
+        self.RangeLow   = np.nan
+        self.RangeMean  = np.nan
+        self.RangeMedian= np.nan
+        self.Count      = 0                                 # INTRADAY CANDLES APPLIED
+        self.Compact    = compact
+        self.VolWindow  = vol_window                        # LOG RETURNS IN VolIndex ( None : THE WHOLE SESSION )
+        self.Stream     = IndicatorStream( capacity= 0, dtype= np.float32, vol_window= vol_window ) if compact else IndicatorStream( vol_window= vol_window )   # O(1) PER CANDLE STATE FOR THE INTRADAY INDICATORS
+        self.Batch      = None                              # IndicatorBatch SHARED BY THE WATCH LIST ( see Attach )
+        self.Required   = None                              # INTRADAY INDICATORS KEPT CURRENT , THE REST ARE LAZY ( see Require )
+        self.Snapshot   = None                              # Summary() OF THE CURRENT BAR , CLEARED WHEN NEW VALUES ARE PUBLISHED
         
-        self.Set( data, seed_df )
+        self.Require( required )
+        if context is None :
+            self.Set( data, seed_df )
+        else:
+            self.Restore( context )
         
 
                                
@@ -95,28 +128,34 @@ class Indicators :
         return contents 
 
 
-    def Summary ( self ) -> dict :
+    def Summary ( self ) -> IndicatorSnapshot :
         """
-            Format all the indicators into a dicctionary for easier external handling
+            Format all the indicators into one read only snapshot for easier external handling
+            ( built once per bar and shared by the logging, the order records and TraderDB until the next candle )
             ARGS    :
                     nothing
             RETURNS :
-                    dictionary of the formatted indicators 
+                    IndicatorSnapshot of the formatted indicators ( reads like a dictionary )
         """
-        fibs = ['dFib','Fib']
-        summary = self.SMA
-        summary |= {'HIGH': self.High, 'LOW':self.Low, 'VWAP':self.VWAP, 'RSI':self.RSI,
-                    'VolIndex' : self.VolIndex, 'dSMA' : self.dSMA ,'ATH': self.ATH, 'ATL':self.ATL}
-        for pos,fib in enumerate( [self.dFib, self.Fib]):
-            for key in fib.keys():
-                summary.update( {  fibs[pos]+"_"+key : fib[key] } ) 
+        if self.Snapshot is not None :
+            return self.Snapshot
 
-        summary |= { 'BB_Lower' : self.BB_Lower, 'BB_Upper' :self.BB_Upper  , "ChopIndex" : self.ChopIndex} #.iloc[-1]}
-        
-        #summary |= { 'DFib' : self.dFib, 'FIB' :self.Fib }
-        #print( "SUMMARY:", summary )
+        if self.Batch is None :                                     # LAZY INDICATORS CATCH UP ONLY WHEN A SUMMARY IS ASKED FOR
+            self.Publish( names = self.INTRADAY )
+        else:
+            self.Publish( self.Batch.Values( self.Symbol ) )
+        names   = list( self.SMA.keys() ) if isinstance( self.SMA, dict ) else []
+        values  = list( self.SMA.values() ) if isinstance( self.SMA, dict ) else []
+        names  += [ 'HIGH', 'LOW', 'VWAP', 'RSI', 'VolIndex', 'VolAnnual', 'dSMA', 'ATH', 'ATL' ]
+        values += [ self.High, self.Low, self.VWAP, self.RSI, self.VolIndex, self.VolAnnual, self.dSMA, self.ATH, self.ATL ]
+        for prefix, fib in ( ( 'dFib', self.dFib ), ( 'Fib', self.Fib ) ) :
+            names  += [ prefix + "_" + key for key in fib.keys() ]
+            values += list( fib.values() )
+        names  += [ 'BB_Lower', 'BB_Upper', 'ChopIndex' ]
+        values += [ self.BB_Lower, self.BB_Upper, self.ChopIndex ]
 
-        return summary
+        self.Snapshot = IndicatorSnapshot( names, values )
+        return self.Snapshot
 
 
 
@@ -150,41 +189,147 @@ class Indicators :
         self.Data = pd.concat([self.Data, seed_df ])
         self.Data = self.Data.dropna().reset_index(drop=True)
         
-        self.Data = pd.DataFrame({}) #Wipe out the dataframe
+        self.Data = self.Stream.Candles                             # INTRADAY CANDLES LIVE IN THE PREALLOCATED RING BUFFER FROM HERE ON
+        self.Snapshot = None
         
         
 
 
 
-            
+    def Context ( self ) -> dict :
+        """
+            Values derived from the daily data in Set() - what DailyCache keeps so a restart does not recalculate them
+            ARGS   :
+                        nothing 
+            RETURNS:
+                        dictionary of the daily values 
+        """
+        return { name : copy.deepcopy( getattr( self, name ) ) for name in self.DAILY }
+
+
+
+    def Restore ( self, context : dict ) -> None :
+        """
+            Take the daily values from a previous Context() instead of recalculating them in Set()
+            ARGS   :
+                        context ( dict ) - values returned by Context()
+            RETURNS:
+                        nothing 
+        """
+        for name in self.DAILY :
+            if name in context :
+                setattr( self, name, copy.deepcopy( context[ name ] ) )
+        self.Data       = self.Stream.Candles
+        self.Snapshot   = None
+
+
+
     def Update ( self , entry : dict   ) -> None :
         """
-            Add a price history entry to the internal dataframe , then recalculate indicators 
+            Fold a price history entry into the streaming indicators ( constant time per candle ), then publish them
             ARGS   :
-                        entry ( list ) - values needed to upate the indicators 
+                        entry ( dict ) - { 0 : { open, high, low, close, volume, datetime } } values needed to update the indicators 
             RETURNS:
-                        dict - MVA
+                        nothing
             
         """        
         try:
-            df = pd.DataFrame(entry).T
-            df['date'] = df['datetime'].apply( lambda x: str(datetime.fromtimestamp(x/1000))[:10])
-
-            #self.Data = self.Data.dropna()
-            self.Data = pd.concat( [df, self.Data ],  ignore_index=True).reset_index( drop=True)
-            #print( f"DATA: {self.Data} ")
-            
-            if 0 in self.Data.columns :
-                self.Data = self.Data.drop(0, axis=1)
-                
-            
-            self.Calculate()
+            candle = entry[0] if 0 in entry else entry
+            if self.Batch is None :
+                if self.Stream.Count == 0 or self.Stream.Timestamp != candle['datetime'] :     # NOT ALREADY FOLDED BY A BarResampler
+                    self.Stream.Update( open= candle['open'], high= candle['high'], low= candle['low'], close= candle['close'],
+                                        volume= candle['volume'], timestamp= candle['datetime'] )
+                self.Publish()
+                return
+
+            if not self.Batch.Applied( self.Symbol, candle['datetime'] ) :             # NOT ALREADY DONE IN THE WATCH LIST PASS
+                self.Batch.Update( symbols= [ self.Symbol ], open= [ candle['open'] ], high= [ candle['high'] ], low= [ candle['low'] ],
+                                   close= [ candle['close'] ], volume= [ candle['volume'] ], timestamp= [ candle['datetime'] ] )
+            self.Publish( self.Batch.Values( self.Symbol, self.Required ) )
         except:
             print("\t\t|EXCEPTION: Indicators::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
             for entry in sys.exc_info():
                 print("\t\t >>   " + str(entry) )
         
                 
+
+    def Attach ( self, batch : IndicatorBatch ) -> None :
+        """
+            Hand the intraday state over to the watch list batch - from here on the batch row is the source of the values
+            ARGS   :
+                        batch ( IndicatorBatch ) - shared batch of the watch list 
+            RETURNS:
+                        nothing 
+        """
+        batch.Add( self.Symbol, self.Stream )
+        batch.Require( self.Required )
+        self.Batch = batch
+
+
+
+    def Follow ( self, stream : IndicatorStream ) -> None :
+        """
+            Read the intraday values from another stream from here on - a BarResampler timeframe that is already current,
+            so switching the strategy to another time interval recalculates nothing
+            ARGS   :
+                        stream ( IndicatorStream ) - indicator state of the timeframe to follow
+            RETURNS:
+                        nothing 
+        """
+        if stream is self.Stream and self.Batch is None :
+            return
+        self.Stream = stream
+        self.Batch  = None
+        self.Data   = stream.Candles
+        self.Stream.Require( self.Required )
+        self.Publish()
+
+
+
+    def Nbytes ( self ) -> int :
+        """
+            Memory held by the intraday state of the symbol in bytes ( its share of the watch list batch included )
+        """
+        share = self.Batch.Nbytes() // max( len( self.Batch ), 1 ) if self.Batch is not None else 0
+        return self.Stream.Nbytes() + share
+
+
+
+    def Require ( self, names : list = None ) -> None :
+        """
+            Declare the intraday indicators read on every candle - only those are computed per candle,
+            the others are brought up to date from the candle buffer when Summary() needs them
+            ARGS   :
+                        names ( list ) - indicator attribute names ( RSI, EMA9, ChopIndex ...) , None for all
+            RETURNS:
+                        nothing 
+        """
+        self.Required = None if names is None else [ name for name in names if name in self.INTRADAY ]
+        self.Stream.Require( self.Required )
+
+
+
+    def Publish ( self, values : dict = None, names : list = None ) -> None :
+        """
+            Copy the current values of the streaming indicators onto the attributes the strategies read
+            ARGS   :
+                        values ( dict ) - values from IndicatorBatch.Values() ( default the single symbol stream )
+                        names  ( list ) - indicators to take from the stream ( default the required ones )
+            RETURNS:
+                        nothing 
+        """
+        if values is None :
+            if self.Stream.Count == 0 :                             # NOTHING INTRADAY YET , KEEP THE DAILY VALUES
+                return
+            values = self.Stream.Values( names if names is not None else self.Required ) | { 'Count' : self.Stream.Count }
+
+        for name, value in values.items() :
+            setattr( self, name, value )
+        if 'SMA' in values :
+            self.SMA    = dict( self.SMA )                          # THE STREAM UPDATES ITS SMA IN PLACE , KEEP THE PUBLISHED ONE FIXED
+        self.Snapshot   = None
+        
+        
         
     def Calculate( self ) -> None :
         """
@@ -212,13 +357,13 @@ class Indicators :
             
             #RSI            Using the last 14 days            
             thisData = pd.Series(self.Data[:14].sort_values(by=['datetime'],ascending=True)['close'])            
-            self.RSI                 = self.CalculateRSI( data = thisData )
+            _, self.RSI              = self.CalculateRSI( data = thisData )
 
             #Volatility 
-            self.VolIndex            = self.CalculateVolatility(df = pd.DataFrame( {'close':list(self.Data["close"])}, index=self.Data["date"]) )
+            self.VolIndex            = self.CalculateVolatility(df = pd.DataFrame( {'close':list(self.Data["close"])}, index=self.Data["date"]), window=self.VolWindow )
 
             # Fibonacci
-            self.dFib               = self.CalculateFibonacci( self.Data['close'].max() , self.Data['close'].min() )
+            self.dFib               = self.CalculateFibonacci( self.High , self.Low )       # same extremes as above
 
             # Bollinger Bands
             self.CalculateBollinger()
@@ -250,7 +395,13 @@ class Indicators :
 
 
     def AvgTrueRange( self ) -> float :
-        return (self.Data['close'] - self.Data['open']).mean().iloc[-1]
+        """
+            Average candle body ( close - open ) over the intraday candles held in the CandleBuffer
+        """
+        candles = self.Stream.Candles
+        if len( candles ) == 0 :
+            return 0
+        return float( ( candles.View( 'close' ) - candles.View( 'open' ) ).mean() )
 
 
 
@@ -364,164 +515,75 @@ class Indicators :
             RETURNS:
                         dictionary of fib levels 
         """
-        diff = high - low
-        fib_levels = {
-        '0%': low,
-        '23.6%': high - (diff * 0.236),
-        '38.2%': high - (diff * 0.382),
-        '50%': high - (diff * 0.5), # 50% is commonly used but not a true Fibonacci ratio
-        '61.8%': high - (diff * 0.618),
-        '78.6%': high - (diff * 0.786),
-        '100%': high
-        }
-        return fib_levels 
+        return fibonacci_levels( high, low )
 
 
                 
-    def CalculateRSI(self, data : object , window : int =14) -> pd.Series :
+    def CalculateRSI(self, data : object , window : int =14) -> (pd.Series, float) :
         """
-            Calculates the Relative Strength Index (RSI).
+            Calculates the Relative Strength Index (RSI) with Wilder's smoothing ( vectorized, see IndicatorSeries.rsi_series ).
 
             Args:
-                data (pd.Series): A pandas Series of closing prices.
+                data (pd.Series): A pandas Series of closing prices ( time order ).
                 window (int): The period for RSI calculation (default is 14).
 
             Returns:
-                pd.Series: A pandas Series containing the RSI values.
+                (pd.Series, float): the RSI for every entry ( back tests ) and the latest RSI value ( live ).
 
             RSI – Relative Strength Indicator 
                 >= 70 -  possible trend reversal downward 
                 <= 30 – possible trend reversal upward 
             Divergence  - when the RSI value shows something different than the price ( Price is always a distraction)
         """
-        rsi = None
+        rsi = pd.Series( dtype=float )
         try:
-            delta = data.diff()
-
-            # Separate gains (positive changes) and losses (negative changes)
-            gains = delta.clip(lower=0)
-            losses = -delta.clip(upper=0)
-
-            # Calculate initial average gains and losses
-            avg_gain = gains.rolling(window=window, min_periods=1).mean()
-            avg_loss = losses.rolling(window=window, min_periods=1).mean()
-
-            # Calculate subsequent average gains and losses using Wilder's smoothing
-            # This loop can be optimized for performance in larger datasets
-            for i in range(window, len(data)):
-                avg_gain.iloc[i] = ((avg_gain.iloc[i-1] * (window - 1)) + gains.iloc[i]) / window
-                avg_loss.iloc[i] = ((avg_loss.iloc[i-1] * (window - 1)) + losses.iloc[i]) / window
-
-            # Calculate Relative Strength (RS)
-            rs = avg_gain / avg_loss
-
-            # Calculate RSI
-            rsi = round ( 100 - (100 / (1 + rs)) , 2 ) 
-               
+            data    = pd.Series( data )
+            rsi     = pd.Series( rsi_series( data.to_numpy( dtype=float ), window ), index=data.index )
         except:
             print("\t\t|EXCEPTION: Indicators::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
             for entry in sys.exc_info():
                 print("\t\t >>   " + str(entry) )                
-        finally:
-            self.RSI =  round( rsi.iloc[-1] , 2 )
-            return round( rsi.iloc[-1] ,2 )
 
+        self.RSI = rsi.iloc[-1] if len( rsi ) > 0 else np.nan
+        return rsi, self.RSI
 
 
-    def CalculateVolatility( self, df : object  ) -> []:
+
+    def CalculateVolatility( self, df : object , window : int = None ) -> float :
         """
-            Calculate the volatility of a stock
+            Calculate the volatility of a stock - standard deviation of the log returns ( the IndicatorStream keeps
+            the same values up to date one candle at a time )
             ARGS   :
-                        df  ( dataframe )  - the datetime and close values of the stock 
+                        df      ( dataframe )  - the datetime and close values of the stock 
+                        window  ( int )        - only the last 'window' returns ( None for all of them )
             RETURNS:
-                        dataframe  modified with a new volatility column 
+                        minute volatility ( VolAnnual is set to the annualized value )
         """
+        minute_volatility = np.nan
         try:
-            df = df.sort_index()
-            # --- 1. Sample Data (Replace with your actual stock data) ---        
-            #dates = pd.to_datetime(pd.date_range(start='2024-01-01', periods=len(data['Close']), freq='D'))
-            #df = pd.DataFrame(data, index=dates)
-            
-            # Define the annualization factor (approx. 252 trading days)
-            TRADING_MINUTES_PER_DAY = 5.5 * 60  # days per year = 252
-
-            # --- 2. Calculate Logarithmic Daily Returns ---
-            # The .shift(1) moves the price back one day, allowing for P_t / P_{t-1}
-            df['Log_Return'] = np.log(df['close'] / df['close'].shift(1))
+            close                       = df.sort_index()['close'].to_numpy( dtype=np.float64 )
+            minute_volatility, returns  = return_volatility( close, window )
+            if returns == 1 :                                       # ONE RETURN - NO DEVIATION YET , USE THE RETURN ITSELF
+                minute_volatility = float( np.log( close[-1] / close[-2] ) )
 
-            # --- 3. Calculate Minute/Daily Volatility (Standard Deviation of Returns) ---
-            # .std() calculates the standard deviation (σ)
-            
-            minute_volatility = df['Log_Return'].std()
-            if pd.isna( minute_volatility ) :
-                minute_volatility =  df.iloc[-1]['Log_Return'] 
-
-            # --- 4. Daily/Annualize the Volatility ---
-            # Volatility is annualized by multiplying the daily volatility by the square root of (5.5 * 60)     252.
-            daily_volatility = minute_volatility * np.sqrt(TRADING_MINUTES_PER_DAY)
-
-            # --- 5. Output Results ---
-            """
-            print("--- Daily Volatility Calculation ---")
-            print(df)
-            print("\nMinute Volatility (Standard Deviation of Minute Log Returns):")
-            print(f"{minute_volatility:.4f}")
-            print("\nDaily Historical Volatility:")
-            print(f"{daily_volatility:.4f} (or {daily_volatility * 100:.2f}%)")
-            """
-           
+            self.VolAnnual = round( abs( minute_volatility ) * np.sqrt( MINUTES_PER_YEAR ), 4 )
         except:
             print("\t\t|EXCEPTION: Indicators::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
             for entry in sys.exc_info():
                 print("\t\t >>   " + str(entry) )                
 
-        self.VolIndex = round ( minute_volatility , 4 ) #df["Log_Return"][-1]
-        return round ( minute_volatility , 4 )          #df["Log_Return"][-1]
+        self.VolIndex = round ( minute_volatility , 4 )
+        return round ( minute_volatility , 4 )
 
 
 
-    def CalculateADX(self,  period : int =14) -> None :
-        """
-            Calculate ADX to verify trend strength 
+    def CalculateADX(self,  period : int =7) -> None :
         """
+            Calculate ADX ( +DI / -DI ) over the daily data to verify trend strength
+            Same recursion as talib.ADX , see IndicatorSeries.adx_series ( the intraday values come from the IndicatorStream )
         """
-        # 1. Calculate True Range (TR)
-        self.Data['High-Low']       = self.Data['high'] - self.Data['low']
-        self.Data['High-PrevClose'] = abs(self.Data['high'] - self.Data['close'].shift(1))
-        self.Data['Low-PrevClose']  = abs(self.Data['low'] - self.Data['close'].shift(1))
-        self.Data['TR']             = self.Data[['High-Low', 'High-PrevClose', 'Low-PrevClose']].max(axis=1)
-
-        # 2. Calculate Directional Movement (DM)
-        self.Data['UpMove']     = self.Data['high'].diff()
-        self.Data['DownMove']   = self.Data['low'].diff().mul(-1) # Make down move positive
-
-        self.Data['+DM'] = np.where((self.Data['UpMove'] > self.Data['DownMove']) & (self.Data['UpMove'] > 0), self.Data['UpMove'], 0)
-        self.Data['-DM'] = np.where((self.Data['DownMove'] > self.Data['UpMove']) & (self.Data['DownMove'] > 0), self.Data['DownMove'], 0)
-
-        # 3. Smoothed TR, +DM, -DM (using Wilder's smoothing)
-        # Wilder's smoothing is like an EMA with alpha=1/period
-        self.Data['SmoothedTR']     = self.Data['TR'].ewm(alpha=1/period, adjust=False).mean()
-        self.Data['Smoothed+DM']    = self.Data['+DM'].ewm(alpha=1/period, adjust=False).mean()
-        self.Data['Smoothed-DM']    = self.Data['-DM'].ewm(alpha=1/period, adjust=False).mean()
-
-        # 4. Calculate Directional Indicators (+DI, -DI)
-        self.Data['+DI'] = (self.Data['Smoothed+DM'] / self.Data['SmoothedTR']) * 100
-        self.Data['-DI'] = (self.Data['Smoothed-DM'] / self.Data['SmoothedTR']) * 100
-
-        # 5. Calculate Directional Index (DX)
-        self.Data['DX'] = (abs(self.Data['+DI'] - self.Data['-DI']) / (self.Data['+DI'] + self.Data['-DI'])) * 100
-
-        # 6. Calculate ADX (EMA of DX)
-        self.Data['DX'] = self.Data['DX'].ewm(alpha=1/period, adjust=False).mean()
-        self.ADX  = self.Data[['datetime','TR', '+DM', '-DM', '+DI', '-DI', 'DX'] ]
-
-        #print( f"ADX: { self.ADX[['TR', '+DM', '-DM', '+DI', '-DI', 'DX'] ][:0] } " )
-        #print( self.Data.columns)
-        """
-        df = self.Data[:self.Data.shape[0]-1].sort_values(by=['datetime'],ascending=True).reset_index()
-        df['ADX'] = talib.ADX(df['high'], df['low'], df['close'], timeperiod=7)
-        self.ADX = df[['ADX','datetime']]
-        self.ADX['full_date'] = self.ADX['datetime'].apply( lambda x : datetime.fromtimestamp( x/1000) )
-        
-        #print ( self.ADX )
+        df = self.Data[:self.Data.shape[0]-1].sort_values(by=['datetime'],ascending=True)
+        adx, plus_di, minus_di = adx_series( df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy(), period=period )
+        if len( adx ) > 0 :
+            self.ADX, self.PlusDI, self.MinusDI = ( float( np.nan_to_num( values[-1] ) ) for values in ( adx, plus_di, minus_di ) )
 
@@ -0,0 +1,56 @@
+## ###################################################################################################################
+##  Program :   Log
+##  Author  :
+##  Install :   pip3 install loguru
+##  Example :
+##              from Log import logger, set_level
+##              set_level( 'DEBUG' )                                            # --log_level=DEBUG , --quiet is WARNING
+##              logger.debug( "\t\t\t->DATA : {} ", ticker_row )                # formatted only when DEBUG is on
+##              logger.opt( lazy=True ).debug( "RSI : {}", lambda : indicators.Summary()['RSI'] )
+##  Notes   :   The leveled logger of the program ( loguru ). Messages are templates with {} arguments, so a level that
+##              is off returns before any string is built or written ; arguments that cost something to compute go
+##              through opt( lazy=True ) and are not even called. The strategy / replay chatter of every candle is DEBUG ,
+##              trades and results INFO , so a back test runs INFO and a sweep worker stays quiet
+##              The sink writes to the sys.stdout of the moment ( message only, like print ) , so redirecting stdout
+##              still silences a worker. Importing the module installs the one INFO handler ( in place of loguru's
+##              DEBUG one on stderr ) ; day_trade.main() sets the level of the command line and a pool worker sets it once
+##              in its initializer ( ParamSweep.attach , BatchReplay.warm , ReplayCompare.Run ) - a job never does , it
+##              may run in the parent
+## ###################################################################################################################
+import sys
+
+from loguru     import logger
+
+
+LEVELS      = ( 'TRACE', 'DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR', 'CRITICAL' )
+LOG_LEVEL   = 'INFO'
+QUIET_LEVEL = 'WARNING'
+
+
+
+def write( message : str ) -> None :
+    """
+        Sink of the logger : the stdout of the moment
+    """
+    sys.stdout.write( message )
+
+
+
+def set_level( level : str = LOG_LEVEL ) -> str :
+    """
+        Lowest level written from now on ( replaces the handler , loguru's default one included )
+        ARGS   :
+                    level ( str ) - one of LEVELS
+        RETURNS:
+                    the level set
+    """
+    level = str( level ).upper()
+    if level not in LEVELS :
+        raise ValueError( f"log level {level} is not one of {LEVELS}" )
+    logger.remove()
+    logger.add( write, level=level, format="{message}", colorize=False, backtrace=False, diagnose=False )
+    return level
+
+
+
+set_level( LOG_LEVEL )
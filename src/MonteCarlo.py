@@ -0,0 +1,169 @@
+## ###################################################################################################################
+##  Program :   Monte Carlo
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              target  = account.TargetGoal                        # BEFORE THE RUN , Sell ZEROES IT AFTER A LARGE LOSS
+##              carlo   = MonteCarlo( trades=account.Trades, funds=5000, target=target, paths=10000, seed=7 )
+##              results = carlo.Run( method='bootstrap' )           # 'bootstrap' / 'shuffle' trades , 'block' daily P&L
+##              print( carlo.Summary( results ) )
+##  Notes   :   How much of a back test result is luck : the P&L of its trades is resampled into thousands of equity
+##              paths at once ( one paths x steps NumPy array , no python loop over paths ) and every path gives a
+##              final equity , a max drawdown and the step it first reaches the TargetGoal equity
+##                  bootstrap - trades drawn with replacement ( other outcomes of the same edge )
+##                  shuffle   - the same trades in another order ( only the drawdown / hitting time change )
+##                  block     - blocks of consecutive days drawn with replacement ( keeps the streaks of the daily P&L )
+## ###################################################################################################################
+import sys
+import inspect
+
+import numpy    as np
+import pandas   as pd
+
+
+METHODS     = ( 'bootstrap', 'shuffle', 'block' )
+PERCENTILES = ( 5, 25, 50, 75, 95 )
+
+
+
+def trade_frame( trades : object ) -> pd.DataFrame :
+    """
+        p_l / askTime of the trades in the order they closed
+        ARGS   :
+                    trades ( dict / DataFrame / list ) - TradeAccount.Trades , BatchReplay trades or a list of P&L
+        RETURNS:
+                    DataFrame with p_l and askTime columns
+    """
+    if isinstance( trades, dict ) :
+        trades = [ trade for entries in trades.values() for trade in entries ]
+    if isinstance( trades, pd.DataFrame ) :
+        frame = trades.copy()
+    elif len( trades ) > 0 and isinstance( trades[0], dict ) :
+        frame = pd.DataFrame( trades )
+    else:
+        frame = pd.DataFrame( { 'p_l' : list( trades ) } )
+
+    if 'askTime' not in frame.columns :
+        frame['askTime'] = ''
+    frame['askTime'] = frame['askTime'].astype( str )
+    return frame.sort_values( by=[ 'askTime' ], kind='stable' )[ [ 'p_l', 'askTime' ] ].reset_index( drop=True )
+
+
+
+class MonteCarlo :
+    def __init__( self, trades : object , funds : float = 5000 , target : float = None , paths : int = 10000 , seed : int = None ) -> None :
+        """
+            INITIALIZE THE TRADES TO RESAMPLE
+            ARGS   :
+                        trades ( dict / DataFrame / list ) - TradeAccount.Trades , BatchReplay trades or a list of P&L
+                        funds  ( float )                   - equity the paths start from
+                        target ( float )                   - equity to reach ( TradeAccount.TargetGoal before the run , None for no target )
+                        paths  ( int )                     - equity paths per run
+                        seed   ( int )                     - random seed ( None for a new one every run )
+            RETURNS:
+                        nothing
+        """
+        self.Trades     = trade_frame( trades )
+        self.PnL        = self.Trades['p_l'].to_numpy( dtype=np.float64 )
+        self.Funds      = float( funds )
+        self.Target     = float( target ) if target else None
+        self.Paths      = int( paths )
+        self.Random     = np.random.default_rng( seed )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"MonteCarlo : {len( self.PnL )} trades  P&L : {round( float( self.PnL.sum() ), 2 )}  funds : {self.Funds}  "
+                 f"target : {self.Target}  paths : {self.Paths}" )
+
+
+
+    def Daily( self ) -> np.ndarray :
+        """
+            P&L of every trading day ( day of askTime ) in order
+        """
+        return self.Trades.groupby( self.Trades['askTime'].str[:10], sort=True )['p_l'].sum().to_numpy( dtype=np.float64 )
+
+
+
+    def Resample( self, method : str = 'bootstrap' , block : int = 5 ) -> np.ndarray :
+        """
+            Resampled P&L sequences
+            ARGS   :
+                        method ( str ) - bootstrap / shuffle ( trades ) , block ( days )
+                        block  ( int ) - days per block of the block bootstrap
+            RETURNS:
+                        paths x steps array of P&L
+        """
+        if method == 'block' :
+            daily   = self.Daily()
+            days    = len( daily )
+            block   = max( 1, min( int( block ), days ) )
+            starts  = self.Random.integers( 0, days, size=( self.Paths, -( -days // block ) ) )
+            index   = ( starts[ :, :, None ] + np.arange( block ) ) % days                     # CIRCULAR BLOCKS
+            return daily[ index.reshape( self.Paths, -1 )[ :, :days ] ]
+        if method == 'shuffle' :
+            return self.Random.permuted( np.broadcast_to( self.PnL, ( self.Paths, len( self.PnL ) ) ), axis=1 )
+        return self.PnL[ self.Random.integers( 0, len( self.PnL ), size=( self.Paths, len( self.PnL ) ) ) ]
+
+
+
+    def Run( self, method : str = 'bootstrap' , block : int = 5 ) -> dict :
+        """
+            Equity paths of the resampled P&L and what every path ends up with
+            ARGS   :
+                        method ( str ) - see METHODS
+                        block  ( int ) - days per block of the block bootstrap
+            RETURNS:
+                        { final_equity, max_drawdown, max_drawdown_pct , hit_step } - one value per path ,
+                        hit_step is the first trade ( day for block ) the equity reaches the target , -1 when it never does
+        """
+        results = {}
+        try:
+            if method not in METHODS :
+                raise ValueError( f"method {method} is not one of {METHODS}" )
+            if len( self.PnL ) == 0 :
+                return { 'final_equity' : np.full( self.Paths, self.Funds ), 'max_drawdown' : np.zeros( self.Paths ),
+                         'max_drawdown_pct' : np.zeros( self.Paths ), 'hit_step' : np.full( self.Paths, -1 ) }
+
+            equity  = self.Resample( method, block )
+            np.cumsum( equity, axis=1, out=equity )                                            # IN PLACE , 10K PATHS ARE LARGE
+            equity += self.Funds
+            falls   = np.maximum.accumulate( equity, axis=1 )
+            np.maximum( falls, self.Funds, out=falls )
+            falls  -= equity                                                                    # PEAK - EQUITY
+            worst   = np.argmax( falls, axis=1 )
+            rows    = np.arange( self.Paths )
+            results = { 'final_equity'      : equity[ :, -1 ].copy(),
+                        'max_drawdown'      : falls[ rows, worst ],
+                        'max_drawdown_pct'  : falls[ rows, worst ] / ( equity[ rows, worst ] + falls[ rows, worst ] ),
+                        'hit_step'          : np.full( self.Paths, -1 ) }
+            if self.Target is not None :
+                reached                 = equity >= self.Target
+                results['hit_step']     = np.where( reached.any( axis=1 ), np.argmax( reached, axis=1 ) + 1, -1 )
+        except:
+            print("\t\t|EXCEPTION: MonteCarlo::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        return results
+
+
+
+    def Summary( self, results : dict ) -> dict :
+        """
+            Percentiles ( see PERCENTILES ) of the distributions and the odds of losing / reaching the target
+        """
+        summary = {}
+        if len( results ) == 0 :
+            return summary
+        for name in ( 'final_equity', 'max_drawdown', 'max_drawdown_pct' ) :
+            summary[ name ] = { f"p{level}" : round( float( value ), 4 ) for level, value in zip( PERCENTILES, np.percentile( results[ name ], PERCENTILES ) ) }
+        hits                    = results['hit_step'][ results['hit_step'] > 0 ]
+        summary['prob_loss']    = round( float( np.mean( results['final_equity'] < self.Funds ) ), 4 )
+        summary['prob_target']  = round( float( len( hits ) / len( results['hit_step'] ) ), 4 ) if self.Target is not None else np.nan
+        summary['hit_step']     = ( { f"p{level}" : round( float( value ), 2 ) for level, value in zip( PERCENTILES, np.percentile( hits, PERCENTILES ) ) }
+                                    if len( hits ) > 0 else {} )
+        return summary
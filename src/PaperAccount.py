@@ -0,0 +1,58 @@
+## ###################################################################################################################
+##  Program :   Paper Account
+##  Author  :
+##  Install :
+##  Example :
+##              account = TradeAccount( funds=5000, limit=0.10, app_type='Paper' )
+##  Notes   :   Offline stand in for the brokerage connection of TradeAccount ( same methods as SchwabAccount that a
+##              back test reaches ) - every order fills at the asked price and no quotes / history are available, so
+##              back tests and parameter sweeps run without credentials or network access
+## ###################################################################################################################
+
+
+
+class PaperAccount :
+    def __init__( self, app_key : str = "" , app_secret : str = "" , cash : float = 5000 ) -> None :
+        """
+            INITIALIZE THE PAPER BALANCE
+            ARGS   :
+                        app_key    ( str )   - ignored ( same signature as SchwabAccount )
+                        app_secret ( str )   - ignored
+                        cash       ( float ) - cash available for trading
+            RETURNS:
+                        nothing
+        """
+        self.Mode   = ""
+        self.Cash   = cash
+        self.Orders = []                        # ( action, symbol, price, qty ) in the order they were sent
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"PaperAccount : cash {self.Cash}  orders : {len( self.Orders )}"
+
+
+
+    def CashForTrading( self ) -> float :
+        return self.Cash
+
+
+    def Buy( self, symbol : str , price : float, qty : int ) -> bool :
+        self.Orders.append( ( 'BUY', symbol, price, qty ) )
+        return True
+
+
+    def Sell( self, symbol : str , price : float, qty : int ) -> bool :
+        self.Orders.append( ( 'SELL', symbol, price, qty ) )
+        return True
+
+
+    def Quote( self, symbol : str ) -> object :
+        return None
+
+
+    def QuoteByInterval( self, symbol : str , **kwargs ) -> object :
+        return None
@@ -0,0 +1,391 @@
+## ###################################################################################################################
+##  Program :   Param Sweep
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              sweep   = ParamSweep( configs=configs, grid={ 'risk_percent' : [0.001, 0.0015], 'interval' : [1, 5] }, workers=16 )
+##              results = sweep.Run( data= CandleMerge( sources=configs['input_data'], symbols=configs['stock'] ).Frame() )
+##              sweep.Save( results )
+##  Notes   :   Back tests every point of a parameter grid over the same candles across a ProcessPoolExecutor.
+##              The candles are copied once into shared memory ( prices + symbol / time codes ) and every worker
+##              attaches to them when it starts, so a point only ships its parameters and gets its results back.
+##              Grid keys are DayTradeStrategy.BaseParams() names ( handed to the strategy as configs['params'] ,
+##              applied after the interval matrix ) and 'interval' , which selects the row of the interval matrix
+##              The points share nothing, so the sweep scales with the number of workers
+##              With --vectorized a worker calculates the signals of the shared candles once ( BackTestEngine ) and
+##              every point / time window it runs afterwards reuses them
+##              Results are kept in a ResultCache ( --no_cache to skip it ) : running the sweep again , or with one more
+##              grid value , only back tests the points it has not seen on the same code and candles
+##              The event loop primes every symbol from a scratch CandleStore of the same candles ( the daily history
+##              before a day , see DayTradeStrategy.PrimeBackTest ) ; a point whose back test ran no row is a failure ,
+##              never a 0 result , and is not cached
+## ###################################################################################################################
+import os
+import sys
+import bisect
+import shutil
+import inspect
+import tempfile
+import itertools
+import contextlib
+import multiprocessing
+
+import numpy    as np
+import pandas   as pd
+
+from datetime               import datetime
+from multiprocessing        import shared_memory, resource_tracker
+from concurrent.futures     import ProcessPoolExecutor
+
+from Clock                  import SimulatedClock
+from TradeAccount           import TradeAccount
+from CandleStore            import CandleStore
+from DailyCache             import DailyCache
+from BackTestEngine         import BackTestEngine
+from DayTradeStrategy       import DayTradeStrategy
+from ResultCache            import ResultCache, CACHE_FOLDER, partition_digests, data_digest
+from Log                    import set_level, LOG_LEVEL
+
+
+SWEEP_FOLDER    = "../files/sweeps/"
+PRICES          = ( 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' )
+RANK_BY         = [ 'p_l', 'win_rate', 'trades' ]
+Shared          = {}                            # WHAT THIS PROCESS ATTACHED TO ( see attach )
+
+
+
+def share_frame( data : pd.DataFrame ) -> (shared_memory.SharedMemory, dict) :
+    """
+        Copy back test rows ( in time order ) into one shared memory block
+            float64 [ rows x 5 ]  LOW, CLOSE, QUOTE, VOLUME, HIGH
+            int32   [ rows x 2 ]  symbol code , time code
+        ARGS   :
+                    data ( DataFrame ) - SYMBOL, DATETIME, LOW, CLOSE, QUOTE, VOLUME, HIGH rows sorted on DATETIME
+        RETURNS:
+                    ( SharedMemory the caller unlinks , descriptor handed to attach() )
+    """
+    symbols, symbol_codes   = np.unique( data['SYMBOL'].astype( str ).to_numpy(), return_inverse=True )
+    times, time_codes       = np.unique( data['DATETIME'].astype( str ).to_numpy(), return_inverse=True )
+    prices                  = data[ list( PRICES ) ].to_numpy( dtype=np.float64 )
+    codes                   = np.column_stack( [ symbol_codes, time_codes ] ).astype( np.int32 )
+
+    block   = shared_memory.SharedMemory( create=True, size=max( 1, prices.nbytes + codes.nbytes ) )
+    np.ndarray( prices.shape, dtype=np.float64, buffer=block.buf )[:] = prices
+    np.ndarray( codes.shape, dtype=np.int32, buffer=block.buf, offset=prices.nbytes )[:] = codes
+
+    return block, { 'name' : block.name, 'rows' : len( data ), 'symbols' : symbols.tolist(), 'times' : times.tolist() }
+
+
+
+def attach( descriptor : dict ) -> None :
+    """
+        Worker initializer : map the shared candles ( no copy ) for every point this process runs , at the log level of the sweep
+    """
+    set_level( descriptor.get('log_level') or LOG_LEVEL )                # A SPAWNED WORKER STARTS AT THE DEFAULT
+    try:
+        block = shared_memory.SharedMemory( name=descriptor['name'], track=False )
+    except TypeError :                                                  # PYTHON < 3.13 , THE CREATOR OWNS THE BLOCK
+        block = shared_memory.SharedMemory( name=descriptor['name'] )
+        if not descriptor.get( 'forked' ) :                             # A FORKED WORKER SHARES THE CREATOR'S RESOURCE TRACKER
+            resource_tracker.unregister( block._name, 'shared_memory' )
+
+    rows                = descriptor['rows']
+    Shared['block']     = block
+    Shared['prices']    = np.ndarray( ( rows, len( PRICES ) ), dtype=np.float64, buffer=block.buf )
+    Shared['codes']     = np.ndarray( ( rows, 2 ), dtype=np.int32, buffer=block.buf, offset=rows * len( PRICES ) * 8 )
+    Shared['symbols']   = descriptor['symbols']
+    Shared['times']     = descriptor['times']
+    Shared['store']     = CandleStore( root=descriptor['store'] ) if descriptor.get('store') else None
+    Shared.pop( 'engine', None )                                        # SIGNALS OF ANOTHER BLOCK
+
+
+
+def shared_range( start : str = None , end : str = None ) -> (int, int) :
+    """
+        First and last + 1 shared rows between start ( None for the first bar ) and end ( None for after the last bar )
+    """
+    codes, times    = Shared['codes'], Shared['times']
+    first           = 0 if start is None else int( np.searchsorted( codes[:, 1], bisect.bisect_left( times, start ) ) )
+    last            = len( codes ) if end is None else int( np.searchsorted( codes[:, 1], bisect.bisect_left( times, end ) ) )
+    return first, last
+
+
+
+def shared_bars( start : str = None , end : str = None ) -> object :
+    """
+        ( bar_time, [ ticker rows ] ) of the shared candles in the layout of CandleMerge.Bars()
+        ARGS   :
+                    start ( str ) - first DATETIME handed out ( None for the first bar )
+                    end   ( str ) - DATETIME to stop before ( None for after the last bar )
+    """
+    prices, codes           = Shared['prices'], Shared['codes']
+    symbols, times          = Shared['symbols'], Shared['times']
+    first, last             = shared_range( start, end )
+    starts                  = np.concatenate( [ [ first ], np.flatnonzero( np.diff( codes[ first:last, 1 ] ) ) + first + 1, [ last ] ] )
+
+    for begin, finish in zip( starts[:-1], starts[1:] ) :
+        if begin == finish :                                            # EMPTY WINDOW
+            continue
+        bar_time = times[ codes[ begin, 1 ] ]
+        yield bar_time, [ [ symbols[ codes[ row, 0 ] ], bar_time ] + prices[ row ].tolist() + [ '' ] for row in range( begin, finish ) ]
+
+
+
+def shared_frame() -> pd.DataFrame :
+    """
+        The shared candles as the DataFrame BackTestEngine works on
+    """
+    frame = pd.DataFrame( Shared['prices'], columns=list( PRICES ) )
+    frame.insert( 0, 'SYMBOL', np.array( Shared['symbols'] )[ Shared['codes'][:, 0] ] )
+    frame.insert( 1, 'DATETIME', np.array( Shared['times'] )[ Shared['codes'][:, 1] ] )
+    return frame
+
+
+
+def shared_engine( strategy : str , params : dict ) -> BackTestEngine :
+    """
+        The BackTestEngine of this worker on the shared candles ( Run calculates the signals of the window it trades )
+    """
+    engine = Shared.get( 'engine' )
+    if engine is None :
+        engine = Shared['engine'] = BackTestEngine( data=shared_frame(), params=params )
+    engine.Params = params
+    return engine
+
+
+
+def rank( results : list ) -> pd.DataFrame :
+    """
+        Results of the points , best first ( see RANK_BY ) with their rank
+    """
+    ranked = pd.DataFrame( results )
+    if len( ranked ) > 0 :
+        ranked = ranked.sort_values( by=RANK_BY, ascending=False, na_position='last' ).reset_index( drop=True )
+        ranked.insert( 0, 'rank', np.arange( 1, len( ranked ) + 1 ) )
+    return ranked
+
+
+
+def point_configs( point : dict , configs : dict ) -> dict :
+    """
+        Configurations of one point : its BaseParams values as configs['params'] , 'interval' selects the matrix row
+    """
+    configs = dict( configs )
+    configs['params']   = { key : value for key, value in point.items() if key != 'interval' }
+    configs['interval'] = point.get( 'interval', configs['interval'] )
+    return configs
+
+
+
+def run_point( point : dict , configs : dict , start : str = None , end : str = None ) -> dict :
+    """
+        Back test one point of the grid on the shared candles ( runs in a worker )
+        ARGS   :
+                    point   ( dict ) - parameter values of the point
+                    configs ( dict ) - configurations of the sweep
+                    start   ( str )  - first DATETIME back tested ( None for the first bar )
+                    end     ( str )  - DATETIME the back test stops before ( None for after the last bar )
+        RETURNS:
+                    point + trades / wins / losses / win_rate / p_l / max_drawdown / funds
+    """
+    result  = dict( point )
+    configs = point_configs( point, configs )
+
+    try:
+        with open( os.devnull, 'w' ) as quiet, contextlib.redirect_stdout( quiet ) :          # THE EVENT LOOP PRINTS EVERY ROW
+            clock       = SimulatedClock()
+            account     = TradeAccount( funds=5000, limit=0.10, app_type='Paper', clock=clock )
+            account.SetFunds( funds=5000.00, limit=0.10 )
+            strategies  = DayTradeStrategy()
+            strategies.Set( strategy=configs['strategy'], interval=configs['interval'], account=account, compact=configs.get('compact', False), clock=clock,
+                            vol_window=configs.get('vol_window') )
+            account.SetMode( "TEST" )
+            if configs.get('vectorized') and BackTestEngine.Supports( configs['strategy'] ) :
+                engine = shared_engine( configs['strategy'], strategies.Strategies[ configs['strategy'] ]['params']( configs ) )
+                engine.Run( account=account, strategy=configs['strategy'], start=start, end=end )
+            else:
+                if Shared.get('store') is not None :                    # DAILY HISTORY OF THE CANDLES , NOT THE BROKER'S
+                    account.SetStore( Shared['store'] )
+                    strategies.Cache = DailyCache( folder=os.path.join( Shared['store'].Root, 'daily_cache' ) )
+                new_data = strategies.BackTest( bars=shared_bars( start, end ), account=account, configs=configs )
+                first, last = shared_range( start, end )
+                if last > first and sum( len( rows ) for rows in new_data.values() ) == 0 :
+                    raise ValueError( f"no row of the {last - first} candles could be back tested" )
+            account.Reconcile()
+
+        trades      = sorted( ( trade for symbol in account.Trades.values() for trade in symbol ), key=lambda trade : str( trade['askTime'] ) )
+        p_l         = np.cumsum( [ trade['p_l'] for trade in trades ] ) if len( trades ) > 0 else np.zeros( 1 )
+        wins        = sum( 1 for trade in trades if trade['p_l'] > 0 )
+        result.update( { 'trades'       : len( trades ),
+                         'wins'         : wins,
+                         'losses'       : len( trades ) - wins,
+                         'win_rate'     : round( wins / len( trades ), 4 ) if len( trades ) > 0 else 0.0,
+                         'p_l'          : round( float( p_l[-1] ), 2 ),
+                         'max_drawdown' : round( float( np.max( np.maximum.accumulate( np.concatenate( [ [0], p_l ] ) ) - np.concatenate( [ [0], p_l ] ) ) ), 2 ),
+                         'funds'        : round( float( account.Funds ), 2 ) } )
+    except:
+        print("\t\t|EXCEPTION: ParamSweep::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+        result.update( { 'trades' : 0, 'wins' : 0, 'losses' : 0, 'win_rate' : 0.0, 'p_l' : np.nan, 'max_drawdown' : np.nan, 'funds' : np.nan } )
+
+    return result
+
+
+
+class ParamSweep :
+    def __init__( self, configs : dict , grid : dict , workers : int = None ) -> None :
+        """
+            INITIALIZE THE GRID
+            ARGS   :
+                        configs ( dict ) - back test configurations ( strategy, interval, volume_threshold ... )
+                        grid    ( dict ) - parameter -> list of values ( BaseParams names and 'interval' )
+                        workers ( int )  - processes ( default every core )
+            RETURNS:
+                        nothing
+        """
+        self.Configs    = configs
+        self.Grid       = { key : ( list( values ) if isinstance( values, ( list, tuple ) ) else [ values ] ) for key, values in grid.items() }
+        self.Workers    = workers or os.cpu_count() or 1
+        self.Cache      = None if configs.get('no_cache') else ResultCache( folder=configs.get('result_cache') or CACHE_FOLDER )
+        self.Resolver   = DayTradeStrategy()                   # RESOLVES THE PARAMS OF A POINT FOR ITS CACHE KEY
+        self.Scratch    = None                                 # CandleStore OF THE CANDLES WHILE A RUN LASTS ( see Share )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"ParamSweep : {self.Configs.get('strategy')}  points : {len( self.Points() )}  workers : {self.Workers}  grid : {self.Grid}"
+
+
+
+    def Points( self ) -> list :
+        """
+            Every combination of the grid values
+        """
+        keys = list( self.Grid.keys() )
+        return [ dict( zip( keys, values ) ) for values in itertools.product( *[ self.Grid[ key ] for key in keys ] ) ]
+
+
+
+    def Run( self, data : pd.DataFrame ) -> pd.DataFrame :
+        """
+            Back test every point of the grid in parallel
+            ARGS   :
+                        data ( DataFrame ) - back test rows sorted on DATETIME ( CandleMerge.Frame() )
+            RETURNS:
+                        DataFrame of the points and their results , best first ( see RANK_BY )
+        """
+        block   = None
+        results = []
+
+        try:
+            digests = partition_digests( data ) if self.Cache is not None else {}
+            block, descriptor = self.Share( data )
+            with self.Pool( descriptor ) as pool :
+                results = self.Map( pool, digests, self.Points() )
+        except:
+            print("\t\t|EXCEPTION: ParamSweep::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        finally:
+            self.Release( block )
+
+        return rank( results )
+
+
+
+    def Share( self, data : pd.DataFrame ) -> (shared_memory.SharedMemory, dict) :
+        """
+            share_frame() of the candles , plus a scratch CandleStore of them for the event loop ( see run_point ) -
+            the vectorized engine needs no daily history
+            RETURNS:
+                        ( SharedMemory , descriptor for Pool() ) , both released by Release()
+        """
+        if not ( self.Configs.get('vectorized') and BackTestEngine.Supports( self.Configs['strategy'] ) ) :
+            self.Scratch = tempfile.mkdtemp( prefix='sweep_store_' )
+            CandleStore( root=self.Scratch ).Write( data )
+
+        block, descriptor       = share_frame( data )
+        descriptor['store']     = self.Scratch
+        return block, descriptor
+
+
+
+    def Release( self, block : shared_memory.SharedMemory ) -> None :
+        """
+            Free the shared candles and the scratch store of Share()
+        """
+        if block is not None :
+            block.close()
+            block.unlink()
+        if self.Scratch is not None :
+            shutil.rmtree( self.Scratch, ignore_errors=True )
+            self.Scratch = None
+
+
+
+    def Key( self, point : dict , digests : dict , start : str = None , end : str = None ) -> str :
+        """
+            Cache key of a point back tested between start and end : strategy, resolved params, engine, code version and
+            the digests of the data partitions it reads
+        """
+        configs = point_configs( point, self.Configs )
+        return self.Cache.Key( kind='back_test', strategy=configs['strategy'], interval=int( configs['interval'] ),
+                               params=self.Resolver.Params( configs['strategy'], configs ),
+                               engine='vectorized' if configs.get('vectorized') and BackTestEngine.Supports( configs['strategy'] ) else 'event',
+                               compact=bool( configs.get('compact') ), vol_window=int( configs.get('vol_window') or 0 ), start=start, end=end, data=data_digest( digests, end ) )
+
+
+
+    def Map( self, pool : ProcessPoolExecutor , digests : dict , points : list , starts : list = None , ends : list = None ) -> list :
+        """
+            run_point over the points ( and time windows ) in the pool - the ones the cache has are read, not run
+            ARGS   :
+                        pool    ( ProcessPoolExecutor ) - workers of Pool()
+                        digests ( dict )                - partition_digests() of the shared candles
+                        points  ( list )                - parameter values of every run
+                        starts  ( list )                - first DATETIME of every run ( None for the first bar )
+                        ends    ( list )                - DATETIME every run stops before ( None for after the last bar )
+            RETURNS:
+                        results in the order of the points
+        """
+        starts  = starts or [ None ] * len( points )
+        ends    = ends or [ None ] * len( points )
+        keys    = [ self.Key( point, digests, start, end ) if self.Cache is not None else None for point, start, end in zip( points, starts, ends ) ]
+        results = [ self.Cache.Load( key ) if key is not None else None for key in keys ]
+        missing = [ index for index, result in enumerate( results ) if result is None ]
+
+        for index, result in zip( missing, pool.map( run_point, [ points[ index ] for index in missing ], itertools.repeat( self.Configs, len( missing ) ),
+                                                     [ starts[ index ] for index in missing ], [ ends[ index ] for index in missing ] ) ) :
+            results[ index ] = result
+            if keys[ index ] is not None and not np.isnan( result['p_l'] ) :          # A FAILED RUN IS TRIED AGAIN NEXT TIME
+                self.Cache.Save( keys[ index ], { key : value for key, value in result.items() if key not in points[ index ] } )
+
+        return [ { **point, **result } for point, result in zip( points, results ) ]
+
+
+
+    def Pool( self, descriptor : dict ) -> ProcessPoolExecutor :
+        """
+            Workers attached to the shared candles of share_frame()
+        """
+        context                 = multiprocessing.get_context()
+        descriptor['forked']    = context.get_start_method() == 'fork'
+        descriptor['log_level'] = self.Configs.get('log_level') or LOG_LEVEL
+        return ProcessPoolExecutor( max_workers=self.Workers, mp_context=context, initializer=attach, initargs=( descriptor, ) )
+
+
+
+    def Save( self, results : pd.DataFrame , folder : str = SWEEP_FOLDER ) -> str :
+        """
+            Write the ranked results table
+            RETURNS:
+                        file name of the csv
+        """
+        os.makedirs( folder, exist_ok=True )
+        file_name = os.path.join( folder, f"sweep_{self.Configs.get('strategy')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv" )
+        results.to_csv( file_name, index=False )
+        return file_name
@@ -0,0 +1,220 @@
+## ###################################################################################################################
+##  Program :   Replay Compare
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              compare = ReplayCompare( configs=configs )                  # configs['strategy'] = 'ema9,simple,vwap'
+##              results = compare.Run( account )                            # [ { strategy, data, account } ] in strategy order
+##  Notes   :   Compares strategies on the same replay day. The parent fetches everything once : the 1 min candles of
+##              the day ( ReplayData , one request per symbol or none when the CandleStore has the day ) and the daily
+##              context of every symbol ( history + seed + the Indicators calculated on them , left in the DailyCache
+##              by one SetORB ). Every strategy then replays in its own worker on a Paper account whose quotes are
+##              built from the shared candles and whose PrimeStockEntry reads the DailyCache, so no worker talks to the
+##              brokerage and comparing N strategies costs about the wall time of one replay
+##              The DailyCache is the configs' daily_cache folder ( default daily_cache/ under the candle store ) ,
+##              never one relative to where the replay was started
+##              Each strategy steps on its own time interval through replay_day ( the steps of replay_test ), so the
+##              intraday indicators are folded per worker - constant time per candle - on top of the shared daily ones
+## ###################################################################################################################
+import os
+import sys
+import inspect
+import itertools
+import multiprocessing
+
+from datetime               import datetime, timedelta
+from concurrent.futures     import ProcessPoolExecutor
+
+from Clock                  import SimulatedClock
+from CandleStore            import CandleStore, STORE_FOLDER
+from ReplayData             import ReplayData
+from TradeAccount           import TradeAccount
+from DayTradeStrategy       import DayTradeStrategy
+from DailyCache             import DailyCache
+from Log                    import logger, set_level, LOG_LEVEL
+
+
+Date_Format     = "%Y-%m-%d %H:%M:%S"
+
+
+
+def next_step( current_time : datetime , time_interval : int ) -> datetime :
+    """
+        Time of the next replay step ( same rule as day_trade.calculate_new_poll_time : it ends on the interval )
+    """
+    deltas = time_interval - ( ( current_time + timedelta( seconds= time_interval ) ).minute % ( time_interval / 60 ) ) * 60
+    return current_time + timedelta( seconds= deltas )
+
+
+
+def daily_cache( configs : dict ) -> DailyCache :
+    """
+        DailyCache the replays share : configs['daily_cache'] , or daily_cache/ under the candle store
+    """
+    return DailyCache( folder= configs.get('daily_cache') or os.path.join( configs.get('candle_store') or STORE_FOLDER, 'daily_cache' ) )
+
+
+
+def replay_day( strategies : DayTradeStrategy , account : TradeAccount , configs : dict , clock : SimulatedClock ) -> dict :
+    """
+        Step through the replay day : the ORB until 10:00 , then one quote per symbol every time interval the strategy
+        asks for , and what is still in play is sold before the close ( day_trade.replay_test and replay_strategy )
+        ARGS   :
+                    strategies ( DayTradeStrategy ) - strategy set on the account
+                    account    ( TradeAccount )     - account in TEST mode whose Store serves the day
+                    configs    ( dict )             - replay configurations ( stock, replay_date ... )
+                    clock      ( SimulatedClock )   - clock of the account and the strategy , moved to every step
+        RETURNS:
+                    { symbol : [ quote entries ] } for summary_report
+    """
+    data            = { symbol : [] for symbol in configs['stock'] }
+    isFirst         = True
+    current_time    = datetime.strptime( configs['replay_date'][:10] + " 09:30:00", Date_Format )
+    time_interval   = 900
+
+    while True :
+        clock.Set( current_time )
+        if ( current_time.hour < 9 and current_time.minute < 30 ) or ( current_time.hour >= 17 ) :
+            logger.debug( "\t\t\t\t -> Outside of market hours " )
+            break
+        elif current_time.hour == 9 :                                                                   # ORB CALCULATIONS
+            strategies.SetORB( configs['stock'], account, current_time )
+        elif current_time.hour == 15 and ( current_time.minute + ( time_interval / 60 ) ) >= 55 :       # Sell whatever is InPlay
+            logger.info( "\t\t\t > Market closing ; shifting InPlay -> Trades" )
+            for symbol in list( account.InPlay.keys() ) :
+                ticker_row = account.QuoteByInterval( symbols= symbol, frequency= time_interval, endDate= current_time )
+                if ticker_row != [] :
+                    account.Sell( stock=symbol, new_price=float( ticker_row[3] ) if ticker_row != None else account.InPlay[symbol]['price'],
+                                  ask_volume=ticker_row[5] if ticker_row != None else 0, indicators=strategies.Stocks[symbol]['Indicators'] )
+            break
+        else:
+            ticker_rows = {}
+            for symbol in configs['stock'] :
+                if isFirst :                                                                            # FIRST QUOTE ON THE 1 MIN CHART
+                    ticker_rows[ symbol ] = account.Quote( symbols= symbol, endDate= current_time )[ symbol ]
+                    isFirst = False
+                else:
+                    ticker_rows[ symbol ] = account.QuoteByInterval( symbols= symbol, frequency= time_interval, endDate= current_time )
+            strategies.UpdateIndicators( [ row for row in ticker_rows.values() if row != None and row != [] ] )   # ONE PASS FOR THE WATCH LIST
+            for symbol, ticker_row in ticker_rows.items() :
+                logger.debug( "\t\t\t->DATA : {} @ {} ", ticker_row, current_time )
+                if ticker_row != None and ticker_row != [] :
+                    success, msg, time_interval, account = strategies.Run( ticker_row, account, configs )
+                    data[ symbol ].append( { 'stock':symbol, 'datetime':f"{current_time}", 'low': float( ticker_row[2] ), 'quote':float( ticker_row[4] ),
+                                             'high':float( ticker_row[6] ), 'close':float( ticker_row[3] ),
+                                             'volume':float( ticker_row[5] ), 'interval': time_interval/60, 'msg':msg } )
+
+        current_time = next_step( current_time, time_interval )
+
+    return data
+
+
+
+def replay_strategy( strategy : str , configs : dict , candles : dict = None , store : CandleStore = None ) -> dict :
+    """
+        Replay the day for one strategy in a worker - replay_day on a Paper account
+        ARGS   :
+                    strategy ( str )         - strategy name
+                    configs  ( dict )        - replay configurations ( stock, replay_date, interval ... )
+                    candles  ( dict )        - ReplayData.Candles loaded by the parent ( None to read the day from the store )
+                    store    ( CandleStore ) - store of the worker ( default the candle_store of the configs )
+        RETURNS:
+                    { strategy, data, account, error } - quote entries per symbol for summary_report , the account
+                    ( Trades / Performance ) without its store and the exception that stopped the replay ( None when it ran )
+    """
+    data            = { symbol : [] for symbol in configs['stock'] }
+    error           = None
+    clock           = SimulatedClock( start= configs['replay_date'][:10] + " 09:30:00" )
+    account         = TradeAccount( funds=5000, limit=0.10, app_type='Paper', clock=clock )
+    strategies      = DayTradeStrategy()
+
+    try:
+        account.SetFunds( 5000.00, 0.50 )
+        account.SetMode( "TEST" )
+        account.SetStore( ReplayData( account=account, symbols=configs['stock'], day=configs['replay_date'], candles=candles,
+                                      store=store or CandleStore( root=configs.get('candle_store') or STORE_FOLDER ) ) )
+        strategies.Set( strategy=strategy, interval=configs['interval'], account=account, compact=configs.get('compact', False), clock=clock,
+                        vol_window=configs.get('vol_window') )
+        strategies.Cache = daily_cache( configs )
+        data = replay_day( strategies, account, configs, clock )
+        account.Reconcile()
+    except:
+        print("\t\t|EXCEPTION: ReplayCompare::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        print("\t\t * Strategy : " , strategy )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+        error = repr( sys.exc_info()[1] )
+
+    account.SetStore( None )                        # THE CANDLES STAY IN THE WORKER
+    return { 'strategy' : strategy, 'data' : data, 'account' : account, 'error' : error }
+
+
+
+class ReplayCompare :
+    def __init__( self, configs : dict , workers : int = None ) -> None :
+        """
+            INITIALIZE THE STRATEGIES TO COMPARE
+            ARGS   :
+                        configs ( dict ) - replay configurations , 'strategy' is a list or a comma delimited string
+                        workers ( int )  - processes ( default one per strategy , at most every core )
+            RETURNS:
+                        nothing
+        """
+        self.Configs    = dict( configs )
+        self.Strategies = [ name.strip() for name in ( configs['strategy'].split( "," ) if isinstance( configs['strategy'], str ) else configs['strategy'] ) ]
+        self.Configs['stock']   = [ configs['stock'] ] if isinstance( configs['stock'], str ) else list( configs['stock'] )
+        self.Workers    = workers or min( len( self.Strategies ), os.cpu_count() or 1 )
+        self.Replay     = None
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"ReplayCompare : {self.Configs['replay_date'][:10]}  strategies : {self.Strategies}  "
+                 f"stocks : {self.Configs['stock']}  workers : {self.Workers}" )
+
+
+
+    def Share( self, account : TradeAccount ) -> ReplayData :
+        """
+            Fetch what every strategy reads , once : the candles of the day and the daily context of every symbol
+            ARGS   :
+                        account ( TradeAccount ) - the brokerage account of the parent ( the only one making requests )
+            RETURNS:
+                        ReplayData of the day
+        """
+        orb_time    = datetime.strptime( self.Configs['replay_date'][:10] + " 10:00:00", Date_Format )
+        self.Replay = ReplayData( account=account, symbols=self.Configs['stock'], day=self.Configs['replay_date'],
+                                  store=CandleStore( root=self.Configs.get('candle_store') or STORE_FOLDER ) )
+        account.SetStore( self.Replay )
+
+        primer      = DayTradeStrategy()                                                # LEAVES THE DAILY CONTEXT IN THE DailyCache
+        primer.Set( strategy=self.Strategies[0], interval=self.Configs['interval'], account=account, compact=self.Configs.get('compact', False),
+                    clock=account.Clock, vol_window=self.Configs.get('vol_window') )
+        primer.Cache = daily_cache( self.Configs )
+        primer.SetORB( self.Configs['stock'], account, orb_time )
+        return self.Replay
+
+
+
+    def Run( self, account : TradeAccount ) -> list :
+        """
+            Share the day then replay every strategy in its own worker
+            ARGS   :
+                        account ( TradeAccount ) - the brokerage account of the parent
+            RETURNS:
+                        [ { strategy, data, account } ] in the order of the strategies
+        """
+        results = []
+        try:
+            replay  = self.Share( account )
+            with ProcessPoolExecutor( max_workers=self.Workers, mp_context=multiprocessing.get_context(),
+                                      initializer=set_level, initargs=( self.Configs.get('log_level') or LOG_LEVEL, ) ) as pool :
+                results = list( pool.map( replay_strategy, self.Strategies, itertools.repeat( self.Configs ), itertools.repeat( replay.Candles ) ) )
+        except:
+            print("\t\t|EXCEPTION: ReplayCompare::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        return results
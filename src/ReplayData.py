@@ -0,0 +1,119 @@
+## ###################################################################################################################
+##  Program :   Replay Data
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              account.SetStore( ReplayData( account=account, symbols=['QQQ','AAPL'], day='2025-08-15', store=CandleStore() ) )
+##  Notes   :   Market data of one replay day held in memory : the 1 min candles of every symbol are read from the
+##              CandleStore when it has the day, otherwise fetched from the brokerage in one price history request per
+##              symbol ( and written to the store, so the next replay of the day is local ).
+##              TradeAccount.Quote / QuoteByInterval then build every candle the replay asks for from memory ( see
+##              candle_bar ) instead of one network request per symbol per step ; History goes to the store when it
+##              has the symbol, the brokerage otherwise
+## ###################################################################################################################
+import sys
+import inspect
+
+import numpy    as np
+import pandas   as pd
+
+from datetime       import datetime, timedelta
+
+from CandleStore    import CandleStore, COLUMNS, candle_bar
+
+
+
+class ReplayData :
+    def __init__( self, account : object , symbols : list , day : str , store : CandleStore = None , candles : dict = None ) -> None :
+        """
+            INITIALIZE AND LOAD THE DAY
+            ARGS   :
+                        account ( TradeAccount ) - account whose brokerage connection fetches what the store does not have
+                        symbols ( list )         - symbols replayed
+                        day     ( str )          - replay day ( 'YYYY-MM-DD' , anything after it is ignored )
+                        store   ( CandleStore )  - local candles ( None to always fetch )
+                        candles ( dict )         - Candles of a ReplayData already loaded ( another process shares its day )
+            RETURNS:
+                        nothing
+        """
+        self.Account    = account
+        self.Day        = str( day )[:10]
+        self.Store      = store
+        self.Candles    = {}                    # symbol -> { TIME / LOW / CLOSE / QUOTE / VOLUME / HIGH : np.ndarray }
+        self.Sources    = {}                    # symbol -> 'store' / 'broker'
+
+        for symbol in ( [ symbols ] if isinstance( symbols, str ) else symbols ) :
+            if candles is not None and symbol in candles :
+                self.Candles[ symbol ]  = candles[ symbol ]
+                self.Sources[ symbol ]  = 'shared'
+            else :
+                self.Load( symbol )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"ReplayData : {self.Day}  " +
+                 "  ".join( f"{symbol} : {len( columns['TIME'] )} candles ( {self.Sources[ symbol ]} )" for symbol, columns in self.Candles.items() ) )
+
+
+
+    def Load( self, symbol : str ) -> None :
+        """
+            1 min candles of the replay day for a symbol , from the store or one brokerage request
+        """
+        try:
+            if self.Store is not None and self.Store.Has( symbol, self.Day ) :
+                self.Candles[ symbol ]  = { column : np.array( values ) for column, values in self.Store.Partition( symbol, self.Day ).items() }
+                self.Sources[ symbol ]  = 'store'
+                return
+
+            start       = datetime.strptime( self.Day, "%Y-%m-%d" )
+            response    = self.Account.Conn.QuoteByInterval( symbol=symbol, periodType='day', period=1, frequencyType='minute', frequency=1,
+                                                             startDate=start, endDate=start + timedelta( hours=23, minutes=59 ) )
+            if isinstance( response, str ) or response.status_code != 200 :
+                print( f"\t\t * ReplayData : no candles for {symbol} on {self.Day}" )
+                return
+
+            candles = pd.DataFrame( response.json().get( 'candles', [] ), columns=[ 'open', 'high', 'low', 'close', 'volume', 'datetime' ] )
+            times   = [ datetime.fromtimestamp( value / 1000 ) for value in candles['datetime'] ]       # LOCAL TIME , LIKE ExtractQuoteEntry
+            frame   = pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : [ str( value ) for value in times ], 'LOW' : candles['low'],
+                                      'CLOSE' : candles['close'], 'QUOTE' : candles['open'], 'VOLUME' : candles['volume'], 'HIGH' : candles['high'] } )
+            frame   = frame[ frame['DATETIME'].str[:10] == self.Day ].sort_values( by=['DATETIME'], kind='stable' )
+
+            self.Candles[ symbol ]  = { 'TIME' : pd.to_datetime( frame['DATETIME'] ).to_numpy().astype( COLUMNS['TIME'] ),
+                                        **{ column : frame[ column ].to_numpy( dtype=float ) for column in ( 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' ) } }
+            self.Sources[ symbol ]  = 'broker'
+            if self.Store is not None and len( frame ) > 0 :
+                self.Store.Write( frame )
+        except:
+            print("\t\t|EXCEPTION: ReplayData::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            print("\t\t * Symbol : " , symbol )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+
+
+
+    def Has( self, symbol : str , day : str = None ) -> bool :
+        """
+            True when the candles of the symbol ( on the day of a date / time if given ) are in memory
+        """
+        return symbol in self.Candles and ( day is None or str( day )[:10] == self.Day )
+
+
+    def Bar( self, symbol : str , when : datetime , seconds : int = 60 ) -> list :
+        """
+            Ticker row of the candle that starts at a time ( see candle_bar )
+        """
+        return candle_bar( symbol, self.Candles[ symbol ], when, seconds ) if self.Has( symbol, when ) else None
+
+
+    def History( self, symbol : str , time_period : str = 'daily' , time_range : int = 1 , today : datetime = None ) -> pd.DataFrame :
+        """
+            History of the store ( empty when it does not have the symbol , TradeAccount then asks the brokerage )
+        """
+        if self.Store is not None and self.Store.Has( symbol ) :
+            return self.Store.History( symbol=symbol, time_period=time_period, time_range=time_range, today=today )
+        return pd.DataFrame()
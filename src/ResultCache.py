@@ -0,0 +1,173 @@
+## ###################################################################################################################
+##  Program :   Result Cache
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              cache   = ResultCache()
+##              key     = cache.Key( kind='back_test', strategy='ema9', params=params, data=data_digest( digests, end='2025-08-16' ) )
+##              result  = cache.Load( key )                         # None when that combination never ran
+##              cache.Save( key, result )
+##  Notes   :   Results of back tests / replays keyed by a hash of everything they depend on : the strategy, its
+##              resolved params ( interval matrix and sweep overrides applied , see DayTradeStrategy.Params ), the
+##              code version ( hash of the source files next to this one ) and the digests of the input data
+##              partitions ( symbol , day ). Running the same combination again reads a small json file instead ;
+##              changing a parameter value, a line of code or the candles of a day gives another key
+## ###################################################################################################################
+import os
+import sys
+import glob
+import json
+import hashlib
+import inspect
+
+import numpy    as np
+import pandas   as pd
+
+
+CACHE_FOLDER    = "../files/result_cache/"
+DATA_COLUMNS    = ( 'SYMBOL', 'DATETIME', 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH' )
+Versions        = {}                            # folder -> code version , hashed once per process
+
+
+
+def canonical( value : object ) -> object :
+    """
+        json default for numpy values and anything else ( dates ... ) - the same value always gives the same text
+    """
+    return value.item() if isinstance( value, np.generic ) else str( value )
+
+
+
+def digest( value : object ) -> str :
+    """
+        Hash of a json-able value ( dictionary key order does not matter )
+    """
+    text = json.dumps( value, sort_keys=True, default=canonical, separators=( ',', ':' ) )
+    return hashlib.sha256( text.encode() ).hexdigest()
+
+
+
+def code_version( folder : str = None ) -> str :
+    """
+        Hash of the source files of the program ( tests left out ) - any edit gives another version
+    """
+    folder = folder or os.path.dirname( os.path.abspath( __file__ ) )
+    if folder not in Versions :
+        hasher = hashlib.sha256()
+        for file_name in sorted( glob.glob( os.path.join( folder, "*.py" ) ) ) :
+            if not os.path.basename( file_name ).startswith( 'test_' ) :
+                with open( file_name, 'rb' ) as file :
+                    hasher.update( os.path.basename( file_name ).encode() + b'\0' + file.read() )
+        Versions[ folder ] = hasher.hexdigest()
+    return Versions[ folder ]
+
+
+
+def partition_digests( data : pd.DataFrame ) -> dict :
+    """
+        Digest of every ( symbol , day ) partition of back test rows
+        ARGS   :
+                    data ( DataFrame ) - SYMBOL, DATETIME, LOW, CLOSE, QUOTE, VOLUME, HIGH rows
+        RETURNS:
+                    { 'SYMBOL DAY' : digest }
+    """
+    rows    = pd.util.hash_pandas_object( data[ list( DATA_COLUMNS ) ].astype( { 'SYMBOL' : str, 'DATETIME' : str } ), index=False ).to_numpy()
+    names   = data['SYMBOL'].astype( str ).to_numpy() + ' ' + data['DATETIME'].astype( str ).str[:10].to_numpy()
+    return { name : hashlib.blake2b( rows[ index ].tobytes(), digest_size=16 ).hexdigest()
+             for name, index in pd.Series( names ).groupby( names ).indices.items() }
+
+
+
+def store_digests( store : object , symbols : list , end : str = None ) -> dict :
+    """
+        Digest of every partition a CandleStore holds for the symbols up to a day ( from the manifest , no candle read )
+    """
+    return { f"{symbol} {day}" : digest( store.Manifest['partitions'][ symbol ][ day ] )
+             for symbol in symbols for day in store.Days( symbol ) if end is None or day <= str( end )[:10] }
+
+
+
+def data_digest( digests : dict , end : str = None ) -> str :
+    """
+        Digest of the partitions a run can read : the days before end ( the indicators carry over from them )
+        ARGS   :
+                    digests ( dict ) - partition_digests() / store_digests()
+                    end     ( str )  - DATETIME the run stops before ( None for every partition )
+    """
+    return digest( { name : value for name, value in digests.items() if end is None or name.split( ' ' )[-1] < str( end )[:10] or
+                     ( len( str( end ) ) > 10 and name.split( ' ' )[-1] == str( end )[:10] ) } )
+
+
+
+class ResultCache :
+    def __init__( self, folder : str = CACHE_FOLDER ) -> None :
+        """
+            INITIALIZE THE CACHE FOLDER
+            ARGS   :
+                        folder ( str ) - where the results are kept
+            RETURNS:
+                        nothing
+        """
+        self.Folder = str( folder )
+        self.Hits   = 0
+        self.Misses = 0
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return f"ResultCache : {self.Folder}  hits : {self.Hits}  misses : {self.Misses}"
+
+
+
+    def Key( self, **parts ) -> str :
+        """
+            Key of a run : digest of its parts and the code version
+        """
+        return digest( { **parts, 'code' : code_version() } )
+
+
+
+    def FileName( self, key : str ) -> str :
+        return os.path.join( self.Folder, key[:2], f"{key}.json" )
+
+
+
+    def Load( self, key : str ) -> dict :
+        """
+            Result saved under the key ( None when there is none )
+        """
+        try:
+            with open( self.FileName( key ), 'r' ) as file :
+                result = json.load( file )
+            self.Hits += 1
+            return result
+        except FileNotFoundError :
+            self.Misses += 1
+        except:
+            print("\t\t|EXCEPTION: ResultCache::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+            self.Misses += 1
+        return None
+
+
+
+    def Save( self, key : str , result : dict ) -> bool :
+        """
+            Keep a result under its key ( written to a temporary file first , a reader never sees half a file )
+        """
+        try:
+            file_name = self.FileName( key )
+            os.makedirs( os.path.dirname( file_name ), exist_ok=True )
+            with open( file_name + ".tmp", 'w' ) as file :
+                json.dump( result, file, default=canonical )
+            os.replace( file_name + ".tmp", file_name )
+            return True
+        except:
+            print("\t\t|EXCEPTION: ResultCache::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        return False
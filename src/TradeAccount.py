@@ -27,6 +27,9 @@ from datetime           import datetime, timedelta, timezone
 from TraderDB           import TraderDB
 from Indicators         import Indicators 
 from SchwabAccount      import SchwabAccount
+from PaperAccount       import PaperAccount
+from Clock              import Clock
+from Log                import logger
 
 warnings.filterwarnings('ignore')
 
@@ -38,7 +41,7 @@ OPTION_PUT  = 2
 class TradeAccount:
     def __init__(self, funds : float =5000, limit : float = 0.10 , userName: str = "", email : str= "",
                  app_type = 'Schwab',app_key ="xxxxx", app_secret = "zzzzzz" ,
-                     sqlServer : str ="127.0.0.1", sqlUserName :str ="", sqlPassword : str ="" ) :
+                     sqlServer : str ="127.0.0.1", sqlUserName :str ="", sqlPassword : str ="" , clock : Clock = None ) :
         """
             Initialize the variables for the Trading Account class 
         """
@@ -55,13 +58,15 @@ class TradeAccount:
         self.DailyFunds     = 0                        # Use this to preserve any profits, instead of re-risking them because the LIMIT is based on percentage
         self.TargetGoal     = 0                        # Dont get greedy, when reach this amount will quit trading for day
         self.Performance    = {}                       # Keep track of wins and loses
-        self.AccountTypes   = { 'SCHWAB' :  SchwabAccount }
+        self.AccountTypes   = { 'SCHWAB' :  SchwabAccount , 'PAPER' : PaperAccount }    # PAPER : OFFLINE FILLS FOR BACK TESTS / SWEEPS
         
+        self.Clock          = clock or Clock()         # WHERE current_time / endDate DEFAULTS COME FROM ( SimulatedClock IN REPLAYS )
+        self.Store          = None                     # CandleStore / ReplayData serving History / quotes of the days it holds ( replays )
         self.SQLConn        = None 
         self.Conn           =  self.AccountTypes  [ app_type.upper()] ( app_key, app_secret )
         self.Funds          = self.Conn.CashForTrading()
         
-        print(f"\t\t\t Available Cash for Trading : ${ self.Funds} " )
+        logger.debug("\t\t\t Available Cash for Trading : ${} ", self.Funds )
 
         self.SetLimit(limit )                           # INCASE VALUE SENT IN THROUGH CONSTRUCTOR
         
@@ -120,7 +125,7 @@ class TradeAccount:
 
 
 
-    def History( self, symbol : str , time_period : str ='daily' , time_range : int =1, period_type ="month" , today :datetime = datetime.now()) -> dict :
+    def History( self, symbol : str , time_period : str ='daily' , time_range : int =1, period_type ="month" , today :datetime = None) -> dict :
         """
             Get historical entries for the symbol
             ARGS  :
@@ -129,7 +134,12 @@ class TradeAccount:
                     time_period  ( str )  daily / month / year / ytd 
             RETURNS:
         """
-        print(f"TRADEACCOUNT::HISTORY -  Its { ('NOT' if today.weekday() != 0 else '' ) }  MONDAY ")
+        today           = today or self.Clock.Now()
+        logger.opt( lazy=True ).debug("TRADEACCOUNT::HISTORY -  Its {}  MONDAY ", lambda : 'NOT' if today.weekday() != 0 else '')
+        if self.Store is not None and self.Store.Has( symbol ) :
+            df = self.Store.History( symbol=symbol, time_period=time_period, time_range=time_range, today=today )
+            if len( df ) > 0 :
+                return df
         df              = None 
         endDate         = today- timedelta( days = ( 3 if today.weekday()== 0 else 1 ) )  # time delta for when working on weekend 
         timeStamp       = 0
@@ -154,7 +164,7 @@ class TradeAccount:
 
             
             if response.status_code != 200 :
-                print( f"\t\t\t TradeAccount::History()  did not get Quote :{response.text}" )
+                logger.debug( "\t\t\t TradeAccount::History()  did not get Quote :{}", response.text )
                 return ticker_row
             #print( response.text)
             
@@ -176,7 +186,7 @@ class TradeAccount:
 
 
         
-    def Quote ( self, symbols : list | str,  endDate : datetime = datetime.now()) -> requests.Response :
+    def Quote ( self, symbols : list | str,  endDate : datetime = None) -> requests.Response :
         """
             Abstraction to call the underlying client ( Schwab / ) to get a quote
             The last candle in candles:{} will be the most current one we want for frequency and timeframe
@@ -186,15 +196,18 @@ class TradeAccount:
                         request.response
         """
         ticker_row  = {}
+        endDate     = endDate or self.Clock.Now()
         
         try:
+            if self.Store is not None and all( self.Store.Has( sym, endDate ) for sym in ( [symbols] if isinstance(symbols,str) else symbols ) ) :
+                return { sym : self.Store.Bar( sym, endDate ) or [] for sym in ( [symbols] if isinstance(symbols,str) else symbols ) }
             quote_response = self.Conn.Quote( symbols)
             for sym in ( [symbols] if isinstance(symbols,str) else symbols):
                 if not( sym in quote_response ):
                     ticker_row.update({ sym :  [ ] })
                 else:
                     details =  quote_response[sym]['quote']
-                    ticker_row.update({ sym :  [ sym, str(datetime.now() ),details['lowPrice'], details['closePrice'], details["openPrice"],
+                    ticker_row.update({ sym :  [ sym, str(self.Clock.Now() ),details['lowPrice'], details['closePrice'], details["openPrice"],
                                                details["totalVolume"],details['highPrice']] })
                 
         except:          
@@ -206,7 +219,7 @@ class TradeAccount:
         return  ticker_row
 
         
-    def QuoteByInterval ( self, symbols : list | str, frequency : int = 60, frequencyType : str = "minute" , endDate : datetime = datetime.now()) -> requests.Response :
+    def QuoteByInterval ( self, symbols : list | str, frequency : int = 60, frequencyType : str = "minute" , endDate : datetime = None) -> requests.Response :
         """
             Abstraction to call the underlying client ( Schwab / ) to get a quote by interval/time 
             The last candle in candles:{} will be the most current one we want for frequency and timeframe
@@ -221,8 +234,11 @@ class TradeAccount:
         ticker_row      = None 
         periodTypes     = ["day","month","year","ytd"]
         frequencyTypes  = ["minute","daily","weekly","monthly"]
+        endDate         = endDate or self.Clock.Now()
         
         try:
+            if self.Store is not None and self.Store.Has( symbols, endDate ) :
+                return self.Store.Bar( symbols, endDate, frequency )
             period          = 1
             frequency       = int (15 if frequency/60 == 0 else frequency/60 )
             startDate       = endDate - timedelta( seconds = frequency * 60) 
@@ -247,7 +263,7 @@ class TradeAccount:
                 #ticker_row = self.Quote ( symbols =symbols, endDate = endDate)[symbols]
                 
                 if ticker_row == None :
-                    print( f"{symbols}  RUNNING SECOND ")
+                    logger.debug( "{}  RUNNING SECOND ", symbols)
                 #    ticker_row = self.Quote( symbols )[symbols]
                 #    return ticker_row
                     
@@ -259,7 +275,7 @@ class TradeAccount:
                 
                 #IF PROPER STILL IS NOT FOUND, THEN GET THE LAST ENTRY IN THE SERIES /RESPONSE DICT
                 if ticker_row == None :
-                    print(f"{symbols}  **********  FAKING IT ************")
+                    logger.debug("{}  **********  FAKING IT ************", symbols)
                     #for entry in candles['candles'] :
                     #    print( f"\t>> {entry} -> {datetime.fromtimestamp(entry['datetime']/1000)}")
                     quote_info = candles['candles'][-1]
@@ -309,6 +325,30 @@ class TradeAccount:
 
         
 
+    def SetStore ( self, store : object ) -> None :
+        """
+            Read History / Quote / QuoteByInterval from a CandleStore / ReplayData for the symbols and days it holds
+            ARGS   :
+                        store ( CandleStore / ReplayData ) - None to go back to the brokerage
+            RETURNS:
+                        nothing 
+        """
+        self.Store = store
+
+
+
+    def SetClock ( self, clock : Clock ) -> None :
+        """
+            Take the time from another clock ( the SimulatedClock of a replay )
+            ARGS   :
+                        clock ( Clock ) - None for the wall clock
+            RETURNS:
+                        nothing 
+        """
+        self.Clock = clock or Clock()
+
+
+
     def SetMode ( self, mode : str ) -> None :
         """
             Sets the mode of the application : TEST / TRADE
@@ -341,7 +381,7 @@ class TradeAccount:
             PARAMETERS  : 
         """
         try:
-            print (f"\t\t FUNDS : {self.Funds }    Limit : {self.Limit} " ) 
+            logger.debug ("\t\t FUNDS : {}    Limit : {} ", self.Funds, self.Limit ) 
             return self.Funds * self.Limit 
         except:
             print("\t\t|EXCEPTION: TradeAccount::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
@@ -352,7 +392,7 @@ class TradeAccount:
 
 
 
-    def Buy( self, stock : str , price : float, current_time : str = str( datetime.now()), volume : int = 0 ,
+    def Buy( self, stock : str , price : float, current_time : str = None, volume : int = 0 ,
                                                          volume_threshold : int = 0, indicators : Indicators = None )  -> bool :
         """
            Attempt to buy the stock under the confines of the limit , True = succeeded , False = failed
@@ -371,23 +411,24 @@ class TradeAccount:
         qty             = 0
         success         = False
         message_prefix  = "\t\t\t   \\-> TradeAccount::" + str(inspect.currentframe().f_code.co_name)
+        current_time    = str( self.Clock.Now() ) if current_time is None else current_time
 
         try :
             # IF MADE TARGET PERCENT THEN DONT BUY ANY MORE 
             if self.TargetGoal  == 0  :#and self.Funds > self.TargetGoal :
-                print(f"{message_prefix}   BUY -  Have already hit the TargetGoal  : { self.TargetGoal} " ) 
+                logger.debug("{}   BUY -  Have already hit the TargetGoal  : {} ", message_prefix, self.TargetGoal ) 
                 return False
 
             
             # CHECK IF CAN AFFORD TO BUY
             #print( "Check : " , str( type( price )) , " : " , str( type( self.Funds * self.Limit ))   )
             if price > ( self.Funds * self.Limit ):
-                print(f"{message_prefix}   Cant even buy ONE stock : {( self.Funds * self.Limit )}  " )
+                logger.opt( lazy=True ).debug( "{}   Cant even buy ONE stock : {}  ", lambda : message_prefix, lambda : self.Funds * self.Limit )
                 return success
 
             # CHECK IF ALREADY HOLDING 
             if stock in self.InPlay.keys() :
-                print(f"{message_prefix}   Already holding {stock}, cant take any more ")
+                logger.debug("{}   Already holding {}, cant take any more ", message_prefix, stock)
                 return success
 
             if not(stock  in self.Trades.keys() ) :
@@ -401,7 +442,9 @@ class TradeAccount:
                 #    return success 
 
             working_capital = self.DailyFunds  if  (self.DailyFunds ) <  (self.Funds * self.Limit )  else (self.Funds * self.Limit )
-            print ( f"{message_prefix}   Working Capital  : {working_capital}  :  {self.Funds * self.Limit }  -> {self.DailyFunds} " )
+            logger.opt( lazy=True ).debug( "{}   Working Capital  : {}  :  {}  -> {} ",
+                                           lambda : message_prefix, lambda : working_capital, lambda : self.Funds * self.Limit,
+                                           lambda : self.DailyFunds )
             qty             = int (working_capital / price )       # instead of self.Funds, so we dont risk previous profits; might need to readjust if had a loss 
             # ACTUALLY BUY SOME NOW IF MODE='TRADE'
             success = self.Conn.Buy( stock , price , qty ) 
@@ -426,7 +469,7 @@ class TradeAccount:
                # print ( f"{message_prefix}   BOUGHT : " , self.InPlay )
                 success = True
             else:
-                print("\t\t\t    --> Account level could not execute BUY properly ")
+                logger.debug("\t\t\t    --> Account level could not execute BUY properly ")
             return success 
         except: 
             print("\t\t|EXCEPTION: TradeAccount::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
@@ -435,7 +478,7 @@ class TradeAccount:
 
 
 
-    def Sell( self, stock : str, new_price : float, current_time : str = str( datetime.now()),
+    def Sell( self, stock : str, new_price : float, current_time : str = None,
                                                   ask_volume : int = 0, indicators : Indicators = None )  -> bool :
         """
            Sell the stock currently holding , True = succeeded , False = failed
@@ -455,18 +498,19 @@ class TradeAccount:
         p_l             = 0   
         success         = False
         message_prefix  = "\t\t\t* TradeAccount::" + str(inspect.currentframe().f_code.co_name) 
+        current_time    = str( self.Clock.Now() ) if current_time is None else current_time
 
         try :
             # CHECK IF ALREADY HOLDING 
             if  not( stock in self.InPlay.keys() ):
-                print(message_prefix + "  Not holding that stock ")
+                logger.debug("{}  Not holding that stock ", message_prefix)
                 return success
 
             
             # WHEN PROFITABLE , ONLY SELL WHEN MORE THAN SPECIFIC PERCENT
             if ( new_price  > self.InPlay[ stock ]['price'] ) :
                 diff = (new_price  - self.InPlay[ stock ]['price'] )/self.InPlay[ stock ]['price']
-                print ( f"\t\t\t    \\----> DIFF  -> {new_price }  {self.InPlay[ stock ]['price']}  {diff } ")
+                logger.debug ( "\t\t\t    \\----> DIFF  -> {}  {}  {} ", new_price, self.InPlay[stock]['price'], diff)
                 #if diff < 0.00016 :    # ignore profit if less than % of investment 
                 #    print(message_prefix + "  Not Selling - trying to be a little greedier ")
                 #    return False
@@ -477,7 +521,9 @@ class TradeAccount:
                 
 
             if self.Mode.lower() == "test" or success:    
-                print('FUNDS: ', self.Funds , ' : ' , ( self.InPlay[stock]['qty'] * new_price ), ' = ' , ( self.InPlay[stock]['qty'] * new_price )+self.Funds)    
+                logger.opt( lazy=True ).debug( "FUNDS:  {}  :  {}  =  {}",
+                                               lambda : self.Funds, lambda : self.InPlay[stock]['qty'] * new_price,
+                                               lambda : self.InPlay[stock]['qty'] * new_price + self.Funds )
                 self.Funds += ( self.InPlay[stock]['qty'] * new_price )
                 p_l         = ( self.InPlay[stock]['qty'] * new_price )  - ( self.InPlay[ stock ]['qty'] *  self.InPlay[ stock ]['price'] )
 
@@ -486,11 +532,11 @@ class TradeAccount:
                             'qty' :self.InPlay[ stock ]['qty'],     'askTime':current_time, 'ask':new_price, 'p_l': p_l ,
                             'indicators_in': self.InPlay[stock]['indicators_in'], 'indicators_out': indicators.Summary()}
                 self.Trades[stock].append(  new_rec )                
-                print ( f"\t\t\t \\-> SOLD :  from ${self.InPlay[stock]['price']} -> ${new_price }  PROFIT: { p_l}"  )
+                logger.info ( "\t\t\t \\-> SOLD :  from ${} -> ${}  PROFIT: {}", self.InPlay[stock]['price'], new_price, p_l  )
                 self.InPlay.pop( stock )    #REMOVE ENTRY FROM DICTIONARY 
                 self.Performance[stock].append ( 'WIN' if p_l >0 else 'LOSS' )                
                 if (  p_l  < ( -0.01 * self.DailyFunds) ) : #                     self.LossLimit) :   # WE HAVE LOST TOO MUCH ON ONE DEAL , CALL QUITS FOR TODAY
-                    print( f"**Lost TOO MUCH on one deal : { p_l}  -> {self.LossLimit} ")
+                    logger.info( "**Lost TOO MUCH on one deal : {}  -> {} ", p_l, self.LossLimit)
                     self.TargetGoal = 0 
 
                 if self.Mode.upper() == "TRADE":
@@ -500,7 +546,7 @@ class TradeAccount:
                     
                 success = True
             else:
-                print ("\t\t --> Account  level did not Execute SELL properly ") 
+                logger.debug ("\t\t --> Account  level did not Execute SELL properly ") 
             
         except: 
             print("\t\t|EXCEPTION: TradeAccount::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
@@ -528,7 +574,7 @@ class TradeAccount:
             toTime      = (datetime.now(timezone.utc)).strftime( date_format)
             fromTime    = (datetime.now(timezone.utc)- timedelta( days = time_interval+1) ).strftime('%Y-%m-%dT%H:%M:%SZ')           
             
-            print(f"ORDERS: from - {fromTime} -> {toTime}")
+            logger.debug("ORDERS: from - {} -> {}", fromTime, toTime)
             orders = self.Conn.AccountOrders ( self.Conn.GetAccountHash() ,
                                 fromTime =fromTime,toTime=toTime , status = "FILLED" )
             #print( f"TRADE ACCOUNT ORDERS : {orders}")
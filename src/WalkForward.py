@@ -0,0 +1,165 @@
+## ###################################################################################################################
+##  Program :   Walk Forward
+##  Author  :
+##  Install :   pip3 install numpy pandas
+##  Example :
+##              walk    = WalkForward( configs=configs, grid={ 'risk_percent' : [0.001, 0.0015], 'interval' : [1, 5] }, in_sample=10, out_sample=2 )
+##              results = walk.Run( data= CandleMerge( sources=configs['input_data'], symbols=configs['stock'] ).Frame() )
+##              walk.Save( results )
+##  Notes   :   Walk forward optimization on top of ParamSweep : the trading days are split into rolling windows of
+##              in_sample days followed by out_sample days ( the windows move out_sample days at a time ). Every point
+##              of the grid is back tested on every in sample window, the best one ( see RANK_BY ) is then back tested
+##              on the out sample days that follow it - only those results say how the optimization holds up
+##              The candles are shared once for every window ; all the ( window , point ) back tests run in one pool,
+##              then the out sample ones. Every window warms up the same way on both engines : the indicators start from
+##              the first candle of the window , as in a back test of those days alone ( the event loop replays only them ,
+##              with --vectorized a worker calculates the signals from the window start once and every point reuses them )
+## ###################################################################################################################
+import os
+import sys
+import inspect
+import itertools
+
+import numpy    as np
+import pandas   as pd
+
+from datetime               import datetime
+
+from ParamSweep             import ParamSweep, SWEEP_FOLDER, rank
+from ResultCache            import partition_digests
+
+
+RESULTS = ( 'trades', 'wins', 'losses', 'win_rate', 'p_l', 'max_drawdown', 'funds' )
+
+
+
+class WalkForward( ParamSweep ) :
+    def __init__( self, configs : dict , grid : dict , in_sample : int = 5 , out_sample : int = 1 , workers : int = None ) -> None :
+        """
+            INITIALIZE THE GRID AND THE WINDOW SIZES
+            ARGS   :
+                        configs    ( dict ) - back test configurations ( strategy, interval, volume_threshold ... )
+                        grid       ( dict ) - parameter -> list of values ( BaseParams names and 'interval' )
+                        in_sample  ( int )  - trading days the grid is optimized on
+                        out_sample ( int )  - trading days after them the best point is checked on
+                        workers    ( int )  - processes ( default every core )
+            RETURNS:
+                        nothing
+        """
+        super().__init__( configs=configs, grid=grid, workers=workers )
+        self.InSample   = max( 1, int( in_sample ) )
+        self.OutSample  = max( 1, int( out_sample ) )
+
+
+
+    def __str__( self ) -> str :
+        """
+            Formats the class to print out in string format
+        """
+        return ( f"WalkForward : {self.Configs.get('strategy')}  in sample : {self.InSample} days  out sample : {self.OutSample} days  "
+                 f"points : {len( self.Points() )}  workers : {self.Workers}  grid : {self.Grid}" )
+
+
+
+    def Windows( self, days : list ) -> list :
+        """
+            Rolling in sample / out sample windows over the trading days
+            ARGS   :
+                        days ( list ) - trading days ( 'YYYY-MM-DD' ) in order
+            RETURNS:
+                        [ { window, in_start, in_end, in_last, out_start, out_end, out_last } ] - the *_end values are
+                        the day the part stops before ( None after the last day ) , DATETIME text compares against them
+        """
+        windows = []
+        for first in range( 0, len( days ) - self.InSample, self.OutSample ) :
+            middle  = first + self.InSample
+            last    = middle + self.OutSample
+            windows.append( { 'window'    : len( windows ) + 1,
+                              'in_start'  : days[ first ],
+                              'in_end'    : days[ middle ],
+                              'in_last'   : days[ middle - 1 ],
+                              'out_start' : days[ middle ],
+                              'out_end'   : days[ last ] if last < len( days ) else None,
+                              'out_last'  : days[ min( last, len( days ) ) - 1 ] } )
+        return windows
+
+
+
+    def Run( self, data : pd.DataFrame ) -> pd.DataFrame :
+        """
+            Optimize every in sample window in parallel and back test its best point on the out sample days
+            ARGS   :
+                        data ( DataFrame ) - back test rows sorted on DATETIME ( CandleMerge.Frame() )
+            RETURNS:
+                        DataFrame with one row per window : its days, the best point, in_* and out_* results
+        """
+        block   = None
+        rows    = []
+
+        try:
+            days    = sorted( data['DATETIME'].astype( str ).str[:10].unique() )
+            windows = self.Windows( days )
+            if len( windows ) == 0 :
+                print( f"\t\t * {len( days )} trading days , need more than {self.InSample} for a walk forward" )
+                return pd.DataFrame()
+
+            digests = partition_digests( data ) if self.Cache is not None else {}
+            block, descriptor = self.Share( data )
+            with self.Pool( descriptor ) as pool :
+                points      = self.Points()
+                tasks       = list( itertools.product( windows, points ) )
+                in_sample   = self.Map( pool, digests, [ point for window, point in tasks ],
+                                        [ window['in_start'] for window, point in tasks ], [ window['in_end'] for window, point in tasks ] )
+
+                best        = [ rank( in_sample[ index * len( points ) : ( index + 1 ) * len( points ) ] ).to_dict( 'records' )[0] for index in range( len( windows ) ) ]
+                chosen      = [ { key : row[ key ] for key in self.Grid } for row in best ]
+                out_sample  = self.Map( pool, digests, chosen, [ window['out_start'] for window in windows ], [ window['out_end'] for window in windows ] )
+
+            for window, row, point, result in zip( windows, best, chosen, out_sample ) :
+                rows.append( { 'window'    : window['window'],
+                               'in_start'  : window['in_start'],
+                               'in_last'   : window['in_last'],
+                               'out_start' : window['out_start'],
+                               'out_last'  : window['out_last'],
+                               **point,
+                               **{ f"in_{key}"  : row[ key ] for key in RESULTS },
+                               **{ f"out_{key}" : result[ key ] for key in RESULTS } } )
+        except:
+            print("\t\t|EXCEPTION: WalkForward::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+            for entry in sys.exc_info():
+                print("\t\t >>   " + str(entry) )
+        finally:
+            self.Release( block )
+
+        return pd.DataFrame( rows )
+
+
+
+    def Summary( self, results : pd.DataFrame ) -> dict :
+        """
+            Totals of the out sample windows and the walk forward efficiency
+            ( out sample P&L per day over in sample P&L per day of the chosen points )
+        """
+        if len( results ) == 0 :
+            return { 'windows' : 0 }
+        in_daily    = results['in_p_l'].sum() / ( len( results ) * self.InSample )
+        out_daily   = results['out_p_l'].sum() / ( len( results ) * self.OutSample )
+        return { 'windows'          : len( results ),
+                 'out_trades'       : int( results['out_trades'].sum() ),
+                 'out_p_l'          : round( float( results['out_p_l'].sum() ), 2 ),
+                 'out_win_rate'     : round( float( results['out_wins'].sum() / max( 1, results['out_trades'].sum() ) ), 4 ),
+                 'profitable'       : int( ( results['out_p_l'] > 0 ).sum() ),
+                 'efficiency'       : round( float( out_daily / in_daily ), 4 ) if in_daily > 0 else np.nan }
+
+
+
+    def Save( self, results : pd.DataFrame , folder : str = SWEEP_FOLDER ) -> str :
+        """
+            Write the window table
+            RETURNS:
+                        file name of the csv
+        """
+        os.makedirs( folder, exist_ok=True )
+        file_name = os.path.join( folder, f"walk_forward_{self.Configs.get('strategy')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv" )
+        results.to_csv( file_name, index=False )
+        return file_name
@@ -8,11 +8,22 @@
 ##              python3 day_trade.py --api_key=XXXXXXXXXXXXXXX --action=download  --stock=QQQ --csv_output=../data --interval=15min --display_config
 ##              python3 day_trade.py --api_key=XXXXXXXXXXXXXXX --action=back_test --stock=QQQ --input_data=../data/QQQ_15min_.csv --interval=15min --display_config --account_api=xxxxxxx --strategy=basic  --list_strategies
 ##              python3 day_trade.py --api_key=XXXXXXXXXXXXXXX --action=back_test --interval=15min --display_config --account_api=xxxxxxx --strategy=basic  --list_strategies --input_data=../data/intraday_15min_QQQ.csv --stock=QQQ
+##              python3 day_trade.py --action=back_test --strategy=ema9 --interval=1 --input_data=../data/QQQ_1min_.csv --stock=QQQ --vectorized --monte_carlo=10000
+##              python3 day_trade.py --action=sweep --strategy=simple --interval=5 --input_data=../data/ --stock=QQQ,AAPL --workers=16 --sweep_grid='{"risk_percent":[0.001,0.0015,0.002],"crash_out_percent":[0.85,0.97],"interval":[1,5,15]}'
+##              python3 day_trade.py --action=store --input_data=../data/ --candle_store=../data/store/
+##              python3 day_trade.py --action=back_test --strategy=ema9 --interval=1 --input_data=../data/store/ --stock=QQQ --vectorized
+##              python3 day_trade.py --action=live_test --strategy=ema9 --interval=5 --stock=QQQ,AAPL --replay_date=2025-08-15
+##              python3 day_trade.py --action=walk_forward --strategy=ema9 --interval=1 --input_data=../data/ --stock=QQQ --vectorized --in_sample_days=10 --out_sample_days=2 --sweep_grid=../files/grid.json
+##              python3 day_trade.py --action=replay_test_compare --strategy=ema9,simple --interval=5 --stock=QQQ --replay_date=2025-08-15 --workers=2
+##              python3 day_trade.py --action=back_test --strategy=simple --interval=5 --input_data=../data/QQQ_1min_.csv --stock=QQQ --log_level=DEBUG
+##              python3 day_trade.py --action=back_test --strategy=simple --interval=1 --input_data=../data/ --stock=QQQ,AAPL --checkpoint=120 --resume
+##              python3 day_trade.py --action=batch_replay --strategy=ema9 --interval=5 --stock=QQQ,AAPL --start_date=2025-06-02 --end_date=2025-08-29 --workers=16
 ##  Notes   :
 ## ###################################################################################################################
 import os
 import re
 import sys
+import json
 import time
 import inspect
 import platform
@@ -31,8 +42,21 @@ from datetime           import datetime, timedelta, timezone
 from PDFReport          import PDFReport
 from TraderDB           import TraderDB
 from TradeAccount       import TradeAccount
-from DayTradeStrategy   import DayTradeStrategy
+from DayTradeStrategy   import DayTradeStrategy, TARGET_GOAL
+from BackTestEngine     import BackTestEngine
+from CandleMerge        import CandleMerge
+from CandleStore        import CandleStore, STORE_FOLDER
+from ReplayData         import ReplayData
+from Clock              import Clock, SimulatedClock
+from ParamSweep         import ParamSweep, SWEEP_FOLDER
+from WalkForward        import WalkForward
+from ReplayCompare      import ReplayCompare, replay_day
+from ResultCache        import CACHE_FOLDER, digest, partition_digests, store_digests, data_digest
+from Checkpoint         import Checkpoint, CHECKPOINT_FOLDER, CHECKPOINT_EVERY
+from MonteCarlo         import MonteCarlo
+from BatchReplay        import BatchReplay, BATCH_FOLDER
 from OptionsTrade       import OptionsTrade
+from Log                import logger, set_level, LOG_LEVEL, QUIET_LEVEL
 
 from selenium                           import webdriver
 from selenium.webdriver.chrome.service  import Service as ChromeService
@@ -83,6 +107,9 @@ def download_stock_data( configs : dict  ) -> None :
 
         with open(f'{configs["csv_output"]}/{configs["stock"]}_{configs["interval"]}_{configs["start_date"]}.csv','w') as outfile:
             outfile.write( data ) 
+
+        if configs.get('candle_store') :
+            CandleStore( root=configs['candle_store'] ).Import( f'{configs["csv_output"]}/{configs["stock"]}_{configs["interval"]}_{configs["start_date"]}.csv' )
         
     except:
         print("\t\t|EXCEPTION: MAIN::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
@@ -148,6 +175,24 @@ def blank_config() -> dict:
                     'csv_input_fields'  : False,                    
                     'display_config'    : False,
                     'list_strategies'   : False,
+                    'resample'          : False,
+                    'compact'           : False,
+                    'vol_window'        : None,
+                    'vectorized'        : False,
+                    'sweep_grid'        : '',
+                    'workers'           : 0,
+                    'in_sample_days'    : 5,
+                    'out_sample_days'   : 1,
+                    'candle_store'      : STORE_FOLDER,
+                    'daily_cache'       : '',
+                    'result_cache'      : CACHE_FOLDER,
+                    'no_cache'          : False,
+                    'monte_carlo'       : 0,
+                    'checkpoint'        : CHECKPOINT_EVERY,
+                    'checkpoint_folder' : CHECKPOINT_FOLDER,
+                    'resume'            : False,
+                    'log_level'         : LOG_LEVEL,
+                    'quiet'             : False,
                     'trading_platform'  : 'Schwab',
                     'sql_server'        : "127.0.0.1",
                     'sql_user'          : "",
@@ -324,17 +369,17 @@ def parse_arguments() -> {} :
                         'email'             : { 'help': 'Email to send the report ',                'action' : None } ,
         		'api_key'           : { 'help': 'API KEY for endpoint' , 		    'action' : None}, 
         		'stock'             : { 'help': 'Stock ticker symbol', 		            'action' : None },
-			'action'            : { 'help': 'Options: download/back_test/trade/test/live_test/sync' ,  'action' : None}, 
+			'action'            : { 'help': 'Options: download/store/back_test/sweep/walk_forward/trade/test/live_test/batch_replay/sync' ,  'action' : None}, 
 			'start_date'        : { 'help': 'Start date', 	                            'action' : None}, 
 			'end_date'          : { 'help': 'End date' ,  			            'action' : None}, 
                         'username'          : { 'help': 'Username to associate with session',       'action' : None},
 			'interval'          : { 'help': 'Time interval [ 5min / ]',           	    'action' : None },                                             
-			'input_data'        : { 'help': 'Data file to be used during back_test',    'action' : None },
+			'input_data'        : { 'help': 'Data file(s) / folder / candle store used during back_test ( comma separated , one per symbol )',    'action' : None },
                         'strategy'          : { 'help': 'Strategy to use [ basic/basic15/basicXm ]','action' : None },
                         'app_key'           : { 'help': 'Schwab application key ',                  'action' : None },
                         'app_secret'        : { 'help': 'Schwab application Secret ',               'action' : None },
                         'trading_platform'  : { 'help': 'Platform of your trading account [ Schwab]','action' : None},                        
-                        'replay_date'       : { 'help': 'Date to pull quotes to do a replay_test',  'action' : None },
+                        'replay_date'       : { 'help': 'Date to pull quotes to do a replay_test ( live_test simulates that day )',  'action' : None },
                         'volume_threshold'  : { 'help': 'Threshold for determining position entry', 'action' : None},
                         'sql_server'        : { 'help': 'The address of the sql server',            'action' : None},                        
                         'sql_user'          : { 'help': 'User account for SQL ',                    'action' : None},
@@ -342,6 +387,24 @@ def parse_arguments() -> {} :
 			'csv_input_fields'  : { 'help': 'Display the fields for the csv file',      'action' : 'store_true'},			
 			'display_config'    : { 'help': 'Display the configuration', 	            'action' : 'store_true'},
                         'list_strategies'   : { 'help': 'Display available strategies', 	    'action' : 'store_true'},
+                        'resample'          : { 'help': 'Poll 1 min bars and build the interval bars locally', 'action' : 'store_true'},
+                        'compact'           : { 'help': 'Float32 bounded indicator state for large watch lists', 'action' : 'store_true'},
+                        'vol_window'        : { 'help': 'Log returns in the intraday volatility ( VolIndex ) , default the whole session', 'action' : None},
+                        'vectorized'        : { 'help': 'Back test on whole series arrays ( strategies with vectorized rules )', 'action' : 'store_true'},
+                        'sweep_grid'        : { 'help': 'Parameter grid for the sweep action ( JSON or JSON file )', 'action' : None},
+                        'workers'           : { 'help': 'Processes for the sweep / walk_forward / replay_test_compare / batch_replay actions ( default every core )', 'action' : None},
+                        'in_sample_days'    : { 'help': 'Trading days the walk_forward action optimizes the sweep grid on', 'action' : None},
+                        'out_sample_days'   : { 'help': 'Trading days after them the walk_forward action checks the best point on', 'action' : None},
+                        'candle_store'      : { 'help': 'Folder of the columnar candle store ( --action=store imports --input_data into it )', 'action' : None},
+                        'daily_cache'       : { 'help': 'Folder of the daily context the replay workers share ( default daily_cache/ under the candle store )', 'action' : None},
+                        'result_cache'      : { 'help': 'Folder of the cached sweep / walk_forward / batch_replay results', 'action' : None},
+                        'no_cache'          : { 'help': 'Run every back test / replay again instead of reading the result cache', 'action' : 'store_true'},
+                        'monte_carlo'       : { 'help': 'Equity paths resampled from the trades after a back_test / batch_replay ( 0 for none )', 'action' : None},
+                        'checkpoint'        : { 'help': 'Seconds between two checkpoints of a back_test event loop ( 0 for none )', 'action' : None},
+                        'checkpoint_folder' : { 'help': 'Folder of the back_test checkpoints', 'action' : None},
+                        'resume'            : { 'help': 'Continue a back_test from its last checkpoint ( sweep / walk_forward / batch_replay resume from the result cache )', 'action' : 'store_true'},
+                        'log_level'         : { 'help': 'Lowest level logged [ DEBUG / INFO / WARNING ] , DEBUG shows every candle', 'action' : None},
+                        'quiet'             : { 'help': 'Log warnings and errors only ( no trades , no candles )', 'action' : 'store_true'},
                                                 
 		}
     try:
@@ -640,6 +703,9 @@ def send_data_to_file( configs : dict , data: dict   )   -> None :
 
     
     try:        
+        if configs.get('candle_store') :                                        # TYPED PARTITIONS INSTEAD OF ONE CSV PER SYMBOL / SESSION
+            CandleStore( root=configs['candle_store'] ).Write( pd.DataFrame( [ row for key in data.keys() for row in data[key] ] ) )
+            return
         for key in data.keys():
             contents    = "SYMBOL,DATETIME,LOW,QUOTE,HIGH,CLOSE,VOLUME,INTERVAL,MSG"
             for row in data[key]:
@@ -748,6 +814,8 @@ def  live_test ( configs : dict  ) -> None :
                     Nothing 
     """
     params  = { 'mode' : 'TEST','time_interval' : 900 , 'account_funds' : 5000 , 'funds_ratio' : 0.50}
+    if configs.get('replay_date') :                                         # THE LIVE LOOP ON A PAST DAY , AT CPU SPEED
+        params['clock'] = SimulatedClock( start= configs['replay_date'][:10] + " 09:30:00" )
 
     trade_center( configs , params  )
 
@@ -758,7 +826,7 @@ def  trade_center( configs :  dict , params : dict ) -> None :
         Accept configs and params to decide to live trade or test trade
         ARGS   :
                     configs  ( dict ) - system wide configuration for trading
-                    params   ( dict ) - parameters for test mode or live mode 
+                    params   ( dict ) - parameters for test mode or live mode ( 'clock' : SimulatedClock to simulate a session )
         RETURNS:
                     nothing 
     """    
@@ -769,6 +837,7 @@ def  trade_center( configs :  dict , params : dict ) -> None :
     success         = False
     orb_calced      = False 
     date_format     = "%Y-%m-%d %H:%M:%S"  
+    clock           = params.get('clock') or Clock()
     
 
     
@@ -777,29 +846,32 @@ def  trade_center( configs :  dict , params : dict ) -> None :
         
         account          = TradeAccount(funds=100, limit=0.10, app_type=configs['trading_platform'], userName = configs['username'], email=configs['email'],
                                         app_key = configs['app_key'], app_secret = configs['app_secret'] ,
-                                    sqlServer =configs['sql_server'], sqlUserName =configs['sql_user'], sqlPassword =configs['sql_password'] )
+                                    sqlServer =configs['sql_server'], sqlUserName =configs['sql_user'], sqlPassword =configs['sql_password'], clock=clock )
         account.SetFunds( params['account_funds'], params['funds_ratio'] )  #5000.00, 0.50 )     
         account.SetMode( params['mode'] )      
+        if clock.Simulated :                                                # QUOTES OF THE SIMULATED DAY FROM MEMORY
+            account.SetStore( ReplayData( account=account, symbols=configs['stock'], day=clock.Now(), store=CandleStore( root=configs.get('candle_store') or STORE_FOLDER ) ) )
         
-        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account)        
-        print( f'\t* About to live {params["mode"]}: ', account )
+        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account, compact=configs.get('compact', False), clock=clock,
+                        vol_window=configs.get('vol_window') )
+        logger.info( "\t* About to live {}:  {}", params['mode'], account )
         
         for stock in  configs['stock'] :
             data.update({ stock :  [] } )
          
         time_interval   = params['time_interval']
-        current_time    = datetime.now()
+        current_time    = clock.Now()
         
         while ( cont )  :
             if (current_time.hour >= 16 ) :
                 cont = False                
             elif (current_time.hour < 9  and current_time.minute < 30  ) or ( current_time.hour >= 17 ) :                
                 cont = False
-                print("\t\t\t\t -> Outside of market hours ")
+                logger.debug("\t\t\t\t -> Outside of market hours ")
                 ## Sell whatever is InPlay
             elif ( current_time.hour == 15 and (current_time.minute  +  (time_interval / 60 )) >=  55)  :               #MARKET CLOSES AT 4PM, SELL WHAT YOU ARE HOLDING (???)
                 # IF THE NEXT TIME INTERVAL CAUSES US TO BE OUTSIDE OF THE MARKET TIME THEN SELL NOW
-                print("\t\t\t > Market closing ; shifting InPlay -> Trades" )
+                logger.info("\t\t\t > Market closing ; shifting InPlay -> Trades" )
                 if  account.InPlay != {} :
                     stocks = set( account.InPlay.keys() )
                     for symbol in stocks:
@@ -814,12 +886,18 @@ def  trade_center( configs :  dict , params : dict ) -> None :
                 current_time    = datetime.strptime( str(current_time)[:17] +"00", date_format) 
                 symbols         = configs['stock'] #[ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock']
                 bought_action   = False 
+                if configs.get('resample') :                  # ONLY 1 MIN QUOTES , THE time_interval BARS ARE BUILT LOCALLY
+                    minute_rows = { symbol : account.QuoteByInterval ( symbols=symbol,  frequency=60, endDate = current_time - timedelta( minutes=1 )) for symbol in symbols }
+                    ticker_rows = Strategies.Resample( [ row for row in minute_rows.values() if row != None and isinstance( row, list) ], time_interval // 60 )
+                else:
+                    ticker_rows = { symbol : account.QuoteByInterval ( symbols=symbol,  frequency=time_interval, endDate = current_time) for symbol in symbols }
+                    Strategies.UpdateIndicators( [ row for row in ticker_rows.values() if row != None and isinstance( row, list) ] )   # ONE PASS FOR THE WATCH LIST
                 for symbol in symbols:
-                    print(f"\t\t\t + {symbol}  @ { current_time } " )                    
-                    ticker_row = account.QuoteByInterval ( symbols=symbol,  frequency=time_interval, endDate = current_time)
+                    logger.debug("\t\t\t + {}  @ {} ", symbol, current_time )                    
+                    ticker_row = ticker_rows.get( symbol )
                     
                     if ticker_row != None and isinstance( ticker_row, list) :                    
-                        print(f"\t\t\t\tTICKER_ROW :{ticker_row}")                
+                        logger.debug("\t\t\t\tTICKER_ROW :{}", ticker_row)                
                         success , msg , time_interval,account = Strategies.Run(  ticker_row,  account, configs )
                         
                         data[symbol].append( {'stock':symbol,'datetime':f"{current_time}",'low': float(ticker_row[2]),'quote':float(ticker_row[4]),
@@ -827,10 +905,10 @@ def  trade_center( configs :  dict , params : dict ) -> None :
                                               'volume':float(ticker_row[5]), 'interval': time_interval/60 , 'msg':msg } )
                         if msg.upper() == "BOUGHT" :
                             bought_action = True 
-                            print(f"\t\t\t\t In Play - should shift from 15 -> {time_interval} min  : " )                            
+                            logger.debug("\t\t\t\t In Play - should shift from 15 -> {} min  : ", time_interval )                            
                         elif msg.upper() == "CLOSED" :
                             bought_action |= False          #KEEP TRACK IF NEED TO CHANGE THE INTERVAL BECAUSE BOUGHT ONE OF THE SYMBOLS 
-                            print(f"\t\t\t\t OUT Play - should shift from {time_interval} -> 15 min  : " )
+                            logger.debug("\t\t\t\t OUT Play - should shift from {} -> 15 min  : ", time_interval )
                     #else:
                     #    print(f"\t\t\t\t Did not get ticker info for symbol { symbol }, CHECK SYMBOL AND TRY AGAIN ")
                     #    return 
@@ -840,17 +918,17 @@ def  trade_center( configs :  dict , params : dict ) -> None :
                     account.SetTargetGoal( target = 0.5  ) # Target making 50% of our funds ( SetFunds) before auto quitting 
                     current_time_temp   , sleep_interval   = calculate_new_poll_time( current_time , 1800)  # 30 ( or 15 ? ) min  cool down period 
                 else:
-                    current_time_temp   , sleep_interval   = calculate_new_poll_time( current_time , time_interval)                 
+                    current_time_temp   , sleep_interval   = calculate_new_poll_time( current_time , 60 if configs.get('resample') else time_interval)                 
                 
                 #current_time_temp   , sleep_interval   = calculate_new_poll_time( current_time , time_interval)                 
-                print(f"\t\t | Sleeping from : {sleep_interval} - { datetime.now() }",  )
-                time.sleep( sleep_interval )
-                print(f"\t\t \\--> AWAKE  : {time_interval} - { datetime.now() } -> {sleep_interval}",  )                
+                logger.opt( lazy=True ).debug("\t\t | Sleeping from : {} - {}", lambda : sleep_interval, lambda : clock.Now(),  )
+                clock.Sleep( sleep_interval )
+                logger.opt( lazy=True ).debug("\t\t \\--> AWAKE  : {} - {} -> {}", lambda : time_interval, lambda : clock.Now(), lambda : sleep_interval,  )                
     #            else:
     #                cont = False
     #                print( 'Just received  empty ticker info ')
                     
-            current_time    = datetime.now()
+            current_time    = clock.Now()
 
 
 
@@ -868,6 +946,9 @@ def  trade_center( configs :  dict , params : dict ) -> None :
             send_data_to_file( configs, data )
 
         
+        if configs.get('compact') :
+            Strategies.MemoryReport()
+        
         # SEND EMAIL OF PERFORMANCE
         summary_report( configs, data, account )
     except:
@@ -880,6 +961,7 @@ def replay_test_compare( configs: dict  ) -> None :
     """
         Allows for efficient comparing of strategies ( makes sure using the same data )
         Expects there to be multiple strategies , probably only one stock 
+        The day and the daily context are fetched once, then every strategy replays in its own worker ( see ReplayCompare )
         Provide  charts for confirmation
         
         ARGS    : 
@@ -888,123 +970,26 @@ def replay_test_compare( configs: dict  ) -> None :
                     Nothing 
     """
     if not ( ',' in configs['strategy'] ):
-        print("\t\t\t Please pick more than one strategy delimited with commas then ")
+        logger.warning("\t\t\t Please pick more than one strategy delimited with commas then ")
         return
-    else:
-        configs['strategy'] =  list( configs['strategy'].split(",") )
         
-    msg             = ""
-    cont            = True
-    data            = {}
-    isFirst         = True  # First quote requested should be on the 1 min chart 
-    success         = False
+    clock           = SimulatedClock( start= configs['replay_date'][:10] + " 09:30:00" )
     account         =  TradeAccount(funds=5000, limit=0.10, app_type=configs['trading_platform'],userName = configs['username'], email=configs['email'],
-                                        app_key = configs['app_key'], app_secret = configs['app_secret'] )
+                                        app_key = configs['app_key'], app_secret = configs['app_secret'], clock=clock )
                                     #sqlServer =configs['sql_server'], sqlUserName =configs['sql_user'], sqlPassword =configs['sql_password'] )
-    accounts        = []
-    date_format     = "%Y-%m-%d %H:%M:%S"
-    current_time    = ""
-    strategies      = [] 
-    
     account.SetFunds( 5000.00, 0.50 )
     account.SetMode( "TEST")
 
-
     try:        
-        print('\t* About to Replay test Comparison: ', account )
-
-        configs['stock'] = [ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock']
-        
-        for indx, strat  in enumerate( configs['strategy']):
-            strategies.append( DayTradeStrategy() ) 
-            accounts.append( TradeAccount(funds=5000, limit=0.10, app_type=configs['trading_platform'],userName = configs['username'], email=configs['email'],
-                                        app_key = configs['app_key'], app_secret = configs['app_secret'] )    )
-            accounts[indx].SetFunds( 5000.00, 0.50 )
-            accounts[indx].SetMode( "TEST")
-            strategies[indx].Set( strategy=strat ,  interval=configs['interval'],account=accounts[indx])
-
-        
-        for stock in configs['stock']: #( [ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock'] ):
-            for indx, strat  in enumerate( strategies):
-                data.update({ f"{stock+str('' if indx ==0 else indx)}" :  [] } )
+        logger.info( "\t* About to Replay test Comparison:  {}", account )
+        compare = ReplayCompare( configs=configs, workers=int( configs.get('workers') or 0 ) or None )
+        logger.info( "\t* {}", compare )
+        results = compare.Run( account )
+        logger.info( "\t* Replayed from {}", compare.Replay )
 
-        current_time = configs['replay_date'][:10] + " 09:30:00"
-        current_time = datetime.strptime( current_time, date_format)                                             
-        time_interval = 900
-        
-        while ( cont )  :
-            #print("\t\t\t\t + Current Time : " , current_time ) 
-            if (current_time.hour < 9  and current_time.minute < 30 ) or ( current_time.hour >= 17 ) :                
-                cont = False
-                print("\t\t\t\t -> Outside of market hours ")
-            elif (current_time.hour == 9  and (current_time.minute >= 30  or current_time.minute  <= 59 ) ):    # ORB CALCULATIONS
-                for indx, strat  in enumerate( strategies):
-                    for symbol in configs['stock']:
-                        strategies[indx].SetORB( symbol , accounts[indx], current_time )    
-            elif ( current_time.hour == 15 and (current_time.minute   +  (time_interval / 60 )) >= 55)   :      # Sell whatever is InPlay
-                print("\t\t\t > Market closing ; shifting InPlay -> Trades" )
-                for symbol in configs['stock']:
-                    ticker_row = account.QuoteByInterval ( symbols= symbol,  frequency= time_interval , endDate = current_time)
-                    for indx, strat  in enumerate( strategies):
-                        symbol = f"{symbol+str('' if indx ==0 else indx)}"
-                        print(f"\t\t + {symbol}  @ { current_time }   {strategies[indx].StrategyName}" )                         
-                        if ticker_row != [] :
-                            if symbol in accounts[indx].InPlay.keys():
-                                accounts[indx].Sell( stock=symbol, new_price=float(ticker_row[3])  if ticker_row != None else accounts[indx].InPlay[symbol]['price'] ,
-                                          ask_volume=ticker_row[5], indicators=strategies[indx].Stocks[symbol]['Indicators'] )
-                        else:
-                            print(f"\t\t\t Ticker Empty " ) 
-                    cont = False
-            else:                
-                for symbol in configs['stock']:
-                    if isFirst :
-                        ticker_row = account.Quote ( symbols= symbol)[symbol]
-                        isFirst = False 
-                    else:
-                        ticker_row = account.QuoteByInterval ( symbols= symbol,  frequency= time_interval , endDate = current_time)
-                    
-                    if ( ticker_row != None and ticker_row != [] ): 
-                        for indx, strat  in enumerate( strategies):
-                            symbol = f"{symbol+str('' if indx ==0 else indx)}"
-                            print(f"\t\t + {symbol}  @ { current_time }   {strategies[indx].StrategyName}" )
-                            #ticker_row[0] = symbol
-                            print(f"\t\t\t->DATA : {ticker_row} " )
-                            success , msg , time_interval,  accounts[indx] = strategies[indx].Run(  ticker_row,  accounts[indx] , configs)                   
-                            data[symbol].append( {'stock':symbol,'datetime':f"{current_time}",'low': float(ticker_row[2]),'quote':float(ticker_row[4]),
-                                            'high':float(ticker_row[6]),'close':float(ticker_row[3]),
-                                              'volume':float(ticker_row[5]), 'interval': time_interval/60 , 'msg':msg } )
-                            if msg.upper() == "BOUGHT" :
-                                print(f"\t\t\t   -> In Play - should shift from 15 -> {time_interval/60} min  : " )                        
-                            elif msg.upper() == "CLOSED" :
-                                print(f"\t\t\t   -> OUT Play - should shift from {time_interval/60} -> 15 min  : " )
-                        
-                        
-                """    
-                if account.TargetGoal == 0 :
-                    account.SetFunds(4500 , .40)  #5000.00, 0.50 )
-                    account.SetTargetGoal( target = 0.5  ) # Target making 50% of our funds ( SetFunds) before auto quitting 
-                   # current_time   , sleep_interval   = calculate_new_poll_time( current_time , 1800) #30 min break
-                """
-                
-            current_time , sleep_interval   = calculate_new_poll_time( current_time , time_interval)                    
-                        
-                #else:
-                #    cont = False
-                #    print( 'Just received  empty ticker info ')
-
-        #RECONCILE WHAT WE LOGGED WITH HOW THE BROKERAGE EXECUTED OUR TRADES
-        account.Reconcile()
-        
-        # SEND TRANSACTIONS TO SQL
-        #send_transactions_to_sql( configs, account.Trades  )
-
-        # SEND DATA TO FILE
-        #send_data_to_file( configs, data )
-
-        
         # SEND EMAIL OF PERFORMANCE         
-        for accnt  in  accounts:
-            summary_report( configs, data, accnt )
+        for result in results :
+            summary_report( { **configs, 'stock' : compare.Configs['stock'], 'strategy' : result['strategy'] }, result['data'], result['account'] )
     except:
         print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
         for entry in sys.exc_info():
@@ -1024,84 +1009,24 @@ def  replay_test( configs: dict  ) -> None :
         RETURNS    :
                     Nothing 
     """
-    msg             = ""
-    cont            = True
     data            = {}
-    isFirst         = True  # First quote requested should be on the 1 min chart 
-    success         = False
+    clock           = SimulatedClock( start= configs['replay_date'][:10] + " 09:30:00" )      # MOVED BY THE REPLAY , NOT THE WALL CLOCK
     account         = TradeAccount(funds=5000, limit=0.10, app_type=configs['trading_platform'],userName = configs['username'], email=configs['email'],
-                                        app_key = configs['app_key'], app_secret = configs['app_secret'] )
+                                        app_key = configs['app_key'], app_secret = configs['app_secret'], clock=clock )
                                     #sqlServer =configs['sql_server'], sqlUserName =configs['sql_user'], sqlPassword =configs['sql_password'] )
-    date_format     = "%Y-%m-%d %H:%M:%S"
-    current_time    = ""
     
     account.SetFunds( 5000.00, 0.50 )
     try:        
-        print( '\t* About to Replay test: ', account )
-        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account)        
+        logger.info( "\t* About to Replay test:  {}", account )
+        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account, compact=configs.get('compact', False), clock=clock,
+                        vol_window=configs.get('vol_window') )
         account.SetMode( "TEST")
-        for stock in configs['stock']: #( [ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock'] ):
-            data.update({ stock :  [] } )
+        account.SetStore( ReplayData( account=account, symbols=configs['stock'], day=configs['replay_date'],            # THE WHOLE DAY ONCE PER SYMBOL ,
+                                      store=CandleStore( root=configs.get('candle_store') or STORE_FOLDER ) ) )    # EVERY STEP FROM MEMORY
+        logger.info( "\t* Replaying from {}", account.Store )
 
-        current_time = configs['replay_date'][:10] + " 09:30:00"
-        current_time = datetime.strptime( current_time, date_format)                                             
-        time_interval = 900
-        
-        while ( cont )  :
-            #print("\t\t\t\t + Current Time : " , current_time ) 
-            if (current_time.hour < 9  and current_time.minute < 30 ) or ( current_time.hour >= 17 ) :                
-                cont = False
-                print("\t\t\t\t -> Outside of market hours ")
-            elif (current_time.hour == 9  and (current_time.minute >= 30  or current_time.minute  <= 59 ) ):    # ORB CALCULATIONS
-                Strategies.SetORB(configs['stock'], account, current_time)    
-            elif ( current_time.hour == 15 and (current_time.minute   +  (time_interval / 60 )) >= 55)   :      # Sell whatever is InPlay
-                print("\t\t\t > Market closing ; shifting InPlay -> Trades" )
-                if  account.InPlay != {} :
-                    symbols = [ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock']
-                    for symbol in symbols:
-                        print(f"\t\t + {symbol}  @ { current_time } " ) 
-                        ticker_row = account.QuoteByInterval ( symbols= symbol,  frequency= time_interval , endDate = current_time) 
-                        if ticker_row != [] :
-                            account.Sell( stock=symbol, new_price=float(ticker_row[3])  if ticker_row != None else account.InPlay[symbol]['price'] ,
-                                              ask_volume=ticker_row[5], indicators=Strategies.Stocks[symbol]['Indicators'] )
-                        else:
-                            print(f"\t\t\t Ticker Empty " ) 
-                cont = False
-            else:
-                symbols = configs['stock'] #[ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock']
-                for symbol in symbols:
-                    print(f"\t\t + {symbol}  @ { current_time } " )
-                    if isFirst :
-                        ticker_row = account.Quote ( symbols= symbol)[symbol]
-                        isFirst = False 
-                    else:
-                        ticker_row = account.QuoteByInterval ( symbols= symbol,  frequency= time_interval , endDate = current_time)
-                    print(f"\t\t\t->DATA : {ticker_row} " ) 
-                    if ( ticker_row != None and ticker_row != [] ): 
-                       # print(f"\t\t\t->DATA : {ticker_row} " ) 
-                        success , msg , time_interval,account = Strategies.Run(  ticker_row,  account , configs)                   
-                        data[symbol].append( {'stock':symbol,'datetime':f"{current_time}",'low': float(ticker_row[2]),'quote':float(ticker_row[4]),
-                                            'high':float(ticker_row[6]),'close':float(ticker_row[3]),
-                                              'volume':float(ticker_row[5]), 'interval': time_interval/60 , 'msg':msg } )
-                        if msg.upper() == "BOUGHT" :
-                            print(f"\t\t\t   -> In Play - should shift from 15 -> {time_interval/60} min  : " )                        
-                        elif msg.upper() == "CLOSED" :
-                            print(f"\t\t\t   -> OUT Play - should shift from {time_interval/60} -> 15 min  : " )
-                        
+        data = replay_day( Strategies, account, configs, clock )                                # THE SAME STEPS AS EVERY ReplayCompare / BatchReplay WORKER
                         
-                """    
-                if account.TargetGoal == 0 :
-                    account.SetFunds(4500 , .40)  #5000.00, 0.50 )
-                    account.SetTargetGoal( target = 0.5  ) # Target making 50% of our funds ( SetFunds) before auto quitting 
-                   # current_time   , sleep_interval   = calculate_new_poll_time( current_time , 1800) #30 min break
-                """
-                
-            current_time , sleep_interval   = calculate_new_poll_time( current_time , time_interval)                    
-                        
-                #else:
-                #    cont = False
-                #    print( 'Just received  empty ticker info ')
-
         #RECONCILE WHAT WE LOGGED WITH HOW THE BROKERAGE EXECUTED OUR TRADES
         account.Reconcile()
         
@@ -1112,6 +1037,9 @@ def  replay_test( configs: dict  ) -> None :
         #send_data_to_file( configs, data )
 
         
+        if configs.get('compact') :
+            Strategies.MemoryReport()
+        
         # SEND EMAIL OF PERFORMANCE
         summary_report( configs, data, account )
     except:
@@ -1125,6 +1053,68 @@ def  replay_test( configs: dict  ) -> None :
 
 
 
+def  batch_replay( configs: dict  ) -> None :
+    """
+        replay_test over every day from start_date to end_date , the days in parallel ( see BatchReplay )
+        PARAMETERS :
+                    configs     :  dictionary of configuration info ( strategy, stock, interval, start_date, end_date,
+                                   candle_store, workers )
+        RETURNS    :
+                    Nothing
+    """
+    merged      = None
+
+    try:
+        start   = configs['start_date'] or configs['replay_date']
+        if start == '' or start is None :
+            logger.warning( '\t\t * Need a start_date ( and end_date ) , cannot batch replay')
+            return
+
+        account = TradeAccount(funds=5000, limit=0.10, app_type=configs['trading_platform'],userName = configs['username'], email=configs['email'],
+                                        app_key = configs['app_key'], app_secret = configs['app_secret'] )
+        batch   = BatchReplay( configs=configs, start=start, end=configs['end_date'] or start, workers=int( configs.get('workers') or 0 ) or None )
+        logger.info( "\t* About to batch replay : {}", batch )
+        merged  = batch.Run( account )
+        logger.opt( lazy=True ).info( "{}", lambda : merged['days'].to_string( index=False ) )
+        logger.opt( lazy=True ).info( "\t* Batch : {}", lambda : batch.Summary( merged ) )
+        logger.info( "\t* {}", batch.Cache )
+        if int( configs.get('monte_carlo') or 0 ) > 0 :
+            monte_carlo_report( configs, merged['trades'], funds=5000.00, target=5000.00 * ( 1 + TARGET_GOAL ), methods=( 'bootstrap', 'block' ) )
+        saved   = batch.Save( merged, folder= configs['csv_output'] or BATCH_FOLDER )
+        logger.info( "\t* Results : {}", saved )
+    except:
+        print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+
+
+
+
+
+
+
+def candle_digest( merge : CandleMerge ) -> str :
+    """
+        Digest of the candles a back_test reads , like the result cache keys : the store manifests , the csv rows
+        ( a checkpoint of other candles under the same path is not resumed )
+        ARGS   :
+                    merge ( CandleMerge ) - sources of the back_test
+        RETURNS:
+                    digest string
+    """
+    digests = {}
+    for store in merge.Stores :
+        digests.update( store_digests( store, sorted( merge.Symbols ) or store.Symbols() ) )
+    if len( merge.Files ) > 0 :
+        digests.update( partition_digests( CandleMerge( sources=merge.Files, symbols=sorted( merge.Symbols ) ).Frame() ) )
+    return data_digest( digests )
+
+
+
+
+
+
+
 def  back_test( configs: dict  ) -> None :
     """
         Run the selected data through the day_trade_strategy to see outcome
@@ -1141,53 +1131,40 @@ def  back_test( configs: dict  ) -> None :
     data        = None
     new_data    = {}
     success     = False 
+    clock       = SimulatedClock()                                  # FOLLOWS THE CANDLES ( DayTradeStrategy.BackTest )
     account     = TradeAccount(funds=5000, limit=0.10, app_type=configs['trading_platform'], userName = configs['username'], email=configs['email'],
-                                        app_key = configs['app_key'], app_secret = configs['app_secret'] )# ,
+                                        app_key = configs['app_key'], app_secret = configs['app_secret'], clock=clock )# ,
                                     #sqlServer =configs['sql_server'], sqlUserName =configs['sql_user'], sqlPassword =configs['sql_password'] )
-    interval    = 900
-    thorHammer  = { }
     account.SetFunds( funds=5000.00, limit=0.10 )
 
     
     try:
         # LOAD TEST DATA
         if configs['input_data'] == '' or  configs['input_data'] is None :
-            print( '\t\t * No input data supplied, cannot back test')
+            logger.warning( '\t\t * No input data supplied, cannot back test')
             return
         
-        data = read_csv( configs['input_data'] )        
-        data = data.sort_values( by=['DATETIME'], ascending=True)        
-        print( '\t* About to back_test: ', account )
-        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account)        
+        merge = CandleMerge( sources=configs['input_data'], symbols=configs['stock'] )       # ONE FILE / PARTITION PER SYMBOL , OR ONE FILE WITH ALL OF THEM
+        logger.info( "\t* About to back_test:  {} {}", account, merge )
+        Strategies.Set( strategy=configs['strategy'] ,  interval=configs['interval'],account=account, compact=configs.get('compact', False), clock=clock,
+                        vol_window=configs.get('vol_window') )
         account.SetMode( "TEST")
-        for index, row in data.iterrows() :
-            for symbol in configs['stock'] :#( [ configs['stock'] ] if isinstance( configs['stock'], str) else configs['stock'] ):
-                if not ( symbol in new_data ):
-                    new_data[  symbol ]       = []
-                    thorHammer [  symbol ]    = { 'high' : -1,'low':-1, 'close': -1,'volume': -1 }
-
-                
-                ticker_row = [f"{row['SYMBOL']}",f"{row['DATETIME']}",float(row['LOW']),float(row['CLOSE']),
-                                  float(row['QUOTE']),float(row['VOLUME']),float(row['HIGH']), row['MSG'] if 'MSG' in row else '']
-                print(f"\t\t\t->DATA : {ticker_row} " ) 
-                """  figure if this is useful at all
-                if ( row['open'] == row['low']) :
-                    print(f"\t\t\t******* Thor's Hammer : {  configs['stock'] } -> { row }")
-                    thorHammer [  configs['stock'] ]    = {'high' : float(row['high']),'low':float(row['low']), 'close': float(row['close']),'volume': float(row['volume']) }
-                if ( row['low']  <   thorHammer [  configs['stock'] ].get( 'low', -1)):
-                     print(f"\t\t\t****** TRIGGERED -Less THan  {row['low']}  -> { thorHammer [  configs['stock'] ].get( 'low', -1)}" )
-                """          
-            
-                #print( f"\t\t Data :  {ticker_row} ")
-                success , msg , interval,account = Strategies.Run(  ticker_row,  account, configs )
-                
-                new_data[symbol].append( {'stock':symbol,'datetime':f"{ticker_row[1]}",'low': float(ticker_row[2]),'quote':float(ticker_row[4]),
-                                            'high':float(ticker_row[6]),'close':float(ticker_row[3]),
-                                          'volume':float(ticker_row[5]), 'interval': interval/60 , 'msg': msg } )
-                if msg.upper() == "BOUGHT" :
-                    print("\t\t\t In Play - should shift from 15 -> 5 min  : " )
-                elif msg.upper() == "CLOSED" :
-                    print("\t\t\t OUT Play - should shift from 5 -> 15 min  : " )
+        target      = account.TargetGoal                                # Sell ZEROES IT AFTER A LARGE LOSS
+        if configs.get('vectorized') and BackTestEngine.Supports( configs['strategy'] ) :       # ARRAYS + SIGNAL TO SIGNAL BOOKKEEPING
+            engine      = BackTestEngine( data=merge.Frame(), params=Strategies.Strategies[ configs['strategy'] ]['params']( configs ) )
+            new_data    = engine.Run( account=account, strategy=configs['strategy'] )
+            logger.info( "\t* {}", engine )
+        else:
+            if configs.get('vectorized') :
+                logger.warning( "\t\t * No vectorized rules for {} , using the event loop", configs['strategy'] )
+            checkpoint  = None
+            if float( configs.get('checkpoint') or 0 ) > 0 or configs.get('resume') :     # THE KEY DIGESTS THE CANDLES , ONLY WHEN ASKED FOR
+                checkpoint  = Checkpoint( key=digest( { 'strategy' : configs['strategy'], 'interval' : configs['interval'], 'stock' : configs['stock'],
+                                                        'data' : candle_digest( merge ), 'compact' : bool( configs.get('compact') ),
+                                                        'vol_window' : int( configs.get('vol_window') or 0 ),
+                                                        'params' : Strategies.Params( configs['strategy'], configs ) } ),
+                                          folder= configs.get('checkpoint_folder') or CHECKPOINT_FOLDER, every= float( configs.get('checkpoint') or 0 ) )
+            new_data    = Strategies.BackTest( bars=merge.Bars(), account=account, configs=configs, checkpoint=checkpoint )     # GLOBAL TIME ORDER , READ A CHUNK AT A TIME
 
         #RECONCILE WHAT WE LOGGED WITH HOW THE BROKERAGE EXECUTED OUR TRADES
         account.Reconcile()
@@ -1195,6 +1172,12 @@ def  back_test( configs: dict  ) -> None :
         # SEND TRANSACTIONS TO SQL
         #send_transactions_to_sql( configs, account.Trades  )
         
+        if configs.get('compact') :
+            Strategies.MemoryReport()
+        
+        if int( configs.get('monte_carlo') or 0 ) > 0 :
+            monte_carlo_report( configs, account.Trades, funds=5000.00, target=target )
+
         # SEND EMAIL OF PERFORMANCE
         summary_report( configs, new_data, account )
     except:
@@ -1205,6 +1188,110 @@ def  back_test( configs: dict  ) -> None :
 
 
 
+def read_sweep_grid( grid : str ) -> dict :
+    """
+        Parameter grid of --sweep_grid , given as JSON or as the name of a JSON file
+        ( { "risk_percent" : [0.001, 0.002] , "interval" : [1, 5] } )
+    """
+    if os.path.exists( grid ) :
+        with open( grid, 'r' ) as file :
+            grid = file.read()
+    return json.loads( grid )
+
+
+
+
+def  parameter_sweep( configs: dict  ) -> None :
+    """
+        Back test every point of a parameter grid in parallel and write the ranked results
+        PARAMETERS :
+                    configs     :  dictionary of configuration info ( input_data, strategy, interval, sweep_grid, workers )
+        RETURNS    :
+                    Nothing
+    """
+    grid        = {}
+    results     = None
+
+    try:
+        if configs['input_data'] == '' or  configs['input_data'] is None or configs['sweep_grid'] == '' :
+            logger.warning( '\t\t * Need input data and a sweep grid, cannot sweep')
+            return
+
+        grid    = read_sweep_grid( configs['sweep_grid'] )
+        sweep   = ParamSweep( configs=configs, grid=grid, workers=int( configs.get('workers') or 0 ) or None )
+        logger.info( "\t* About to sweep : {}", sweep )
+        results = sweep.Run( data=CandleMerge( sources=configs['input_data'], symbols=configs['stock'] ).Frame() )
+        logger.opt( lazy=True ).info( "{}", lambda : results.head( 20 ).to_string( index=False ) )
+        logger.info( "\t* {}", sweep.Cache )
+        saved   = sweep.Save( results, folder= configs['csv_output'] or SWEEP_FOLDER )
+        logger.info( "\t* Results : {}", saved )
+    except:
+        print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+
+
+
+
+def  import_candles( configs: dict  ) -> None :
+    """
+        Add the csv files of input_data to the columnar candle store
+        PARAMETERS :
+                    configs     :  dictionary of configuration info ( input_data, candle_store )
+        RETURNS    :
+                    Nothing
+    """
+    try:
+        if configs['input_data'] == '' or  configs['input_data'] is None :
+            logger.warning( '\t\t * Need input data, nothing to import')
+            return
+
+        store   = CandleStore( root=configs['candle_store'] or STORE_FOLDER )
+        files   = CandleMerge( sources=configs['input_data'] ).Files
+        logger.opt( lazy=True ).info( "\t* Importing {} files into {}", lambda : len( files ), lambda : store.Root )
+        written = store.Import( files )
+        logger.info( "\t* {} partitions written : {}", written, store )
+    except:
+        print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+
+
+
+
+def  walk_forward( configs: dict  ) -> None :
+    """
+        Optimize the sweep grid on rolling in sample windows and back test the best point on the days after each
+        PARAMETERS :
+                    configs     :  dictionary of configuration info ( input_data, strategy, interval, sweep_grid, workers,
+                                   in_sample_days, out_sample_days )
+        RETURNS    :
+                    Nothing
+    """
+    results     = None
+
+    try:
+        if configs['input_data'] == '' or  configs['input_data'] is None or configs['sweep_grid'] == '' :
+            logger.warning( '\t\t * Need input data and a sweep grid, cannot walk forward')
+            return
+
+        walk    = WalkForward( configs=configs, grid=read_sweep_grid( configs['sweep_grid'] ), in_sample=int( configs['in_sample_days'] ),
+                               out_sample=int( configs['out_sample_days'] ), workers=int( configs.get('workers') or 0 ) or None )
+        logger.info( "\t* About to walk forward : {}", walk )
+        results = walk.Run( data=CandleMerge( sources=configs['input_data'], symbols=configs['stock'] ).Frame() )
+        logger.opt( lazy=True ).info( "{}", lambda : results.to_string( index=False ) )
+        logger.opt( lazy=True ).info( "\t* Out of sample : {}", lambda : walk.Summary( results ) )
+        logger.info( "\t* {}", walk.Cache )
+        saved   = walk.Save( results, folder= configs['csv_output'] or SWEEP_FOLDER )
+        logger.info( "\t* Results : {}", saved )
+    except:
+        print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+
+
+
+
 def  sync_broker_transactions( configs: dict  ) -> None :
     """
         Sync the local database with the transactions from the selected brokerage account
@@ -1246,6 +1333,31 @@ def  sync_broker_transactions( configs: dict  ) -> None :
 
 
 
+def monte_carlo_report( configs : dict , trades : object , funds : float , target : float = None , methods : tuple = ( 'bootstrap', 'shuffle' ) ) -> None :
+    """
+        Print how the result holds up when its trades are resampled ( see MonteCarlo )
+        ARGS   :
+                    configs  ( dict )                - configuration info ( monte_carlo : number of paths )
+                    trades   ( dict / DataFrame )    - TradeAccount.Trades or BatchReplay trades
+                    funds    ( float )               - starting equity
+                    target   ( float )               - TargetGoal equity ( None for no target )
+                    methods  ( tuple )               - resampling methods to print
+        RETURNS:
+                    nothing 
+    """
+    try:
+        carlo = MonteCarlo( trades=trades, funds=funds, target=target, paths=int( configs['monte_carlo'] ) )
+        logger.info( "\t* {}", carlo )
+        for method in methods :
+            logger.opt( lazy=True ).info( "\t\t {} : {}", lambda : method, lambda : carlo.Summary( carlo.Run( method=method ) ) )
+    except:
+        print("\t\t|EXCEPTION: day_trade::" + str(inspect.currentframe().f_code.co_name) + " - Ran into an exception:" )
+        for entry in sys.exc_info():
+            print("\t\t >>   " + str(entry) )
+
+
+
+
 def summary_report ( configs : dict , data : dict , account : object ) -> None :
     """
         Prep and send report of trading
@@ -1532,6 +1644,7 @@ def main() -> None :
         print( '\t * Checking csv_config ' )
         if Configs['csv_config'] != ''  :
             Configs = apply_csv_config ( Configs)
+        Configs['log_level'] = set_level( QUIET_LEVEL if Configs['quiet'] else Configs['log_level'] )
         
             
         # IF THE USER NEEDS TO KNOW WHICH FIELDS TO INCLUDE
@@ -1564,12 +1677,16 @@ def main() -> None :
         hub = {
                 'options'               : options_trading,
                 'download'              : download_stock_data,
+                'store'                 : import_candles,
                 'back_test'             : back_test,
+                'sweep'                 : parameter_sweep,
+                'walk_forward'          : walk_forward,
                 'test'                  : system_test,
                 'live_test'             : live_test,
                 'live_trade'            : live_trade,
                 'replay_test'           : replay_test,
                 'replay_test_compare'   : replay_test_compare,
+                'batch_replay'          : batch_replay,
                 'sync'          : sync_broker_transactions
             }
 
@@ -0,0 +1,147 @@
+## ###################################################################################################################
+##  Program :   Back_Test_Engine_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_back_test_engine.py
+##  Notes   :   The vectorized back test must make the same trades as DayTradeStrategy.BackTest on the same candles
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from BackTestEngine      import BackTestEngine
+from Clock               import SimulatedClock
+from DailyCache          import DailyCache
+from DayTradeStrategy    import DayTradeStrategy
+from TradeAccount        import TradeAccount
+
+
+PARAMS  = { 'time_interval' : 300, 'time_interval_bought' : 60, 'volume_threshold' : 0 }
+CONFIGS = { 'strategy' : 'ema9', 'interval' : 1, 'volume_threshold' : 0, 'stock' : [ 'AAA', 'BBB' ] }
+
+
+def make_back_test( symbols : tuple = ( 'AAA', 'BBB' ) , episodes : int = 20 , seed : int = 4 ) -> pd.DataFrame :
+    """
+        Minute bars that crash, go flat and creep back above the EMA9 while the RSI is still under 10 , half of
+        them dropping through the 0.16 stop afterwards
+    """
+    rng     = np.random.default_rng( seed )
+    frames  = []
+    for symbol in symbols :
+        moves = []
+        for episode in range( episodes ) :
+            moves += list( rng.normal( 0, 0.05, 5 ) ) + [ -3, -3 ] + [ 0 ] * 30 + [ 0.02, 0.01, 0.01, 0.01 ]
+            moves += ( [ -0.25 ] if rng.random() < 0.5 else [] ) + list( rng.normal( -0.02, 0.03, 6 ) )
+        close   = np.round( 600 + np.cumsum( moves ), 2 )
+        times   = [ pd.Timestamp( '2025-08-15 09:30:00' ) + pd.Timedelta( days= index // 300, minutes= index % 300 ) for index in range( len( close ) ) ]
+        frames.append( pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : [ str( value ) for value in times ],
+                                       'LOW'    : close - np.round( rng.random( len( close ) ) * 0.03, 2 ), 'CLOSE' : close, 'QUOTE' : close,
+                                       'VOLUME' : rng.integers( 1000, 9000, len( close ) ).astype( float ),
+                                       'HIGH'   : close + np.round( rng.random( len( close ) ) * 0.03, 2 ) } ) )
+    return pd.concat( frames ).reset_index( drop=True )
+
+
+class RecordingAccount :
+    def __init__( self ) -> None :
+        self.InPlay = {}
+        self.Trades = []
+
+    def Buy( self, stock, price, current_time, volume, volume_threshold, indicators ) -> bool :
+        if stock in self.InPlay :
+            return False
+        self.InPlay[ stock ] = ( current_time, price, indicators.Summary()['RSI'] )
+        return True
+
+    def Sell( self, stock, new_price, current_time, ask_volume, indicators ) -> bool :
+        self.Trades.append( ( stock, ) + self.InPlay.pop( stock ) + ( current_time, new_price ) )
+        return True
+
+
+def paper_strategy( folder : str ) -> tuple :
+    """
+        DayTradeStrategy on the ema9 rules and a Paper account in TEST mode ( daily cache under folder )
+    """
+    clock       = SimulatedClock()
+    account     = TradeAccount( funds=50000, limit=0.10, app_type='Paper', clock=clock )
+    account.SetFunds( funds=50000.00, limit=0.10 )
+    strategies  = DayTradeStrategy()
+    strategies.Set( strategy='ema9', interval=1, account=account, clock=clock )
+    strategies.Cache = DailyCache( folder=folder )
+    account.SetMode( "TEST" )
+    return strategies, account
+
+
+def candle_bars( data : pd.DataFrame , stop : int = None ) -> object :
+    """
+        ( bar_time , ticker rows ) of the back test rows in time order - raises before bar number stop ( a crash )
+    """
+    for number, ( bar_time, bar ) in enumerate( data.sort_values( by=['DATETIME'], kind='stable' ).groupby( 'DATETIME', sort=True ) ) :
+        if number == stop :
+            raise RuntimeError( f"interrupted before {bar_time}" )
+        yield bar_time, [ [ row.SYMBOL, row.DATETIME, row.LOW, row.CLOSE, row.QUOTE, row.VOLUME, row.HIGH ] for row in bar.itertuples() ]
+
+
+def trades_of( account : TradeAccount ) -> dict :
+    """
+        Trades of an account without the indicator snapshots
+    """
+    return { symbol : [ { key : value for key, value in trade.items() if not key.startswith( 'indicators' ) } for trade in trades ]
+             for symbol, trades in account.Trades.items() }
+
+
+def back_test( data : pd.DataFrame , folder : str , vectorized : bool ) -> tuple :
+    """
+        The same Paper account run through DayTradeStrategy.BackTest ( candle by candle ) or through BackTestEngine
+    """
+    strategies, account = paper_strategy( folder )
+    if vectorized :
+        new_data = BackTestEngine( data= data, params= strategies.EMA9Params( CONFIGS ) ).Run( account= account, strategy= 'ema9' )
+    else:
+        new_data = strategies.BackTest( bars= candle_bars( data ), account= account, configs= CONFIGS )
+    return trades_of( account ), { symbol : [ row['msg'] for row in rows ] for symbol, rows in new_data.items() }, account
+
+
+
+def test_engine_matches_back_test( tmp_path ):
+    data                            = make_back_test()
+    loop_trades, loop_msgs, loop    = back_test( data, str( tmp_path ), vectorized=False )
+    trades, msgs, account           = back_test( data, str( tmp_path ), vectorized=True )
+
+    assert sum( len( symbol ) for symbol in loop_trades.values() ) > 20
+    assert any( trade['ask'] <= trade['bid'] - 0.16 for symbol in loop_trades.values() for trade in symbol )   # SOME EXITS CAME FROM THE STOP
+    assert trades == loop_trades and msgs == loop_msgs
+    assert account.Performance == loop.Performance and account.Funds == loop.Funds
+
+
+def test_back_test_vol_window( tmp_path ):
+    strategies, account = paper_strategy( str( tmp_path ) )
+    strategies.Set( strategy='ema9', interval=1, account=account, clock=account.Clock, vol_window='30' )      # CLI VALUES ARRIVE AS TEXT
+    strategies.BackTest( bars= candle_bars( make_back_test( episodes= 2 ) ), account= account, configs= CONFIGS )
+
+    assert strategies.Batch.VolWindow == 30 and strategies.Resampler.Stream( 'AAA', 5 ).VolWindow == 30
+    assert [ stock['Indicators'].VolWindow for stock in strategies.Stocks.values() ] == [ 30, 30 ]
+
+
+def test_engine_without_rules():
+    assert BackTestEngine.Supports( 'ema9' ) and not BackTestEngine.Supports( 'basic' )
+    engine = BackTestEngine( data= make_back_test( episodes= 1 ), params= PARAMS )
+    assert engine.Run( account= RecordingAccount(), strategy= 'basic' ) == {}
+
+
+def test_engine_window():
+    data            = make_back_test( episodes= 30 )
+    engine          = BackTestEngine( data= data, params= PARAMS )
+    day_account     = RecordingAccount()
+    new_data        = engine.Run( account= day_account, strategy= 'ema9', start= '2025-08-16', end= '2025-08-17' )
+    signals         = engine.Signals
+    assert len( day_account.Trades ) > 0
+    assert all( '2025-08-16' <= trade[1] < '2025-08-17' for trade in day_account.Trades )
+    assert all( row['datetime'][:10] == '2025-08-16' for rows in new_data.values() for row in rows )
+
+    again           = RecordingAccount()
+    engine.Run( account= again, strategy= 'ema9', start= '2025-08-16', end= '2025-08-17' )
+    assert engine.Signals is signals and again.Trades == day_account.Trades             # SAME WINDOW , NOT RECALCULATED
+
+    day             = data[ ( data['DATETIME'] >= '2025-08-16' ) & ( data['DATETIME'] < '2025-08-17' ) ]
+    alone           = RecordingAccount()                                                # WARMS UP LIKE A BACK TEST OF THE DAY ALONE
+    BackTestEngine( data= day, params= PARAMS ).Run( account= alone, strategy= 'ema9' )
+    assert alone.Trades == day_account.Trades
@@ -0,0 +1,61 @@
+## ###################################################################################################################
+##  Program :   Bar_Resampler_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_bar_resampler.py
+##  Notes   :   The locally built bars and their indicators must match a pandas resample of the same 1 minute bars
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from BarResampler       import BarResampler
+from IndicatorStream    import IndicatorStream
+from test_indicator_stream import make_candles
+
+
+OPEN_MS = 1754400000000 - 1754400000000 % 1800000                      # ALIGNED ON THE HALF HOUR
+
+
+def feed( df : pd.DataFrame ) -> BarResampler :
+    resampler = BarResampler()
+    for row in df.itertuples() :
+        resampler.Add( 'X', row.open, row.high, row.low, row.close, row.volume, OPEN_MS + row.Index * 60000 )
+    return resampler
+
+
+def test_bars_match_pandas_resample():
+    df          = make_candles( length = 90 )
+    resampler   = feed( df )
+    frame       = df.set_index( pd.to_datetime( OPEN_MS + df.index * 60000, unit='ms' ) )
+    bars        = frame.resample( '15min' ).agg( { 'open' : 'first', 'high' : 'max', 'low' : 'min', 'close' : 'last', 'volume' : 'sum' } )
+
+    last        = resampler.Bar( 'X', 15 )
+    assert [ last[ field ] for field in ( 'open', 'high', 'low', 'close', 'volume' ) ] == list( bars.iloc[-1] )
+    assert last['datetime'] == OPEN_MS + 75 * 60000
+
+    stream      = IndicatorStream()
+    for bar in bars.itertuples() :
+        stream.Update( bar.open, bar.high, bar.low, bar.close, bar.volume )
+    assert resampler.Stream( 'X', 15 ).Values() == stream.Values()
+    assert resampler.Stream( 'X', 1 ).Count == 90 and resampler.Stream( 'X', 30 ).Count == 3
+
+
+def test_bar_closes_on_its_last_minute():
+    resampler   = BarResampler( timeframes = ( 5, ) )
+    closed      = [ resampler.Add( 'X', 1, 2, 0.5, 1.5, 100, OPEN_MS + minute * 60000 ) for minute in range( 5 ) ]
+    assert [ 5 in minutes for minutes in closed ] == [ False, False, False, False, True ]
+    assert resampler.Add( 'X', 1, 2, 0.5, 1.5, 100, OPEN_MS + 4 * 60000 ) == []           # SAME MINUTE POLLED TWICE
+    assert resampler.Row( 'X', 5 )[2:] == [ 0.5, 1.5, 1.0, 500.0, 2.0 ]
+
+
+def test_gap_closes_the_bar_it_cut_short():
+    resampler   = BarResampler( timeframes = ( 5, ) )
+    for minute in range( 3 ) :                                                          # 09:30 - 09:32 , THEN NOTHING UNTIL 09:35
+        assert resampler.Add( 'X', 1, 2, 0.5, 1.5, 100, OPEN_MS + minute * 60000 ) == [ 1 ]
+    assert resampler.Add( 'X', 3, 4, 2.5, 3.5, 200, OPEN_MS + 5 * 60000 ) == [ 1, 5 ]   # THE 09:30 BAR CLOSES ON THE GAP
+    assert resampler.Row( 'X', 5 )[2:] == [ 0.5, 1.5, 1.0, 300.0, 2.0 ]
+
+    assert resampler.Add( 'X', 5, 6, 4.5, 5.5, 400, OPEN_MS + 14 * 60000 ) == [ 1, 5, 5 ]    # 09:35 CUT SHORT , 09:40 CLOSES ON ITS LAST MINUTE
+    assert resampler.Row( 'X', 5 )[2:] == [ 4.5, 5.5, 5.0, 400.0, 6.0 ]
+    assert resampler.Row( 'X', 5, back=1 )[2:] == [ 2.5, 3.5, 3.0, 200.0, 4.0 ] and resampler.Bar( 'X', 5, back=2 ) is None
+    assert resampler.Stream( 'X', 5 ).Count == 3
@@ -0,0 +1,87 @@
+## ###################################################################################################################
+##  Program :   Batch_Replay_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_batch_replay.py
+##  Notes   :   A job replays its day from the candle store , the batch merges the jobs in day order and a job that
+##              failed is not kept in the result cache
+## ###################################################################################################################
+import os
+
+import numpy  as np
+import pandas as pd
+
+from BatchReplay    import BatchReplay, replay_job, warm, TRADE_FIELDS
+from CandleStore    import CandleStore
+
+
+def write_days( root : str , symbols : tuple = ( 'AAA', 'BBB' ) , start : str = '2025-08-11' , end : str = '2025-08-15' ) -> None :
+    """
+        390 one minute candles a day for every symbol
+    """
+    rng     = np.random.default_rng( 3 )
+    frames  = []
+    for symbol in symbols :
+        for day in pd.bdate_range( start, end ) :
+            times   = pd.date_range( day + pd.Timedelta( hours=9, minutes=30 ), periods=390, freq='min' )
+            close   = np.round( 100 + np.cumsum( rng.normal( 0, 0.1, 390 ) ), 2 )
+            frames.append( pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : times.astype( str ), 'LOW' : close - 0.05, 'CLOSE' : close, 'QUOTE' : close,
+                                           'VOLUME' : rng.integers( 1000, 9000, 390 ).astype( float ), 'HIGH' : close + 0.05 } ) )
+    CandleStore( root=root ).Write( pd.concat( frames ) )
+
+
+def configs( tmp_path , **more ) -> dict :
+    return { 'strategy' : 'simple', 'stock' : [ 'AAA', 'BBB' ], 'interval' : 5, 'volume_threshold' : 0,
+             'candle_store' : str( tmp_path / 'store' ), 'result_cache' : str( tmp_path / 'cache' ), 'daily_cache' : str( tmp_path / 'daily' ) } | more
+
+
+def test_replay_job_from_store( tmp_path ):
+    write_days( str( tmp_path / 'store' ) )
+    warm( str( tmp_path / 'store' ) )
+    result  = replay_job( '2025-08-14', [ 'AAA', 'BBB' ], configs( tmp_path ) )
+
+    assert result['error'] is None and result['day'] == '2025-08-14' and result['steps'] > 0 and len( result['trades'] ) > 0
+    assert all( set( trade ) == { 'day', 'symbol', *TRADE_FIELDS } and trade['bidTime'][:10] == '2025-08-14' for trade in result['trades'] )
+    assert [ trade['askTime'] for trade in result['trades'] ] == sorted( trade['askTime'] for trade in result['trades'] )
+    assert replay_job( '2025-08-14', [ 'AAA', 'BBB' ], configs( tmp_path ) ) == result
+    assert sorted( os.listdir( tmp_path / 'daily' ) ) == [ 'AAA_2025-08-14.pkl', 'BBB_2025-08-14.pkl' ]     # NOT UNDER THE WORKING FOLDER
+
+
+def test_merge_and_summary( tmp_path ):
+    batch   = BatchReplay( configs( tmp_path, no_cache=True ), start='2025-08-14', end='2025-08-15' )
+    trade   = lambda day, symbol, ask_time, p_l : { 'day' : day, 'symbol' : symbol, 'bidTime' : day + ' 09:40:00', 'bid' : 10.0,
+                                                    'askTime' : day + ask_time, 'ask' : 10.0 + p_l, 'qty' : 1, 'p_l' : p_l }
+    results = [ { 'day' : '2025-08-14', 'symbols' : [ 'AAA' ], 'steps' : 70, 'performance' : { 'AAA' : [ 'WIN', 'LOSS' ] }, 'error' : None,
+                  'trades' : [ trade( '2025-08-14', 'AAA', ' 10:00:00', 3.0 ), trade( '2025-08-14', 'AAA', ' 11:00:00', -5.0 ) ] },
+                { 'day' : '2025-08-14', 'symbols' : [ 'BBB' ], 'steps' : 70, 'performance' : { 'BBB' : [ 'WIN' ] }, 'error' : None,
+                  'trades' : [ trade( '2025-08-14', 'BBB', ' 10:30:00', 1.0 ) ] },
+                { 'day' : '2025-08-15', 'symbols' : [ 'AAA' ], 'steps' : 70, 'performance' : {}, 'error' : None, 'trades' : [] } ]
+    merged  = batch.Merge( results )
+
+    assert merged['days'].to_dict( 'records' ) == [ { 'day' : '2025-08-14', 'trades' : 3, 'wins' : 2, 'losses' : 1, 'win_rate' : 0.6667, 'p_l' : -1.0, 'steps' : 140 },
+                                                    { 'day' : '2025-08-15', 'trades' : 0, 'wins' : 0, 'losses' : 0, 'win_rate' : 0.0, 'p_l' : 0.0, 'steps' : 70 } ]
+    assert list( merged['trades']['askTime'].str[11:] ) == [ '10:00:00', '10:30:00', '11:00:00' ]
+    assert merged['performance'] == { 'AAA' : [ 'WIN', 'LOSS' ], 'BBB' : [ 'WIN' ] }
+    assert batch.Summary( merged ) == { 'days' : 2, 'trades' : 3, 'wins' : 2, 'losses' : 1, 'win_rate' : 0.6667, 'p_l' : -1.0,
+                                        'max_drawdown' : 5.0, 'profitable_days' : 0 }
+    assert batch.Summary( batch.Merge( [] ) )['trades'] == 0
+
+
+def test_failed_job_is_not_cached( tmp_path ):
+    write_days( str( tmp_path / 'store' ) )
+    column  = tmp_path / 'store' / 'AAA' / '2025-08-15' / 'CLOSE.npy'
+    closes  = column.read_bytes()
+    column.unlink()                                                                     # A PARTITION THE REPLAY CANNOT READ
+    warm( str( tmp_path / 'store' ) )
+    assert replay_job( '2025-08-15', [ 'AAA', 'BBB' ], configs( tmp_path ) )['error'] == "KeyError('AAA')"       # NO CANDLES OF AAA FOR THE DAY
+
+    failed  = BatchReplay( configs( tmp_path ), start='2025-08-15', end='2025-08-15', workers=1 )
+    assert failed.Run()['days']['steps'].tolist() == [ 0 ]
+    assert failed.Cache.Load( failed.Key( '2025-08-15', [ 'AAA', 'BBB' ] ) ) is None
+
+    column.write_bytes( closes )                                                        # THE SAME CANDLES BACK
+    batch   = BatchReplay( configs( tmp_path ), start='2025-08-15', end='2025-08-15', workers=1 )
+    assert batch.Key( '2025-08-15', [ 'AAA', 'BBB' ] ) == failed.Key( '2025-08-15', [ 'AAA', 'BBB' ] )
+    merged  = batch.Run()
+    assert merged['days']['steps'].tolist()[0] > 0
+    assert batch.Cache.Load( batch.Key( '2025-08-15', [ 'AAA', 'BBB' ] ) )['error'] is None
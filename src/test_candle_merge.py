@@ -0,0 +1,51 @@
+## ###################################################################################################################
+##  Program :   Candle_Merge_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_candle_merge.py
+##  Notes   :   The merged sources must hand out every row once , in global time order
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from CandleMerge import CandleMerge
+
+
+def write_symbol( folder : object , symbol : str , minutes : list , shuffle : bool = False ) -> pd.DataFrame :
+    """
+        Candle file of one symbol at the given minutes after the open
+    """
+    times   = [ str( pd.Timestamp( '2025-08-15 09:30:00' ) + pd.Timedelta( minutes= int( minute ) ) ) for minute in minutes ]
+    close   = 100 + np.arange( len( minutes ) ) * 0.01
+    df      = pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : times, 'LOW' : close - 0.05, 'CLOSE' : close, 'QUOTE' : close,
+                              'VOLUME' : 1000.0, 'HIGH' : close + 0.05 } )
+    ( df.sample( frac=1, random_state=1 ) if shuffle else df ).to_csv( folder / f"{symbol}.csv", index=False )
+    return df
+
+
+def test_merge_per_symbol_files( tmp_path ):
+    frames  = [ write_symbol( tmp_path, 'AAA', range( 0, 300 ) ),
+                write_symbol( tmp_path, 'BBB', range( 0, 300, 5 ) ),
+                write_symbol( tmp_path, 'CCC', range( 100, 200 ), shuffle=True ) ]          # NOT IN TIME ORDER , SORTED IN MEMORY
+    merge   = CandleMerge( sources=str( tmp_path ), chunksize=16 )
+    rows    = list( merge )
+
+    assert merge.Rows == len( rows ) == sum( len( frame ) for frame in frames )
+    assert [ row[1] for row in rows ] == sorted( row[1] for row in rows )
+    assert all( len( row ) == 8 and row[7] == '' for row in rows )
+    for frame in frames :
+        symbol = frame['SYMBOL'].iloc[0]
+        assert [ row[3] for row in rows if row[0] == symbol ] == list( frame['CLOSE'] )
+
+    bars = list( CandleMerge( sources=f"{tmp_path}/AAA.csv,{tmp_path}/BBB.csv", symbols=[ 'BBB' ] ).Bars() )
+    assert len( bars ) == 60 and all( len( bar ) == 1 and bar[0][0] == 'BBB' for bar_time, bar in bars )
+
+
+def test_merge_streams( tmp_path ):
+    write_symbol( tmp_path, 'AAA', range( 0, 5000 ) )
+    write_symbol( tmp_path, 'BBB', range( 0, 5000 ) )
+    merge           = CandleMerge( sources=[ tmp_path / 'AAA.csv', tmp_path / 'BBB.csv' ], chunksize=100 )
+    bar_time, bar   = next( merge.Bars() )
+
+    assert [ row[0] for row in bar ] == [ 'AAA', 'BBB' ]              # TIES KEEP THE ORDER OF THE SOURCES
+    assert merge.Rows < 10                                              # NOTHING READ PAST THE FIRST BAR
@@ -0,0 +1,69 @@
+## ###################################################################################################################
+##  Program :   Candle_Store_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_candle_store.py
+##  Notes   :   Candles written to the store must come back typed , in time order and in the layouts the readers expect
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from datetime    import datetime
+from CandleMerge import CandleMerge
+from CandleStore import CandleStore
+
+
+def make_candles( symbol : str , days : tuple = ( '2025-08-14', '2025-08-15' ) ) -> pd.DataFrame :
+    """
+        390 one minute bars per day in the back_test csv layout
+    """
+    times   = [ str( pd.Timestamp( f"{day} 09:30:00" ) + pd.Timedelta( minutes= minute ) ) for day in days for minute in range( 390 ) ]
+    close   = 100 + np.arange( len( times ) ) * 0.01
+    return pd.DataFrame( { 'SYMBOL' : symbol, 'DATETIME' : times, 'LOW' : close - 0.05, 'QUOTE' : close - 0.01, 'HIGH' : close + 0.05,
+                           'CLOSE' : close, 'VOLUME' : 1000.0 } )
+
+
+def test_store_round_trip( tmp_path ):
+    store   = CandleStore( root= tmp_path )
+    aaa     = make_candles( 'AAA' )
+    assert store.Write( aaa ) == 2
+
+    alpha   = make_candles( 'BBB', days= ( '2025-08-15', ) ).rename( columns={ 'SYMBOL' : 'stock', 'DATETIME' : 'timestamp', 'QUOTE' : 'open',
+                                                                                'LOW' : 'low', 'HIGH' : 'high', 'CLOSE' : 'close', 'VOLUME' : 'volume' } )
+    alpha[ ::-1 ].to_csv( tmp_path / 'BBB.csv', index=False )                                  # DOWNLOAD LAYOUT , NEWEST FIRST
+    assert store.Import( [ tmp_path / 'BBB.csv' ] ) == 1
+
+    store   = CandleStore( root= tmp_path )                                                    # FROM THE MANIFEST
+    assert store.Symbols() == [ 'AAA', 'BBB' ] and store.Days( 'AAA' ) == [ '2025-08-14', '2025-08-15' ]
+    assert store.Partition( 'AAA', '2025-08-15' )['TIME'].dtype == np.dtype( 'datetime64[s]' )
+
+    data    = store.Frame( symbols= [ 'AAA' ], start= '2025-08-15' )
+    assert list( data['DATETIME'] ) == list( aaa['DATETIME'][ 390: ] )
+    assert np.allclose( data['CLOSE'], aaa['CLOSE'][ 390: ] ) and np.allclose( data['QUOTE'], aaa['QUOTE'][ 390: ] )
+
+    merged  = CandleMerge( sources= str( tmp_path ) ).Frame()
+    assert len( merged ) == 3 * 390 and list( merged['DATETIME'] ) == sorted( merged['DATETIME'] )
+    assert list( merged.columns ) == [ 'SYMBOL', 'DATETIME', 'LOW', 'CLOSE', 'QUOTE', 'VOLUME', 'HIGH', 'MSG' ]
+    rows    = list( CandleMerge( sources= str( tmp_path ), symbols= [ 'BBB' ] ) )
+    assert len( rows ) == 390 and rows[0][:2] == [ 'BBB', '2025-08-15 09:30:00' ] and rows[0][7] == ''
+    assert np.allclose( rows[0][2:7], [ 99.95, 100.0, 99.99, 1000.0, 100.05 ] )
+
+    store.Write( make_candles( 'AAA', days= ( '2025-08-15', ) ).assign( CLOSE= 1.0 ) )        # SAME TIMES , NEW ROWS WIN
+    assert store.Manifest['partitions']['AAA']['2025-08-15']['rows'] == 390 and store.Manifest['partitions']['AAA']['2025-08-15']['close'] == 1.0
+
+
+def test_store_quotes_and_history( tmp_path ):
+    store   = CandleStore( root= tmp_path )
+    store.Write( make_candles( 'AAA' ) )
+
+    bar     = store.Bar( 'AAA', datetime( 2025, 8, 15, 10, 0 ), 900 )                          # THE 15 MIN CANDLE OF 10:00
+    assert bar[:2] == [ 'AAA', '2025-08-15 10:00:00' ] and bar[5] == 15000.0
+    assert np.isclose( bar[4], 100 + 420 * 0.01 - 0.01 ) and np.isclose( bar[3], 100 + 434 * 0.01 ) and np.isclose( bar[6], 100 + 434 * 0.01 + 0.05 )
+    assert store.Bar( 'AAA', datetime( 2025, 8, 15, 16, 30 ), 60 )[3] == store.Frame( [ 'AAA' ] )['CLOSE'].iloc[-1]
+    assert store.Bar( 'AAA', datetime( 2025, 8, 16, 10, 0 ) ) is None
+
+    daily   = store.History( 'AAA', time_range= 5, today= datetime( 2025, 8, 15, 9, 30 ) )
+    assert list( daily['date'] ) == [ '2025-08-14' ] and daily['volume'].iloc[0] == 390000.0
+    minutes = store.History( 'AAA', time_period= 'minute', time_range= 1, today= datetime( 2025, 8, 15, 9, 30 ) )
+    assert len( minutes ) == 390 and minutes['datetime'].is_monotonic_decreasing
+    assert str( datetime.fromtimestamp( minutes['datetime'].iloc[-1] / 1000 ) ) == '2025-08-14 09:30:00'
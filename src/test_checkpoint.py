@@ -0,0 +1,138 @@
+## ###################################################################################################################
+##  Program :   Checkpoint_Test
+##  Author  :
+##  Install :   pip3 install pytest numpy pandas
+##  Example :	python3 -m pytest test_checkpoint.py
+##  Notes   :   A restored simulation state carries on exactly like the one that was saved , without pickle , and a
+##              back test that crashed resumes from its last checkpoint to the same trades
+## ###################################################################################################################
+import json
+import types
+
+import numpy  as np
+import pytest
+
+from Checkpoint         import Checkpoint, write, read
+from IndicatorBatch     import IndicatorBatch
+from IndicatorStream    import IndicatorStream
+from IndicatorSnapshot  import IndicatorSnapshot
+from test_back_test_engine import make_back_test, paper_strategy, candle_bars, trades_of, CONFIGS
+
+
+def candles( count, symbols, seed=11 ):
+    rng     = np.random.default_rng( seed )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( count, len( symbols ) ) ), axis=0 )
+    return close, rng.integers( 1000, 5000, close.shape ).astype( float )
+
+
+def simulation( symbols ):
+    batch       = IndicatorBatch( symbols, capacity=0, dtype=np.float32 )
+    strategies  = types.SimpleNamespace( StrategyName='ema9', Interval=1, Batch=batch, isORBBuild=True,
+                                         Stocks={ symbol : { 'Previous' : [ symbol, '2025-08-15 09:31:00', 1.0 ], 'Losses' : 0,
+                                                             'Stream' : IndicatorStream(), 'Batch' : batch } for symbol in symbols } )
+    account     = types.SimpleNamespace( Funds=5000.0, Limit=0.1, LossLimit=125.0, DailyFunds=500.0, TargetGoal=5125.0,
+                                         Trades={ 'AAA' : [ { 'bidTime' : '2025-08-15 09:35:00', 'p_l' : np.float64( 1.5 ),
+                                                              'indicators_in' : IndicatorSnapshot( ( 'RSI', 'EMA9' ), ( 55.0, np.float32( 99.5 ) ) ) } ] },
+                                         InPlay={}, Performance={ 'AAA' : [ 'WIN' ] } )
+    return strategies, account
+
+
+def step( strategies, close, volume, bar ):
+    symbols = list( strategies.Stocks )
+    for pos, symbol in enumerate( symbols ):
+        strategies.Stocks[ symbol ]['Stream'].Update( close[bar,pos], close[bar,pos] + 0.2, close[bar,pos] - 0.2, close[bar,pos], volume[bar,pos], bar * 60000 )
+    strategies.Batch.Update( symbols, close[bar], close[bar] + 0.2, close[bar] - 0.2, close[bar], volume[bar], [ bar * 60000 ] * len( symbols ) )
+
+
+def test_restored_state_carries_on_like_the_original( tmp_path ):
+    symbols                 = [ 'AAA', 'BBB' ]
+    close, volume           = candles( 120, symbols )
+    strategies, account     = simulation( symbols )
+    for bar in range( 60 ):
+        step( strategies, close, volume, bar )
+
+    checkpoint = Checkpoint( key='run', folder=str( tmp_path ), every=0 )
+    assert not checkpoint.Due()
+    assert checkpoint.Save( strategies, account, position='2025-08-15 10:30:00', data={ 'AAA' : [ { 'msg' : 'bought' } ] } )
+
+    state = checkpoint.Load()
+    assert state['position'] == '2025-08-15 10:30:00' and state['data'] == { 'AAA' : [ { 'msg' : 'bought' } ] }
+    assert Checkpoint( key='another run', folder=str( tmp_path ) ).Load() is None
+
+    restored, restored_account = simulation( [] )
+    checkpoint.Restore( state, restored, restored_account )
+    assert restored.Stocks['AAA']['Batch'] is restored.Batch                        # SHARED , NOT COPIED
+    assert restored.Batch.Dtype is np.float32 and restored.Batch.Candles['close'].dtype == np.float32
+    trade = restored_account.Trades['AAA'][0]
+    assert trade['indicators_in']['EMA9'] == np.float32( 99.5 ) and type( trade['p_l'] ) is np.float64
+    assert restored_account.Performance == account.Performance and restored_account.Funds == account.Funds
+
+    for bar in range( 60, 120 ):
+        step( strategies, close, volume, bar )
+        step( restored, close, volume, bar )
+    for symbol in symbols :
+        assert restored.Batch.Values( symbol ) == strategies.Batch.Values( symbol )
+        assert restored.Stocks[ symbol ]['Stream'].Values() == strategies.Stocks[ symbol ]['Stream'].Values()
+
+    checkpoint.Remove()
+    assert checkpoint.Load() is None
+
+
+def test_format_is_versioned_and_pickle_free( tmp_path ):
+    file_name = write( str( tmp_path / "state.npz" ), { 'stream' : IndicatorStream(), 'keys' : { 9 : ( 1, 2 ) } } )
+    with np.load( file_name, allow_pickle=False ) as archive :
+        header = json.loads( archive['header'].tobytes().decode() )
+        assert all( archive[ name ].dtype != object for name in archive.files )
+    assert header['version'] == 1 and header['objects'][0]['class'] == 'IndicatorStream.IndicatorStream'
+    assert read( file_name )['root']['keys'] == { 9 : ( 1, 2 ) }
+
+    header['version'] = 2
+    with open( file_name, 'wb' ) as file :
+        np.savez( file, header=np.frombuffer( json.dumps( header ).encode(), dtype=np.uint8 ) )
+    with pytest.raises( ValueError ):
+        read( file_name )
+
+    with pytest.raises( TypeError ):
+        write( str( tmp_path / "other.npz" ), { 'account' : types.SimpleNamespace( Funds=1 ) } )
+
+
+
+def test_interrupted_back_test_resumes( tmp_path ):
+    data                    = make_back_test( episodes=8 )
+    strategies, account     = paper_strategy( str( tmp_path ) )
+    whole                   = strategies.BackTest( bars= candle_bars( data ), account= account, configs= CONFIGS )
+
+    checkpoint              = Checkpoint( key='interrupted', folder=str( tmp_path / 'checkpoints' ), every=1e-9 )
+    stop                    = data['DATETIME'].nunique() // 2
+    strategies, crashed     = paper_strategy( str( tmp_path ) )
+    strategies.BackTest( bars= candle_bars( data, stop=stop ), account= crashed, configs= CONFIGS, checkpoint=checkpoint )
+    state                   = checkpoint.Load()                         # THE RAISE SKIPPED Remove()
+    assert state['position'] == sorted( data['DATETIME'].unique() )[ stop - 1 ]
+    assert 0 < sum( map( len, crashed.Trades.values() ) ) < sum( map( len, account.Trades.values() ) )
+
+    strategies, resumed     = paper_strategy( str( tmp_path ) )
+    new_data                = strategies.BackTest( bars= candle_bars( data ), account= resumed, configs= CONFIGS | { 'resume' : True },
+                                                   checkpoint=Checkpoint( key='interrupted', folder=str( tmp_path / 'checkpoints' ), every=0 ) )
+    assert trades_of( resumed ) == trades_of( account ) and new_data == whole
+    assert resumed.Performance == account.Performance and resumed.Funds == account.Funds
+    assert checkpoint.Load() is None                                    # RAN TO THE END
+
+
+
+def test_checkpoint_of_other_code_is_not_resumed( tmp_path, monkeypatch ):
+    data                    = make_back_test( episodes=8 )
+    strategies, account     = paper_strategy( str( tmp_path ) )
+    whole                   = strategies.BackTest( bars= candle_bars( data ), account= account, configs= CONFIGS )
+
+    checkpoint              = Checkpoint( key='changed', folder=str( tmp_path / 'checkpoints' ), every=1e-9 )
+    strategies, crashed     = paper_strategy( str( tmp_path ) )
+    strategies.BackTest( bars= candle_bars( data, stop=data['DATETIME'].nunique() // 2 ), account= crashed, configs= CONFIGS, checkpoint=checkpoint )
+    assert checkpoint.Load() is not None
+
+    restored                = []
+    monkeypatch.setattr( 'DayTradeStrategy.code_version', lambda : 'another version' )
+    monkeypatch.setattr( Checkpoint, 'Restore', lambda self, *args : restored.append( args ) )
+    strategies, resumed     = paper_strategy( str( tmp_path ) )
+    new_data                = strategies.BackTest( bars= candle_bars( data ), account= resumed, configs= CONFIGS | { 'resume' : True },
+                                                   checkpoint=Checkpoint( key='changed', folder=str( tmp_path / 'checkpoints' ), every=0 ) )
+    assert restored == [] and trades_of( resumed ) == trades_of( account ) and new_data == whole       # STARTED OVER
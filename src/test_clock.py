@@ -0,0 +1,31 @@
+## ###################################################################################################################
+##  Program :   Clock_Test
+##  Author  :
+##  Install :   pip3 install pytest
+##  Example :	python3 -m pytest test_clock.py
+##  Notes   :   A simulated clock only moves when the session moves it , and sleeping never waits
+## ###################################################################################################################
+import time
+
+from datetime import datetime, timedelta
+from Clock    import Clock, SimulatedClock
+
+
+def test_simulated_clock():
+    clock   = SimulatedClock( start= '2025-08-15 09:30:00.123456' )
+    assert clock.Simulated and clock.Now() == datetime( 2025, 8, 15, 9, 30 )
+
+    started = time.perf_counter()
+    clock.Sleep( 30 * 60 )                                                  # SetORB PAUSING UNTIL 10:00
+    assert time.perf_counter() - started < 0.1 and clock.Now() == datetime( 2025, 8, 15, 10, 0 )
+
+    clock.Set( datetime( 2025, 8, 15, 15, 46 ) )
+    assert clock.Now().hour == 15 and clock.Now().minute >= 45
+    clock.Sleep( -5 )
+    assert clock.Now() == datetime( 2025, 8, 15, 15, 46 )
+
+
+def test_wall_clock():
+    clock   = Clock()
+    clock.Set( '2025-08-15 09:30:00' )                                      # NOT MOVABLE
+    assert not clock.Simulated and abs( clock.Now() - datetime.now() ) < timedelta( seconds= 1 )
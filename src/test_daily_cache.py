@@ -0,0 +1,58 @@
+## ###################################################################################################################
+##  Program :   Daily_Cache_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas
+##  Example :	python3 -m pytest test_daily_cache.py
+##  Notes   :   The daily context must come back from disk unchanged and callers must not be able to alter the cache ,
+##              every mode keeps its own entry and the process keeps the most recently used ones only
+## ###################################################################################################################
+import os
+
+import pandas as pd
+
+from DailyCache import DailyCache, compact_frame
+
+
+def test_daily_cache_round_trip( tmp_path ):
+    data    = pd.DataFrame( { 'close' : [ 1.0, 2.0, 3.0 ], 'datetime' : [ 1, 2, 3 ] } )
+    entry   = { 'data' : data, 'seed' : data.head( 1 ), 'context' : { 'ATH' : 3.0, 'SMA' : { 'SMA9' : 2.0 } } }
+    cache   = DailyCache( folder = str( tmp_path ) )
+
+    assert cache.Load( 'AAPL', '2025-08-15' ) is None
+    assert cache.Save( 'AAPL', '2025-08-15 09:30:00', entry )
+
+    DailyCache.Memory.clear()                                           # NEW PROCESS : ONLY THE FILE IS LEFT
+    loaded  = DailyCache( folder = str( tmp_path ) ).Load( 'AAPL', '2025-08-15' )
+    assert loaded['data'].equals( data ) and loaded['context'] == entry['context']
+
+    loaded['data']['full_date'] = 0                                     # CALLERS ADD COLUMNS
+    assert not ( 'full_date' in cache.Load( 'AAPL', '2025-08-15' )['data'] )
+    assert cache.Load( 'AAPL', '2025-08-16' ) is None
+
+
+def test_compact_frame_drops_text_columns():
+    data    = pd.DataFrame( { 'close' : [ 1.0, 2.0 ], 'datetime' : [ 1754400000000, 1754486400000 ], 'date' : [ '2025-08-05', '2025-08-06' ] } )
+    compact = compact_frame( data )
+    assert list( compact.columns ) == [ 'close', 'datetime' ]
+    assert str( compact['close'].dtype ) == 'float32' and str( compact['datetime'].dtype ) == 'int64'
+
+
+def test_daily_cache_modes_and_bound( tmp_path, monkeypatch ):
+    data    = pd.DataFrame( { 'close' : [ 1.0, 2.0, 3.0 ], 'datetime' : [ 1, 2, 3 ] } )
+    cache   = DailyCache( folder = str( tmp_path ) )
+    DailyCache.Memory.clear()
+
+    assert cache.Save( 'AAPL', '2025-08-15', { 'data' : data, 'context' : { 'VolIndex' : 0.5 } } )
+    assert cache.Save( 'AAPL', '2025-08-15', { 'data' : compact_frame( data ), 'context' : { 'VolIndex' : 0.5 } }, compact=True )
+    assert cache.Save( 'AAPL', '2025-08-15', { 'data' : data, 'context' : { 'VolIndex' : 0.2 } }, vol_window=30 )
+    assert len( os.listdir( tmp_path ) ) == 3
+    assert str( cache.Load( 'AAPL', '2025-08-15', compact=True )['data']['close'].dtype ) == 'float32'
+    assert cache.Load( 'AAPL', '2025-08-15', vol_window=30 )['context'] == { 'VolIndex' : 0.2 }
+    assert cache.Load( 'AAPL', '2025-08-15', compact=True, vol_window=30 ) is None
+
+    monkeypatch.setattr( DailyCache, 'Capacity', 2 )
+    cache.Load( 'AAPL', '2025-08-15' )                                  # THE COMPACT ENTRY IS NOW THE LEAST RECENTLY USED
+    cache.Save( 'MSFT', '2025-08-15', { 'data' : data } )
+    assert list( DailyCache.Memory ) == [ cache.Key( 'AAPL', '2025-08-15' ), cache.Key( 'MSFT', '2025-08-15' ) ]
+    assert cache.Load( 'AAPL', '2025-08-15', compact=True ) is not None       # STILL ON DISK
+    DailyCache.Memory.clear()
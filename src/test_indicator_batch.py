@@ -0,0 +1,111 @@
+## ###################################################################################################################
+##  Program :   Indicator_Batch_Test
+##  Author  :
+##  Install :   pip3 install pytest numpy
+##  Example :	python3 -m pytest test_indicator_batch.py
+##  Notes   :   One vectorized pass over the watch list must land on the same values as a stream per symbol
+## ###################################################################################################################
+import math
+import numpy  as np
+
+from IndicatorBatch  import IndicatorBatch
+from IndicatorStream import IndicatorStream
+
+
+def test_batch_matches_streams():
+    rng     = np.random.default_rng( 3 )
+    symbols = [ f"S{index}" for index in range( 6 ) ]
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( 400, len(symbols) ) ), axis=0 )
+    open    = close + rng.normal( 0, 0.1, close.shape )
+    high    = np.maximum( open, close ) + rng.random( close.shape ) * 0.3
+    low     = np.minimum( open, close ) - rng.random( close.shape ) * 0.3
+    volume  = rng.integers( 1000, 5000, close.shape ).astype( float )
+
+    streams = { symbol : IndicatorStream() for symbol in symbols }
+    batch   = IndicatorBatch( symbols[:-1] )
+    for bar in range( len( close ) ):
+        if bar == 30 :
+            batch.Add( symbols[-1], streams[ symbols[-1] ] )            # JOINS THE WATCH LIST MID SESSION
+        present = [ pos for pos in range( len(symbols) ) if rng.random() > 0.2 ]
+        for pos in present :
+            streams[ symbols[pos] ].Update( open[bar,pos], high[bar,pos], low[bar,pos], close[bar,pos], volume[bar,pos], bar * 60000 )
+        present = [ pos for pos in present if symbols[pos] in batch.Index ]
+        batch.Update( [ symbols[pos] for pos in present ], open[bar,present], high[bar,present], low[bar,present],
+                      close[bar,present], volume[bar,present], [ bar * 60000 ] * len(present) )
+
+    for symbol in symbols :
+        values = batch.Values( symbol )
+        for name in IndicatorBatch.PUBLISHED :
+            assert math.isclose( values[ name ], getattr( streams[ symbol ], name ), abs_tol=0.011 ), name
+        for name, value in streams[ symbol ].SMA.items() :
+            assert math.isclose( values['SMA'][ name ], value, abs_tol=1e-9 )
+        assert batch.Applied( symbol, streams[ symbol ].Timestamp )
+
+
+def test_batch_rolling_volatility_matches_stream():
+    rng     = np.random.default_rng( 5 )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( 120, 3 ) ), axis=0 )
+    streams = [ IndicatorStream( vol_window = 20 ) for _ in range( 3 ) ]
+    batch   = IndicatorBatch( [ 'A', 'B', 'C' ], vol_window = 20 )
+    for bar in range( len( close ) ):
+        for pos, stream in enumerate( streams ) :
+            stream.Update( close[bar,pos], close[bar,pos], close[bar,pos], close[bar,pos], 1000 )
+        batch.Update( [ 'A', 'B', 'C' ], close[bar], close[bar], close[bar], close[bar], [ 1000 ] * 3 )
+
+    for symbol, stream in zip( 'ABC', streams ) :
+        assert math.isclose( batch.Values( symbol )['VolIndex'], stream.VolIndex, abs_tol=1e-4 )
+        assert math.isclose( batch.Values( symbol )['VolAnnual'], stream.VolAnnual, abs_tol=1e-3 )
+
+
+def test_batch_volatility_skips_non_positive_closes_like_stream():
+    rng     = np.random.default_rng( 9 )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( 120, 2 ) ), axis=0 )
+    close[ [ 25, 26, 70 ], 0 ] = [ 0.0, -1.0, 0.0 ]                    # BAD PRINTS OF A , THE RETURNS AROUND THEM ARE SKIPPED
+    for window in ( None, 20 ) :
+        streams = [ IndicatorStream( vol_window = window ) for _ in range( 2 ) ]
+        batch   = IndicatorBatch( [ 'A', 'B' ], vol_window = window )
+        for bar in range( len( close ) ):
+            for pos, stream in enumerate( streams ) :
+                stream.Update( close[bar,pos], close[bar,pos], close[bar,pos], close[bar,pos], 1000 )
+            batch.Update( [ 'A', 'B' ], close[bar], close[bar], close[bar], close[bar], [ 1000 ] * 2 )
+            for symbol, stream in zip( 'AB', streams ) :
+                assert math.isclose( batch.Values( symbol )['VolIndex'], stream.VolIndex, abs_tol=1e-4 ), ( window, bar )
+        assert batch.Returns[ batch.Index['A'] ] == streams[0].Returns
+
+
+def test_compact_batch_matches_compact_stream():
+    rng     = np.random.default_rng( 9 )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( 300, 20 ) ), axis=0 )
+    symbols = [ f"S{index}" for index in range( 20 ) ]
+    stream  = IndicatorStream( capacity = 0, dtype = np.float32 )
+    batch   = IndicatorBatch( capacity = 0, dtype = np.float32 )
+    for bar in range( len( close ) ):
+        stream.Update( close[bar,0], close[bar,0] + 0.2, close[bar,0] - 0.2, close[bar,0], 1000 )
+        batch.Update( symbols, close[bar], close[bar] + 0.2, close[bar] - 0.2, close[bar], [ 1000 ] * len( symbols ) )
+
+    values = batch.Values( 'S0' )
+    for name in IndicatorBatch.PUBLISHED :
+        assert math.isclose( values[ name ], getattr( stream, name ), abs_tol=0.011 ), name
+    assert len( batch ) == 20 and batch.Nbytes() * 2 < IndicatorBatch( symbols ).Nbytes()
+
+
+def test_lazy_batch_matches_eager_past_capacity():
+    rng     = np.random.default_rng( 4 )
+    symbols = [ 'A', 'B', 'C' ]
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, ( 1500, 3 ) ), axis=0 )
+    high    = close + rng.random( close.shape ) * 0.3
+    low     = close - rng.random( close.shape ) * 0.3
+    eager   = IndicatorBatch( symbols )
+    lazy    = IndicatorBatch( symbols )
+    lazy.Require( [ 'EMA9', 'ChopIndex', 'RSI', 'BB_Lower', 'BB_Upper' ] )
+    for bar in range( len( close ) ):
+        present = [ pos for pos in range( 3 ) if pos != bar % 3 ]       # ROWS LAG EACH OTHER
+        for batch in ( eager, lazy ) :
+            batch.Update( [ symbols[pos] for pos in present ], close[bar,present], high[bar,present], low[bar,present],
+                          close[bar,present], [ 1000 ] * len(present) )
+        if bar == 700 :
+            assert lazy.Values( 'A', [ 'RangeMean' ] ) == { 'RangeMean' : eager.Values( 'A' )['RangeMean'], 'Count' : eager.Values( 'A' )['Count'] }
+
+    assert np.all( lazy.Folded['Range'][:3] < lazy.Count[:3] )
+    for symbol in symbols :
+        assert lazy.Values( symbol ) == eager.Values( symbol )
@@ -0,0 +1,163 @@
+## ###################################################################################################################
+##  Program :   Indicator_Series_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_indicator_series.py
+##  Notes   :   The vectorized indicators must match the original pandas / python loop versions
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from IndicatorSeries import rsi_series, adx_series, ema_series, chop_series, linear_recursion, wilder_smooth, return_volatility, SeriesIndicators
+from IndicatorStream import IndicatorStream
+
+
+def loop_rsi( data : pd.Series , window : int = 14 ) -> pd.Series :
+    """
+        The original Indicators.CalculateRSI ( element by element Wilder smoothing ) kept as the reference
+    """
+    delta       = data.diff()
+    gains       = delta.clip(lower=0)
+    losses      = -delta.clip(upper=0)
+    avg_gain    = gains.rolling(window=window, min_periods=1).mean()
+    avg_loss    = losses.rolling(window=window, min_periods=1).mean()
+    for i in range(window, len(data)):
+        avg_gain.iloc[i] = ((avg_gain.iloc[i-1] * (window - 1)) + gains.iloc[i]) / window
+        avg_loss.iloc[i] = ((avg_loss.iloc[i-1] * (window - 1)) + losses.iloc[i]) / window
+    return round( 100 - (100 / (1 + avg_gain / avg_loss)), 2 )
+
+
+def test_rsi_matches_loop():
+    rng     = np.random.default_rng( 11 )
+    close   = pd.Series( 50 + np.cumsum( rng.normal( 0, 0.4, 2000 ) ) )
+    for window in [ 2, 7, 14 ]:
+        expected = loop_rsi( close, window ).to_numpy()
+        actual   = rsi_series( close.to_numpy(), window )
+        assert np.allclose( actual, expected, atol=0.011, equal_nan=True )
+        assert np.mean( actual[1:] == expected[1:] ) > 0.999
+
+
+def test_zero_decay_restarts_the_recursion():
+    values  = np.random.default_rng( 5 ).normal( 0, 1, 300 )
+    with np.errstate( all='raise' ):
+        assert np.array_equal( wilder_smooth( values, 1 ), values )
+        decays  = np.where( np.arange( 300 ) % 50 == 7, 0.0, 0.9 )
+        actual  = linear_recursion( 2.0, decays, values )
+
+    expected, last = [], 2.0
+    for decay, value in zip( decays, values ):
+        last = decay * last + value
+        expected.append( last )
+    assert np.allclose( actual, expected )
+
+
+def test_rsi_short_and_flat_series():
+    assert np.isnan( rsi_series( np.array( [ 10.0 ] ) )[-1] )
+    assert np.isnan( rsi_series( np.full( 30, 10.0 ) )[-1] )
+    assert rsi_series( np.arange( 30, dtype=float ) )[-1] == 100
+
+
+def test_stream_rsi_matches_series():
+    rng     = np.random.default_rng( 3 )
+    close   = 20 + np.cumsum( rng.normal( 0, 0.2, 500 ) )
+    stream  = IndicatorStream()
+    for price in close :
+        stream.Update( price, price, price, price, 1000 )
+    assert stream.RSI == rsi_series( close )[-1]
+
+
+def loop_adx( high : np.ndarray , low : np.ndarray , close : np.ndarray , period : int = 7 ) -> np.ndarray :
+    """
+        TA-Lib's ADX ( ta_ADX.c ) element by element , kept as the reference now that talib is not a dependency
+    """
+    adx     = np.full( len( close ), np.nan )
+    sums    = [ 0.0, 0.0, 0.0 ]                                         # TR , +DM , -DM
+    sum_dx  = 0.0
+    for i in range( 1, len( close ) ):
+        up, down    = high[i] - high[i-1], low[i-1] - low[i]
+        values      = [ max( high[i] - low[i], abs( high[i] - close[i-1] ), abs( low[i] - close[i-1] ) ),
+                        up if ( up > 0 and up > down ) else 0.0, down if ( down > 0 and down > up ) else 0.0 ]
+        sums        = [ total + value if i < period else total - total / period + value for total, value in zip( sums, values ) ]
+        if i < period :
+            continue
+        plus, minus = 100 * sums[1] / sums[0], 100 * sums[2] / sums[0]
+        dx          = 100 * abs( plus - minus ) / ( plus + minus )
+        if i < 2 * period :
+            sum_dx += dx
+            if i == 2 * period - 1 :
+                adx[i] = sum_dx / period
+        else:
+            adx[i] = ( adx[i-1] * (period - 1) + dx ) / period
+    return adx
+
+
+def test_adx_matches_loop_and_stream():
+    rng     = np.random.default_rng( 5 )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, 400 ) )
+    high    = close + rng.random( 400 ) * 0.3
+    low     = close - rng.random( 400 ) * 0.3
+    for period in [ 7, 14 ]:
+        assert np.allclose( adx_series( high, low, close, period )[0], loop_adx( high, low, close, period ), equal_nan=True )
+
+    stream  = IndicatorStream()
+    for index in range( len( close ) ):
+        stream.Update( close[index], high[index], low[index], close[index], 1000 )
+        if index == 12 :
+            assert stream.ADX == 0                                      # NOT DEFINED BEFORE 2 * period CANDLES
+    adx, plus_di, minus_di = adx_series( high, low, close, 7 )
+    assert abs( stream.ADX - adx[-1] ) < 1e-9
+    assert abs( stream.PlusDI - plus_di[-1] ) < 1e-9 and abs( stream.MinusDI - minus_di[-1] ) < 1e-9
+
+
+
+def test_ema_and_chop_match_stream():
+    rng     = np.random.default_rng( 9 )
+    close   = np.round( 50 + np.cumsum( rng.normal( 0, 0.1, 300 ) ), 2 )
+    close[ 100:120 ] = close[ 99 ]                                      # FLAT PRICES
+    high    = close + np.round( rng.random( 300 ) * 0.2, 2 )
+    low     = close - np.round( rng.random( 300 ) * 0.2, 2 )
+    ema     = ema_series( close )
+    chop    = chop_series( high, low, close )
+
+    stream  = IndicatorStream()
+    for index in range( len( close ) ):
+        stream.Update( close[index], high[index], low[index], close[index], 1000 )
+        assert abs( stream.EMA9 - ema[index] ) < 1e-9                  # linear_recursion , NOT THE SAME ROUNDING
+        assert stream.ChopIndex == chop[index]
+
+
+
+def test_series_plan_matches_stream():
+    rng     = np.random.default_rng( 21 )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, 400 ) )
+    high    = close + rng.random( 400 ) * 0.3
+    low     = close - rng.random( 400 ) * 0.3
+    volume  = rng.integers( 1000, 5000, 400 ).astype( float )
+    series  = SeriesIndicators( high, low, close, volume, vol_window=30 ).Values()
+    assert set( SeriesIndicators( high, low, close ).Values( [ 'EMA9', 'RSI' ] ) ) == { 'EMA9', 'RSI' }
+
+    stream  = IndicatorStream( vol_window=30 )
+    for index in range( len( close ) ):
+        stream.Update( close[index], high[index], low[index], close[index], volume[index] )
+        for name, value in stream.Values().items() :
+            if name == 'SMA' :
+                assert all( abs( value[ key ] - series['SMA'][ key ][ index ] ) < 1e-9 for key in value ), index
+            elif name != 'dFib' and not np.isnan( series[ name ][ index ] ) :
+                assert abs( value - series[ name ][ index ] ) <= ( 0.011 if name.startswith( 'BB' ) else 1.1e-4 if name.startswith( 'Vol' ) else 1e-8 ), ( name, index )
+
+
+
+def test_return_volatility_windows():
+    rng     = np.random.default_rng( 8 )
+    close   = 100 * np.exp( np.cumsum( rng.normal( 0, 0.002, 120 ) ) )
+    returns = np.log( close[1:] / close[:-1] )
+    windows = np.lib.stride_tricks.sliding_window_view( returns, 30 ).std( axis=1, ddof=1 )
+    for end in range( 31, len( close ) + 1 ) :
+        assert return_volatility( close[ :end ], 30 ) == ( float( windows[ end - 31 ] ), 30 )
+    assert return_volatility( close )[0] == float( np.std( returns, ddof=1 ) )
+    assert np.isnan( return_volatility( close[ :2 ] )[0] ) and return_volatility( close[ :2 ] )[1] == 1
+
+    stream  = IndicatorStream( vol_window=30 )
+    for value in close :
+        stream.Update( value, value, value, value, 1000.0 )
+    assert abs( stream.Values()['VolIndex'] - return_volatility( close, 30 )[0] ) < 1e-4       # ROUNDED TO 4 PLACES
@@ -0,0 +1,30 @@
+## ###################################################################################################################
+##  Program :   Indicator_Snapshot_Test
+##  Author  :
+##  Install :   pip3 install pytest
+##  Example :	python3 -m pytest test_indicator_snapshot.py
+##  Notes   :   The snapshot reads like the dictionary Summary() used to return and can not be changed
+## ###################################################################################################################
+import pickle
+
+import pytest
+
+from IndicatorSnapshot import IndicatorSnapshot
+
+
+def test_snapshot_reads_like_a_dictionary():
+    snapshot = IndicatorSnapshot( ( 'SMA9', 'RSI', 'VWAP' ), ( 10.5, 55.0, 10.2 ) )
+    assert snapshot['RSI'] == 55.0 and 'VWAP' in snapshot and not ( 'ADX' in snapshot )
+    assert dict( snapshot ) == { 'SMA9' : 10.5, 'RSI' : 55.0, 'VWAP' : 10.2 }
+    assert snapshot.get( 'ADX' ) is None
+    assert pickle.loads( pickle.dumps( snapshot ) ) == snapshot
+
+
+def test_snapshot_is_read_only_and_shares_its_layout():
+    first   = IndicatorSnapshot( ( 'RSI', 'VWAP' ), ( 1.0, 2.0 ) )
+    second  = IndicatorSnapshot( [ 'RSI', 'VWAP' ], ( 3.0, 4.0 ) )
+    assert first.Index is second.Index and first.Names is second.Names
+    with pytest.raises( AttributeError ):
+        first.Values = ( 0.0, 0.0 )
+    with pytest.raises( ValueError ):
+        IndicatorSnapshot( ( 'RSI', ), ( 1.0, 2.0 ) )
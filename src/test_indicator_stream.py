@@ -0,0 +1,167 @@
+## ###################################################################################################################
+##  Program :   Indicator_Stream_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_indicator_stream.py
+##  Notes   :   The streaming indicators must land on the same values as the full history pandas calculations
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+import pytest
+
+from IndicatorStream import IndicatorStream
+from CandleBuffer    import CandleBuffer
+
+
+def make_candles( length : int = 300 , seed : int = 7 ) -> pd.DataFrame :
+    """
+        Random walk candles to feed the indicators
+    """
+    rng     = np.random.default_rng( seed )
+    close   = 100 + np.cumsum( rng.normal( 0, 0.3, length ) )
+    open    = close + rng.normal( 0, 0.1, length )
+    return pd.DataFrame( { 'open'   : open,
+                           'high'   : np.maximum( open, close ) + rng.random( length ) * 0.3,
+                           'low'    : np.minimum( open, close ) - rng.random( length ) * 0.3,
+                           'close'  : close,
+                           'volume' : rng.integers( 1000, 5000, length ).astype( float ) } )
+
+
+def run_stream( df : pd.DataFrame ) -> IndicatorStream :
+    stream = IndicatorStream()
+    for row in df.itertuples() :
+        stream.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+    return stream
+
+
+def test_stream_matches_full_history():
+    df      = make_candles()
+    stream  = run_stream( df )
+
+    typical = ( df['high'] + df['low'] + df['close'] ) / 3
+    assert abs( stream.VWAP - ( typical * df['volume'] ).sum() / df['volume'].sum() ) < 1e-9
+    assert abs( stream.EMA9 - df['close'].ewm( span=9, adjust=False ).mean().iloc[-1] ) < 1e-9
+    assert abs( stream.SMA['SMA21'] - df['close'][-21:].mean() ) < 1e-9
+
+    mean    = df['close'].rolling( 15 ).mean().iloc[-1]
+    std     = df['close'].rolling( 15 ).std().iloc[-1]
+    assert stream.BB_Upper == round( mean + 2 * std, 2 )
+    assert stream.BB_Lower == round( mean - 2 * std, 2 )
+
+    returns = np.log( df['close'] / df['close'].shift( 1 ) )
+    assert stream.VolIndex == round( returns.std(), 4 )
+
+    true_range = pd.concat( [ df['high'] - df['low'], ( df['high'] - df['close'].shift() ).abs(),
+                              ( df['low'] - df['close'].shift() ).abs() ], axis=1 ).max( axis=1 )
+    chop = 100 * np.log10( true_range.rolling( 4 ).sum() / ( df['high'].rolling( 4 ).max() - df['low'].rolling( 4 ).min() ) ) / np.log10( 4 )
+    assert stream.ChopIndex == round( chop.iloc[-1], 2 )
+
+    assert stream.RangeHigh == df['high'].rolling( 20 ).max().max()
+    assert abs( stream.RangeMean - df['close'].rolling( 20 ).mean().mean() ) < 1e-9
+    assert abs( stream.RangeMedian - df['close'].rolling( 20 ).median().median() ) < 1e-9
+
+
+def test_stream_warm_up():
+    stream = run_stream( make_candles( length = 3 ) )
+    assert stream.ChopIndex == 50
+    assert np.isnan( stream.BB_Upper )
+    assert np.isnan( stream.RangeHigh )
+
+
+def test_candle_buffer_wraps_without_copy():
+    candles = CandleBuffer( capacity = 8 )
+    for index in range( 20 ):
+        candles.Append( index, index + 1, index - 1, index + 0.5, 100, index )
+    assert len( candles ) == 8
+    assert list( candles.View( 'close', 3 ) ) == [ 17.5, 18.5, 19.5 ]
+    assert list( candles.View( 'timestamp' ) ) == list( range( 12, 20 ) )
+    assert candles.Last( 'close', 7 ) == 12.5
+    assert not candles.View( 'close' ).flags.writeable
+
+
+def test_lazy_groups_catch_up():
+    df      = make_candles()
+    eager   = run_stream( df )
+    lazy    = IndicatorStream()
+    lazy.Require( [ 'EMA9', 'ChopIndex' ] )
+    for row in df.itertuples() :
+        lazy.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+        if row.Index == 100 :
+            assert lazy.Values( [ 'RSI' ] )['RSI'] == run_stream( df[:101] ).RSI
+
+    assert lazy.Applied['EMA'] == lazy.Count and lazy.Applied['ADX'] == 0
+    assert lazy.Values() == eager.Values()
+
+
+
+def test_lazy_groups_past_buffer_capacity():
+    df      = make_candles( length = 1500 )                              # NEARLY THREE TIMES THE CandleBuffer
+    eager   = run_stream( df )
+    for capacity in ( 512, 0 ) :
+        lazy = IndicatorStream( capacity = capacity )
+        lazy.Require( [ 'EMA9', 'ChopIndex', 'RSI', 'BB_Lower', 'BB_Upper' ] )
+        for row in df.itertuples() :
+            lazy.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+            assert lazy.Count - lazy.Applied['Range'] <= lazy.Candles.Capacity - lazy.Lookback['Range']
+
+        assert 0 < lazy.Applied['Session'] < lazy.Count
+        assert lazy.Values() == eager.Values()
+
+    behind = IndicatorStream( capacity = 0 )
+    behind.Require( [ 'EMA9' ] )
+    behind.Horizon = float( 'inf' )                                     # SKIP THE CATCH UP
+    for row in df[:300].itertuples() :
+        behind.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+    with pytest.raises( ValueError ):
+        behind.Values( [ 'RangeMean' ] )
+
+
+def test_intermediates_shared_per_candle():
+    stream  = IndicatorStream()
+    calls   = []
+    calc    = stream.CalcTrueRange
+    stream.CalcTrueRange = lambda count, back, *inputs : calls.append( count ) or calc( count, back, *inputs )
+    run     = make_candles( length = 50 )
+    for row in run.itertuples() :
+        stream.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+
+    assert calls == list( range( 1, 51 ) )                              # Chop and ADX share one TrueRange per candle
+    assert all( name in IndicatorStream.INTERMEDIATES for inputs in IndicatorStream.INPUTS.values() for name in inputs )
+
+
+def test_rolling_volatility_matches_pandas():
+    df      = make_candles()
+    stream  = IndicatorStream( vol_window = 30 )
+    for row in df.itertuples() :
+        stream.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+
+    returns = np.log( df['close'] / df['close'].shift( 1 ) )
+    assert stream.VolIndex == round( returns.rolling( 30 ).std().iloc[-1], 4 )
+    assert abs( stream.VolAnnual - returns[-30:].std() * np.sqrt( 252 * 330 ) ) < 1e-3
+
+
+def test_compact_stream_close_to_full():
+    df      = make_candles()
+    full    = run_stream( df )
+    compact = IndicatorStream( capacity = 0, dtype = np.float32 )
+    for row in df.itertuples() :
+        compact.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+
+    assert compact.Candles.Capacity == 201 and compact.Nbytes() * 2 < full.Nbytes()
+    for name, value in full.Values().items() :
+        if isinstance( value, float ) :
+            assert abs( compact.Values( [ name ] )[ name ] - value ) < 0.02, name
+
+
+def test_volatility_skips_non_positive_closes():
+    df                          = make_candles()
+    df.loc[ [ 40, 41, 90, 150 ], 'close' ] = [ 0.0, -1.0, 0.0, 0.0 ]      # A BAD PRINT , THE RETURNS AROUND IT ARE SKIPPED
+    with np.errstate( invalid='ignore', divide='ignore' ):
+        returns                 = np.log( df['close'] / df['close'].shift( 1 ) ).where( ( df['close'] > 0 ) & ( df['close'].shift( 1 ) > 0 ) )
+    for window, expected in ( ( None, returns.expanding( 2 ).std() ), ( 30, returns.rolling( 30, min_periods=2 ).std() ) ) :
+        stream  = IndicatorStream( vol_window = window )
+        for row in df.itertuples() :
+            stream.Update( row.open, row.high, row.low, row.close, row.volume, row.Index )
+            if not np.isnan( expected[ row.Index ] ) :
+                assert stream.VolIndex == round( expected[ row.Index ], 4 ), ( window, row.Index )
+        assert stream.Returns == returns[ -( window or len( df ) ): ].count()
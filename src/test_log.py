@@ -0,0 +1,57 @@
+## ###################################################################################################################
+##  Program :   Log_Test
+##  Author  :
+##  Install :   pip3 install pytest loguru
+##  Example :	python3 -m pytest test_log.py
+##  Notes   :   A level that is off neither formats nor calls the lazy arguments , and the sink follows stdout
+##              Importing the module leaves the one INFO handler on stdout
+## ###################################################################################################################
+import io
+import os
+import sys
+import contextlib
+import subprocess
+
+import pytest
+
+from Log import logger, set_level, LOG_LEVEL, QUIET_LEVEL
+
+
+def test_levels_and_lazy_arguments():
+    calls = []
+    def summary():
+        calls.append( 1 )
+        return 42
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout( output ) :
+            set_level( 'info' )
+            logger.debug( "->DATA : {} ", [ 'QQQ', 1.0 ] )
+            logger.opt( lazy=True ).debug( "RSI : {}", summary )
+            logger.info( "SOLD : {} -> {}", 1.5, 2.25 )
+            assert calls == []
+
+            set_level( 'DEBUG' )
+            logger.opt( lazy=True ).debug( "RSI : {}", summary )
+
+            set_level( QUIET_LEVEL )
+            logger.info( "not written" )
+            logger.warning( "{{ literal }}" )
+    finally:
+        set_level( LOG_LEVEL )
+
+    assert output.getvalue() == "SOLD : 1.5 -> 2.25\nRSI : 42\n{{ literal }}\n"
+    assert calls == [ 1 ]
+
+
+def test_unknown_level():
+    with pytest.raises( ValueError ):
+        set_level( 'LOUD' )
+
+
+
+def test_import_installs_one_info_handler():
+    script  = "from Log import logger\nlogger.debug( 'not written' )\nlogger.info( 'written' )"
+    run     = subprocess.run( [ sys.executable, '-c', script ], cwd=os.path.dirname( os.path.abspath( __file__ ) ), capture_output=True, text=True )
+    assert run.returncode == 0 and run.stdout == "written\n" and run.stderr == ""
@@ -0,0 +1,43 @@
+## ###################################################################################################################
+##  Program :   Monte_Carlo_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_monte_carlo.py
+##  Notes   :   Resampled equity paths , their drawdowns / hitting times and the speed of 10k paths
+## ###################################################################################################################
+import time
+
+import numpy  as np
+
+from MonteCarlo import MonteCarlo, trade_frame
+
+
+def test_paths():
+    trades  = { 'AAA' : [ { 'p_l' : 10.0, 'askTime' : '2025-08-14 10:00:00' }, { 'p_l' : -30.0, 'askTime' : '2025-08-14 11:00:00' } ],
+                'BBB' : [ { 'p_l' : 50.0, 'askTime' : '2025-08-15 10:00:00' } ] }
+    assert trade_frame( trades )['p_l'].tolist() == [ 10.0, -30.0, 50.0 ]
+
+    carlo   = MonteCarlo( trades=trades, funds=1000, target=1040, paths=2000, seed=1 )
+    results = carlo.Run( method='shuffle' )
+    assert np.allclose( results['final_equity'], 1030 )                                         # SAME TRADES , ANOTHER ORDER
+    assert set( np.round( results['max_drawdown'], 6 ) ) <= { 0.0, 20.0, 30.0 }
+    assert set( results['hit_step'] ) == { 1, 2, -1 }                                           # 50 FIRST / 10 THEN 50 / NEVER ( ENDS AT 1030 )
+
+    again   = MonteCarlo( trades=trades, funds=1000, target=1040, paths=2000, seed=1 ).Run( method='bootstrap' )
+    assert np.array_equal( again['final_equity'], MonteCarlo( trades=trades, funds=1000, target=1040, paths=2000, seed=1 ).Run()['final_equity'] )
+    assert again['final_equity'].min() == 910 and again['final_equity'].max() == 1150
+
+    daily   = carlo.Run( method='block', block=1 )
+    assert carlo.Daily().tolist() == [ -20.0, 50.0 ] and set( daily['final_equity'] ) <= { 960.0, 1030.0, 1100.0 }
+
+    summary = carlo.Summary( results )
+    assert summary['prob_loss'] == 0.0 and 0.4 < summary['prob_target'] < 0.6 and summary['final_equity']['p50'] == 1030
+
+
+def test_speed():
+    pnl     = np.random.default_rng( 3 ).normal( 1, 20, 250 )
+    carlo   = MonteCarlo( trades=pnl.tolist(), funds=5000, target=5125, paths=10000, seed=3 )
+    start   = time.perf_counter()
+    summary = carlo.Summary( carlo.Run() )
+    assert time.perf_counter() - start < 1.0
+    assert summary['max_drawdown']['p5'] <= summary['max_drawdown']['p95'] and 0 <= summary['prob_loss'] <= 1
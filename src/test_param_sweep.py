@@ -0,0 +1,47 @@
+## ###################################################################################################################
+##  Program :   Param_Sweep_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_param_sweep.py
+##  Notes   :   An event loop point primes its symbols from the candles and trades on a Paper account ; a point
+##              that back tested nothing is a failure , not a 0 result
+## ###################################################################################################################
+import numpy  as np
+
+from ParamSweep             import ParamSweep, attach, run_point, Shared
+from DayTradeStrategy       import DayTradeStrategy
+from test_back_test_engine  import make_back_test
+
+
+CONFIGS = { 'strategy' : 'ema9', 'interval' : 1, 'volume_threshold' : 0, 'stock' : [ 'AAA', 'BBB' ], 'no_cache' : True }
+
+
+def run_shared( point : dict , start : str = None , **configs ) -> dict :
+    sweep               = ParamSweep( configs=CONFIGS | configs, grid={ 'risk_percent' : [ 0.0015 ] }, workers=1 )
+    block, descriptor   = sweep.Share( make_back_test().sort_values( by=['DATETIME'], kind='stable' ) )
+    descriptor['forked'] = True                                        # SAME PROCESS , SAME RESOURCE TRACKER
+    try:
+        attach( descriptor )                                            # THIS PROCESS AS THE WORKER
+        return run_point( point, sweep.Configs, start=start )
+    finally:
+        Shared.clear()
+        sweep.Release( block )
+
+
+def test_event_loop_point_trades( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    result = run_shared( { 'risk_percent' : 0.0015 } )
+    assert result['trades'] > 0 and result['wins'] + result['losses'] == result['trades']
+    assert not np.isnan( result['p_l'] ) and result['funds'] > 0
+    assert run_shared( { 'risk_percent' : 0.0015 }, vectorized=True ) == result        # SAME TRADES AS BackTestEngine
+
+    later = run_shared( { 'risk_percent' : 0.0015 }, start='2025-08-16' )       # THE DAY BEFORE IS IN THE STORE
+    assert later['trades'] > 0
+    assert run_shared( { 'risk_percent' : 0.0015 }, start='2025-08-16', vectorized=True ) == later     # SAME WARM UP FROM THE WINDOW START
+
+
+def test_point_that_ran_nothing_is_a_failure( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    monkeypatch.setattr( DayTradeStrategy, 'PrimeStockEntry', lambda self, *args, **kwargs : {} )
+    result = run_shared( { 'risk_percent' : 0.0015 } )
+    assert result['trades'] == 0 and np.isnan( result['p_l'] )
@@ -0,0 +1,62 @@
+## ###################################################################################################################
+##  Program :   Replay_Compare_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_replay_compare.py
+##  Notes   :   The replay steps end on the interval , and strategies compared on shared candles replay like each of
+##              them alone on the candle store , and the daily context of a live day is not cached before the close
+## ###################################################################################################################
+from datetime           import datetime
+
+from Clock              import SimulatedClock
+from CandleStore        import CandleStore
+from DailyCache         import DailyCache
+from DayTradeStrategy   import DayTradeStrategy
+from ReplayCompare      import ReplayCompare, replay_strategy, next_step
+from ReplayData         import ReplayData
+from TradeAccount       import TradeAccount
+from test_batch_replay  import write_days
+
+
+def test_next_step():
+    assert next_step( datetime( 2025, 8, 15, 9, 30 ), 900 ) == datetime( 2025, 8, 15, 9, 45 )
+    assert next_step( datetime( 2025, 8, 15, 9, 33 ), 300 ) == datetime( 2025, 8, 15, 9, 35 )        # BACK ON THE 5 MIN GRID
+    assert next_step( datetime( 2025, 8, 15, 9, 52 ), 900 ) == datetime( 2025, 8, 15, 10, 0 )
+    assert next_step( datetime( 2025, 8, 15, 15, 59 ), 60 ) == datetime( 2025, 8, 15, 16, 0 )
+
+
+def test_compare_matches_each_replay( tmp_path ):
+    write_days( str( tmp_path / 'store' ) )
+    configs = { 'strategy' : 'ema9,simple', 'stock' : [ 'AAA', 'BBB' ], 'replay_date' : '2025-08-14', 'interval' : 5,
+                'volume_threshold' : 0, 'candle_store' : str( tmp_path / 'store' ), 'daily_cache' : str( tmp_path / 'daily' ) }
+    account = TradeAccount( funds=5000, limit=0.10, app_type='Paper', clock=SimulatedClock( start='2025-08-14 09:30:00' ) )
+    compare = ReplayCompare( configs=configs, workers=2 )
+    results = compare.Run( account )
+
+    assert [ result['strategy'] for result in results ] == [ 'ema9', 'simple' ]
+    assert compare.Replay.Sources == { 'AAA' : 'store', 'BBB' : 'store' }
+    for result in results :
+        alone = replay_strategy( result['strategy'], compare.Configs, store=CandleStore( root=configs['candle_store'] ) )
+        assert result['error'] is None and alone['error'] is None
+        assert result['account'].Trades == alone['account'].Trades and result['data'] == alone['data']
+        assert all( row['datetime'][:10] == '2025-08-14' for rows in result['data'].values() for row in rows )
+    assert sum( len( rows ) for rows in results[1]['data'].values() ) > 0
+
+
+class SessionClock( SimulatedClock ) :
+    Simulated = False                                                       # A WALL CLOCK STOPPED IN THE SESSION
+
+
+def test_live_day_is_not_cached( tmp_path ):
+    write_days( str( tmp_path / 'store' ) )
+    for run, ( clock, cached ) in enumerate( ( ( SimulatedClock( start='2025-08-14 10:00:00' ), True ), ( SessionClock( start='2025-08-14 10:00:00' ), False ),
+                                               ( SessionClock( start='2025-08-14 16:05:00' ), True ) ) ) :
+        account     = TradeAccount( funds=5000, limit=0.10, app_type='Paper', clock=clock )
+        account.SetStore( ReplayData( account=account, symbols=[ 'AAA' ], day='2025-08-14', store=CandleStore( root=str( tmp_path / 'store' ) ) ) )
+        strategies  = DayTradeStrategy()
+        strategies.Set( strategy='simple', interval=5, account=account, clock=clock )
+        strategies.Cache = DailyCache( folder=str( tmp_path / f"cache{run}" ) )
+        strategies.SetORB( [ 'AAA' ], account, clock.Now() )
+
+        assert 'AAA' in strategies.Stocks
+        assert ( strategies.Cache.Load( 'AAA', '2025-08-14' ) is not None ) == cached, run
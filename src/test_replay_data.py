@@ -0,0 +1,52 @@
+## ###################################################################################################################
+##  Program :   Replay_Data_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_replay_data.py
+##  Notes   :   A replay day is fetched once per symbol and every candle after that comes from memory
+## ###################################################################################################################
+import numpy  as np
+
+from types       import SimpleNamespace
+from datetime    import datetime, timedelta
+from CandleStore import CandleStore
+from ReplayData  import ReplayData
+
+
+class PriceHistory :
+    def __init__( self ) -> None :
+        self.Calls = 0
+
+    def QuoteByInterval( self, symbol, periodType, period, frequencyType, frequency, startDate, endDate ) -> object :
+        """
+            390 one minute candles from 09:30 ( plus one of the day before ) like /marketdata/v1/pricehistory
+        """
+        self.Calls += 1
+        times   = [ startDate - timedelta( minutes= 1 ) ] + [ startDate + timedelta( hours= 9, minutes= 30 + minute ) for minute in range( 390 ) ]
+        candles = [ { 'open' : 100 + index, 'high' : 101 + index, 'low' : 99 + index, 'close' : 100.5 + index, 'volume' : 10,
+                      'datetime' : int( value.timestamp() * 1000 ) } for index, value in enumerate( times ) ]
+        return SimpleNamespace( status_code= 200, json= lambda : { 'symbol' : symbol, 'candles' : candles } )
+
+
+def test_replay_day_from_memory( tmp_path ):
+    broker  = PriceHistory()
+    account = SimpleNamespace( Conn= broker )
+    store   = CandleStore( root= tmp_path )
+    replay  = ReplayData( account= account, symbols= [ 'AAA', 'BBB' ], day= '2025-08-15 09:30:00', store= store )
+
+    assert broker.Calls == 2 and replay.Sources == { 'AAA' : 'broker', 'BBB' : 'broker' }
+    assert len( replay.Candles['AAA']['TIME'] ) == 390                                          # THE CANDLE OF THE DAY BEFORE IS DROPPED
+    for step in range( 0, 390, 15 ) :
+        bar = replay.Bar( 'AAA', datetime( 2025, 8, 15, 9, 30 ) + timedelta( minutes= step ), 900 )
+        assert bar == [ 'AAA', str( datetime( 2025, 8, 15, 9, 30 ) + timedelta( minutes= step ) ), 100.0 + step, 115.5 + step, 101.0 + step, 150.0, 116.0 + step ]
+    assert broker.Calls == 2
+    assert replay.Bar( 'AAA', datetime( 2025, 8, 16, 9, 30 ) ) is None and not replay.Has( 'CCC' )
+
+    again   = ReplayData( account= account, symbols= [ 'AAA' ], day= '2025-08-15', store= CandleStore( root= tmp_path ) )
+    assert broker.Calls == 2 and again.Sources == { 'AAA' : 'store' }
+    assert np.array_equal( again.Candles['AAA']['CLOSE'], replay.Candles['AAA']['CLOSE'] )
+    assert len( again.History( 'AAA', time_period= 'minute', today= datetime( 2025, 8, 16, 9, 30 ) ) ) == 390
+
+    shared  = ReplayData( account= None, symbols= [ 'AAA' ], day= '2025-08-15', candles= replay.Candles )       # ANOTHER PROCESS , NO FETCH
+    assert broker.Calls == 2 and shared.Sources == { 'AAA' : 'shared' }
+    assert shared.Bar( 'AAA', datetime( 2025, 8, 15, 9, 45 ), 900 ) == replay.Bar( 'AAA', datetime( 2025, 8, 15, 9, 45 ), 900 )
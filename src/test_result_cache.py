@@ -0,0 +1,42 @@
+## ###################################################################################################################
+##  Program :   Result_Cache_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_result_cache.py
+##  Notes   :   The same strategy / params / code / candles give the same key , any change of them another one
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from ResultCache import ResultCache, partition_digests, data_digest
+
+
+def candles() -> pd.DataFrame :
+    times = [ f"2025-08-{day} 09:{minute:02d}:00" for day in ( 14, 15 ) for minute in range( 30, 40 ) ]
+    return pd.DataFrame( { 'SYMBOL' : 'AAA', 'DATETIME' : times, 'LOW' : 1.0, 'CLOSE' : np.arange( 20, dtype=float ), 'QUOTE' : 1.0,
+                           'VOLUME' : 100.0, 'HIGH' : 2.0 } )
+
+
+def test_keys( tmp_path ):
+    cache   = ResultCache( folder= tmp_path )
+    key     = cache.Key( kind='back_test', strategy='ema9', params={ 'risk_percent' : 0.001, 'limit' : 0.2 } )
+    assert key == cache.Key( params={ 'limit' : 0.2, 'risk_percent' : np.float64( 0.001 ) }, strategy='ema9', kind='back_test' )
+    assert key != cache.Key( kind='back_test', strategy='ema9', params={ 'risk_percent' : 0.002, 'limit' : 0.2 } )
+
+    assert cache.Load( key ) is None and cache.Misses == 1
+    assert cache.Save( key, { 'trades' : 3, 'p_l' : np.float64( 1.25 ) } )
+    assert cache.Load( key ) == { 'trades' : 3, 'p_l' : 1.25 } and cache.Hits == 1
+
+
+def test_partitions():
+    data    = candles()
+    digests = partition_digests( data )
+    assert sorted( digests ) == [ 'AAA 2025-08-14', 'AAA 2025-08-15' ]
+
+    changed = data.copy()
+    changed.loc[ 15, 'CLOSE' ] += 0.01                                                          # ONE CANDLE OF THE 15TH
+    other   = partition_digests( changed )
+    assert other['AAA 2025-08-14'] == digests['AAA 2025-08-14'] and other['AAA 2025-08-15'] != digests['AAA 2025-08-15']
+    assert data_digest( other, end='2025-08-15' ) == data_digest( digests, end='2025-08-15' )   # A RUN THAT STOPS BEFORE THE 15TH
+    assert data_digest( other ) != data_digest( digests )
+    assert data_digest( other, end='2025-08-15 09:35:00' ) != data_digest( digests, end='2025-08-15 09:35:00' )
@@ -0,0 +1,50 @@
+## ###################################################################################################################
+##  Program :   Walk_Forward_Test
+##  Author  :
+##  Install :   pip3 install pytest pandas numpy
+##  Example :	python3 -m pytest test_walk_forward.py
+##  Notes   :   Rolling windows over the trading days , the best in sample point checked out of sample , the same
+##              results on the event loop and the vectorized engine
+## ###################################################################################################################
+import numpy  as np
+import pandas as pd
+
+from WalkForward            import WalkForward
+from test_back_test_engine  import make_back_test
+
+
+CONFIGS = { 'strategy' : 'ema9', 'interval' : 1, 'volume_threshold' : 0, 'stock' : [ 'AAA', 'BBB' ], 'no_cache' : True }
+DAYS    = [ f"2025-08-{day:02d}" for day in range( 11, 19 ) ]
+
+
+def test_window_boundaries():
+    windows = WalkForward( configs=CONFIGS, grid={ 'risk_percent' : [ 0.0015 ] }, in_sample=3, out_sample=2 ).Windows( DAYS )
+    assert windows == [ { 'window' : 1, 'in_start' : DAYS[0], 'in_end' : DAYS[3], 'in_last' : DAYS[2], 'out_start' : DAYS[3], 'out_end' : DAYS[5], 'out_last' : DAYS[4] },
+                        { 'window' : 2, 'in_start' : DAYS[2], 'in_end' : DAYS[5], 'in_last' : DAYS[4], 'out_start' : DAYS[5], 'out_end' : DAYS[7], 'out_last' : DAYS[6] },
+                        { 'window' : 3, 'in_start' : DAYS[4], 'in_end' : DAYS[7], 'in_last' : DAYS[6], 'out_start' : DAYS[7], 'out_end' : None,    'out_last' : DAYS[7] } ]
+
+    walk = WalkForward( configs=CONFIGS, grid={ 'risk_percent' : [ 0.0015 ] }, in_sample=7, out_sample=5 )
+    assert [ ( window['in_start'], window['out_start'], window['out_end'] ) for window in walk.Windows( DAYS ) ] == [ ( DAYS[0], DAYS[7], None ) ]
+    assert walk.Windows( DAYS[:7] ) == []                                           # NOTHING LEFT OUT OF SAMPLE
+
+
+def test_summary_efficiency():
+    walk    = WalkForward( configs=CONFIGS, grid={ 'risk_percent' : [ 0.0015 ] }, in_sample=3, out_sample=2 )
+    results = pd.DataFrame( { 'in_p_l' : [ 10.0, 20.0 ], 'out_p_l' : [ 3.0, -1.0 ], 'out_trades' : [ 4, 2 ], 'out_wins' : [ 3, 0 ] } )
+    assert walk.Summary( results ) == { 'windows' : 2, 'out_trades' : 6, 'out_p_l' : 2.0, 'out_win_rate' : 0.5, 'profitable' : 1,
+                                        'efficiency' : 0.1 }                       # ( 2 / 4 days ) / ( 30 / 6 days )
+    assert np.isnan( walk.Summary( results.assign( in_p_l=[ -10.0, 5.0 ] ) )['efficiency'] )
+    assert walk.Summary( pd.DataFrame() ) == { 'windows' : 0 }
+
+
+def test_run_on_both_engines( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    data    = make_back_test( episodes=30 ).sort_values( by=['DATETIME'], kind='stable' )
+    grid    = { 'risk_percent' : [ 0.0015, 0.003 ] }
+    event   = WalkForward( configs=CONFIGS, grid=grid, in_sample=2, out_sample=1, workers=2 ).Run( data )
+    vector  = WalkForward( configs=CONFIGS | { 'vectorized' : True }, grid=grid, in_sample=2, out_sample=1, workers=2 ).Run( data )
+
+    days    = sorted( data['DATETIME'].str[:10].unique() )
+    assert list( event['window'] ) == [ 1, 2, 3 ] and list( event['out_start'] ) == days[2:]
+    assert event['out_trades'].sum() > 0 and not event[ [ 'in_p_l', 'out_p_l' ] ].isna().any().any()
+    pd.testing.assert_frame_equal( event, vector )                                  # SAME WARM UP AT EVERY WINDOW START